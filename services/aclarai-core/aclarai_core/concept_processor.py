@@ -6,21 +6,27 @@ candidate management.
 """
 
 import logging
+from collections.abc import Iterator
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from aclarai_shared import load_config
 from aclarai_shared.config import aclaraiConfig
 from aclarai_shared.concept_detection import ConceptDetector
-from aclarai_shared.noun_phrase_extraction import NounPhraseExtractor
+from aclarai_shared.noun_phrase_extraction import (
+    NounPhraseCandidate,
+    NounPhraseExtractor,
+)
 from aclarai_shared.noun_phrase_extraction.concept_candidates_store import (
     ConceptCandidatesVectorStore,
 )
 from aclarai_shared.concept_detection.models import (
     ConceptAction,
     ConceptDetectionBatch,
+    ConceptDetectionResult,
 )
 from aclarai_shared.graph.models import ConceptInput
-from aclarai_shared.graph import Neo4jGraphManager
+from aclarai_shared.graph import Neo4jGraphManager, iter_node_pages
+from aclarai_shared.graph.pagination import graph_read_page_size
 from aclarai_shared.tier3_concept import ConceptFileWriter
 
 logger = logging.getLogger(__name__)
@@ -64,6 +70,8 @@ class ConceptProcessor:
         self.concept_detector = concept_detector or ConceptDetector(self.config)
         self.concept_file_writer = concept_file_writer or ConceptFileWriter(self.config)
         self.neo4j_manager = neo4j_manager or Neo4jGraphManager(self.config)
+        # The canonical concept index is built from the graph on first use
+        self._canonical_index_ready = False
         logger.info(
             "Initialized ConceptProcessor",
             extra={
@@ -121,43 +129,67 @@ class ConceptProcessor:
                     "concept_actions": [],
                     "message": "No noun phrases extracted",
                 }
-            # Step 2: Store candidates in vector store
-            stored_count = self.candidates_store.store_candidates(
-                extraction_result.candidates
-            )
-            # Step 3: Perform concept detection on the extracted candidates
-            detection_batch = self.concept_detector.process_candidates_batch(
+            # Step 2: Resolve already known phrases without embedding them
+            if not self._canonical_index_ready:
+                self._build_canonical_index()
+            exact_results = self.concept_detector.match_exact(
                 extraction_result.candidates
             )
+            new_candidates = []
+            exact_candidates = []
+            exact_matches = []
+            for candidate, exact_result in zip(
+                extraction_result.candidates, exact_results, strict=True
+            ):
+                if exact_result is None:
+                    new_candidates.append(candidate)
+                else:
+                    exact_candidates.append(candidate)
+                    exact_matches.append(exact_result)
+            # Known phrases are recorded as merged straight away
+            exact_updates = self._record_exact_matches(exact_candidates, exact_matches)
+            # Step 3: Store the remaining candidates in vector store (embeds them)
+            stored_count = 0
+            detection_batch = ConceptDetectionBatch(processing_time=0.0)
+            if new_candidates:
+                stored_count = self.candidates_store.store_candidates(new_candidates)
+                # Step 4: Perform concept detection on the new candidates
+                detection_batch = self.concept_detector.process_candidates_batch(
+                    new_candidates
+                )
             # Build candidate metadata mapping for efficient lookup
             candidate_metadata_map = {}
-            for candidate in extraction_result.candidates:
+            for candidate in new_candidates:
                 candidate_id = f"{candidate.source_node_type}_{candidate.source_node_id}_{candidate.text[:50]}"
                 candidate_metadata_map[candidate_id] = {
                     "source_node_id": candidate.source_node_id,
                     "source_node_type": candidate.source_node_type,
                     "aclarai_id": candidate.aclarai_id,
                     "text": candidate.text,
+                    "normalized_text": candidate.normalized_text,
+                    "embedding": candidate.embedding,
                 }
-            # Step 4: Update candidate statuses based on detection results
-            updated_candidates = self._update_candidate_statuses(
+            # Step 5: Update candidate statuses based on detection results
+            updated_candidates = exact_updates + self._update_candidate_statuses(
                 detection_batch, candidate_metadata_map
             )
+            merged_count = detection_batch.merged_count + len(exact_matches)
             # Prepare results summary
             results = {
                 "success": True,
                 "aclarai_id": aclarai_id,
                 "block_type": block_type,
                 "candidates_extracted": len(extraction_result.candidates),
-                "candidates_stored": stored_count,
+                "candidates_stored": stored_count + len(exact_updates),
                 "concept_actions": [],
-                "merged_count": detection_batch.merged_count,
+                "merged_count": merged_count,
+                "exact_match_count": len(exact_matches),
                 "promoted_count": detection_batch.promoted_count,
                 "processing_time": detection_batch.processing_time,
                 "updated_candidates": updated_candidates,
             }
             # Add concept action recommendations
-            for result in detection_batch.results:
+            for result in [*exact_matches, *detection_batch.results]:
                 action_info = {
                     "candidate_text": result.candidate_text,
                     "action": result.action.value,
@@ -173,13 +205,14 @@ class ConceptProcessor:
                 results["concept_actions"].append(action_info)
             logger.info(
                 f"Processed {len(extraction_result.candidates)} concept candidates from block {aclarai_id}: "
-                f"{detection_batch.merged_count} merged, {detection_batch.promoted_count} promoted",
+                f"{merged_count} merged ({len(exact_matches)} by exact match), {detection_batch.promoted_count} promoted",
                 extra={
                     "service": "aclarai-core",
                     "filename.function_name": "concept_processor.ConceptProcessor.process_block_for_concepts",
                     "aclarai_id": aclarai_id,
                     "candidates_extracted": len(extraction_result.candidates),
-                    "merged_count": detection_batch.merged_count,
+                    "merged_count": merged_count,
+                    "exact_match_count": len(exact_matches),
                     "promoted_count": detection_batch.promoted_count,
                 },
             )
@@ -203,6 +236,73 @@ class ConceptProcessor:
                 "concept_actions": [],
             }
 
+    def _status_update(
+        self, result: ConceptDetectionResult
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Describe the status change a detection result makes to its candidate.
+        Args:
+            result: Detection result for one candidate
+        Returns:
+            The update reported to callers and the metadata merged into the
+            candidate's row along with its status
+        """
+        update = {
+            "candidate_id": result.candidate_id,
+            "candidate_text": result.candidate_text,
+            "new_status": result.action.value,
+            "confidence": result.confidence,
+            "reason": result.reason,
+        }
+        metadata_updates = {
+            "confidence": result.confidence,
+            "reason": result.reason,
+            "updated_at": datetime.now().isoformat(),
+        }
+        if result.action == ConceptAction.MERGED and result.best_match:
+            update["merged_with"] = {
+                "matched_id": result.best_match.matched_candidate_id,
+                "matched_text": result.best_match.matched_text,
+                "similarity_score": result.best_match.similarity_score,
+            }
+            metadata_updates["merged_with_id"] = result.best_match.matched_candidate_id
+            metadata_updates["similarity_score"] = result.best_match.similarity_score
+            if result.best_match.matched_concept_id:
+                update["merged_with"]["concept_id"] = (
+                    result.best_match.matched_concept_id
+                )
+                metadata_updates["merged_with_concept_id"] = (
+                    result.best_match.matched_concept_id
+                )
+        return update, metadata_updates
+
+    def _record_exact_matches(
+        self,
+        candidates: list[NounPhraseCandidate],
+        results: list[ConceptDetectionResult],
+    ) -> list[dict[str, Any]]:
+        """
+        Persist candidates resolved by exact match as merged, without embedding them.
+        Args:
+            candidates: Candidates resolved by exact match
+            results: Their merge results, in the same order
+        Returns:
+            List of candidate updates that were recorded
+        """
+        if not candidates:
+            return []
+        merges = []
+        updates = []
+        for candidate, result in zip(candidates, results, strict=True):
+            update, metadata_updates = self._status_update(result)
+            merges.append((candidate, metadata_updates))
+            updates.append(update)
+        if not self.candidates_store.store_merged_candidates(merges):
+            return []
+        # A re-synced candidate may still sit in the index as a merge target
+        self.concept_detector.remove_candidates([r.candidate_id for r in results])
+        return updates
+
     def _update_candidate_statuses(
         self,
         detection_batch: ConceptDetectionBatch,
@@ -218,37 +318,18 @@ class ConceptProcessor:
         """
         updates = []
         promoted_concepts = []
+        pending_updates = []
+        status_updates = []
         for result in detection_batch.results:
-            update = {
-                "candidate_id": result.candidate_id,
-                "candidate_text": result.candidate_text,
-                "new_status": result.action.value,
-                "confidence": result.confidence,
-                "reason": result.reason,
-            }
-            # Update candidate status in vector store
-            metadata_updates = {
-                "confidence": result.confidence,
-                "reason": result.reason,
-                "updated_at": datetime.now().isoformat(),
-            }
-            if result.action == ConceptAction.MERGED and result.best_match:
-                update["merged_with"] = {
-                    "matched_id": result.best_match.matched_candidate_id,
-                    "matched_text": result.best_match.matched_text,
-                    "similarity_score": result.best_match.similarity_score,
-                }
-                metadata_updates["merged_with_id"] = (
-                    result.best_match.matched_candidate_id
-                )
-                metadata_updates["similarity_score"] = (
-                    result.best_match.similarity_score
-                )
-            # Update the candidate status in the vector store
-            success = self.candidates_store.update_candidate_status(
-                result.candidate_id, result.action.value, metadata_updates
+            update, metadata_updates = self._status_update(result)
+            pending_updates.append((result, update))
+            status_updates.append(
+                (result.candidate_id, result.action.value, metadata_updates)
             )
-            if success:
+        # Update all candidate statuses in the vector store in one round trip
+        updated_ids = self.candidates_store.update_candidate_statuses(status_updates)
+        for result, update in pending_updates:
+            if result.candidate_id in updated_ids:
                 updates.append(update)
                 # If promoted, prepare for Concept node creation
                 if result.action == ConceptAction.PROMOTED:
@@ -296,6 +377,23 @@ class ConceptProcessor:
                         "concepts_created": len(created_concepts),
                     },
                 )
+                # Later candidates are checked against the new concepts
+                self.concept_detector.add_concepts(
+                    [
+                        {
+                            "concept_id": concept.concept_id,
+                            "text": concept.text,
+                            "source_candidate_id": concept.source_candidate_id,
+                            "normalized_text": candidate_metadata_map.get(
+                                concept.source_candidate_id, {}
+                            ).get("normalized_text"),
+                            "embedding": candidate_metadata_map.get(
+                                concept.source_candidate_id, {}
+                            ).get("embedding"),
+                        }
+                        for concept in created_concepts
+                    ]
+                )
                 # Write Tier 3 Markdown files for created concepts
                 files_written = 0
                 file_write_errors = []
@@ -368,6 +466,7 @@ class ConceptProcessor:
     def build_concept_index(self, force_rebuild: bool = False) -> int:
         """
         Build or rebuild the concept detection index.
+        The canonical concept index is rebuilt from the Concept nodes as well.
         Args:
             force_rebuild: Whether to force rebuild even if index exists
         Returns:
@@ -385,12 +484,14 @@ class ConceptProcessor:
             items_added = self.concept_detector.build_index_from_candidates(
                 force_rebuild
             )
+            concepts_indexed = self._build_canonical_index(force_rebuild)
             logger.info(
                 f"Built concept detection index with {items_added} items",
                 extra={
                     "service": "aclarai-core",
                     "filename.function_name": "concept_processor.ConceptProcessor.build_concept_index",
                     "items_added": items_added,
+                    "concepts_indexed": concepts_indexed,
                 },
             )
             return items_added
@@ -405,6 +506,57 @@ class ConceptProcessor:
             )
             raise
 
+    def close(self) -> None:
+        """Save the detector's indexes so the next start can load them."""
+        try:
+            self.concept_detector.close()
+        except Exception as e:  # noqa: BLE001 - an unsaved index is rebuilt on the next start
+            logger.error(
+                f"Error saving concept indexes on shutdown: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "concept_processor.ConceptProcessor.close",
+                    "error": str(e),
+                },
+            )
+
+    def _build_canonical_index(self, force_rebuild: bool = False) -> int:
+        """
+        Build the detector's canonical concept index from the Concept nodes.
+        Failures are logged and retried on the next call, leaving detection
+        to the candidate index in the meantime.
+        Args:
+            force_rebuild: Rebuild even if a current saved index exists
+        Returns:
+            Number of concepts in the index
+        """
+        try:
+            count = self.concept_detector.build_canonical_index(
+                self._iter_concepts(), force_rebuild
+            )
+        except Exception as e:  # noqa: BLE001 - detection falls back to the candidate index
+            logger.warning(
+                f"Failed to build canonical concept index: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "concept_processor.ConceptProcessor._build_canonical_index",
+                    "error": str(e),
+                },
+            )
+            return 0
+        self._canonical_index_ready = True
+        return count
+
+    def _iter_concepts(self) -> Iterator[dict[str, Any]]:
+        """Read every Concept node page by page."""
+        for page in iter_node_pages(
+            self.neo4j_manager,
+            "Concept",
+            "n.id as id, n.text as text, n.source_candidate_id as source_candidate_id",
+            page_size=graph_read_page_size(self.config),
+        ):
+            yield from page
+
     def get_concept_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about concept candidates and detection.
@@ -412,21 +564,13 @@ class ConceptProcessor:
             Dictionary with various statistics
         """
         try:
-            # Get candidates by status
-            pending_candidates = self.candidates_store.get_candidates_by_status(
-                "pending"
-            )
-            merged_candidates = self.candidates_store.get_candidates_by_status("merged")
-            promoted_candidates = self.candidates_store.get_candidates_by_status(
-                "promoted"
-            )
+            # Count candidates by status in one query rather than loading them
+            counts = self.candidates_store.count_candidates_by_status()
             stats = {
-                "total_candidates": len(pending_candidates)
-                + len(merged_candidates)
-                + len(promoted_candidates),
-                "pending_candidates": len(pending_candidates),
-                "merged_candidates": len(merged_candidates),
-                "promoted_candidates": len(promoted_candidates),
+                "total_candidates": sum(counts.values()),
+                "pending_candidates": counts.get("pending", 0),
+                "merged_candidates": counts.get("merged", 0),
+                "promoted_candidates": counts.get("promoted", 0),
                 "index_size": len(self.concept_detector.id_to_metadata),
                 "similarity_threshold": self.concept_detector.similarity_threshold,
             }
@@ -7,8 +7,8 @@ from vault-watcher and updates graph nodes with proper version checking.
 import json
 import logging
 from pathlib import Path
+from collections.abc import Callable
 from typing import Dict, Any, Optional
-from datetime import datetime
 from aclarai_shared import load_config
 from aclarai_shared.graph.neo4j_manager import Neo4jGraphManager
 from aclarai_shared.mq import RabbitMQManager
@@ -29,6 +29,9 @@ class DirtyBlockConsumer:
         """Initialize the dirty block consumer."""
         self.config = config or load_config(validate=True)
         self.graph_manager = Neo4jGraphManager(self.config)
+        # With a write buffer, block syncs are deferred and messages are acked
+        # only after the flush that contains their writes commits
+        self.write_buffer = self.graph_manager.write_buffer
         self.block_parser = BlockParser()
         self.concept_processor = ConceptProcessor(self.config)
         # Initialize RabbitMQ manager
@@ -62,7 +65,15 @@ class DirtyBlockConsumer:
         # Get channel from manager
         channel = self.rabbitmq_manager.get_channel()
         # Set up message consumer
-        channel.basic_qos(prefetch_count=1)  # Process one message at a time
+        prefetch_count = 1  # Process one message at a time
+        if self.write_buffer is not None:
+            # Keep enough unacked messages in flight to fill a buffer flush
+            prefetch_count = self.write_buffer.max_rows
+            channel.connection.call_later(
+                self.write_buffer.max_delay_seconds,
+                lambda: self._flush_due_writes(channel),
+            )
+        channel.basic_qos(prefetch_count=prefetch_count)
         channel.basic_consume(
             queue=self.queue_name,
             on_message_callback=self._on_message_received,
@@ -87,8 +98,35 @@ class DirtyBlockConsumer:
                 },
             )
             channel.stop_consuming()
+            self._flush_pending_writes()
+            self.concept_processor.close()
             self.disconnect()
 
+    def _flush_due_writes(self, channel) -> None:
+        """Flush buffered writes that reached the age threshold and reschedule."""
+        self.write_buffer.flush_if_due()
+        channel.connection.call_later(
+            self.write_buffer.max_delay_seconds,
+            lambda: self._flush_due_writes(channel),
+        )
+
+    def _flush_pending_writes(self) -> None:
+        """Flush buffered writes so their messages are acked before shutdown."""
+        if self.write_buffer is None:
+            return
+        try:
+            self.graph_manager.flush()
+        except Exception as e:  # noqa: BLE001 - unacked messages are redelivered, whatever failed
+            # Unacked messages are redelivered after reconnecting
+            logger.error(
+                f"DirtyBlockConsumer: Failed to flush buffered writes: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "dirty_block_consumer._flush_pending_writes",
+                    "error": str(e),
+                },
+            )
+
     def _on_message_received(self, channel, method, properties, body) -> None:
         """
         Process a received dirty block message.
@@ -111,6 +149,9 @@ class DirtyBlockConsumer:
                     "file_path": message.get("file_path"),
                 },
             )
+            if self.write_buffer is not None:
+                self._process_deferred(channel, method.delivery_tag, message)
+                return
             # Process the dirty block
             success = self._process_dirty_block(message)
             if success:
@@ -158,11 +199,61 @@ class DirtyBlockConsumer:
             # Reject and requeue for retry
             channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
 
-    def _process_dirty_block(self, message: Dict[str, Any]) -> bool:
+    def _process_deferred(self, channel, delivery_tag, message: dict[str, Any]) -> None:
+        """
+        Process a message whose graph writes go through the write buffer.
+        The message is acked when the flush containing its writes commits and
+        requeued if that flush fails.
+        """
+        aclarai_id = message.get("aclarai_id")
+
+        def _ack() -> None:
+            channel.basic_ack(delivery_tag=delivery_tag)
+            logger.debug(
+                "DirtyBlockConsumer: Graph writes committed, acknowledged message",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "dirty_block_consumer._process_deferred",
+                    "aclarai_id": aclarai_id,
+                },
+            )
+
+        def _requeue(error: Exception) -> None:
+            channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
+            logger.warning(
+                f"DirtyBlockConsumer: Buffered graph write failed, requeuing: {error}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "dirty_block_consumer._process_deferred",
+                    "aclarai_id": aclarai_id,
+                },
+            )
+
+        if not self._process_dirty_block(message, on_commit=_ack, on_failure=_requeue):
+            channel.basic_nack(delivery_tag=delivery_tag, requeue=True)
+            logger.warning(
+                "DirtyBlockConsumer: Failed to process message, requeuing",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "dirty_block_consumer._process_deferred",
+                    "aclarai_id": aclarai_id,
+                },
+            )
+
+    def _process_dirty_block(
+        self,
+        message: dict[str, Any],
+        on_commit: Callable[[], None] | None = None,
+        on_failure: Callable[[Exception], None] | None = None,
+    ) -> bool:
         """
         Process a single dirty block message.
         Args:
             message: The dirty block message from RabbitMQ
+            on_commit: If given, the block sync is deferred to the write buffer
+                and this is called once it commits, after the block's concepts
+                are processed (immediately if the message needs no graph write)
+            on_failure: Called with the error if the deferred write fails
         Returns:
             True if processing was successful, False otherwise
         """
@@ -181,6 +272,8 @@ class DirtyBlockConsumer:
                         "change_type": change_type,
                     },
                 )
+                if on_commit is not None:
+                    on_commit()
                 return True
             # Read and parse the current block from the file
             current_block = self._read_block_from_file(file_path, aclarai_id)
@@ -195,39 +288,23 @@ class DirtyBlockConsumer:
                     },
                 )
                 return False
+            needs_concepts = change_type in ("created", "modified")
+            commit_hook = on_commit
+            if on_commit is not None and needs_concepts:
+                # Concept writes link to the Block node, so with a deferred sync
+                # they run once the flush has committed it, before the ack
+
+                def commit_hook() -> None:
+                    self._process_block_concepts(current_block)
+                    on_commit()
+
             # Sync block with graph using proper version checking
-            sync_success = self._sync_block_with_graph(current_block, file_path)
+            sync_success = self._sync_block_with_graph(
+                current_block, file_path, on_commit=commit_hook, on_failure=on_failure
+            )
             # If sync was successful and this is a new or updated block, process for concepts
-            if sync_success and change_type in ("created", "modified"):
-                try:
-                    concept_result = self.concept_processor.process_block_for_concepts(
-                        current_block,
-                        block_type="claim",  # Assume claim type for now
-                    )
-                    logger.debug(
-                        f"Concept processing completed for block {aclarai_id}: "
-                        f"{concept_result.get('merged_count', 0)} merged, "
-                        f"{concept_result.get('promoted_count', 0)} promoted",
-                        extra={
-                            "service": "aclarai-core",
-                            "filename.function_name": "dirty_block_consumer._process_dirty_block",
-                            "aclarai_id": aclarai_id,
-                            "concept_processing_success": concept_result.get(
-                                "success", False
-                            ),
-                        },
-                    )
-                except Exception as e:
-                    # Don't fail the whole message if concept processing fails
-                    logger.warning(
-                        f"Concept processing failed for block {aclarai_id}: {e}",
-                        extra={
-                            "service": "aclarai-core",
-                            "filename.function_name": "dirty_block_consumer._process_dirty_block",
-                            "aclarai_id": aclarai_id,
-                            "concept_processing_error": str(e),
-                        },
-                    )
+            if sync_success and needs_concepts and on_commit is None:
+                self._process_block_concepts(current_block)
             return sync_success
         except KeyError as e:
             logger.error(
@@ -251,6 +328,42 @@ class DirtyBlockConsumer:
             )
             return False
 
+    def _process_block_concepts(self, block: dict[str, Any]) -> None:
+        """
+        Extract and link concepts for a synced block.
+        Failures are logged and do not fail the message.
+        Args:
+            block: Block dictionary with aclarai_id and semantic_text
+        """
+        aclarai_id = block["aclarai_id"]
+        try:
+            concept_result = self.concept_processor.process_block_for_concepts(
+                block,
+                block_type="claim",  # Assume claim type for now
+            )
+            logger.debug(
+                f"Concept processing completed for block {aclarai_id}: "
+                f"{concept_result.get('merged_count', 0)} merged, "
+                f"{concept_result.get('promoted_count', 0)} promoted",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "dirty_block_consumer._process_block_concepts",
+                    "aclarai_id": aclarai_id,
+                    "concept_processing_success": concept_result.get("success", False),
+                },
+            )
+        except Exception as e:
+            # Don't fail the whole message if concept processing fails
+            logger.warning(
+                f"Concept processing failed for block {aclarai_id}: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "dirty_block_consumer._process_block_concepts",
+                    "aclarai_id": aclarai_id,
+                    "concept_processing_error": str(e),
+                },
+            )
+
     def _read_block_from_file(
         self, file_path: Path, aclarai_id: str
     ) -> Optional[Dict[str, Any]]:
@@ -296,7 +409,13 @@ class DirtyBlockConsumer:
             )
             return None
 
-    def _sync_block_with_graph(self, block: Dict[str, Any], file_path: Path) -> bool:
+    def _sync_block_with_graph(
+        self,
+        block: dict[str, Any],
+        file_path: Path,
+        on_commit: Callable[[], None] | None = None,
+        on_failure: Callable[[Exception], None] | None = None,
+    ) -> bool:
         """
         Synchronize a block with the Neo4j graph using proper version checking.
         Implements the optimistic locking strategy from sprint_4-Block_syncing_loop.md:
@@ -304,20 +423,45 @@ class DirtyBlockConsumer:
         - If vault_ver == graph_ver: Clean update, increment version
         - If vault_ver > graph_ver: Proceed with update (vault is more recent)
         - If vault_ver < graph_ver: Conflict detected, skip update and log
+        The checks and the write run in one query via Neo4jGraphManager.sync_blocks.
         Args:
             block: Block dictionary with aclarai_id, version, semantic_text, content_hash
             file_path: Path to the source file
+            on_commit: If given, queue the sync in the write buffer and call this
+                once the flush commits
+            on_failure: Called with the error if the deferred write fails
         Returns:
-            True if sync was successful, False otherwise
+            True if sync was successful (or queued), False otherwise
         """
         try:
             aclarai_id = block["aclarai_id"]
             vault_version = block["version"]
-            # Get existing block from graph
-            existing_block = self._get_block_from_graph(aclarai_id)
-            if existing_block is None:
-                # New block - create in graph
-                self._create_block_in_graph(block, file_path)
+            if on_commit is not None:
+                # Outcomes are logged by the graph manager when the buffer flushes
+                self.graph_manager.buffer_block_sync(
+                    [block],
+                    source_file=str(file_path),
+                    on_commit=on_commit,
+                    on_failure=on_failure,
+                )
+                logger.debug(
+                    "DirtyBlockConsumer: Queued block sync in write buffer",
+                    extra={
+                        "service": "aclarai-core",
+                        "filename.function_name": "dirty_block_consumer._sync_block_with_graph",
+                        "aclarai_id": aclarai_id,
+                        "file": str(file_path),
+                        "action": "queued",
+                    },
+                )
+                return True
+            # Hash comparison, version check and write happen in one query
+            outcome = self.graph_manager.sync_blocks(
+                [block], source_file=str(file_path)
+            )[0]
+            action = outcome["action"]
+            graph_version = outcome["graph_version"]
+            if action == "create":
                 logger.info(
                     "DirtyBlockConsumer: Created new block in graph",
                     extra={
@@ -329,12 +473,7 @@ class DirtyBlockConsumer:
                     },
                 )
                 return True
-            # Existing block - perform version checking
-            graph_version = existing_block.get("version", 1)
-            existing_hash = existing_block.get("hash", "")
-            new_hash = block["content_hash"]
-            # Check if content actually changed
-            if existing_hash == new_hash:
+            if action == "unchanged":
                 logger.debug(
                     "DirtyBlockConsumer: Block content unchanged, skipping",
                     extra={
@@ -345,8 +484,7 @@ class DirtyBlockConsumer:
                     },
                 )
                 return True
-            # Implement version checking logic
-            if vault_version < graph_version:
+            if action == "conflict":
                 # Conflict detected - vault is stale
                 logger.warning(
                     "DirtyBlockConsumer: Version conflict detected - vault is stale",
@@ -361,23 +499,34 @@ class DirtyBlockConsumer:
                     },
                 )
                 return True  # Skip update but don't fail the message
-            # Proceed with update (vault_ver >= graph_ver)
-            self._update_block_in_graph(block, existing_block, file_path)
-            logger.info(
-                "DirtyBlockConsumer: Updated block in graph",
+            if action == "update":
+                logger.info(
+                    "DirtyBlockConsumer: Updated block in graph",
+                    extra={
+                        "service": "aclarai-core",
+                        "filename.function_name": "dirty_block_consumer._sync_block_with_graph",
+                        "aclarai_id": aclarai_id,
+                        "file": str(file_path),
+                        "action": "update",
+                        "vault_version": vault_version,
+                        "graph_version": graph_version,
+                        "new_version": outcome["version"],
+                        "old_hash": (outcome["old_hash"] or "")[:8],
+                        "new_hash": block["content_hash"][:8],
+                    },
+                )
+                return True
+            logger.error(
+                f"DirtyBlockConsumer: Error syncing block with graph: {outcome.get('error')}",
                 extra={
                     "service": "aclarai-core",
                     "filename.function_name": "dirty_block_consumer._sync_block_with_graph",
                     "aclarai_id": aclarai_id,
                     "file": str(file_path),
-                    "action": "update",
-                    "vault_version": vault_version,
-                    "graph_version": graph_version,
-                    "old_hash": existing_hash[:8],
-                    "new_hash": new_hash[:8],
+                    "error": outcome.get("error"),
                 },
             )
-            return True
+            return False
         except Exception as e:
             logger.error(
                 f"DirtyBlockConsumer: Error syncing block with graph: {e}",
@@ -390,85 +539,3 @@ class DirtyBlockConsumer:
                 },
             )
             return False
-
-    def _get_block_from_graph(self, aclarai_id: str) -> Optional[Dict[str, Any]]:
-        """Get block properties from Neo4j graph by aclarai_id."""
-        cypher_query = """
-        MATCH (b:Block {id: $aclarai_id})
-        RETURN b.id as id, b.text as text, b.hash as hash,
-               b.version as version, b.last_updated as last_updated,
-               b.needs_reprocessing as needs_reprocessing
-        """
-
-        def _execute_get_block():
-            with self.graph_manager.session() as session:
-                result = session.run(cypher_query, aclarai_id=aclarai_id)
-                record = result.single()
-                return dict(record) if record else None
-
-        return self.graph_manager._retry_with_backoff(_execute_get_block)
-
-    def _create_block_in_graph(self, block: Dict[str, Any], file_path: Path):
-        """Create a new block in the Neo4j graph."""
-        current_time = datetime.utcnow().isoformat()
-        cypher_query = """
-        MERGE (b:Block {id: $aclarai_id})
-        ON CREATE SET
-            b.text = $text,
-            b.hash = $hash,
-            b.version = $version,
-            b.last_updated = datetime($last_updated),
-            b.needs_reprocessing = true,
-            b.source_file = $source_file
-        """
-
-        def _execute_create_block():
-            with self.graph_manager.session() as session:
-                session.run(
-                    cypher_query,
-                    aclarai_id=block["aclarai_id"],
-                    text=block["semantic_text"],
-                    hash=block["content_hash"],
-                    version=block["version"],
-                    last_updated=current_time,
-                    source_file=str(file_path),
-                )
-
-        self.graph_manager._retry_with_backoff(_execute_create_block)
-
-    def _update_block_in_graph(
-        self, block: Dict[str, Any], existing_block: Dict[str, Any], file_path: Path
-    ):
-        """
-        Update an existing block in the Neo4j graph.
-        This implements the proper version incrementing as specified:
-        - Increment the graph version (ver = ver + 1)
-        - Mark with needs_reprocessing: true
-        """
-        current_time = datetime.utcnow().isoformat()
-        # Increment the graph version, not use the vault version
-        current_graph_version = existing_block.get("version", 1)
-        new_version = current_graph_version + 1
-        cypher_query = """
-        MATCH (b:Block {id: $aclarai_id})
-        SET b.text = $text,
-            b.hash = $hash,
-            b.version = $version,
-            b.last_updated = datetime($last_updated),
-            b.needs_reprocessing = true,
-            b.source_file = $source_file
-        """
-
-        def _execute_update_block():
-            with self.graph_manager.session() as session:
-                session.run(
-                    cypher_query,
-                    aclarai_id=block["aclarai_id"],
-                    text=block["semantic_text"],
-                    hash=block["content_hash"],
-                    version=new_version,
-                    last_updated=current_time,
-                    source_file=str(file_path),
-                )
-
-        self.graph_manager._retry_with_backoff(_execute_update_block)
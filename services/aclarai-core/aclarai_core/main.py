@@ -9,10 +9,16 @@ This service handles:
 """
 
 import logging
+import signal
 from aclarai_shared import load_config
 from .dirty_block_consumer import DirtyBlockConsumer
 
 
+def _handle_sigterm(signum, frame):
+    """Turn SIGTERM into KeyboardInterrupt so the consumer shuts down cleanly."""
+    raise KeyboardInterrupt
+
+
 def main():
     """Main entry point for the aclarai Core service."""
     try:
@@ -32,6 +38,9 @@ def main():
         # Start the dirty block consumer for reactive sync
         logger.info("Starting dirty block consumer...")
         consumer = DirtyBlockConsumer(config)
+        # Container stops send SIGTERM; handle it like Ctrl+C so buffered
+        # writes are flushed and the concept indexes are saved
+        signal.signal(signal.SIGTERM, _handle_sigterm)
         # This will block and process messages until interrupted
         consumer.start_consuming()
     except ValueError as e:
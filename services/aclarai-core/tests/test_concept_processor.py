@@ -17,6 +17,7 @@ from aclarai_shared.concept_detection.models import (
     ConceptDetectionResult,
     ConceptDetectionBatch,
     ConceptAction,
+    SimilarityMatch,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,7 +38,13 @@ class TestConceptProcessor:
         # Create mock dependencies
         mock_noun_phrase_extractor = Mock()
         mock_candidates_store = Mock()
+        mock_candidates_store.update_candidate_statuses.side_effect = lambda updates: {
+            candidate_id for candidate_id, _, _ in updates
+        }
         mock_concept_detector = Mock()
+        mock_concept_detector.match_exact.side_effect = lambda candidates: (
+            [None] * len(candidates)
+        )
         mock_concept_file_writer = Mock()
         mock_neo4j_manager = Mock()
         # Create processor with injected mocks
@@ -142,6 +149,54 @@ class TestConceptProcessor:
         assert len(result["concept_actions"]) == 2
         assert len(result["updated_candidates"]) == 2
 
+    def test_exact_matches_skip_embedding_and_detection(
+        self, concept_processor, sample_block
+    ):
+        """Test that known phrases bypass the vector store and the ANN search."""
+        candidate = NounPhraseCandidate(
+            text="Machine Learning",
+            normalized_text="machine learning",
+            source_node_id="blk_test_123",
+            source_node_type="claim",
+            aclarai_id="blk_test_123",
+        )
+        concept_processor.noun_phrase_extractor.extract_from_text.return_value = (
+            ExtractionResult(candidates=[candidate])
+        )
+        concept_processor.concept_detector.match_exact.side_effect = None
+        concept_processor.concept_detector.match_exact.return_value = [
+            ConceptDetectionResult(
+                candidate_id="claim_blk_test_123_Machine Learning",
+                candidate_text="Machine Learning",
+                action=ConceptAction.MERGED,
+                similarity_matches=[
+                    SimilarityMatch(
+                        candidate_id="claim_blk_test_123_Machine Learning",
+                        matched_concept_id="concept_ml",
+                        matched_candidate_id="cand_ml",
+                        similarity_score=1.0,
+                        matched_text="machine learning",
+                    )
+                ],
+            )
+        ]
+        result = concept_processor.process_block_for_concepts(sample_block, "claim")
+        assert result["success"] is True
+        assert result["merged_count"] == 1
+        assert result["exact_match_count"] == 1
+        assert result["candidates_stored"] == 1
+        assert result["concept_actions"][0]["best_match"]["similarity"] == 1.0
+        concept_processor.candidates_store.store_candidates.assert_not_called()
+        concept_processor.concept_detector.process_candidates_batch.assert_not_called()
+        # The candidate is still persisted as merged, with its merge target
+        ((stored, metadata),) = (
+            concept_processor.candidates_store.store_merged_candidates.call_args[0][0]
+        )
+        assert stored is candidate
+        assert metadata["merged_with_id"] == "cand_ml"
+        assert metadata["merged_with_concept_id"] == "concept_ml"
+        assert result["updated_candidates"][0]["new_status"] == "merged"
+
     def test_process_block_for_concepts_no_extraction(
         self, concept_processor, sample_block
     ):
@@ -232,12 +287,12 @@ class TestConceptProcessor:
 
     def test_get_concept_statistics(self, concept_processor):
         """Test getting concept statistics."""
-        # Mock the store's get_candidates_by_status method
-        concept_processor.candidates_store.get_candidates_by_status.side_effect = [
-            [{"id": "1"}, {"id": "2"}],  # pending
-            [{"id": "3"}],  # merged
-            [{"id": "4"}, {"id": "5"}, {"id": "6"}],  # promoted
-        ]
+        # Mock the store's count_candidates_by_status method
+        concept_processor.candidates_store.count_candidates_by_status.return_value = {
+            "pending": 2,
+            "merged": 1,
+            "promoted": 3,
+        }
         # Mock the detector's metadata
         concept_processor.concept_detector.id_to_metadata = {"1": {}, "2": {}}
         concept_processor.concept_detector.similarity_threshold = 0.9
@@ -250,6 +305,7 @@ class TestConceptProcessor:
         assert stats["promoted_candidates"] == 3
         assert stats["index_size"] == 2
         assert stats["similarity_threshold"] == 0.9
+        concept_processor.candidates_store.get_candidates_by_status.assert_not_called()
 
     def test_update_candidate_statuses(self, concept_processor):
         """Test updating candidate statuses."""
@@ -303,6 +359,73 @@ class TestConceptProcessor:
         assert updates[1]["new_status"] == "merged"
         assert updates[1]["confidence"] == 0.95
 
+    def test_update_candidate_statuses_indexes_concepts(self, concept_processor):
+        """Test that created concepts reach the canonical concept index."""
+        concept_match = SimilarityMatch(
+            candidate_id="test_2",
+            matched_concept_id="concept_ai",
+            matched_candidate_id="cand_ai",
+            similarity_score=0.97,
+            matched_text="ai",
+        )
+        mock_batch = ConceptDetectionBatch(
+            results=[
+                ConceptDetectionResult(
+                    candidate_id="test_1",
+                    candidate_text="machine learning",
+                    action=ConceptAction.PROMOTED,
+                ),
+                ConceptDetectionResult(
+                    candidate_id="test_2",
+                    candidate_text="artificial intelligence",
+                    action=ConceptAction.MERGED,
+                    similarity_matches=[concept_match],
+                ),
+            ],
+            total_processed=2,
+            merged_count=1,
+            promoted_count=1,
+        )
+        concept = Mock(
+            concept_id="concept_ml",
+            text="machine learning",
+            source_candidate_id="test_1",
+        )
+        concept_processor.neo4j_manager.create_concepts.return_value = [concept]
+        updates = concept_processor._update_candidate_statuses(
+            mock_batch,
+            {
+                "test_1": {
+                    "text": "machine learning",
+                    "normalized_text": "machine learning",
+                    "embedding": [0.1] * 384,
+                },
+                "test_2": {"text": "artificial intelligence", "embedding": [0.2] * 384},
+            },
+        )
+        assert updates[1]["merged_with"]["concept_id"] == "concept_ai"
+        # Both statuses are written with a single bulk update
+        store = concept_processor.candidates_store
+        store.update_candidate_statuses.assert_called_once()
+        status_updates = store.update_candidate_statuses.call_args[0][0]
+        assert [(c, status) for c, status, _ in status_updates] == [
+            ("test_1", "promoted"),
+            ("test_2", "merged"),
+        ]
+        assert status_updates[1][2]["merged_with_concept_id"] == "concept_ai"
+        store.update_candidate_status.assert_not_called()
+        concept_processor.concept_detector.add_concepts.assert_called_once_with(
+            [
+                {
+                    "concept_id": "concept_ml",
+                    "text": "machine learning",
+                    "source_candidate_id": "test_1",
+                    "normalized_text": "machine learning",
+                    "embedding": [0.1] * 384,
+                }
+            ]
+        )
+
 
 class TestConceptProcessorIntegration:
     """Integration tests for ConceptProcessor with real services."""
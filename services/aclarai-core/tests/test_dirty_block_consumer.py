@@ -109,6 +109,17 @@ Another claim. <!-- aclarai:id=clm_other ver=1 -->
         assert block["version"] == 2
         assert "This is the target claim." in block["semantic_text"]
 
+    @staticmethod
+    def _outcome(aclarai_id, action, graph_version=None, version=None):
+        """Build a sync_blocks outcome."""
+        return {
+            "aclarai_id": aclarai_id,
+            "action": action,
+            "graph_version": graph_version,
+            "version": version,
+            "old_hash": "old_hash",
+        }
+
     def test_sync_block_new_block(self, consumer):
         """Test syncing a new block (not in graph)."""
         block = {
@@ -117,13 +128,14 @@ Another claim. <!-- aclarai:id=clm_other ver=1 -->
             "semantic_text": "This is a new claim.",
             "content_hash": "abc123",
         }
-        # Mock graph manager to return None (block doesn't exist)
-        consumer._get_block_from_graph = Mock(return_value=None)
-        consumer._create_block_in_graph = Mock()
+        consumer.graph_manager.sync_blocks = Mock(
+            return_value=[self._outcome("clm_new123", "create", None, 1)]
+        )
         result = consumer._sync_block_with_graph(block, Path("test.md"))
         assert result is True
-        consumer._get_block_from_graph.assert_called_once_with("clm_new123")
-        consumer._create_block_in_graph.assert_called_once()
+        consumer.graph_manager.sync_blocks.assert_called_once_with(
+            [block], source_file="test.md"
+        )
 
     def test_sync_block_unchanged_content(self, consumer):
         """Test syncing a block with unchanged content."""
@@ -133,18 +145,11 @@ Another claim. <!-- aclarai:id=clm_other ver=1 -->
             "semantic_text": "This is an existing claim.",
             "content_hash": "same_hash",
         }
-        existing_block = {
-            "id": "clm_existing",
-            "version": 2,
-            "hash": "same_hash",  # Same hash = no change
-            "text": "This is an existing claim.",
-        }
-        consumer._get_block_from_graph = Mock(return_value=existing_block)
-        consumer._update_block_in_graph = Mock()
+        consumer.graph_manager.sync_blocks = Mock(
+            return_value=[self._outcome("clm_existing", "unchanged", 2, 2)]
+        )
         result = consumer._sync_block_with_graph(block, Path("test.md"))
         assert result is True
-        # Should not call update since content is unchanged
-        consumer._update_block_in_graph.assert_not_called()
 
     def test_sync_block_version_conflict(self, consumer):
         """Test version conflict detection (vault older than graph)."""
@@ -154,18 +159,11 @@ Another claim. <!-- aclarai:id=clm_other ver=1 -->
             "semantic_text": "This is a conflicted claim.",
             "content_hash": "new_hash",
         }
-        existing_block = {
-            "id": "clm_conflict",
-            "version": 3,  # Graph version 3 > vault version 1
-            "hash": "old_hash",
-            "text": "Previous version",
-        }
-        consumer._get_block_from_graph = Mock(return_value=existing_block)
-        consumer._update_block_in_graph = Mock()
+        consumer.graph_manager.sync_blocks = Mock(
+            return_value=[self._outcome("clm_conflict", "conflict", 3, 3)]
+        )
         result = consumer._sync_block_with_graph(block, Path("test.md"))
         assert result is True  # Don't fail, but skip update
-        # Should not call update due to version conflict
-        consumer._update_block_in_graph.assert_not_called()
 
     def test_sync_block_successful_update(self, consumer):
         """Test successful block update (vault newer or equal)."""
@@ -175,47 +173,25 @@ Another claim. <!-- aclarai:id=clm_other ver=1 -->
             "semantic_text": "This is an updated claim.",
             "content_hash": "new_hash",
         }
-        existing_block = {
-            "id": "clm_update",
-            "version": 2,  # Graph version 2 < vault version 3
-            "hash": "old_hash",
-            "text": "Previous version",
-        }
-        consumer._get_block_from_graph = Mock(return_value=existing_block)
-        consumer._update_block_in_graph = Mock()
+        consumer.graph_manager.sync_blocks = Mock(
+            return_value=[self._outcome("clm_update", "update", 2, 3)]
+        )
         result = consumer._sync_block_with_graph(block, Path("test.md"))
         assert result is True
-        # Should call update since vault is newer
-        consumer._update_block_in_graph.assert_called_once()
 
-    @patch("aclarai_core.dirty_block_consumer.datetime")
-    def test_update_block_increments_version(self, mock_datetime, consumer):
-        """Test that updating a block increments the graph version."""
-        mock_datetime.utcnow.return_value.isoformat.return_value = "2024-01-01T00:00:00"
+    def test_sync_block_failed_batch(self, consumer):
+        """Test that a failed graph write fails the message so it is requeued."""
         block = {
-            "aclarai_id": "clm_increment",
-            "semantic_text": "Updated text",
-            "content_hash": "new_hash",
-        }
-        existing_block = {
-            "version": 5  # Current graph version
+            "aclarai_id": "clm_error",
+            "version": 1,
+            "semantic_text": "This claim could not be written.",
+            "content_hash": "hash",
         }
-        # Mock the graph manager
-        mock_session = Mock()
-        consumer.graph_manager.session.return_value.__enter__.return_value = (
-            mock_session
-        )
-        consumer.graph_manager._retry_with_backoff = Mock(
-            side_effect=lambda func: func()
-        )
-        consumer._update_block_in_graph(block, existing_block, Path("test.md"))
-        # Verify the Cypher query was called with incremented version (5 + 1 = 6)
-        mock_session.run.assert_called_once()
-        call_args = mock_session.run.call_args
-        assert call_args[1]["version"] == 6  # Should be incremented
-        assert call_args[1]["aclarai_id"] == "clm_increment"
-        assert call_args[1]["text"] == "Updated text"
-        assert call_args[1]["hash"] == "new_hash"
+        outcome = self._outcome("clm_error", "error")
+        outcome["error"] = "ServiceUnavailable"
+        consumer.graph_manager.sync_blocks = Mock(return_value=[outcome])
+        result = consumer._sync_block_with_graph(block, Path("test.md"))
+        assert result is False
 
     def test_process_dirty_block_deleted(self, consumer):
         """Test processing deleted block messages."""
@@ -248,7 +224,9 @@ Another claim. <!-- aclarai:id=clm_other ver=1 -->
         result = consumer._process_dirty_block(message)
         assert result is True
         mock_read.assert_called_once_with(Path("test.md"), "clm_modified")
-        mock_sync.assert_called_once_with(mock_block, Path("test.md"))
+        mock_sync.assert_called_once_with(
+            mock_block, Path("test.md"), on_commit=None, on_failure=None
+        )
 
     def test_process_dirty_block_missing_fields(self, consumer):
         """Test processing message with missing required fields."""
@@ -258,3 +236,35 @@ Another claim. <!-- aclarai:id=clm_other ver=1 -->
         }
         result = consumer._process_dirty_block(message)
         assert result is False
+
+    @patch.object(DirtyBlockConsumer, "_read_block_from_file")
+    def test_deferred_sync_acks_after_commit(self, mock_read, consumer):
+        """Test that with a write buffer the message is acked only after commit."""
+        mock_read.return_value = {
+            "aclarai_id": "clm_buffered",
+            "version": 1,
+            "semantic_text": "Buffered claim.",
+            "content_hash": "hash",
+        }
+        hooks = {}
+        consumer.graph_manager.buffer_block_sync = Mock(
+            side_effect=lambda _blocks, **kwargs: hooks.update(kwargs)
+        )
+        channel = Mock()
+        message = {
+            "aclarai_id": "clm_buffered",
+            "file_path": "test.md",
+            "change_type": "modified",
+        }
+        process_concepts = consumer.concept_processor.process_block_for_concepts
+        consumer._process_deferred(channel, 7, message)
+        # Queued in the buffer, not yet acknowledged
+        channel.basic_ack.assert_not_called()
+        channel.basic_nack.assert_not_called()
+        # Concepts link to the Block node, so they wait for its sync to commit
+        process_concepts.assert_not_called()
+        hooks["on_commit"]()
+        process_concepts.assert_called_once()
+        channel.basic_ack.assert_called_once_with(delivery_tag=7)
+        hooks["on_failure"](RuntimeError("flush failed"))
+        channel.basic_nack.assert_called_once_with(delivery_tag=7, requeue=True)
@@ -0,0 +1,423 @@
+"""
+Bulk initial load of the vault into the Neo4j knowledge graph.
+Syncing a large vault for the first time through VaultSyncJob issues one
+MERGE per block. This module instead scans the vault in parallel, writes the
+aclarai:id blocks to a CSV file and loads it in bulk:
+- admin-import: for an empty database. The CSV is written with a
+  neo4j-admin header and loaded offline with `neo4j-admin database import
+  full`; constraints and indexes are created afterwards by `finalize`, which
+  is faster than maintaining them during the import.
+- load-csv: for a running (possibly non-empty) database. The CSV is read by
+  the server with LOAD CSV and committed every rows_per_transaction rows.
+  Without a shared import directory, blocks are sent as UNWIND batches.
+Both modes record the scan start time as the vault_sync watermark, so the
+periodic VaultSyncJob only rescans files changed after the load. Claim and
+Sentence nodes and their ORIGINATES_FROM relationships are not stored in the
+vault; they are produced from the loaded blocks by Claimify (e.g. the
+claimify backfill) and are not part of the bulk load.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from aclarai_shared import load_config
+from aclarai_shared.graph.neo4j_manager import Neo4jGraphManager
+from aclarai_shared.vault import BlockParser
+
+from .vault_sync import WATERMARK_NAME
+
+logger = logging.getLogger(__name__)
+
+BLOCKS_FILE = "blocks.csv"
+MANIFEST_FILE = "bulk_load_manifest.json"
+# Header read by LOAD CSV WITH HEADERS
+BLOCK_COLUMNS = ("id", "text", "hash", "version", "source_file")
+# Header read by neo4j-admin import: id space, property types and label
+ADMIN_IMPORT_COLUMNS = (
+    "id:ID(Block)",
+    "text",
+    "hash",
+    "version:int",
+    "source_file",
+    "needs_reprocessing:boolean",
+    "last_updated:datetime",
+    ":LABEL",
+)
+
+# Same create/update/conflict semantics as BLOCK_SYNC_QUERY, one row at a time.
+# Runs in an auto-commit transaction; {rows} is the periodic commit size.
+LOAD_CSV_BLOCKS_QUERY = """
+LOAD CSV WITH HEADERS FROM $url AS row
+CALL {{
+    WITH row
+    MERGE (b:Block {{id: row.id}})
+    ON CREATE SET
+        b.text = row.text,
+        b.hash = row.hash,
+        b.version = toInteger(row.version),
+        b.last_updated = datetime(),
+        b.needs_reprocessing = true,
+        b.source_file = row.source_file
+    WITH b, row
+    WHERE b.hash <> row.hash AND toInteger(row.version) >= coalesce(b.version, 1)
+    SET b.text = row.text,
+        b.hash = row.hash,
+        b.version = coalesce(b.version, 1) + 1,
+        b.last_updated = datetime(),
+        b.needs_reprocessing = true,
+        b.source_file = row.source_file
+}} IN TRANSACTIONS OF {rows} ROWS
+"""
+
+DEFAULT_BULK_LOAD_SETTINGS: Dict[str, Any] = {
+    "scan_workers": 4,
+    "import_dir": "",
+    "import_url": "file:///",
+    "rows_per_transaction": 10000,
+    "admin_command": "neo4j-admin",
+}
+
+
+def bulk_load_settings(config: Any) -> Dict[str, Any]:
+    """
+    Get the bulk load settings.
+    Args:
+        config: aclarai configuration
+    Returns:
+        processing.bulk_load merged over DEFAULT_BULK_LOAD_SETTINGS
+    """
+    settings = dict(DEFAULT_BULK_LOAD_SETTINGS)
+    processing = getattr(config, "processing", {})
+    if isinstance(processing, dict) and isinstance(processing.get("bulk_load"), dict):
+        settings.update(processing["bulk_load"])
+    return settings
+
+
+class VaultBulkLoadJob:
+    """
+    Loads every aclarai:id block of the vault into Neo4j in bulk.
+    Intended for first-time ingestion of a large vault; afterwards the
+    periodic VaultSyncJob keeps the graph in sync from the recorded watermark.
+    """
+
+    def __init__(self, config=None, graph_manager: Optional[Neo4jGraphManager] = None):
+        """
+        Initialize the bulk load job.
+        Args:
+            config: aclarai configuration (loaded if None)
+            graph_manager: Graph manager to use; created on first use, since
+                preparing an admin import runs while the database is stopped
+        """
+        self.config = config or load_config(validate=True)
+        self.graph_manager = graph_manager
+        self.vault_path = Path(self.config.vault_path)
+        self.tier_paths = [
+            self.vault_path / self.config.paths.tier1,
+            self.vault_path / self.config.paths.tier2,
+            self.vault_path / self.config.paths.tier3,
+        ]
+        settings = bulk_load_settings(self.config)
+        self.scan_workers = max(int(settings["scan_workers"]), 1)
+        self.import_dir = settings["import_dir"] or None
+        self.import_url = settings["import_url"]
+        self.rows_per_transaction = max(int(settings["rows_per_transaction"]), 1)
+        self.admin_command = settings["admin_command"]
+
+    def _graph(self) -> Neo4jGraphManager:
+        """Get the graph manager, connecting on first use."""
+        if self.graph_manager is None:
+            self.graph_manager = Neo4jGraphManager(self.config)
+        return self.graph_manager
+
+    def scan_vault(self) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Parse the aclarai:id blocks of every tier in parallel.
+        Returns:
+            Tuple of (blocks tagged with source_file, scan statistics); when an
+            id appears in several files, the first file in path order wins
+        """
+        md_files = [
+            md_file
+            for tier_path in self.tier_paths
+            if tier_path.exists()
+            for md_file in sorted(tier_path.glob("**/*.md"))
+        ]
+        stats = {"files_processed": 0, "blocks": 0, "duplicates": 0, "errors": 0}
+        if self.scan_workers > 1 and len(md_files) > 1:
+            chunksize = max(len(md_files) // (self.scan_workers * 4), 1)
+            with ProcessPoolExecutor(max_workers=self.scan_workers) as executor:
+                parsed = list(executor.map(_parse_file, md_files, chunksize=chunksize))
+        else:
+            parsed = [_parse_file(md_file) for md_file in md_files]
+        blocks: Dict[str, Dict[str, Any]] = {}
+        for md_file, (file_blocks, error) in zip(md_files, parsed, strict=True):
+            stats["files_processed"] += 1
+            if error is not None:
+                stats["errors"] += 1
+                logger.error(
+                    f"bulk_load.scan_vault: Error processing file {md_file}: {error}",
+                    extra={
+                        "service": "aclarai-scheduler",
+                        "filename.function_name": "bulk_load.scan_vault",
+                        "file": str(md_file),
+                        "error": error,
+                    },
+                )
+                continue
+            for block in file_blocks:
+                if block["aclarai_id"] in blocks:
+                    stats["duplicates"] += 1
+                    continue
+                blocks[block["aclarai_id"]] = block
+        stats["blocks"] = len(blocks)
+        logger.info(
+            f"bulk_load.scan_vault: Found {len(blocks)} blocks in {len(md_files)} files",
+            extra={
+                "service": "aclarai-scheduler",
+                "filename.function_name": "bulk_load.scan_vault",
+                **stats,
+            },
+        )
+        return list(blocks.values()), stats
+
+    def write_blocks_csv(
+        self,
+        blocks: List[Dict[str, Any]],
+        output_dir: Path,
+        admin_import: bool = False,
+    ) -> Path:
+        """
+        Write blocks to a CSV file.
+        Args:
+            blocks: Parsed blocks tagged with source_file
+            output_dir: Directory to write BLOCKS_FILE to
+            admin_import: Write the neo4j-admin header instead of plain names
+        Returns:
+            Path of the written file
+        """
+        output_dir.mkdir(parents=True, exist_ok=True)
+        csv_path = output_dir / BLOCKS_FILE
+        loaded_at = datetime.now(timezone.utc).isoformat()
+        with csv_path.open("w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(ADMIN_IMPORT_COLUMNS if admin_import else BLOCK_COLUMNS)
+            for block in blocks:
+                row = [
+                    block["aclarai_id"],
+                    block["semantic_text"],
+                    block["content_hash"],
+                    block["version"],
+                    block["source_file"],
+                ]
+                if admin_import:
+                    row.extend(["true", loaded_at, "Block"])
+                writer.writerow(row)
+        return csv_path
+
+    def admin_import_command(self, csv_path: Path) -> List[str]:
+        """
+        Build the neo4j-admin command importing the blocks CSV.
+        Args:
+            csv_path: Blocks CSV written with the neo4j-admin header
+        Returns:
+            Command line as a list of arguments
+        """
+        database = self.config.neo4j.database or "neo4j"
+        return [
+            self.admin_command,
+            "database",
+            "import",
+            "full",
+            f"--nodes={csv_path}",
+            "--multiline-fields=true",
+            database,
+        ]
+
+    def prepare_admin_import(
+        self, output_dir: Path, execute: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Scan the vault and write the CSV and manifest for neo4j-admin import.
+        The target database must be empty and stopped. Run finalize() once it
+        is started again.
+        Args:
+            output_dir: Directory for the CSV file and manifest
+            execute: Run the import command (requires neo4j-admin locally)
+        Returns:
+            Scan statistics with the import command
+        """
+        watermark = time.time()
+        blocks, stats = self.scan_vault()
+        csv_path = self.write_blocks_csv(blocks, output_dir, admin_import=True)
+        command = self.admin_import_command(csv_path)
+        stats["command"] = command
+        manifest = {"watermark": watermark, "csv": str(csv_path), **stats}
+        (output_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+        logger.info(
+            f"bulk_load.prepare_admin_import: Wrote {stats['blocks']} blocks; import with: {' '.join(command)}",
+            extra={
+                "service": "aclarai-scheduler",
+                "filename.function_name": "bulk_load.prepare_admin_import",
+                "csv": str(csv_path),
+                "blocks_count": stats["blocks"],
+            },
+        )
+        if execute:
+            subprocess.run(command, check=True)
+        return stats
+
+    def finalize(self, output_dir: Path) -> Dict[str, Any]:
+        """
+        Create constraints and indexes and record the watermark after an
+        admin import.
+        Args:
+            output_dir: Directory holding the manifest of prepare_admin_import
+        Returns:
+            The manifest
+        """
+        manifest = json.loads((output_dir / MANIFEST_FILE).read_text())
+        graph = self._graph()
+        graph.setup_schema()
+        self._record_watermark(manifest["watermark"], manifest["errors"])
+        return manifest
+
+    def load_csv(self) -> Dict[str, Any]:
+        """
+        Scan the vault and load its blocks into the running database.
+        The uniqueness constraint on Block.id is created first, since every
+        row is merged on it.
+        Returns:
+            Scan and load statistics
+        """
+        start_time = time.time()
+        blocks, stats = self.scan_vault()
+        graph = self._graph()
+        graph.setup_schema()
+        if self.import_dir:
+            csv_path = self.write_blocks_csv(blocks, Path(self.import_dir))
+            stats.update(self._run_load_csv(csv_path.name))
+        else:
+            outcomes = graph.sync_blocks(blocks)
+            stats["errors"] += sum(
+                1 for outcome in outcomes if outcome["action"] == "error"
+            )
+        self._record_watermark(start_time, stats["errors"])
+        stats["duration"] = time.time() - start_time
+        logger.info(
+            f"bulk_load.load_csv: Loaded {stats['blocks']} blocks in {stats['duration']:.1f}s",
+            extra={
+                "service": "aclarai-scheduler",
+                "filename.function_name": "bulk_load.load_csv",
+                "blocks_count": stats["blocks"],
+                "errors": stats["errors"],
+                "duration": stats["duration"],
+            },
+        )
+        return stats
+
+    def _run_load_csv(self, file_name: str) -> Dict[str, int]:
+        """
+        Run LOAD CSV over a file in the server's import directory.
+        CALL { ... } IN TRANSACTIONS must run in an auto-commit transaction,
+        so this uses a plain session instead of a transaction function.
+        """
+        query = LOAD_CSV_BLOCKS_QUERY.format(rows=self.rows_per_transaction)
+        url = f"{self.import_url}{file_name}"
+        with self._graph().session() as session:
+            summary = session.run(query, url=url).consume()
+        counters = summary.counters
+        return {
+            "nodes_created": counters.nodes_created,
+            "properties_set": counters.properties_set,
+        }
+
+    def _record_watermark(self, watermark: float, errors: int) -> None:
+        """Record the watermark unless files failed, which keeps full scans."""
+        if errors:
+            logger.warning(
+                f"bulk_load._record_watermark: {errors} errors, not recording a watermark",
+                extra={
+                    "service": "aclarai-scheduler",
+                    "filename.function_name": "bulk_load._record_watermark",
+                    "errors": errors,
+                },
+            )
+            return
+        self._graph().set_sync_watermark(WATERMARK_NAME, watermark)
+
+    def close(self):
+        """Clean up resources."""
+        if self.graph_manager is not None:
+            self.graph_manager.close()
+
+
+def _parse_file(file_path: Path) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Parse one Markdown file in a worker process.
+    Returns:
+        Tuple of (blocks tagged with source_file, error message or None)
+    """
+    try:
+        content = file_path.read_text(encoding="utf-8")
+        blocks = BlockParser().extract_aclarai_blocks(content)
+    except Exception as e:
+        return [], str(e)
+    return [{**block, "source_file": str(file_path)} for block in blocks], None
+
+
+def main():
+    """Command-line entry point for the bulk initial load."""
+    parser = argparse.ArgumentParser(
+        description="Bulk load the vault's aclarai:id blocks into Neo4j",
+    )
+    parser.add_argument(
+        "mode",
+        choices=["load-csv", "admin-import", "finalize"],
+        help="load-csv into a running database, or admin-import into an empty "
+        "stopped one followed by finalize once it is started",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=None,
+        help="Directory for the admin-import CSV and manifest "
+        "(default: processing.bulk_load.import_dir)",
+    )
+    parser.add_argument(
+        "--execute",
+        action="store_true",
+        help="Run neo4j-admin after writing the admin-import CSV",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    job = VaultBulkLoadJob()
+    try:
+        if args.mode == "load-csv":
+            result = job.load_csv()
+        else:
+            output_dir = args.output_dir or (
+                Path(job.import_dir) if job.import_dir else None
+            )
+            if output_dir is None:
+                parser.error("--output-dir or processing.bulk_load.import_dir required")
+            if args.mode == "admin-import":
+                result = job.prepare_admin_import(output_dir, execute=args.execute)
+            else:
+                result = job.finalize(output_dir)
+    finally:
+        job.close()
+    print(json.dumps(result, indent=2, default=str))
+    return 0 if not result.get("errors") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,9 +7,8 @@ through content hashing and updating graph nodes accordingly.
 
 import logging
 import time
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from aclarai_shared import load_config
 from aclarai_shared.graph.neo4j_manager import Neo4jGraphManager
@@ -17,12 +16,20 @@ from aclarai_shared.vault import BlockParser
 
 logger = logging.getLogger(__name__)
 
+# Blocks collected from consecutive files before they are synced with the graph
+MAX_PENDING_BLOCKS = 5000
+# SyncState entry holding the time up to which the vault has been loaded
+WATERMARK_NAME = "vault_sync"
+
 
 class VaultSyncJob:
     """
     Job for synchronizing vault Markdown files with Neo4j graph.
     Follows the block-level synchronization strategy from
     docs/arch/on-graph_vault_synchronization.md.
+    Once a watermark has been recorded (by the bulk initial load or a previous
+    error-free run), files not modified since the watermark are skipped and
+    the watermark advances after every error-free run.
     """
 
     def __init__(self, config=None):
@@ -55,15 +62,18 @@ class VaultSyncJob:
             # Statistics tracking
             stats = {
                 "files_processed": 0,
+                "files_skipped": 0,
                 "blocks_processed": 0,
                 "blocks_unchanged": 0,
                 "blocks_updated": 0,
                 "blocks_new": 0,
+                "blocks_conflicted": 0,
                 "errors": 0,
                 "start_time": start_time,
                 "end_time": None,
                 "duration": None,
             }
+            watermark = self._load_watermark()
             # Process Tier 1 files (required)
             logger.info(
                 "vault_sync.run_sync: Processing Tier 1 files",
@@ -74,7 +84,7 @@ class VaultSyncJob:
                     "path": str(self.tier1_path),
                 },
             )
-            tier1_stats = self._process_tier_files(self.tier1_path, "tier1")
+            tier1_stats = self._process_tier_files(self.tier1_path, "tier1", watermark)
             self._merge_stats(stats, tier1_stats)
             # Process other tiers if they contain aclarai:id blocks
             for tier_name, tier_path in [
@@ -91,8 +101,14 @@ class VaultSyncJob:
                             "path": str(tier_path),
                         },
                     )
-                    tier_stats = self._process_tier_files(tier_path, tier_name)
+                    tier_stats = self._process_tier_files(
+                        tier_path, tier_name, watermark
+                    )
                     self._merge_stats(stats, tier_stats)
+            # Files changed during this run are newer than start_time and are
+            # picked up by the next run
+            if watermark is not None and stats["errors"] == 0:
+                self._store_watermark(start_time)
             # Finalize stats
             end_time = time.time()
             stats["end_time"] = end_time
@@ -103,9 +119,11 @@ class VaultSyncJob:
                     "service": "aclarai-scheduler",
                     "filename.function_name": "vault_sync.run_sync",
                     "files_processed": stats["files_processed"],
+                    "files_skipped": stats["files_skipped"],
                     "blocks_processed": stats["blocks_processed"],
                     "blocks_updated": stats["blocks_updated"],
                     "blocks_new": stats["blocks_new"],
+                    "blocks_conflicted": stats["blocks_conflicted"],
                     "duration": stats["duration"],
                     "errors": stats["errors"],
                 },
@@ -122,14 +140,26 @@ class VaultSyncJob:
             )
             raise
 
-    def _process_tier_files(self, tier_path: Path, tier_name: str) -> Dict[str, int]:
-        """Process all Markdown files in a tier directory."""
+    def _process_tier_files(
+        self, tier_path: Path, tier_name: str, watermark: Optional[float] = None
+    ) -> Dict[str, int]:
+        """
+        Process all Markdown files in a tier directory.
+        Blocks from consecutive files are synced together, so the number of
+        graph round trips depends on the number of batches, not blocks.
+        Args:
+            tier_path: Tier directory to scan
+            tier_name: Tier name for logging
+            watermark: Skip files not modified since this Unix timestamp
+        """
         stats = {
             "files_processed": 0,
+            "files_skipped": 0,
             "blocks_processed": 0,
             "blocks_unchanged": 0,
             "blocks_updated": 0,
             "blocks_new": 0,
+            "blocks_conflicted": 0,
             "errors": 0,
         }
         if not tier_path.exists():
@@ -154,11 +184,13 @@ class VaultSyncJob:
                 "file_count": len(md_files),
             },
         )
+        pending_blocks: List[Dict[str, Any]] = []
         for md_file in md_files:
+            if watermark is not None and not _modified_since(md_file, watermark):
+                stats["files_skipped"] += 1
+                continue
             try:
-                file_stats = self._process_markdown_file(md_file, tier_name)
-                self._merge_stats(stats, file_stats)
-                stats["files_processed"] += 1
+                blocks = self._extract_file_blocks(md_file, tier_name)
             except Exception as e:
                 logger.error(
                     f"vault_sync._process_tier_files: Error processing file {md_file}: {e}",
@@ -171,236 +203,229 @@ class VaultSyncJob:
                     },
                 )
                 stats["errors"] += 1
+                stats["files_processed"] += 1
+                continue
+            pending_blocks.extend(blocks)
+            stats["files_processed"] += 1
+            if len(pending_blocks) >= MAX_PENDING_BLOCKS:
+                self._merge_stats(stats, self._sync_blocks_with_graph(pending_blocks))
+                pending_blocks = []
+        if pending_blocks:
+            self._merge_stats(stats, self._sync_blocks_with_graph(pending_blocks))
         return stats
 
     def _process_markdown_file(self, file_path: Path, tier_name: str) -> Dict[str, int]:
         """Process a single Markdown file for aclarai:id blocks."""
-        stats = {
-            "blocks_processed": 0,
-            "blocks_unchanged": 0,
-            "blocks_updated": 0,
-            "blocks_new": 0,
-            "errors": 0,
-        }
         try:
-            # Read file content
-            content = file_path.read_text(encoding="utf-8")
-            # Extract aclarai:id blocks
-            blocks = self.block_parser.extract_aclarai_blocks(content)
-            if not blocks:
-                logger.debug(
-                    f"vault_sync._process_markdown_file: No aclarai:id blocks found in {file_path}",
-                    extra={
-                        "service": "aclarai-scheduler",
-                        "filename.function_name": "vault_sync._process_markdown_file",
-                        "file": str(file_path),
-                        "tier": tier_name,
-                    },
-                )
-                return stats
-            logger.debug(
-                f"vault_sync._process_markdown_file: Found {len(blocks)} aclarai:id blocks in {file_path}",
+            blocks = self._extract_file_blocks(file_path, tier_name)
+        except Exception as e:
+            logger.error(
+                f"vault_sync._process_markdown_file: Error reading file {file_path}: {e}",
                 extra={
                     "service": "aclarai-scheduler",
                     "filename.function_name": "vault_sync._process_markdown_file",
                     "file": str(file_path),
-                    "tier": tier_name,
-                    "block_count": len(blocks),
+                    "error": str(e),
                 },
             )
-            # Process each block
-            for block in blocks:
-                try:
-                    block_stats = self._sync_block_with_graph(block, file_path)
-                    self._merge_stats(stats, block_stats)
-                    stats["blocks_processed"] += 1
-                except Exception as e:
-                    logger.error(
-                        f"vault_sync._process_markdown_file: Error processing block {block.get('aclarai_id', 'unknown')}: {e}",
-                        extra={
-                            "service": "aclarai-scheduler",
-                            "filename.function_name": "vault_sync._process_markdown_file",
-                            "file": str(file_path),
-                            "aclarai_id": block.get("aclarai_id", "unknown"),
-                            "error": str(e),
-                        },
-                    )
-                    stats["errors"] += 1
-        except Exception as e:
-            logger.error(
-                f"vault_sync._process_markdown_file: Error reading file {file_path}: {e}",
+            return {
+                "blocks_processed": 0,
+                "blocks_unchanged": 0,
+                "blocks_updated": 0,
+                "blocks_new": 0,
+                "blocks_conflicted": 0,
+                "errors": 1,
+            }
+        return self._sync_blocks_with_graph(blocks)
+
+    def _extract_file_blocks(
+        self, file_path: Path, tier_name: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a Markdown file and extract its aclarai:id blocks.
+        Returns:
+            Parsed blocks, each tagged with its source_file
+        """
+        # Read file content
+        content = file_path.read_text(encoding="utf-8")
+        # Extract aclarai:id blocks
+        blocks = self.block_parser.extract_aclarai_blocks(content)
+        if not blocks:
+            logger.debug(
+                f"vault_sync._extract_file_blocks: No aclarai:id blocks found in {file_path}",
                 extra={
                     "service": "aclarai-scheduler",
-                    "filename.function_name": "vault_sync._process_markdown_file",
+                    "filename.function_name": "vault_sync._extract_file_blocks",
                     "file": str(file_path),
-                    "error": str(e),
+                    "tier": tier_name,
                 },
             )
-            stats["errors"] += 1
-        return stats
+            return []
+        logger.debug(
+            f"vault_sync._extract_file_blocks: Found {len(blocks)} aclarai:id blocks in {file_path}",
+            extra={
+                "service": "aclarai-scheduler",
+                "filename.function_name": "vault_sync._extract_file_blocks",
+                "file": str(file_path),
+                "tier": tier_name,
+                "block_count": len(blocks),
+            },
+        )
+        return [{**block, "source_file": str(file_path)} for block in blocks]
 
-    def _sync_block_with_graph(
-        self, block: Dict[str, Any], file_path: Path
-    ) -> Dict[str, int]:
+    def _sync_blocks_with_graph(self, blocks: List[Dict[str, Any]]) -> Dict[str, int]:
         """
-        Synchronize a single block with the Neo4j graph.
+        Synchronize blocks with the Neo4j graph in batched queries.
+        Hash comparison, version conflict detection and version increments
+        are done by Neo4jGraphManager.sync_blocks.
         Returns stats about the sync operation.
         """
         stats = {
+            "blocks_processed": 0,
             "blocks_unchanged": 0,
             "blocks_updated": 0,
             "blocks_new": 0,
+            "blocks_conflicted": 0,
             "errors": 0,
         }
-        aclarai_id = block["aclarai_id"]
+        if not blocks:
+            return stats
         try:
-            # Get existing block from graph
-            existing_block = self._get_block_from_graph(aclarai_id)
-            if existing_block is None:
-                # New block - create in graph
-                self._create_block_in_graph(block, file_path)
+            outcomes = self.graph_manager.sync_blocks(blocks)
+        except Exception as e:
+            logger.error(
+                f"vault_sync._sync_blocks_with_graph: Error syncing {len(blocks)} blocks: {e}",
+                extra={
+                    "service": "aclarai-scheduler",
+                    "filename.function_name": "vault_sync._sync_blocks_with_graph",
+                    "block_count": len(blocks),
+                    "error": str(e),
+                },
+            )
+            stats["blocks_processed"] += len(blocks)
+            stats["errors"] += len(blocks)
+            return stats
+        for block, outcome in zip(blocks, outcomes, strict=False):
+            stats["blocks_processed"] += 1
+            action = outcome["action"]
+            aclarai_id = outcome["aclarai_id"]
+            if action == "create":
                 stats["blocks_new"] += 1
                 logger.info(
-                    "vault_sync._sync_block_with_graph: Created new block in graph",
+                    "vault_sync._sync_blocks_with_graph: Created new block in graph",
                     extra={
                         "service": "aclarai-scheduler",
-                        "filename.function_name": "vault_sync._sync_block_with_graph",
+                        "filename.function_name": "vault_sync._sync_blocks_with_graph",
                         "aclarai_id": aclarai_id,
-                        "file": str(file_path),
+                        "file": block["source_file"],
                         "action": "create",
                     },
                 )
+            elif action == "update":
+                stats["blocks_updated"] += 1
+                logger.info(
+                    "vault_sync._sync_blocks_with_graph: Updated changed block in graph",
+                    extra={
+                        "service": "aclarai-scheduler",
+                        "filename.function_name": "vault_sync._sync_blocks_with_graph",
+                        "aclarai_id": aclarai_id,
+                        "file": block["source_file"],
+                        "action": "update",
+                        # Log first 8 chars for brevity
+                        "old_hash": (outcome["old_hash"] or "")[:8],
+                        "new_hash": block["content_hash"][:8],
+                        "version": outcome["version"],
+                    },
+                )
+            elif action == "unchanged":
+                stats["blocks_unchanged"] += 1
+                logger.debug(
+                    "vault_sync._sync_blocks_with_graph: Block unchanged",
+                    extra={
+                        "service": "aclarai-scheduler",
+                        "filename.function_name": "vault_sync._sync_blocks_with_graph",
+                        "aclarai_id": aclarai_id,
+                        "action": "unchanged",
+                    },
+                )
+            elif action == "conflict":
+                stats["blocks_conflicted"] += 1
+                logger.warning(
+                    "vault_sync._sync_blocks_with_graph: Version conflict detected - vault is stale",
+                    extra={
+                        "service": "aclarai-scheduler",
+                        "filename.function_name": "vault_sync._sync_blocks_with_graph",
+                        "aclarai_id": aclarai_id,
+                        "file": block["source_file"],
+                        "vault_version": block["version"],
+                        "graph_version": outcome["graph_version"],
+                        "action": "skip_conflict",
+                    },
+                )
             else:
-                # Existing block - check if content changed
-                existing_hash = existing_block.get("hash", "")
-                new_hash = block["content_hash"]
-                if existing_hash != new_hash:
-                    # Content changed - update block
-                    self._update_block_in_graph(block, existing_block, file_path)
-                    stats["blocks_updated"] += 1
-                    logger.info(
-                        "vault_sync._sync_block_with_graph: Updated changed block in graph",
-                        extra={
-                            "service": "aclarai-scheduler",
-                            "filename.function_name": "vault_sync._sync_block_with_graph",
-                            "aclarai_id": aclarai_id,
-                            "file": str(file_path),
-                            "action": "update",
-                            "old_hash": existing_hash[
-                                :8
-                            ],  # Log first 8 chars for brevity
-                            "new_hash": new_hash[:8],
-                        },
-                    )
-                else:
-                    # No change
-                    stats["blocks_unchanged"] += 1
-                    logger.debug(
-                        "vault_sync._sync_block_with_graph: Block unchanged",
-                        extra={
-                            "service": "aclarai-scheduler",
-                            "filename.function_name": "vault_sync._sync_block_with_graph",
-                            "aclarai_id": aclarai_id,
-                            "action": "unchanged",
-                        },
-                    )
+                stats["errors"] += 1
+                logger.error(
+                    f"vault_sync._sync_blocks_with_graph: Error syncing block {aclarai_id}: {outcome.get('error')}",
+                    extra={
+                        "service": "aclarai-scheduler",
+                        "filename.function_name": "vault_sync._sync_blocks_with_graph",
+                        "aclarai_id": aclarai_id,
+                        "file": block["source_file"],
+                        "error": outcome.get("error"),
+                    },
+                )
+        return stats
+
+    def _load_watermark(self) -> Optional[float]:
+        """Get the recorded vault watermark, or None to scan every file."""
+        try:
+            watermark = self.graph_manager.get_sync_watermark(WATERMARK_NAME)
         except Exception as e:
-            logger.error(
-                f"vault_sync._sync_block_with_graph: Error syncing block {aclarai_id}: {e}",
+            logger.warning(
+                f"vault_sync._load_watermark: Could not read watermark, scanning all files: {e}",
                 extra={
                     "service": "aclarai-scheduler",
-                    "filename.function_name": "vault_sync._sync_block_with_graph",
-                    "aclarai_id": aclarai_id,
-                    "file": str(file_path),
+                    "filename.function_name": "vault_sync._load_watermark",
                     "error": str(e),
                 },
             )
-            stats["errors"] += 1
-        return stats
-
-    def _get_block_from_graph(self, aclarai_id: str) -> Optional[Dict[str, Any]]:
-        """Get block properties from Neo4j graph by aclarai_id."""
-        cypher_query = """
-        MATCH (b:Block {id: $aclarai_id})
-        RETURN b.id as id, b.text as text, b.hash as hash,
-               b.version as version, b.last_updated as last_updated,
-               b.needs_reprocessing as needs_reprocessing
-        """
-
-        def _execute_get_block():
-            with self.graph_manager.session() as session:
-                result = session.run(cypher_query, aclarai_id=aclarai_id)
-                record = result.single()
-                return dict(record) if record else None
-
-        return self.graph_manager._retry_with_backoff(_execute_get_block)
-
-    def _create_block_in_graph(self, block: Dict[str, Any], file_path: Path):
-        """Create a new block in the Neo4j graph."""
-        current_time = datetime.utcnow().isoformat()
-        cypher_query = """
-        MERGE (b:Block {id: $aclarai_id})
-        ON CREATE SET
-            b.text = $text,
-            b.hash = $hash,
-            b.version = $version,
-            b.last_updated = datetime($last_updated),
-            b.needs_reprocessing = true,
-            b.source_file = $source_file
-        """
-
-        def _execute_create_block():
-            with self.graph_manager.session() as session:
-                session.run(
-                    cypher_query,
-                    aclarai_id=block["aclarai_id"],
-                    text=block["semantic_text"],
-                    hash=block["content_hash"],
-                    version=block["version"],
-                    last_updated=current_time,
-                    source_file=str(file_path),
-                )
-
-        self.graph_manager._retry_with_backoff(_execute_create_block)
-
-    def _update_block_in_graph(
-        self, block: Dict[str, Any], _existing_block: Dict[str, Any], file_path: Path
-    ):
-        """Update an existing block in the Neo4j graph."""
-        current_time = datetime.utcnow().isoformat()
-        new_version = block["version"]  # Use version from vault file
-        cypher_query = """
-        MATCH (b:Block {id: $aclarai_id})
-        SET b.text = $text,
-            b.hash = $hash,
-            b.version = $version,
-            b.last_updated = datetime($last_updated),
-            b.needs_reprocessing = true,
-            b.source_file = $source_file
-        """
-
-        def _execute_update_block():
-            with self.graph_manager.session() as session:
-                session.run(
-                    cypher_query,
-                    aclarai_id=block["aclarai_id"],
-                    text=block["semantic_text"],
-                    hash=block["content_hash"],
-                    version=new_version,
-                    last_updated=current_time,
-                    source_file=str(file_path),
-                )
+            return None
+        if not isinstance(watermark, (int, float)):
+            return None
+        logger.info(
+            f"vault_sync._load_watermark: Syncing files modified since {watermark}",
+            extra={
+                "service": "aclarai-scheduler",
+                "filename.function_name": "vault_sync._load_watermark",
+                "watermark": watermark,
+            },
+        )
+        return float(watermark)
 
-        self.graph_manager._retry_with_backoff(_execute_update_block)
+    def _store_watermark(self, watermark: float) -> None:
+        """Advance the vault watermark; a failure only means a wider next scan."""
+        try:
+            self.graph_manager.set_sync_watermark(WATERMARK_NAME, watermark)
+        except Exception as e:
+            logger.warning(
+                f"vault_sync._store_watermark: Could not record watermark: {e}",
+                extra={
+                    "service": "aclarai-scheduler",
+                    "filename.function_name": "vault_sync._store_watermark",
+                    "error": str(e),
+                },
+            )
 
     def _merge_stats(self, target: Dict[str, int], source: Dict[str, int]):
         """Merge statistics from source into target."""
         for key in [
             "files_processed",
+            "files_skipped",
             "blocks_processed",
             "blocks_unchanged",
             "blocks_updated",
             "blocks_new",
+            "blocks_conflicted",
             "errors",
         ]:
             if key in source:
@@ -410,3 +435,13 @@ class VaultSyncJob:
         """Clean up resources."""
         if hasattr(self, "graph_manager"):
             self.graph_manager.close()
+
+
+def _modified_since(file_path: Path, watermark: float) -> bool:
+    """
+    Check whether a file changed after the watermark.
+    The inode change time is included so files moved or copied into the
+    vault with an older modification time are not missed.
+    """
+    stat = file_path.stat()
+    return max(stat.st_mtime, stat.st_ctime) > watermark
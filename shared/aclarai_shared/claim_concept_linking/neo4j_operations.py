@@ -5,10 +5,11 @@ in the Neo4j database, following the graph schema from technical_overview.md.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..config import aclaraiConfig, load_config
 from ..graph.neo4j_manager import Neo4jGraphManager
+from ..graph.pagination import graph_read_page_size, iter_node_pages
 from .models import (
     ClaimConceptLinkResult,
 )
@@ -62,7 +63,12 @@ class ClaimConceptNeo4jManager:
             ORDER BY c.timestamp DESC
             LIMIT $limit
             """
-            result = self.neo4j_manager.execute_query(query, {"limit": limit})
+            result = self.neo4j_manager.execute_query(
+                query,
+                {"limit": limit},
+                read_only=True,
+                query_name="fetch_unlinked_claims",
+            )
             claims = []
             for record in result:
                 claims.append(
@@ -99,36 +105,41 @@ class ClaimConceptNeo4jManager:
             )
             return []
 
+    def iter_concept_pages(
+        self, page_size: Optional[int] = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream concept nodes in pages ordered by id.
+        Args:
+            page_size: Concepts per page (defaults to processing.batch_sizes.graph_reads)
+        Returns:
+            Iterator of pages of concept dictionaries with id, text, and metadata
+        """
+        if page_size is None:
+            page_size = graph_read_page_size(self.config)
+        yield from iter_node_pages(
+            self.neo4j_manager,
+            "Concept",
+            """n.id as id, n.text as text,
+               n.source_node_id as source_node_id,
+               n.source_node_type as source_node_type,
+               n.aclarai_id as aclarai_id,
+               n.version as version, n.timestamp as timestamp""",
+            page_size=page_size,
+        )
+
     def fetch_all_concepts(self) -> List[Dict[str, Any]]:
         """
         Fetch all concept nodes for linking.
+        Prefer iter_concept_pages or count_concepts for large graphs, which
+        do not hold every concept in memory.
         Returns:
             List of concept dictionaries with id, text, and metadata
         """
         try:
-            query = """
-            MATCH (k:Concept)
-            RETURN k.id as id, k.text as text,
-                   k.source_node_id as source_node_id,
-                   k.source_node_type as source_node_type,
-                   k.aclarai_id as aclarai_id,
-                   k.version as version, k.timestamp as timestamp
-            ORDER BY k.timestamp DESC
-            """
-            result = self.neo4j_manager.execute_query(query)
-            concepts = []
-            for record in result:
-                concepts.append(
-                    {
-                        "id": record["id"],
-                        "text": record["text"],
-                        "source_node_id": record["source_node_id"],
-                        "source_node_type": record["source_node_type"],
-                        "aclarai_id": record["aclarai_id"],
-                        "version": record["version"],
-                        "timestamp": record["timestamp"],
-                    }
-                )
+            concepts = [
+                concept for page in self.iter_concept_pages() for concept in page
+            ]
             logger.debug(
                 f"Fetched {len(concepts)} concepts",
                 extra={
@@ -149,6 +160,30 @@ class ClaimConceptNeo4jManager:
             )
             return []
 
+    def count_concepts(self) -> int:
+        """
+        Count concept nodes without fetching them.
+        Returns:
+            Number of concept nodes, or 0 if the query fails
+        """
+        try:
+            result = self.neo4j_manager.execute_query(
+                "MATCH (k:Concept) RETURN count(k) as concept_count",
+                read_only=True,
+                query_name="count_concepts",
+            )
+            return result[0]["concept_count"] if result else 0
+        except Exception as e:
+            logger.error(
+                f"Failed to count concepts: {e}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "claim_concept_linking.ClaimConceptNeo4jManager.count_concepts",
+                    "error": str(e),
+                },
+            )
+            return 0
+
     def create_claim_concept_relationship(
         self, link_result: ClaimConceptLinkResult
     ) -> bool:
@@ -174,7 +209,9 @@ class ClaimConceptNeo4jManager:
                 "concept_id": link_result.concept_id,
                 "properties": properties,
             }
-            result = self.neo4j_manager.execute_query(query, params)
+            result = self.neo4j_manager.execute_query(
+                query, params, query_name="create_claim_concept_relationship"
+            )
             if result:
                 logger.info(
                     f"Created {relationship_type} relationship",
@@ -256,9 +293,14 @@ class ClaimConceptNeo4jManager:
             OPTIONAL MATCH (b)<-[:SUMMARIZES]-(s:Summary)
             RETURN b.text as source_block_text,
                    s.text as summary_text,
-                   b.aclarai_id as aclarai_id
+                   b.id as aclarai_id
             """
-            result = self.neo4j_manager.execute_query(query, {"claim_id": claim_id})
+            result = self.neo4j_manager.execute_query(
+                query,
+                {"claim_id": claim_id},
+                read_only=True,
+                query_name="get_claim_context",
+            )
             if result and len(result) > 0:
                 record = result[0]
                 return {
@@ -299,9 +341,14 @@ class ClaimConceptNeo4jManager:
             query = """
             MATCH (c:Claim)-[:REFERENCES]->(b:Block)
             WHERE c.id IN $claim_ids
-            RETURN c.id as claim_id, b.aclarai_id as aclarai_id
+            RETURN c.id as claim_id, b.id as aclarai_id
             """
-            result = self.neo4j_manager.execute_query(query, {"claim_ids": claim_ids})
+            result = self.neo4j_manager.execute_query(
+                query,
+                {"claim_ids": claim_ids},
+                read_only=True,
+                query_name="get_claims_source_files",
+            )
             file_mapping = {}
             for record in result:
                 file_mapping[record["claim_id"]] = record["aclarai_id"]
@@ -347,7 +394,12 @@ class ClaimConceptNeo4jManager:
                    type(r) as relationship_type, r.strength as strength
             ORDER BY c.id, r.strength DESC
             """
-            result = self.neo4j_manager.execute_query(query, {"claim_ids": claim_ids})
+            result = self.neo4j_manager.execute_query(
+                query,
+                {"claim_ids": claim_ids},
+                read_only=True,
+                query_name="get_concepts_for_claims",
+            )
             concepts_mapping = {}
             for record in result:
                 claim_id = record["claim_id"]
@@ -127,10 +127,9 @@ class ClaimConceptLinker:
                     },
                 )
                 return stats
-            # Step 2: Fetch available concepts
-            concepts = self.neo4j_manager.fetch_all_concepts()
-            stats["concepts_available"] = len(concepts)
-            if not concepts:
+            # Step 2: Count available concepts (candidates come from the vector store)
+            stats["concepts_available"] = self.neo4j_manager.count_concepts()
+            if not stats["concepts_available"]:
                 logger.warning(
                     "No concepts available for linking - this is expected if Tier 3 creation task hasn't run yet",
                     extra={
@@ -8,7 +8,12 @@ The pipeline follows the architecture described in docs/arch/on-claim_generation
 and supports model injection and context windowing as per design_config_panel.md.
 """
 
-from .agents import DecompositionAgent, DisambiguationAgent, SelectionAgent
+from .agents import (
+    DecompositionAgent,
+    DisambiguationAgent,
+    FusedDisambiguationDecompositionAgent,
+    SelectionAgent,
+)
 from .config_integration import (
     get_model_config_for_stage,
     load_claimify_config_from_file,
@@ -24,8 +29,28 @@ from .data_models import (
     SelectionResult,
     SentenceChunk,
 )
-from .integration import ClaimifyGraphIntegration, create_graph_manager_from_config
+from .integration import (
+    ClaimifyGraphIntegration,
+    ClaimifyGraphSink,
+    create_graph_manager_from_config,
+)
+from .json_stream import IncrementalJSONParser, repair_truncated_json
+from .llm_cache import CachedLLM, LLMResponseCache
+from .metrics import (
+    ClaimifyMetrics,
+    InMemoryMetricsSink,
+    JsonlMetricsSink,
+    LoggingMetricsSink,
+)
 from .pipeline import ClaimifyPipeline
+from .preselection import (
+    EmbeddingClassifier,
+    PreselectionDecision,
+    PreselectionGate,
+    evaluate_preselection_agreement,
+    load_labelled_set,
+)
+from .sentence_memo import SentenceMemo
 
 __all__ = [
     "SentenceChunk",
@@ -40,9 +65,25 @@ __all__ = [
     "SelectionAgent",
     "DisambiguationAgent",
     "DecompositionAgent",
+    "FusedDisambiguationDecompositionAgent",
     "load_claimify_config_from_yaml",
     "load_claimify_config_from_file",
     "get_model_config_for_stage",
     "ClaimifyGraphIntegration",
     "create_graph_manager_from_config",
+    "ClaimifyGraphSink",
+    "LLMResponseCache",
+    "CachedLLM",
+    "PreselectionGate",
+    "PreselectionDecision",
+    "EmbeddingClassifier",
+    "evaluate_preselection_agreement",
+    "load_labelled_set",
+    "ClaimifyMetrics",
+    "LoggingMetricsSink",
+    "JsonlMetricsSink",
+    "InMemoryMetricsSink",
+    "IncrementalJSONParser",
+    "repair_truncated_json",
+    "SentenceMemo",
 ]
@@ -9,10 +9,12 @@ Each agent is designed to accept different LLM instances for future configurabil
 
 import json
 import logging
+import threading
 import time
-from typing import Optional, Protocol
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, Tuple
 
 from .data_models import (
+    FUSED_STAGE,
     ClaimCandidate,
     ClaimifyConfig,
     ClaimifyContext,
@@ -21,6 +23,9 @@ from .data_models import (
     SelectionResult,
     SentenceChunk,
 )
+from .json_stream import IncrementalJSONParser, repair_truncated_json
+from .metrics import ClaimifyMetrics, estimate_tokens
+from .preselection import PRESELECTION_REASON_PREFIX, PreselectionGate
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +38,124 @@ class LLMInterface(Protocol):
         ...
 
 
+class StreamingLLMInterface(LLMInterface, Protocol):
+    """LLM that can also yield a completion incrementally."""
+
+    def stream_complete(self, prompt: str, **kwargs) -> Iterator[str]:
+        """Yield the completion for the given prompt as text deltas."""
+        ...
+
+
+def stream_completion(llm: LLMInterface, prompt: str, **kwargs) -> Iterator[str]:
+    """
+    Yield a completion as text deltas.
+    LLMs without stream_complete yield their whole completion at once. Chunks
+    that are response objects (such as LlamaIndex CompletionResponse) are
+    reduced to their delta text. Closing the iterator stops generation.
+    Args:
+        llm: LLM instance to call
+        prompt: Prompt text
+        **kwargs: Completion parameters
+    Yields:
+        Text deltas in generation order
+    """
+    stream = getattr(llm, "stream_complete", None)
+    if stream is None:
+        yield llm.complete(prompt, **kwargs)
+        return
+    chunks = stream(prompt, **kwargs)
+    try:
+        for chunk in chunks:
+            yield chunk if isinstance(chunk, str) else getattr(chunk, "delta", "") or ""
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+class ConcurrencyLimitedLLM:
+    """
+    LLM wrapper that bounds the number of in-flight completions.
+    Wrappers created with the same semaphore share one limit, which lets the
+    pipeline enforce a per-model cap across stages that use the same model.
+    """
+
+    def __init__(self, llm: LLMInterface, semaphore: threading.Semaphore):
+        self.llm = llm
+        self.semaphore = semaphore
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        """Generate a completion once a concurrency slot is available."""
+        with self.semaphore:
+            return self.llm.complete(prompt, **kwargs)
+
+    def stream_complete(self, prompt: str, **kwargs) -> Iterator[str]:
+        """Stream a completion, holding a concurrency slot until it ends."""
+        with self.semaphore:
+            yield from stream_completion(self.llm, prompt, **kwargs)
+
+
+class InstrumentedLLM:
+    """LLM wrapper that records latency and token counts for each completion."""
+
+    def __init__(
+        self, llm: LLMInterface, metrics: ClaimifyMetrics, model: str, stage: str
+    ):
+        self.llm = llm
+        self.metrics = metrics
+        self.model = model
+        self.stage = stage
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        """Generate a completion and record its latency and token counts."""
+        start_time = time.time()
+        try:
+            response = self.llm.complete(prompt, **kwargs)
+        except Exception:
+            self.metrics.record_llm_call(
+                self.stage,
+                self.model,
+                time.time() - start_time,
+                estimate_tokens(prompt),
+                0,
+                error=True,
+            )
+            raise
+        self.metrics.record_llm_call(
+            self.stage,
+            self.model,
+            time.time() - start_time,
+            estimate_tokens(prompt),
+            estimate_tokens(str(response)),
+        )
+        return response
+
+    def stream_complete(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Stream a completion, recording the tokens actually received.
+        A stream closed early is recorded with only the consumed deltas.
+        """
+        start_time = time.time()
+        received: List[str] = []
+        error = False
+        try:
+            for chunk in stream_completion(self.llm, prompt, **kwargs):
+                received.append(chunk)
+                yield chunk
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.metrics.record_llm_call(
+                self.stage,
+                self.model,
+                time.time() - start_time,
+                estimate_tokens(prompt),
+                estimate_tokens("".join(received)),
+                error=error,
+            )
+
+
 class BaseClaimifyAgent:
     """Base class for all Claimify pipeline agents."""
 
@@ -40,9 +163,11 @@ class BaseClaimifyAgent:
         self,
         llm: Optional[LLMInterface] = None,
         config: Optional[ClaimifyConfig] = None,
+        metrics: Optional[ClaimifyMetrics] = None,
     ):
         self.llm = llm
         self.config = config or ClaimifyConfig()
+        self.metrics = metrics
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     def _log_decision(self, stage: str, decision: str, reasoning: str = "") -> None:
@@ -76,6 +201,8 @@ class BaseClaimifyAgent:
 
     def _log_timing(self, stage: str, processing_time: float) -> None:
         """Log processing time if configured."""
+        if self.metrics is not None:
+            self.metrics.record_stage_time(stage, processing_time)
         if self.config.log_timing:
             self.logger.debug(
                 f"[agents.{self.__class__.__name__}._log_timing] Claimify.{stage} processing time: {processing_time:.3f}s",
@@ -86,14 +213,111 @@ class BaseClaimifyAgent:
                 },
             )
 
+    def _record_parse_failure(self, stage: str) -> None:
+        """Count an LLM response that could not be parsed as JSON."""
+        if self.metrics is not None:
+            self.metrics.record_parse_failure(
+                stage, self.config.get_model_for_stage(stage)
+            )
+
+    def _record_retry(self, stage: str) -> None:
+        """Count an LLM call that re-issues work from an earlier failed call."""
+        if self.metrics is not None:
+            self.metrics.record_retry(stage, self.config.get_model_for_stage(stage))
+
+    def _complete_json(
+        self,
+        stage: str,
+        prompt: str,
+        max_tokens: int,
+        is_decided: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Call the LLM and parse its JSON response.
+        With streaming enabled the completion is parsed as it arrives and
+        generation stops as soon as is_decided accepts the top-level fields
+        parsed so far.
+        Args:
+            stage: Pipeline stage name
+            prompt: Prompt text
+            max_tokens: Completion token limit
+            is_decided: Predicate over the decided fields that allows an early stop
+        Returns:
+            Parsed JSON object (only the decided fields after an early stop)
+        """
+        kwargs = {"temperature": self.config.temperature, "max_tokens": max_tokens}
+        if not self.config.streaming_enabled:
+            response = self.llm.complete(prompt, **kwargs).strip()
+            return self._parse_json_response(stage, response)
+        parser = IncrementalJSONParser()
+        chunks = stream_completion(self.llm, prompt, **kwargs)
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                if parser.is_complete:
+                    break
+                if is_decided is not None and is_decided(parser.fields):
+                    self._record_early_stop(stage)
+                    return dict(parser.fields)
+        finally:
+            chunks.close()
+        return self._parse_json_response(stage, parser.text.strip())
+
+    def _parse_json_response(self, stage: str, response: str) -> Dict[str, Any]:
+        """
+        Parse a JSON response, repairing truncation and code fences if needed.
+        Raises:
+            ValueError: If the response cannot be parsed or repaired
+        """
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError as e:
+            repaired = repair_truncated_json(response)
+            if repaired is None:
+                self._record_parse_failure(stage)
+                raise ValueError(f"Invalid JSON response from LLM: {e}") from e
+            self.logger.warning(
+                f"[agents.{self.__class__.__name__}._parse_json_response] Repaired malformed Claimify.{stage} JSON response: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "stage": stage,
+                    "response_length": len(response),
+                    "recovered_fields": sorted(repaired),
+                },
+            )
+            if self.metrics is not None:
+                self.metrics.record_json_repair(
+                    stage, self.config.get_model_for_stage(stage)
+                )
+            return repaired
+
+    def _record_early_stop(self, stage: str) -> None:
+        """Count a streamed completion stopped once its verdict was decided."""
+        if self.metrics is not None:
+            self.metrics.record_early_stop(
+                stage, self.config.get_model_for_stage(stage)
+            )
+
 
 class SelectionAgent(BaseClaimifyAgent):
     """
     Agent responsible for identifying sentence chunks that contain verifiable information
     relevant for claim extraction.
     This is the first stage of the Claimify pipeline.
+    An optional PreselectionGate rejects obvious non-claims locally, before
+    any LLM call is made.
     """
 
+    def __init__(
+        self,
+        llm: Optional[LLMInterface] = None,
+        config: Optional[ClaimifyConfig] = None,
+        preselection_gate: Optional[PreselectionGate] = None,
+        metrics: Optional[ClaimifyMetrics] = None,
+    ):
+        super().__init__(llm, config, metrics)
+        self.preselection_gate = preselection_gate
+
     def process(self, context: ClaimifyContext) -> SelectionResult:
         """
         Process a sentence chunk to determine if it should be selected for further processing.
@@ -102,6 +326,34 @@ class SelectionAgent(BaseClaimifyAgent):
         Returns:
             SelectionResult with decision and reasoning
         """
+        preselected = self._preselect(context)
+        if preselected is not None:
+            return preselected
+        return self._process_with_llm(context)
+
+    def _preselect(self, context: ClaimifyContext) -> Optional[SelectionResult]:
+        """
+        Apply the pre-selection gate, if configured.
+        Returns:
+            A rejected SelectionResult, or None if the sentence needs the LLM
+        """
+        if self.preselection_gate is None:
+            return None
+        start_time = time.time()
+        decision = self.preselection_gate.evaluate(context.current_sentence)
+        if decision is None:
+            return None
+        self._record_selection(False)
+        return SelectionResult(
+            sentence_chunk=context.current_sentence,
+            is_selected=False,
+            confidence=decision.confidence,
+            reasoning=f"{PRESELECTION_REASON_PREFIX} {decision.reason}",
+            processing_time=time.time() - start_time,
+        )
+
+    def _process_with_llm(self, context: ClaimifyContext) -> SelectionResult:
+        """Run LLM-based selection for a single sentence."""
         start_time = time.time()
         sentence = context.current_sentence
         try:
@@ -111,6 +363,7 @@ class SelectionAgent(BaseClaimifyAgent):
             result = self._llm_selection(context)
             processing_time = time.time() - start_time
             result.processing_time = processing_time
+            self._record_selection(result.is_selected)
             self._log_decision(
                 "selection",
                 "selected" if result.is_selected else "rejected",
@@ -135,6 +388,11 @@ class SelectionAgent(BaseClaimifyAgent):
                 processing_time=processing_time,
             )
 
+    def _record_selection(self, selected: bool) -> None:
+        """Feed a Selection decision into the selection-rate series."""
+        if self.metrics is not None:
+            self.metrics.record_selection(selected)
+
     def _llm_selection(self, context: ClaimifyContext) -> SelectionResult:
         """
         LLM-based selection following the Claimify approach.
@@ -143,7 +401,7 @@ class SelectionAgent(BaseClaimifyAgent):
         2. Uses JSON output format as specified in claimify_selection.yaml prompt
         """
         sentence = context.current_sentence
-        context_text = self._build_context_text(context)
+        context_text = _build_context_text(context)
         # Use JSON prompt format matching claimify_selection.yaml
         prompt = f"""You are an expert at identifying verifiable factual content in text. Your task is to determine whether a given sentence contains information that could be extracted as verifiable claims.
 Analyze the following sentence within its context to determine if it contains verifiable, factual information.
@@ -175,51 +433,198 @@ Respond with valid JSON only:
   "reasoning": "Brief explanation of decision"
 }}"""
         try:
-            # Call the LLM with the prompt
-            response = self.llm.complete(
+            result_data = self._complete_json(
+                "selection",
                 prompt,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens or 500,
-            ).strip()
-            # Parse JSON response
-            try:
-                result_data = json.loads(response)
-                is_selected = result_data.get("selected", False)
-                confidence = result_data.get("confidence", 0.0)
-                reasoning = result_data.get("reasoning", "No reasoning provided")
-                # Apply confidence threshold - if LLM confidence is below threshold, reject selection
-                if (
-                    is_selected
-                    and confidence < self.config.selection_confidence_threshold
-                ):
-                    is_selected = False
-                    reasoning = f"LLM selected but confidence {confidence:.2f} below threshold {self.config.selection_confidence_threshold:.2f}"
-                return SelectionResult(
-                    sentence_chunk=sentence,
-                    is_selected=is_selected,
-                    reasoning=reasoning,
-                    confidence=confidence,
-                    rewritten_text=sentence.text if is_selected else None,
-                )
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON response from LLM: {e}") from e
+                self.config.max_tokens or 500,
+                is_decided=self._is_rejection_decided,
+            )
+            return self._build_selection_result(sentence, result_data)
         except Exception as e:
             # If LLM fails, we cannot perform selection without heuristics
             raise ValueError(
                 f"LLM selection failed and no fallback available: {e}"
             ) from e
 
-    def _build_context_text(self, context: ClaimifyContext) -> str:
-        """Build context text from surrounding sentences."""
+    def _is_rejection_decided(self, fields: Dict[str, Any]) -> bool:
+        """
+        Check whether streamed fields already decide a rejection.
+        Selected sentences keep streaming so their reasoning is preserved.
+        """
+        if fields.get("selected") is False:
+            return True
+        confidence = fields.get("confidence")
+        return (
+            fields.get("selected") is True
+            and isinstance(confidence, (int, float))
+            and confidence < self.config.selection_confidence_threshold
+        )
+
+    def _build_selection_result(
+        self, sentence: SentenceChunk, result_data: Dict[str, Any]
+    ) -> SelectionResult:
+        """Build a SelectionResult from a parsed JSON verdict."""
+        is_selected = result_data.get("selected", False)
+        confidence = result_data.get("confidence", 0.0)
+        reasoning = result_data.get("reasoning", "No reasoning provided")
+        # Apply confidence threshold - if LLM confidence is below threshold, reject selection
+        if is_selected and confidence < self.config.selection_confidence_threshold:
+            is_selected = False
+            reasoning = f"LLM selected but confidence {confidence:.2f} below threshold {self.config.selection_confidence_threshold:.2f}"
+        return SelectionResult(
+            sentence_chunk=sentence,
+            is_selected=is_selected,
+            reasoning=reasoning,
+            confidence=confidence,
+            rewritten_text=sentence.text if is_selected else None,
+        )
+
+    def process_batch(self, contexts: List[ClaimifyContext]) -> List[SelectionResult]:
+        """
+        Process a window of consecutive sentences with a single LLM call.
+        Each target sentence gets its own JSON verdict. Targets whose verdict is
+        missing or malformed fall back to per-sentence selection.
+        Args:
+            contexts: Context windows for consecutive target sentences
+        Returns:
+            SelectionResult objects in the same order as the contexts
+        """
+        results: List[Optional[SelectionResult]] = [
+            self._preselect(context) for context in contexts
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            llm_results = self._process_batch_with_llm([contexts[i] for i in pending])
+            for i, result in zip(pending, llm_results, strict=True):
+                results[i] = result
+        return results  # type: ignore[return-value]
+
+    def _process_batch_with_llm(
+        self, contexts: List[ClaimifyContext]
+    ) -> List[SelectionResult]:
+        """Run LLM-based selection for sentences that passed pre-selection."""
+        if len(contexts) == 1:
+            return [self._process_with_llm(contexts[0])]
+        start_time = time.time()
+        verdicts: Dict[int, Dict[str, Any]] = {}
+        try:
+            if self.llm is None:
+                raise ValueError("LLM is required for Selection agent processing")
+            verdicts = self._llm_batch_selection(contexts)
+        except Exception as e:
+            self.logger.warning(
+                f"[agents.{self.__class__.__name__}.process_batch] Batched selection failed, falling back to per-sentence calls: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "stage": "selection",
+                    "batch_size": len(contexts),
+                    "error": str(e),
+                },
+            )
+        # Amortize the shared call across the sentences it covered
+        batch_time = (time.time() - start_time) / len(contexts)
+        results: List[SelectionResult] = []
+        missing = []
+        for index, context in enumerate(contexts, start=1):
+            verdict = verdicts.get(index)
+            if verdict is None:
+                missing.append(index)
+                self._record_retry("selection")
+                results.append(self._process_with_llm(context))
+                continue
+            result = self._build_selection_result(context.current_sentence, verdict)
+            result.processing_time = batch_time
+            self._record_selection(result.is_selected)
+            self._log_decision(
+                "selection",
+                "selected" if result.is_selected else "rejected",
+                result.reasoning or "",
+            )
+            results.append(result)
+        if missing and verdicts:
+            self.logger.warning(
+                f"[agents.{self.__class__.__name__}.process_batch] Batched selection response missed {len(missing)} of {len(contexts)} sentences, used per-sentence fallback",
+                extra={
+                    "service": "aclarai-core",
+                    "stage": "selection",
+                    "batch_size": len(contexts),
+                    "missing_indices": missing,
+                },
+            )
+        self._log_timing("selection", time.time() - start_time)
+        return results
+
+    def _llm_batch_selection(
+        self, contexts: List[ClaimifyContext]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Score several target sentences in one LLM call.
+        The instruction preamble and the shared surrounding context are sent once.
+        Returns:
+            Mapping of 1-based target index to its parsed JSON verdict. Only
+            well-formed verdicts for requested indices are included.
+        """
+        context_text = self._build_batch_context_text(contexts)
+        prompt = f"""You are an expert at identifying verifiable factual content in text. Your task is to determine whether each target sentence contains information that could be extracted as verifiable claims.
+Analyze each target sentence within its context to determine if it contains verifiable, factual information.
+Context (surrounding sentences, targets are marked [T1]..[T{len(contexts)}]):
+{context_text}
+Consider these criteria for each target sentence:
+1. Does this sentence contain factual, verifiable information?
+2. Is it a statement (not a question, command, or exclamation)?
+3. Could this information be fact-checked or validated?
+4. Does it describe events, relationships, measurements, or properties?
+5. Is it specific enough to be meaningful?
+Sentences to REJECT:
+- Questions ("What should we do?")
+- Commands ("Please fix this.")
+- Opinions without factual basis ("I think it's bad.")
+- Vague statements ("Something happened.")
+- Very short fragments ("Yes.", "OK.")
+Sentences to SELECT:
+- Technical facts ("The system returned error code 500.")
+- Event descriptions ("The deployment occurred at 10:30 AM.")
+- Measurements ("The response time was 2.3 seconds.")
+- Relationships ("User A reported the bug to Team B.")
+- Specific observations ("The CPU usage spiked to 95%.")
+Respond with valid JSON only, with exactly one verdict per target index from 1 to {len(contexts)}:
+{{
+  "verdicts": [
+    {{
+      "index": 1,
+      "selected": true/false,
+      "confidence": 0.0-1.0,
+      "reasoning": "Brief explanation of decision"
+    }}
+  ]
+}}"""
+        result_data = self._complete_json(
+            "selection", prompt, self.config.max_tokens or 500
+        )
+        verdicts: Dict[int, Dict[str, Any]] = {}
+        for verdict in result_data.get("verdicts", []):
+            if not isinstance(verdict, dict) or "selected" not in verdict:
+                continue
+            try:
+                index = int(verdict.get("index"))
+            except (TypeError, ValueError):
+                continue
+            if 1 <= index <= len(contexts):
+                verdicts[index] = verdict
+        return verdicts
+
+    def _build_batch_context_text(self, contexts: List[ClaimifyContext]) -> str:
+        """Build shared context text for a window of consecutive target sentences."""
         parts = []
-        # Add preceding sentences
-        for i, sent in enumerate(context.preceding_sentences):
-            parts.append(f"[{-len(context.preceding_sentences) + i}] {sent.text}")
-        # Add current sentence marker
-        parts.append(f"[0] {context.current_sentence.text} ← TARGET")
-        # Add following sentences
-        for i, sent in enumerate(context.following_sentences):
-            parts.append(f"[{i + 1}] {sent.text}")
+        # Add sentences preceding the first target
+        for sent in contexts[0].preceding_sentences:
+            parts.append(f"[C] {sent.text}")
+        # Add target sentences with their batch index
+        for i, context in enumerate(contexts, start=1):
+            parts.append(f"[T{i}] {context.current_sentence.text}")
+        # Add sentences following the last target
+        for sent in contexts[-1].following_sentences:
+            parts.append(f"[C] {sent.text}")
         return "\n".join(parts)
 
 
@@ -283,7 +688,7 @@ class DisambiguationAgent(BaseClaimifyAgent):
         2. Uses context to resolve ambiguities confidently
         3. Uses JSON output format as specified in claimify_disambiguation.yaml prompt
         """
-        context_text = self._build_context_text(context)
+        context_text = _build_context_text(context)
         # Use JSON prompt format matching claimify_disambiguation.yaml
         prompt = f"""You are an expert at disambiguating text by resolving pronouns, adding missing context, and making implicit information explicit. Your goal is to rewrite sentences to be clear and self-contained while preserving their original meaning.
 Rewrite the following sentence to remove ambiguities and make it self-contained. Use the surrounding context to resolve pronouns and add missing subjects or objects.
@@ -309,53 +714,16 @@ Respond with valid JSON only:
   "confidence": 0.0-1.0
 }}"""
         try:
-            # Call the LLM with the prompt
-            response = self.llm.complete(
-                prompt,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens or 500,
-            ).strip()
-            # Parse JSON response
-            try:
-                result_data = json.loads(response)
-                disambiguated_text = result_data.get(
-                    "disambiguated_text", sentence.text
-                )
-                changes_made = result_data.get("changes_made", [])
-                confidence = result_data.get("confidence", 0.8)
-                # Apply confidence threshold - if LLM confidence is below threshold, use original text
-                if confidence < self.config.disambiguation_confidence_threshold:
-                    disambiguated_text = sentence.text
-                    changes_made = [
-                        f"LLM confidence {confidence:.2f} below threshold {self.config.disambiguation_confidence_threshold:.2f}, using original text"
-                    ]
-                return DisambiguationResult(
-                    original_sentence=sentence,
-                    disambiguated_text=disambiguated_text,
-                    changes_made=changes_made,
-                    confidence=confidence,
-                )
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON response from LLM: {e}") from e
+            result_data = self._complete_json(
+                "disambiguation", prompt, self.config.max_tokens or 500
+            )
+            return _build_disambiguation_result(sentence, result_data, self.config)
         except Exception as e:
             # If LLM fails, we cannot perform disambiguation without heuristics
             raise ValueError(
                 f"LLM disambiguation failed and no fallback available: {e}"
             ) from e
 
-    def _build_context_text(self, context: ClaimifyContext) -> str:
-        """Build context text from surrounding sentences."""
-        parts = []
-        # Add preceding sentences
-        for i, sent in enumerate(context.preceding_sentences):
-            parts.append(f"[{-len(context.preceding_sentences) + i}] {sent.text}")
-        # Add current sentence marker
-        parts.append(f"[0] {context.current_sentence.text} ← TARGET")
-        # Add following sentences
-        for i, sent in enumerate(context.following_sentences):
-            parts.append(f"[{i + 1}] {sent.text}")
-        return "\n".join(parts)
-
 
 class DecompositionAgent(BaseClaimifyAgent):
     """
@@ -411,6 +779,7 @@ class DecompositionAgent(BaseClaimifyAgent):
                 original_text=disambiguated_text,
                 claim_candidates=[],
                 processing_time=processing_time,
+                error=f"Error during processing: {e}",
             )
 
     def _llm_decomposition(self, text: str) -> DecompositionResult:
@@ -459,58 +828,240 @@ Respond with valid JSON only:
 }}"""
         try:
             # Call the LLM with the prompt
-            response = self.llm.complete(
-                prompt,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens or 1000,
-            ).strip()
-            # Parse JSON response
-            try:
-                result_data = json.loads(response)
-                claim_candidates = []
-                for candidate_data in result_data.get("claim_candidates", []):
-                    claim_text = candidate_data.get("text", "").strip()
-                    if not claim_text:
-                        continue
-                    # Get quality flags from LLM output
-                    is_atomic = candidate_data.get("is_atomic", False)
-                    is_self_contained = candidate_data.get("is_self_contained", False)
-                    is_verifiable = candidate_data.get("is_verifiable", False)
-                    passes_criteria = candidate_data.get("passes_criteria", False)
-                    reasoning = candidate_data.get("reasoning", "No reasoning provided")
-                    # Get confidence from LLM response or calculate based on quality flags
-                    confidence = candidate_data.get("confidence")
-                    if confidence is None:
-                        # Fallback calculation if LLM doesn't provide confidence
-                        if (
-                            passes_criteria
-                            and is_atomic
-                            and is_self_contained
-                            and is_verifiable
-                        ):
-                            confidence = 0.9
-                        elif sum([is_atomic, is_self_contained, is_verifiable]) >= 2:
-                            confidence = 0.6
-                        else:
-                            confidence = 0.3
-                    # Apply confidence threshold - only include candidates above threshold
-                    if confidence >= self.config.decomposition_confidence_threshold:
-                        candidate = ClaimCandidate(
-                            text=claim_text,
-                            is_atomic=is_atomic,
-                            is_self_contained=is_self_contained,
-                            is_verifiable=is_verifiable,
-                            confidence=confidence,
-                            reasoning=reasoning,
-                        )
-                        claim_candidates.append(candidate)
-                return DecompositionResult(
-                    original_text=text, claim_candidates=claim_candidates
-                )
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON response from LLM: {e}") from e
+            result_data = self._complete_json(
+                "decomposition", prompt, self.config.max_tokens or 1000
+            )
+            return _build_decomposition_result(text, result_data, self.config)
         except Exception as e:
             # If LLM fails, we cannot perform decomposition without heuristics
             raise ValueError(
                 f"LLM decomposition failed and no fallback available: {e}"
             ) from e
+
+
+class FusedDisambiguationDecompositionAgent(BaseClaimifyAgent):
+    """
+    Agent that disambiguates a selected sentence and decomposes it into claims
+    in a single LLM call.
+    Replaces the Disambiguation and Decomposition stages for models listed in
+    ClaimifyConfig.fused_stage_models, returning the same result shapes.
+    """
+
+    def __init__(
+        self,
+        llm: Optional[LLMInterface] = None,
+        config: Optional[ClaimifyConfig] = None,
+        metrics: Optional[ClaimifyMetrics] = None,
+        decomposition_agent: Optional[DecompositionAgent] = None,
+    ):
+        """
+        Initialize the fused agent.
+        Args:
+            llm: LLM instance for the fused call
+            config: Pipeline configuration
+            metrics: Optional metrics registry
+            decomposition_agent: Agent used to re-decompose the original text
+                when the rewrite is rejected by the disambiguation threshold
+        """
+        super().__init__(llm, config, metrics)
+        self.decomposition_agent = decomposition_agent
+
+    def process(
+        self, sentence: SentenceChunk, context: ClaimifyContext
+    ) -> Tuple[DisambiguationResult, DecompositionResult]:
+        """
+        Disambiguate a selected sentence and extract its atomic claims.
+        Args:
+            sentence: The sentence chunk to process
+            context: Surrounding context for disambiguation
+        Returns:
+            Tuple of DisambiguationResult and DecompositionResult
+        """
+        start_time = time.time()
+        try:
+            if self.llm is None:
+                raise ValueError("LLM is required for fused agent processing")
+            disambiguation_result, decomposition_result = self._llm_fused(
+                sentence, context
+            )
+        except Exception as e:
+            processing_time = time.time() - start_time
+            self.logger.error(
+                f"[agents.{self.__class__.__name__}.process] Error in fused disambiguation/decomposition processing: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "stage": FUSED_STAGE,
+                    "error": str(e),
+                },
+            )
+            return (
+                DisambiguationResult(
+                    original_sentence=sentence,
+                    disambiguated_text=sentence.text,  # Return original on error
+                    changes_made=[f"Error during processing: {e}"],
+                ),
+                DecompositionResult(
+                    original_text=sentence.text,
+                    claim_candidates=[],
+                    processing_time=processing_time,
+                    error=f"Error during processing: {e}",
+                ),
+            )
+        processing_time = time.time() - start_time
+        # The single call is attributed to decomposition
+        decomposition_result.processing_time = processing_time
+        self._log_transformation(
+            "disambiguation",
+            sentence.text,
+            disambiguation_result.disambiguated_text,
+            disambiguation_result.changes_made,
+        )
+        self.logger.info(
+            f"[agents.{self.__class__.__name__}.process] Claimify.{FUSED_STAGE} completed: {len(decomposition_result.valid_claims)} claims, {len(decomposition_result.sentence_nodes)} sentences",
+            extra={
+                "service": "aclarai-core",
+                "stage": FUSED_STAGE,
+                "claims_count": len(decomposition_result.valid_claims),
+                "sentences_count": len(decomposition_result.sentence_nodes),
+                "total_candidates": len(decomposition_result.claim_candidates),
+            },
+        )
+        self._log_timing(FUSED_STAGE, processing_time)
+        return disambiguation_result, decomposition_result
+
+    def _llm_fused(
+        self, sentence: SentenceChunk, context: ClaimifyContext
+    ) -> Tuple[DisambiguationResult, DecompositionResult]:
+        """
+        Run Stage 2 and Stage 3 of the Claimify pipeline in one structured prompt.
+        Claims are extracted from the rewritten sentence. If the rewrite falls
+        below the disambiguation threshold, the original text is decomposed
+        separately so results match the two-call pipeline.
+        """
+        context_text = _build_context_text(context)
+        prompt = f"""You are an expert at disambiguating text and extracting atomic claims. First rewrite the target sentence so it is clear and self-contained, then break the rewritten sentence into individual, verifiable claims.
+Context (surrounding sentences):
+{context_text}
+Target sentence: "{sentence.text}"
+Step 1 - Disambiguation guidelines:
+1. Replace ambiguous pronouns (it, this, that, they) with specific entities
+2. Add missing subjects for sentences starting with verbs
+3. Clarify vague references ("the error", "the issue", "the problem")
+4. Make temporal and causal relationships explicit
+5. Preserve the original meaning and factual content
+6. Keep the sentence concise but complete
+Step 2 - Quality criteria for claims extracted from the rewritten sentence:
+1. ATOMIC: Contains exactly one verifiable fact (no compound statements)
+2. SELF-CONTAINED: No ambiguous pronouns or references (all entities clearly identified)
+3. VERIFIABLE: Contains specific, factual information that can be fact-checked
+Split compound sentences (connected by "and", "but", "or", "because", etc.) and evaluate each potential claim against all three criteria. Claims that fail any criterion become :Sentence nodes instead.
+Respond with valid JSON only:
+{{
+  "disambiguated_text": "The rewritten sentence",
+  "changes_made": ["List of specific changes"],
+  "confidence": 0.0-1.0,
+  "claim_candidates": [
+    {{
+      "text": "The extracted claim text",
+      "is_atomic": true/false,
+      "is_self_contained": true/false,
+      "is_verifiable": true/false,
+      "passes_criteria": true/false,
+      "confidence": 0.0-1.0,
+      "reasoning": "Explanation of evaluation",
+      "node_type": "Claim" or "Sentence"
+    }}
+  ]
+}}"""
+        result_data = self._complete_json(
+            FUSED_STAGE, prompt, self.config.max_tokens or 1500
+        )
+        disambiguation_result = _build_disambiguation_result(
+            sentence, result_data, self.config
+        )
+        rewritten_text = result_data.get("disambiguated_text", sentence.text)
+        if (
+            disambiguation_result.disambiguated_text != rewritten_text
+            and self.decomposition_agent is not None
+        ):
+            # The rewrite was rejected, so its claims cannot be used
+            return disambiguation_result, self.decomposition_agent.process(
+                disambiguation_result.disambiguated_text, sentence
+            )
+        return disambiguation_result, _build_decomposition_result(
+            disambiguation_result.disambiguated_text, result_data, self.config
+        )
+
+
+def _build_context_text(context: ClaimifyContext) -> str:
+    """Build context text from surrounding sentences."""
+    parts = []
+    # Add preceding sentences
+    for i, sent in enumerate(context.preceding_sentences):
+        parts.append(f"[{-len(context.preceding_sentences) + i}] {sent.text}")
+    # Add current sentence marker
+    parts.append(f"[0] {context.current_sentence.text} ← TARGET")
+    # Add following sentences
+    for i, sent in enumerate(context.following_sentences):
+        parts.append(f"[{i + 1}] {sent.text}")
+    return "\n".join(parts)
+
+
+def _build_disambiguation_result(
+    sentence: SentenceChunk, result_data: Dict[str, Any], config: ClaimifyConfig
+) -> DisambiguationResult:
+    """Build a DisambiguationResult from a parsed JSON response."""
+    disambiguated_text = result_data.get("disambiguated_text", sentence.text)
+    changes_made = result_data.get("changes_made", [])
+    confidence = result_data.get("confidence", 0.8)
+    # Apply confidence threshold - if LLM confidence is below threshold, use original text
+    if confidence < config.disambiguation_confidence_threshold:
+        disambiguated_text = sentence.text
+        changes_made = [
+            f"LLM confidence {confidence:.2f} below threshold {config.disambiguation_confidence_threshold:.2f}, using original text"
+        ]
+    return DisambiguationResult(
+        original_sentence=sentence,
+        disambiguated_text=disambiguated_text,
+        changes_made=changes_made,
+        confidence=confidence,
+    )
+
+
+def _build_decomposition_result(
+    text: str, result_data: Dict[str, Any], config: ClaimifyConfig
+) -> DecompositionResult:
+    """Build a DecompositionResult from a parsed JSON response."""
+    claim_candidates = []
+    for candidate_data in result_data.get("claim_candidates", []):
+        claim_text = candidate_data.get("text", "").strip()
+        if not claim_text:
+            continue
+        # Get quality flags from LLM output
+        is_atomic = candidate_data.get("is_atomic", False)
+        is_self_contained = candidate_data.get("is_self_contained", False)
+        is_verifiable = candidate_data.get("is_verifiable", False)
+        passes_criteria = candidate_data.get("passes_criteria", False)
+        reasoning = candidate_data.get("reasoning", "No reasoning provided")
+        # Get confidence from LLM response or calculate based on quality flags
+        confidence = candidate_data.get("confidence")
+        if confidence is None:
+            # Fallback calculation if LLM doesn't provide confidence
+            if passes_criteria and is_atomic and is_self_contained and is_verifiable:
+                confidence = 0.9
+            elif sum([is_atomic, is_self_contained, is_verifiable]) >= 2:
+                confidence = 0.6
+            else:
+                confidence = 0.3
+        # Apply confidence threshold - only include candidates above threshold
+        if confidence >= config.decomposition_confidence_threshold:
+            candidate = ClaimCandidate(
+                text=claim_text,
+                is_atomic=is_atomic,
+                is_self_contained=is_self_contained,
+                is_verifiable=is_verifiable,
+                confidence=confidence,
+                reasoning=reasoning,
+            )
+            claim_candidates.append(candidate)
+    return DecompositionResult(original_text=text, claim_candidates=claim_candidates)
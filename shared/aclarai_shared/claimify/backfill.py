@@ -0,0 +1,595 @@
+"""
+Resumable Claimify backfill over an existing vault.
+Onboarding a vault with thousands of Tier 1 files means running Claimify over
+every block. This module drives ClaimifyPipeline block by block and records
+per-block progress in a local SQLite checkpoint store, so an interrupted run
+resumes where it left off instead of repeating LLM calls already paid for.
+The runner also enforces a token/cost budget and a sentence rate limit, and
+reports sentences/minute and an ETA as it goes.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..vault.block_parser import BlockParser
+from .agents import LLMInterface, stream_completion
+from .data_models import ClaimifyResult, SentenceChunk
+from .integration import ClaimifyGraphIntegration
+from .llm_cache import CachedLLM
+from .metrics import estimate_tokens
+from .pipeline import ClaimifyPipeline
+from .sentence_memo import ERROR_PREFIX, has_processing_error
+
+logger = logging.getLogger(__name__)
+
+# Supported block orderings
+PRIORITY_NEWEST = "newest"
+PRIORITY_OLDEST = "oldest"
+PRIORITY_PATH = "path"
+
+
+@dataclass
+class BackfillBlock:
+    """A Tier 1 block queued for backfill."""
+
+    block_id: str
+    file_path: str
+    text: str
+    content_hash: str
+    modified_time: float
+
+
+@dataclass
+class BackfillProgress:
+    """Progress of a backfill run."""
+
+    total_blocks: int = 0
+    skipped_blocks: int = 0  # Already completed in an earlier run
+    completed_blocks: int = 0
+    failed_blocks: int = 0
+    processed_sentences: int = 0
+    claims_created: int = 0
+    tokens_used: int = 0  # Including tokens recorded by earlier runs
+    started_at: float = field(default_factory=time.time)
+    stopped_reason: Optional[str] = None
+
+    @property
+    def remaining_blocks(self) -> int:
+        """Blocks not yet completed, skipped or failed."""
+        return (
+            self.total_blocks
+            - self.skipped_blocks
+            - self.completed_blocks
+            - self.failed_blocks
+        )
+
+    def sentences_per_minute(self, now: Optional[float] = None) -> float:
+        """Throughput of this run in sentences per minute."""
+        elapsed = (now or time.time()) - self.started_at
+        if elapsed <= 0:
+            return 0.0
+        return self.processed_sentences / elapsed * 60
+
+    def eta_seconds(self, now: Optional[float] = None) -> Optional[float]:
+        """Estimated seconds until all remaining blocks are done."""
+        done = self.completed_blocks + self.failed_blocks
+        if done == 0:
+            return None
+        elapsed = (now or time.time()) - self.started_at
+        return elapsed / done * self.remaining_blocks
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert progress to a report dictionary."""
+        return {
+            "total_blocks": self.total_blocks,
+            "skipped_blocks": self.skipped_blocks,
+            "completed_blocks": self.completed_blocks,
+            "failed_blocks": self.failed_blocks,
+            "remaining_blocks": self.remaining_blocks,
+            "processed_sentences": self.processed_sentences,
+            "claims_created": self.claims_created,
+            "tokens_used": self.tokens_used,
+            "sentences_per_minute": self.sentences_per_minute(),
+            "eta_seconds": self.eta_seconds(),
+            "stopped_reason": self.stopped_reason,
+        }
+
+
+class BackfillCheckpointStore:
+    """
+    SQLite store of per-block backfill progress.
+    A block is done once its results have been persisted; a block whose
+    semantic text changed since it was completed is processed again.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the checkpoint store.
+        Args:
+            path: SQLite database path (":memory:" for a non-persistent store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS backfill_blocks (
+                block_id TEXT PRIMARY KEY,
+                file_path TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                status TEXT NOT NULL,
+                sentences INTEGER NOT NULL DEFAULT 0,
+                claims INTEGER NOT NULL DEFAULT 0,
+                tokens INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def is_completed(self, block_id: str, content_hash: str) -> bool:
+        """Check whether a block was completed with the same content."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash, status FROM backfill_blocks WHERE block_id = ?",
+                (block_id,),
+            ).fetchone()
+        return row is not None and row[0] == content_hash and row[1] == "completed"
+
+    def mark_completed(
+        self, block: BackfillBlock, sentences: int, claims: int, tokens: int
+    ) -> None:
+        """Record a block whose results have been persisted."""
+        self._upsert(block, "completed", sentences, claims, tokens, None)
+
+    def mark_failed(self, block: BackfillBlock, tokens: int, error: str) -> None:
+        """Record a block that failed; it is retried on the next run."""
+        self._upsert(block, "failed", 0, 0, tokens, error)
+
+    def _upsert(
+        self,
+        block: BackfillBlock,
+        status: str,
+        sentences: int,
+        claims: int,
+        tokens: int,
+        error: Optional[str],
+    ) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO backfill_blocks
+                    (block_id, file_path, content_hash, status, sentences, claims,
+                     tokens, error, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(block_id) DO UPDATE SET
+                    file_path = excluded.file_path,
+                    content_hash = excluded.content_hash,
+                    status = excluded.status,
+                    sentences = excluded.sentences,
+                    claims = excluded.claims,
+                    tokens = backfill_blocks.tokens + excluded.tokens,
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    block.block_id,
+                    block.file_path,
+                    block.content_hash,
+                    status,
+                    sentences,
+                    claims,
+                    tokens,
+                    error,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def total_tokens(self) -> int:
+        """Tokens spent by all runs so far, including failed blocks."""
+        with self._lock:
+            (tokens,) = self._conn.execute(
+                "SELECT COALESCE(SUM(tokens), 0) FROM backfill_blocks"
+            ).fetchone()
+        return int(tokens)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get counts of checkpointed blocks by status.
+        Returns:
+            Dictionary with block counts per status and token/claim totals
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT status, COUNT(*), SUM(sentences), SUM(claims), SUM(tokens)
+                FROM backfill_blocks GROUP BY status
+                """
+            ).fetchall()
+        summary: Dict[str, Any] = {"blocks": {}, "sentences": 0, "claims": 0}
+        tokens = 0
+        for status, count, sentences, claims, status_tokens in rows:
+            summary["blocks"][status] = count
+            summary["sentences"] += sentences or 0
+            summary["claims"] += claims or 0
+            tokens += status_tokens or 0
+        summary["tokens"] = tokens
+        return summary
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class TokenCountingLLM:
+    """
+    LLM wrapper that meters prompt and completion tokens.
+    Token counts are estimated at four characters per token, which is close
+    enough for budgeting without depending on a model-specific tokenizer.
+    """
+
+    def __init__(self, llm: LLMInterface):
+        self.llm = llm
+        self.tokens = 0
+        self._lock = threading.Lock()
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        """Generate a completion and add its estimated tokens to the meter."""
+        response = self.llm.complete(prompt, **kwargs)
+        self._add(estimate_tokens(prompt) + estimate_tokens(str(response)))
+        return response
+
+    def stream_complete(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Stream a completion, metering the prompt and the deltas received.
+        A stream closed early is metered with only the consumed deltas.
+        """
+        received: List[str] = []
+        try:
+            for chunk in stream_completion(self.llm, prompt, **kwargs):
+                received.append(chunk)
+                yield chunk
+        finally:
+            self._add(estimate_tokens(prompt) + estimate_tokens("".join(received)))
+
+    def _add(self, tokens: int) -> None:
+        with self._lock:
+            self.tokens += tokens
+
+
+class ClaimifyBackfillRunner:
+    """
+    Runs Claimify over a set of Tier 1 blocks with checkpointing.
+    Each block is processed and persisted as a unit, then checkpointed. A
+    rerun skips completed blocks, so a crash loses at most the block that was
+    in flight. The run stops cleanly when the token or cost budget is spent.
+    """
+
+    def __init__(
+        self,
+        pipeline: ClaimifyPipeline,
+        checkpoint_store: BackfillCheckpointStore,
+        integration: Optional[ClaimifyGraphIntegration] = None,
+        sentence_splitter: Optional[Callable[[str, str], List[str]]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        embed_texts: Optional[Callable[[List[str]], List[List[float]]]] = None,
+        stored_embeddings: Optional[
+            Callable[[str], Dict[int, Tuple[str, List[float]]]]
+        ] = None,
+    ):
+        """
+        Initialize the runner.
+        Args:
+            pipeline: Claimify pipeline to run
+            checkpoint_store: Store for per-block progress
+            integration: Graph integration used to persist results (optional)
+            sentence_splitter: Function (text, block_id) -> sentences; defaults
+                to the shared UtteranceChunker
+            sleep: Sleep function used for rate limiting
+            embed_texts: Function embedding sentence texts for the pre-selection
+                classifier; defaults to the shared EmbeddingGenerator, and is
+                only called when the gate has a trained classifier
+            stored_embeddings: Function block_id -> {chunk_index: (text, embedding)}
+                returning the utterance embeddings stored at ingestion, such as
+                aclaraiVectorStore.get_chunk_embeddings; sentences found there
+                are not embedded again
+        """
+        self.pipeline = pipeline
+        self.config = pipeline.config
+        self.checkpoint_store = checkpoint_store
+        self.integration = integration
+        self.sentence_splitter = sentence_splitter or self._split_with_chunker
+        self._chunker: Optional[Any] = None
+        self.sleep = sleep
+        self.embed_texts = embed_texts
+        self.stored_embeddings = stored_embeddings
+        self.block_parser = BlockParser()
+        self.token_meters: List[TokenCountingLLM] = []
+        for agent in (
+            pipeline.selection_agent,
+            pipeline.disambiguation_agent,
+            pipeline.decomposition_agent,
+            pipeline.fused_agent,
+        ):
+            if agent is not None and agent.llm is not None:
+                self.token_meters.append(_install_token_meter(agent))
+
+    def discover_blocks(
+        self, vault_path: str, pattern: str = "**/*.md"
+    ) -> List[BackfillBlock]:
+        """
+        Find all aclarai:id blocks in the vault, ordered by the configured priority.
+        Args:
+            vault_path: Root directory of the vault
+            pattern: Glob pattern for Tier 1 files
+        Returns:
+            Blocks in processing order
+        """
+        blocks = []
+        for file_path in Path(vault_path).glob(pattern):
+            if not file_path.is_file():
+                continue
+            try:
+                content = file_path.read_text(encoding="utf-8")
+            except Exception as e:
+                logger.warning(
+                    f"[backfill.ClaimifyBackfillRunner.discover_blocks] Could not read {file_path}: {e}",
+                    extra={
+                        "service": "aclarai-core",
+                        "pipeline": "claimify",
+                        "file_path": str(file_path),
+                        "error": str(e),
+                    },
+                )
+                continue
+            modified_time = file_path.stat().st_mtime
+            for block in self.block_parser.extract_aclarai_blocks(content):
+                blocks.append(
+                    BackfillBlock(
+                        block_id=block["aclarai_id"],
+                        file_path=str(file_path),
+                        text=block["semantic_text"],
+                        content_hash=block["content_hash"],
+                        modified_time=modified_time,
+                    )
+                )
+        return self.order_blocks(blocks)
+
+    def order_blocks(self, blocks: List[BackfillBlock]) -> List[BackfillBlock]:
+        """Order blocks by the configured backfill priority."""
+        priority = self.config.backfill_priority
+        if priority == PRIORITY_NEWEST:
+            return sorted(blocks, key=lambda b: (-b.modified_time, b.file_path))
+        if priority == PRIORITY_OLDEST:
+            return sorted(blocks, key=lambda b: (b.modified_time, b.file_path))
+        if priority == PRIORITY_PATH:
+            return sorted(blocks, key=lambda b: b.file_path)
+        raise ValueError(f"Unknown backfill priority: {priority}")
+
+    def run(
+        self,
+        blocks: Iterable[BackfillBlock],
+        progress_callback: Optional[Callable[[BackfillProgress], None]] = None,
+    ) -> BackfillProgress:
+        """
+        Process blocks, skipping those already completed.
+        Args:
+            blocks: Blocks in processing order
+            progress_callback: Called with the progress after each block
+        Returns:
+            BackfillProgress for this run
+        """
+        blocks = list(blocks)
+        progress = BackfillProgress(total_blocks=len(blocks))
+        tokens_before_run = self.checkpoint_store.total_tokens()
+        progress.tokens_used = tokens_before_run
+        for block in blocks:
+            if self.checkpoint_store.is_completed(block.block_id, block.content_hash):
+                progress.skipped_blocks += 1
+                continue
+            stop_reason = self._check_budget(progress.tokens_used)
+            if stop_reason:
+                progress.stopped_reason = stop_reason
+                logger.warning(
+                    f"[backfill.ClaimifyBackfillRunner.run] Stopping backfill: {stop_reason}",
+                    extra={
+                        "service": "aclarai-core",
+                        "pipeline": "claimify",
+                        "progress": progress.to_dict(),
+                    },
+                )
+                break
+            self._process_block(block, progress)
+            progress.tokens_used = tokens_before_run + self._metered_tokens()
+            self._log_progress(progress)
+            if progress_callback:
+                progress_callback(progress)
+        if self.pipeline.metrics is not None:
+            self.pipeline.metrics.export()
+        return progress
+
+    def _process_block(self, block: BackfillBlock, progress: BackfillProgress) -> None:
+        """Process, persist and checkpoint a single block."""
+        tokens_before = self._metered_tokens()
+        start_time = time.time()
+        try:
+            sentences = [
+                SentenceChunk(
+                    text=text,
+                    source_id=block.block_id,
+                    chunk_id=f"{block.block_id}_chunk_{i}",
+                    sentence_index=i,
+                )
+                for i, text in enumerate(
+                    self.sentence_splitter(block.text, block.block_id)
+                )
+            ]
+            self._attach_embeddings(sentences)
+            results = self.pipeline.process_sentences(sentences)
+            failed = [r for r in results if has_processing_error(r)]
+            if failed:
+                # Agents turn LLM errors into results instead of raising; keep
+                # the block unfinished so the next run retries it
+                raise RuntimeError(
+                    f"{len(failed)}/{len(results)} sentences failed: "
+                    + "; ".join(_first_error(r) for r in failed[:3])
+                )
+            claims = self._persist(results)
+        except Exception as e:
+            progress.failed_blocks += 1
+            self.checkpoint_store.mark_failed(
+                block, self._metered_tokens() - tokens_before, str(e)
+            )
+            logger.error(
+                f"[backfill.ClaimifyBackfillRunner._process_block] Failed to backfill block {block.block_id}: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "pipeline": "claimify",
+                    "aclarai_id": block.block_id,
+                    "file_path": block.file_path,
+                    "error": str(e),
+                },
+            )
+            return
+        self.checkpoint_store.mark_completed(
+            block, len(sentences), claims, self._metered_tokens() - tokens_before
+        )
+        progress.completed_blocks += 1
+        progress.processed_sentences += len(sentences)
+        progress.claims_created += claims
+        self._throttle(len(sentences), time.time() - start_time)
+
+    def _persist(self, results: List[ClaimifyResult]) -> int:
+        """Persist results, raising if any write failed so the block is retried."""
+        if self.integration is None:
+            return sum(len(r.final_claims) for r in results)
+        claims_created, _, errors = self.integration.persist_claimify_results(results)
+        if errors:
+            raise RuntimeError("; ".join(errors))
+        return claims_created
+
+    def _check_budget(self, tokens_used: int) -> Optional[str]:
+        """Get the reason to stop, if the token or cost budget is spent."""
+        token_budget = self.config.backfill_token_budget
+        if token_budget is not None and tokens_used >= token_budget:
+            return f"token budget of {token_budget} exhausted ({tokens_used} used)"
+        cost_budget = self.config.backfill_cost_budget
+        if cost_budget is not None:
+            cost = tokens_used / 1000 * self.config.backfill_cost_per_1k_tokens
+            if cost >= cost_budget:
+                return f"cost budget of {cost_budget:.2f} exhausted ({cost:.2f} spent)"
+        return None
+
+    def _throttle(self, sentence_count: int, elapsed: float) -> None:
+        """Sleep so the run stays under max_sentences_per_minute."""
+        limit = self.config.backfill_max_sentences_per_minute
+        if not limit or sentence_count == 0:
+            return
+        min_duration = sentence_count / limit * 60
+        if elapsed < min_duration:
+            self.sleep(min_duration - elapsed)
+
+    def _split_with_chunker(self, text: str, block_id: str) -> List[str]:
+        """Split a block into sentence chunks with the shared UtteranceChunker."""
+        if self._chunker is None:
+            from ..embedding.chunking import UtteranceChunker
+
+            self._chunker = UtteranceChunker()
+        return [
+            chunk.text for chunk in self._chunker.chunk_utterance_block(text, block_id)
+        ]
+
+    def _attach_embeddings(self, sentences: List[SentenceChunk]) -> None:
+        """
+        Attach embeddings when the pre-selection gate has a classifier.
+        Sentences are split with the same chunker as ingestion, so a stored
+        utterance embedding with the same chunk index and text is reused;
+        only the remaining sentences are embedded.
+        """
+        gate = self.pipeline.selection_agent.preselection_gate
+        if (
+            not sentences
+            or gate is None
+            or gate.classifier is None
+            or not gate.classifier.is_trained
+        ):
+            return
+        stored: Dict[int, Tuple[str, List[float]]] = {}
+        if self.stored_embeddings is not None:
+            stored = self.stored_embeddings(sentences[0].source_id)
+        missing = []
+        for sentence in sentences:
+            chunk_text, embedding = stored.get(sentence.sentence_index, (None, None))
+            if chunk_text == sentence.text:
+                sentence.embedding = embedding
+            else:
+                missing.append(sentence)
+        if not missing:
+            return
+        if self.embed_texts is None:
+            from ..embedding import EmbeddingGenerator
+
+            self.embed_texts = (
+                EmbeddingGenerator().embedding_model.get_text_embedding_batch
+            )
+        embeddings = self.embed_texts([sentence.text for sentence in missing])
+        for sentence, embedding in zip(missing, embeddings, strict=True):
+            sentence.embedding = embedding
+
+    def _metered_tokens(self) -> int:
+        return sum(meter.tokens for meter in self.token_meters)
+
+    def _log_progress(self, progress: BackfillProgress) -> None:
+        eta = progress.eta_seconds()
+        eta_text = f"{eta / 60:.1f} min" if eta is not None else "unknown"
+        logger.info(
+            f"[backfill.ClaimifyBackfillRunner.run] Backfill progress: "
+            f"{progress.completed_blocks + progress.skipped_blocks}/{progress.total_blocks} blocks, "
+            f"{progress.sentences_per_minute():.1f} sentences/min, ETA {eta_text}",
+            extra={
+                "service": "aclarai-core",
+                "pipeline": "claimify",
+                "progress": progress.to_dict(),
+            },
+        )
+
+
+def _first_error(result: ClaimifyResult) -> str:
+    """Get the first error message recorded on a failed result."""
+    if result.errors:
+        return result.errors[0]
+    if result.selection_result is not None and (
+        result.selection_result.reasoning or ""
+    ).startswith(ERROR_PREFIX):
+        return result.selection_result.reasoning
+    if result.disambiguation_result is not None:
+        for change in result.disambiguation_result.changes_made:
+            if change.startswith(ERROR_PREFIX):
+                return change
+    if (
+        result.decomposition_result is not None
+        and result.decomposition_result.error is not None
+    ):
+        return result.decomposition_result.error
+    return "unknown error"
+
+
+def _install_token_meter(agent: Any) -> TokenCountingLLM:
+    """
+    Meter an agent's LLM calls, below its response cache if it has one.
+    Cache hits cost nothing, so only calls that reach the model are counted.
+    """
+    holder = agent.llm if isinstance(agent.llm, CachedLLM) else agent
+    if not isinstance(holder.llm, TokenCountingLLM):
+        holder.llm = TokenCountingLLM(holder.llm)
+    return holder.llm
@@ -0,0 +1,202 @@
+"""
+Offline throughput benchmark for the Claimify pipeline.
+Runs ClaimifyPipeline over a fixed corpus with ReplayLLM stand-ins and reports
+sentences/sec, LLM calls per sentence and prompt tokens per stage, so
+concurrency, batching and caching strategies can be compared without a live
+model. Record the corpus once per strategy with record_claimify_corpus.
+"""
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .agents import LLMInterface
+from .data_models import ClaimifyConfig, SentenceChunk
+from .llm_cache import LLMResponseCache
+from .pipeline import ClaimifyPipeline
+from .replay import RecordingLLM, ReplayLLM, ReplayLog
+
+STAGES = ("selection", "disambiguation", "decomposition")
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and cost figures for one benchmark run."""
+
+    name: str
+    sentences: int
+    elapsed_seconds: float
+    llm_calls: Dict[str, int] = field(default_factory=dict)
+    prompt_tokens: Dict[str, int] = field(default_factory=dict)
+    replay_misses: int = 0
+    errors: int = 0
+
+    @property
+    def sentences_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.sentences / self.elapsed_seconds
+
+    @property
+    def llm_calls_per_sentence(self) -> float:
+        if self.sentences == 0:
+            return 0.0
+        return sum(self.llm_calls.values()) / self.sentences
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to a report dictionary."""
+        return {
+            "name": self.name,
+            "sentences": self.sentences,
+            "elapsed_seconds": self.elapsed_seconds,
+            "sentences_per_second": self.sentences_per_second,
+            "llm_calls_per_sentence": self.llm_calls_per_sentence,
+            "llm_calls": self.llm_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "replay_misses": self.replay_misses,
+            "errors": self.errors,
+        }
+
+
+def load_corpus(path: str) -> List[SentenceChunk]:
+    """
+    Load a benchmark corpus from a JSONL file.
+    Each line holds "text" and optionally "source_id" and "chunk_id".
+    Args:
+        path: Path to the JSONL corpus
+    Returns:
+        Sentence chunks in file order
+    """
+    sentences = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            index = len(sentences)
+            sentences.append(
+                SentenceChunk(
+                    text=record["text"],
+                    source_id=record.get("source_id", "benchmark"),
+                    chunk_id=record.get("chunk_id", f"benchmark_{index}"),
+                    sentence_index=index,
+                )
+            )
+    return sentences
+
+
+def record_claimify_corpus(
+    sentences: List[SentenceChunk],
+    llm: LLMInterface,
+    log: ReplayLog,
+    config: Optional[ClaimifyConfig] = None,
+) -> None:
+    """
+    Run the pipeline once against a live LLM, recording every completion.
+    Args:
+        sentences: Corpus to process
+        llm: Live LLM used for all stages
+        log: Replay log the completions are appended to
+        config: Pipeline configuration (its prompts determine what is recorded)
+    """
+    config = config or ClaimifyConfig()
+    stage_llms = {
+        stage: RecordingLLM(llm, log, config.get_model_for_stage(stage), stage)
+        for stage in STAGES
+    }
+    pipeline = ClaimifyPipeline(
+        config=config,
+        selection_llm=stage_llms["selection"],
+        disambiguation_llm=stage_llms["disambiguation"],
+        decomposition_llm=stage_llms["decomposition"],
+    )
+    pipeline.process_sentences(sentences)
+
+
+def run_claimify_benchmark(
+    sentences: List[SentenceChunk],
+    log: ReplayLog,
+    config: Optional[ClaimifyConfig] = None,
+    name: str = "default",
+    simulate_latency: bool = True,
+    latency_scale: float = 1.0,
+    llm_cache: Optional[LLMResponseCache] = None,
+) -> BenchmarkResult:
+    """
+    Replay the pipeline over a corpus and measure throughput.
+    Args:
+        sentences: Corpus to process
+        log: Recorded completions to replay
+        config: Pipeline configuration under test
+        name: Label for the result
+        simulate_latency: Sleep for recorded latencies so concurrency matters
+        latency_scale: Multiplier for recorded latencies (e.g. 0.1 for quick runs)
+        llm_cache: Optional response cache placed in front of the replayed LLMs
+    Returns:
+        BenchmarkResult for the run
+    """
+    config = config or ClaimifyConfig()
+    if llm_cache is None and config.llm_cache_enabled:
+        # Keep benchmark runs from touching the persistent cache file
+        llm_cache = LLMResponseCache(":memory:")
+    stage_llms = {
+        stage: ReplayLLM(
+            log,
+            config.get_model_for_stage(stage),
+            stage,
+            simulate_latency=simulate_latency,
+            latency_scale=latency_scale,
+        )
+        for stage in STAGES
+    }
+    pipeline = ClaimifyPipeline(
+        config=config,
+        selection_llm=stage_llms["selection"],
+        disambiguation_llm=stage_llms["disambiguation"],
+        decomposition_llm=stage_llms["decomposition"],
+        llm_cache=llm_cache,
+    )
+    start_time = time.time()
+    results = pipeline.process_sentences(sentences)
+    elapsed = time.time() - start_time
+    return BenchmarkResult(
+        name=name,
+        sentences=len(sentences),
+        elapsed_seconds=elapsed,
+        llm_calls={stage: llm.calls for stage, llm in stage_llms.items()},
+        prompt_tokens={stage: llm.prompt_tokens for stage, llm in stage_llms.items()},
+        replay_misses=sum(llm.misses for llm in stage_llms.values()),
+        errors=sum(len(r.errors) for r in results),
+    )
+
+
+def compare_strategies(
+    sentences: List[SentenceChunk],
+    log: ReplayLog,
+    configs: Dict[str, ClaimifyConfig],
+    simulate_latency: bool = True,
+    latency_scale: float = 1.0,
+) -> List[BenchmarkResult]:
+    """
+    Benchmark several pipeline configurations on the same corpus.
+    Args:
+        sentences: Corpus to process
+        log: Recorded completions covering every configuration's prompts
+        configs: Configurations keyed by strategy name
+        simulate_latency: Sleep for recorded latencies
+        latency_scale: Multiplier for recorded latencies
+    Returns:
+        One BenchmarkResult per configuration, in the given order
+    """
+    return [
+        run_claimify_benchmark(
+            sentences,
+            log,
+            config,
+            name=name,
+            simulate_latency=simulate_latency,
+            latency_scale=latency_scale,
+        )
+        for name, config in configs.items()
+    ]
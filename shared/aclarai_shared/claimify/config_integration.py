@@ -43,6 +43,50 @@ def load_claimify_config_from_yaml(config_data: Dict[str, Any]) -> ClaimifyConfi
     timeout_seconds = processing_config.get("timeout_seconds", 30)
     temperature = processing_config.get("temperature", 0.1)
     max_tokens = processing_config.get("max_tokens", 1000)
+    # Concurrency settings
+    concurrency_config = claimify_processing.get("concurrency", {})
+    max_concurrency = concurrency_config.get("max_workers", 1)
+    model_concurrency_limits = concurrency_config.get("per_model", {}) or {}
+    selection_batch_size = claimify_processing.get("selection_batch_size", 1)
+    # LLM response cache settings
+    cache_config = claimify_processing.get("llm_cache", {})
+    llm_cache_enabled = cache_config.get("enabled", False)
+    llm_cache_path = cache_config.get(
+        "path", ".aclarai/cache/claimify_llm_cache.sqlite"
+    )
+    llm_cache_ttl_seconds = cache_config.get("ttl_seconds", 604800)
+    llm_cache_max_entries = cache_config.get("max_entries", 100000)
+    # Local pre-selection gate settings
+    preselection_config = claimify_processing.get("preselection", {})
+    preselection_enabled = preselection_config.get("enabled", False)
+    preselection_confidence_threshold = preselection_config.get(
+        "confidence_threshold", 0.9
+    )
+    preselection_classifier_path = preselection_config.get("classifier_path")
+    persistence_batch_size = claimify_processing.get("persistence_batch_size", 100)
+    # Backfill runner settings
+    backfill_config = claimify_processing.get("backfill", {})
+    backfill_checkpoint_path = backfill_config.get(
+        "checkpoint_path", ".aclarai/cache/claimify_backfill.sqlite"
+    )
+    backfill_priority = backfill_config.get("priority", "newest")
+    backfill_token_budget = backfill_config.get("token_budget")
+    backfill_cost_budget = backfill_config.get("cost_budget")
+    backfill_cost_per_1k_tokens = backfill_config.get("cost_per_1k_tokens", 0.0)
+    backfill_max_sentences_per_minute = backfill_config.get("max_sentences_per_minute")
+    fused_stage_models = list(claimify_processing.get("fused_stage_models", []) or [])
+    memo_config = claimify_processing.get("sentence_memo", {})
+    sentence_memo_enabled = memo_config.get("enabled", False)
+    sentence_memo_strictness = memo_config.get("strictness", "normalized")
+    sentence_memo_max_entries = memo_config.get("max_entries", 50000)
+    streaming_enabled = claimify_processing.get("streaming", {}).get("enabled", False)
+    # Metrics settings
+    metrics_config = claimify_processing.get("metrics", {})
+    metrics_enabled = metrics_config.get("enabled", False)
+    metrics_jsonl_path = metrics_config.get("jsonl_path")
+    metrics_export_interval_seconds = metrics_config.get(
+        "export_interval_seconds", 60.0
+    )
     # Threshold settings (to be implemented when threshold evaluation is added)
     # For now, these return default values as the thresholds are not yet configured
     selection_confidence_threshold = 0.5
@@ -64,6 +108,31 @@ def load_claimify_config_from_yaml(config_data: Dict[str, Any]) -> ClaimifyConfi
         timeout_seconds=timeout_seconds,
         temperature=temperature,
         max_tokens=max_tokens,
+        max_concurrency=max_concurrency,
+        model_concurrency_limits=model_concurrency_limits,
+        selection_batch_size=selection_batch_size,
+        llm_cache_enabled=llm_cache_enabled,
+        llm_cache_path=llm_cache_path,
+        llm_cache_ttl_seconds=llm_cache_ttl_seconds,
+        llm_cache_max_entries=llm_cache_max_entries,
+        preselection_enabled=preselection_enabled,
+        preselection_confidence_threshold=preselection_confidence_threshold,
+        preselection_classifier_path=preselection_classifier_path,
+        persistence_batch_size=persistence_batch_size,
+        backfill_checkpoint_path=backfill_checkpoint_path,
+        backfill_priority=backfill_priority,
+        backfill_token_budget=backfill_token_budget,
+        backfill_cost_budget=backfill_cost_budget,
+        backfill_cost_per_1k_tokens=backfill_cost_per_1k_tokens,
+        backfill_max_sentences_per_minute=backfill_max_sentences_per_minute,
+        fused_stage_models=fused_stage_models,
+        sentence_memo_enabled=sentence_memo_enabled,
+        sentence_memo_strictness=sentence_memo_strictness,
+        sentence_memo_max_entries=sentence_memo_max_entries,
+        streaming_enabled=streaming_enabled,
+        metrics_enabled=metrics_enabled,
+        metrics_jsonl_path=metrics_jsonl_path,
+        metrics_export_interval_seconds=metrics_export_interval_seconds,
         selection_confidence_threshold=selection_confidence_threshold,
         disambiguation_confidence_threshold=disambiguation_confidence_threshold,
         decomposition_confidence_threshold=decomposition_confidence_threshold,
@@ -7,10 +7,13 @@ pipeline, including input/output types and configuration models.
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Stage name of the single-call Disambiguation + Decomposition mode
+FUSED_STAGE = "disambiguation_decomposition"
+
 
 class NodeType(str, Enum):
     """Types of nodes that can be created from processed content."""
@@ -31,6 +34,7 @@ class SentenceChunk:
     source_id: str  # Original block/document ID
     chunk_id: str  # Unique identifier for this chunk
     sentence_index: int  # Position within the source
+    embedding: Optional[List[float]] = None  # Precomputed embedding, if available
 
 
 @dataclass
@@ -107,6 +111,7 @@ class DecompositionResult:
     original_text: str
     claim_candidates: List[ClaimCandidate] = field(default_factory=list)
     processing_time: Optional[float] = None
+    error: Optional[str] = None
 
     @property
     def valid_claims(self) -> List[ClaimCandidate]:
@@ -168,6 +173,43 @@ class ClaimifyConfig:
     timeout_seconds: int = 30
     temperature: float = 0.1
     max_tokens: int = 1000
+    # Concurrency parameters
+    max_concurrency: int = 1  # Sentences processed in parallel (1 = sequential)
+    model_concurrency_limits: Dict[str, int] = field(
+        default_factory=dict
+    )  # Max in-flight LLM calls per model name
+    # Selection batching (1 = one selection prompt per sentence)
+    selection_batch_size: int = 1
+    # Persistent LLM response cache
+    llm_cache_enabled: bool = False
+    llm_cache_path: str = ".aclarai/cache/claimify_llm_cache.sqlite"
+    llm_cache_ttl_seconds: int = 604800  # 7 days
+    llm_cache_max_entries: int = 100000
+    # Local pre-selection gate (rejects obvious non-claims before the LLM)
+    preselection_enabled: bool = False
+    preselection_confidence_threshold: float = 0.9
+    preselection_classifier_path: Optional[str] = None
+    # Streaming persistence (results per Neo4j micro-batch)
+    persistence_batch_size: int = 100
+    # Backfill runner
+    backfill_checkpoint_path: str = ".aclarai/cache/claimify_backfill.sqlite"
+    backfill_priority: str = "newest"  # "newest", "oldest" or "path"
+    backfill_token_budget: Optional[int] = None
+    backfill_cost_budget: Optional[float] = None
+    backfill_cost_per_1k_tokens: float = 0.0
+    backfill_max_sentences_per_minute: Optional[int] = None
+    # Models that run Disambiguation and Decomposition in one fused call
+    fused_stage_models: List[str] = field(default_factory=list)
+    # Reuse of finished results for repeated sentences across conversations
+    sentence_memo_enabled: bool = False
+    sentence_memo_strictness: str = "normalized"  # "exact", "normalized" or "relaxed"
+    sentence_memo_max_entries: int = 50000
+    # Stream completions and stop once a Selection rejection is decided
+    streaming_enabled: bool = False
+    # Per-stage latency, token and selection-rate metrics
+    metrics_enabled: bool = False
+    metrics_jsonl_path: Optional[str] = None
+    metrics_export_interval_seconds: float = 60.0
     # Quality thresholds (to be added when threshold evaluation is implemented)
     selection_confidence_threshold: float = 0.5
     disambiguation_confidence_threshold: float = 0.5
@@ -183,5 +225,24 @@ class ClaimifyConfig:
             "selection": self.selection_model,
             "disambiguation": self.disambiguation_model,
             "decomposition": self.decomposition_model,
+            FUSED_STAGE: self.decomposition_model,
         }
         return stage_models.get(stage) or self.default_model
+
+    def get_fused_stage_model(self) -> Optional[str]:
+        """
+        Get the model for fused Disambiguation + Decomposition, if enabled.
+        Fusing applies only when both stages use the same model and that
+        model is listed in fused_stage_models.
+        """
+        model = self.get_model_for_stage("decomposition")
+        if model != self.get_model_for_stage("disambiguation"):
+            return None
+        return model if model in self.fused_stage_models else None
+
+    def get_concurrency_limit_for_model(self, model: str) -> Optional[int]:
+        """Get the max number of in-flight LLM calls for a model, if limited."""
+        limit = self.model_concurrency_limits.get(model)
+        if limit is None or limit <= 0:
+            return None
+        return limit
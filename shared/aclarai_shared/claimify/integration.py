@@ -5,11 +5,16 @@ and persist them to the knowledge graph.
 """
 
 import logging
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from ..graph.models import ClaimInput, SentenceInput
 from ..graph.neo4j_manager import Neo4jGraphManager
-from .data_models import ClaimCandidate, ClaimifyResult, SentenceChunk
+from .data_models import (
+    ClaimCandidate,
+    ClaimifyConfig,
+    ClaimifyResult,
+    SentenceChunk,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +27,19 @@ class ClaimifyGraphIntegration:
     to the knowledge graph.
     """
 
-    def __init__(self, graph_manager: Neo4jGraphManager):
+    def __init__(
+        self,
+        graph_manager: Neo4jGraphManager,
+        config: Optional[ClaimifyConfig] = None,
+    ):
         """
         Initialize the integration with a graph manager.
         Args:
             graph_manager: Neo4jGraphManager instance for database operations
+            config: Claimify configuration (used for persistence batch size)
         """
         self.graph_manager = graph_manager
+        self.config = config or ClaimifyConfig()
 
     def persist_claimify_results(
         self, results: List[ClaimifyResult]
@@ -55,7 +66,47 @@ class ClaimifyGraphIntegration:
                 logger.error(
                     f"[integration.ClaimifyGraphIntegration.persist_claimify_results] {error_msg}"
                 )
-        # Persist to Neo4j
+        claims_created, sentences_created, persist_errors = self._persist_inputs(
+            claim_inputs, sentence_inputs
+        )
+        errors.extend(persist_errors)
+        return claims_created, sentences_created, errors
+
+    def persist_claimify_stream(
+        self, results: Iterable[ClaimifyResult], batch_size: Optional[int] = None
+    ) -> Tuple[int, int, List[str]]:
+        """
+        Persist a stream of Claimify results in micro-batches.
+        Results are written every batch_size results, so memory stays bounded
+        and completed work is durable even if a later sentence fails.
+        Args:
+            results: Iterable of ClaimifyResult objects, e.g. from
+                ClaimifyPipeline.iter_process_sentences
+            batch_size: Number of results per Neo4j write (defaults to
+                config.persistence_batch_size)
+        Returns:
+            Tuple of (claims_created, sentences_created, errors)
+        """
+        sink = ClaimifyGraphSink(
+            self, batch_size=batch_size or self.config.persistence_batch_size
+        )
+        with sink:
+            for _ in sink.consume(results):
+                pass
+        return sink.claims_created, sink.sentences_created, sink.errors
+
+    def _persist_inputs(
+        self, claim_inputs: List[ClaimInput], sentence_inputs: List[SentenceInput]
+    ) -> Tuple[int, int, List[str]]:
+        """
+        Write converted claim and sentence inputs to Neo4j.
+        Args:
+            claim_inputs: Claims to create
+            sentence_inputs: Sentences to create
+        Returns:
+            Tuple of (claims_created, sentences_created, errors)
+        """
+        errors = []
         claims_created = 0
         sentences_created = 0
         if claim_inputs:
@@ -63,26 +114,26 @@ class ClaimifyGraphIntegration:
                 created_claims = self.graph_manager.create_claims(claim_inputs)
                 claims_created = len(created_claims)
                 logger.info(
-                    f"[integration.ClaimifyGraphIntegration.persist_claimify_results] Persisted {claims_created} claims"
+                    f"[integration.ClaimifyGraphIntegration._persist_inputs] Persisted {claims_created} claims"
                 )
             except Exception as e:
                 error_msg = f"Failed to persist claims to Neo4j: {e}"
                 errors.append(error_msg)
                 logger.error(
-                    f"[integration.ClaimifyGraphIntegration.persist_claimify_results] {error_msg}"
+                    f"[integration.ClaimifyGraphIntegration._persist_inputs] {error_msg}"
                 )
         if sentence_inputs:
             try:
                 created_sentences = self.graph_manager.create_sentences(sentence_inputs)
                 sentences_created = len(created_sentences)
                 logger.info(
-                    f"[integration.ClaimifyGraphIntegration.persist_claimify_results] Persisted {sentences_created} sentences"
+                    f"[integration.ClaimifyGraphIntegration._persist_inputs] Persisted {sentences_created} sentences"
                 )
             except Exception as e:
                 error_msg = f"Failed to persist sentences to Neo4j: {e}"
                 errors.append(error_msg)
                 logger.error(
-                    f"[integration.ClaimifyGraphIntegration.persist_claimify_results] {error_msg}"
+                    f"[integration.ClaimifyGraphIntegration._persist_inputs] {error_msg}"
                 )
         return claims_created, sentences_created, errors
 
@@ -194,6 +245,89 @@ class ClaimifyGraphIntegration:
         )
 
 
+class ClaimifyGraphSink:
+    """
+    Micro-batching persistence sink for streamed Claimify results.
+    Buffers converted claim and sentence inputs and flushes them to Neo4j once
+    batch_size results have been added. Use as a context manager so the last
+    partial batch is flushed on exit.
+    """
+
+    def __init__(self, integration: ClaimifyGraphIntegration, batch_size: int = 100):
+        """
+        Initialize the sink.
+        Args:
+            integration: Integration used to convert and persist results
+            batch_size: Number of results buffered before each flush
+        """
+        self.integration = integration
+        self.batch_size = max(batch_size, 1)
+        self._claim_inputs: List[ClaimInput] = []
+        self._sentence_inputs: List[SentenceInput] = []
+        self._buffered_results = 0
+        self.claims_created = 0
+        self.sentences_created = 0
+        self.flushes = 0
+        self.errors: List[str] = []
+
+    def add(self, result: ClaimifyResult) -> None:
+        """Buffer one result, flushing when the batch is full."""
+        try:
+            claims, sentences = self.integration._convert_result_to_inputs(result)
+            self._claim_inputs.extend(claims)
+            self._sentence_inputs.extend(sentences)
+        except Exception as e:
+            error_msg = f"Failed to convert result for chunk {result.original_chunk.chunk_id}: {e}"
+            self.errors.append(error_msg)
+            logger.error(f"[integration.ClaimifyGraphSink.add] {error_msg}")
+        self._buffered_results += 1
+        if self._buffered_results >= self.batch_size:
+            self.flush()
+
+    def consume(self, results: Iterable[ClaimifyResult]) -> Iterator[ClaimifyResult]:
+        """
+        Add each result to the sink and pass it through to the caller.
+        Args:
+            results: Iterable of ClaimifyResult objects
+        Yields:
+            The same results, after they have been buffered
+        """
+        for result in results:
+            self.add(result)
+            yield result
+
+    def flush(self) -> None:
+        """Write all buffered inputs to Neo4j."""
+        if self._buffered_results == 0:
+            return
+        claim_inputs, self._claim_inputs = self._claim_inputs, []
+        sentence_inputs, self._sentence_inputs = self._sentence_inputs, []
+        buffered_results, self._buffered_results = self._buffered_results, 0
+        claims_created, sentences_created, errors = self.integration._persist_inputs(
+            claim_inputs, sentence_inputs
+        )
+        self.claims_created += claims_created
+        self.sentences_created += sentences_created
+        self.errors.extend(errors)
+        self.flushes += 1
+        logger.debug(
+            f"[integration.ClaimifyGraphSink.flush] Flushed {buffered_results} results ({claims_created} claims, {sentences_created} sentences)",
+            extra={
+                "service": "aclarai-core",
+                "pipeline": "claimify",
+                "results": buffered_results,
+                "claims_created": claims_created,
+                "sentences_created": sentences_created,
+            },
+        )
+
+    def __enter__(self) -> "ClaimifyGraphSink":
+        return self
+
+    def __exit__(self, _exc_type, _exc_val, _exc_tb) -> None:
+        self.flush()
+
+
 def create_graph_manager_from_config(_config: dict) -> Neo4jGraphManager:
     """
     Create a Neo4jGraphManager from configuration.
@@ -0,0 +1,138 @@
+"""
+Incremental parsing and repair of JSON emitted by Claimify LLM stages.
+IncrementalJSONParser consumes a streamed completion chunk by chunk and
+exposes each top-level field as soon as its value is complete, so a caller
+can stop generation once the fields it needs are decided.
+repair_truncated_json recovers the complete prefix of a response that was
+cut off (max_tokens) or wrapped in a Markdown code fence.
+"""
+
+import contextlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class IncrementalJSONParser:
+    """
+    Streaming parser for a single top-level JSON object.
+    Text before the first "{" (such as a code fence) is ignored. Each
+    top-level member is decoded once the "," or "}" that ends it arrives.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self.fields: Dict[str, Any] = {}
+        self.is_complete = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        """
+        Consume the next chunk of the completion.
+        Args:
+            chunk: Text delta from the LLM stream
+        Returns:
+            The top-level fields decided so far
+        """
+        self.text += chunk
+        while self._pos < len(self.text) and not self.is_complete:
+            char = self.text[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                if self._depth > 0:
+                    self._in_string = True
+            elif char in "{[":
+                if self._depth == 0 and char == "{":
+                    self._member_start = self._pos + 1
+                if self._depth > 0 or char == "{":
+                    self._depth += 1
+            elif char in "}]" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._close_member(self._pos)
+                    self.is_complete = True
+            elif char == "," and self._depth == 1:
+                self._close_member(self._pos)
+                self._member_start = self._pos + 1
+            self._pos += 1
+        return self.fields
+
+    def _close_member(self, end: int) -> None:
+        """Decode the top-level member that ends at the given position."""
+        member = self.text[self._member_start : end].strip()
+        if not member:
+            return
+        # Malformed members are left to the full-text parse
+        with contextlib.suppress(json.JSONDecodeError):
+            self.fields.update(json.loads("{" + member + "}"))
+
+
+def repair_truncated_json(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Recover the complete prefix of a truncated or fenced JSON object.
+    Open brackets are closed. An incomplete last member (a cut-off string,
+    a dangling key, a partial literal or a trailing comma) is dropped rather
+    than guessed at, backing off one member at a time until the result parses.
+    Args:
+        text: Raw LLM response
+    Returns:
+        The recovered object, or None if no JSON object could be recovered
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    text = text[start:]
+    stack: List[str] = []
+    cut_points: List[Tuple[int, List[str]]] = []
+    in_string = False
+    escape = False
+    end = len(text)
+    for index, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append(char)
+        elif char in "}]":
+            if not stack:
+                end = index
+                break
+            stack.pop()
+            if not stack:
+                end = index + 1
+                break
+        elif char == ",":
+            cut_points.append((index, list(stack)))
+    candidates = [] if in_string else [text[:end] + _closing(stack)]
+    for index, open_stack in reversed(cut_points):
+        candidates.append(text[:index] + _closing(open_stack))
+    for candidate in candidates:
+        try:
+            result = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(result, dict):
+            return result
+    return None
+
+
+def _closing(stack: List[str]) -> str:
+    """Get the closing brackets for a stack of open brackets."""
+    return "".join(_CLOSERS[opener] for opener in reversed(stack))
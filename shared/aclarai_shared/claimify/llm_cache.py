@@ -0,0 +1,306 @@
+"""
+Persistent LLM response cache for the Claimify pipeline.
+Re-running Claimify over unchanged content (config reloads, requeued dirty
+blocks, vault resyncs) sends identical prompts to the LLM. This module caches
+completions in SQLite, keyed by (model, stage, prompt hash, temperature), with
+TTL and size-based eviction.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .agents import LLMInterface, stream_completion
+from .json_stream import IncrementalJSONParser
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed cache of LLM completions.
+    Entries expire after ttl_seconds and the least recently used entries are
+    evicted once the cache holds more than max_entries rows. Hit and miss
+    counters are tracked per stage for reporting.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize the cache.
+        Args:
+            path: SQLite database path (":memory:" for a non-persistent cache)
+            ttl_seconds: Entry lifetime in seconds (None or <= 0 disables expiry)
+            max_entries: Maximum number of entries (None or <= 0 disables the limit)
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self.max_entries = max_entries if max_entries and max_entries > 0 else None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS llm_cache_last_accessed ON llm_cache (last_accessed)"
+        )
+        self._conn.commit()
+        logger.info(
+            f"[llm_cache.LLMResponseCache.__init__] Opened Claimify LLM cache at {path}",
+            extra={
+                "service": "aclarai-core",
+                "pipeline": "claimify",
+                "cache_path": path,
+                "ttl_seconds": self.ttl_seconds,
+                "max_entries": self.max_entries,
+            },
+        )
+
+    @staticmethod
+    def make_key(model: str, stage: str, prompt: str, temperature: Any) -> str:
+        """Build the cache key for a completion request."""
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return hashlib.sha256(
+            f"{model}\x00{stage}\x00{prompt_hash}\x00{temperature}".encode("utf-8")
+        ).hexdigest()
+
+    def get(
+        self,
+        model: str,
+        stage: str,
+        prompt: str,
+        temperature: Any,
+        record_stats: bool = True,
+    ) -> Optional[str]:
+        """
+        Look up a cached completion.
+        Args:
+            record_stats: Count the lookup as a hit or miss for the stage
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        key = self.make_key(model, stage, prompt, temperature)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if record_stats:
+                self._record_lookup(stage, row is not None)
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET last_accessed = ? WHERE cache_key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+            return row[0]
+
+    def record_lookup(self, stage: str, hit: bool) -> None:
+        """Count a hit or miss for a stage whose lookup skipped record_stats."""
+        with self._lock:
+            self._record_lookup(stage, hit)
+
+    def _record_lookup(self, stage: str, hit: bool) -> None:
+        """Update the stage counters; the caller holds the lock."""
+        stage_stats = self._stats.setdefault(stage, {"hits": 0, "misses": 0})
+        stage_stats["hits" if hit else "misses"] += 1
+
+    def put(
+        self, model: str, stage: str, prompt: str, temperature: Any, response: str
+    ) -> None:
+        """Store a completion and apply TTL and size eviction."""
+        key = self.make_key(model, stage, prompt, temperature)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache
+                    (cache_key, model, stage, response, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, model, stage, response, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Remove expired entries, then least recently used ones over the limit."""
+        if self.ttl_seconds:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+        if self.max_entries:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    """
+                    DELETE FROM llm_cache WHERE cache_key IN (
+                        SELECT cache_key FROM llm_cache
+                        ORDER BY last_accessed ASC LIMIT ?
+                    )
+                    """,
+                    (overflow,),
+                )
+
+    def clear(self) -> None:
+        """Remove all cached entries and reset counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+            self._stats.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters per stage and overall.
+        Returns:
+            Dictionary with per-stage and total hit rates and the entry count
+        """
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            stages = {}
+            total_hits = 0
+            total_misses = 0
+            for stage, counts in self._stats.items():
+                lookups = counts["hits"] + counts["misses"]
+                stages[stage] = {
+                    "hits": counts["hits"],
+                    "misses": counts["misses"],
+                    "hit_rate": counts["hits"] / lookups if lookups > 0 else 0,
+                }
+                total_hits += counts["hits"]
+                total_misses += counts["misses"]
+        total_lookups = total_hits + total_misses
+        return {
+            "entries": entries,
+            "hits": total_hits,
+            "misses": total_misses,
+            "hit_rate": total_hits / total_lookups if total_lookups > 0 else 0,
+            "stages": stages,
+        }
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Suffix of the stage under which decided prefixes of early-stopped streams
+# are kept, apart from full responses
+DECIDED_PREFIX_SUFFIX = ":decided"
+
+
+class CachedLLM:
+    """
+    LLM wrapper that serves completions from an LLMResponseCache.
+    Only responses that parse as JSON are stored, since every Claimify agent
+    expects JSON and a cached malformed response would fail on every re-run.
+    """
+
+    def __init__(
+        self, llm: LLMInterface, cache: LLMResponseCache, model: str, stage: str
+    ):
+        self.llm = llm
+        self.cache = cache
+        self.model = model
+        self.stage = stage
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        """Return a cached completion, or call the LLM and cache its response."""
+        temperature = kwargs.get("temperature")
+        cached = self.cache.get(self.model, self.stage, prompt, temperature)
+        if cached is not None:
+            return cached
+        response = self.llm.complete(prompt, **kwargs)
+        if self._is_cacheable(response):
+            self.cache.put(self.model, self.stage, prompt, temperature, response)
+        return response
+
+    def stream_complete(self, prompt: str, **kwargs) -> Iterator[str]:
+        """
+        Stream a cached completion, or stream from the LLM and cache the result.
+        Agents close the stream once their verdict is decided (such as a
+        Selection rejection). The top-level fields complete at that point
+        are cached under a separate decided-prefix stage, which only
+        streaming callers read, so complete() never returns a truncated
+        response. A stream that fails, or is closed before any field is
+        complete, is never cached.
+        """
+        temperature = kwargs.get("temperature")
+        prefix_stage = f"{self.stage}{DECIDED_PREFIX_SUFFIX}"
+        cached = self.cache.get(
+            self.model, self.stage, prompt, temperature, record_stats=False
+        )
+        if cached is None:
+            cached = self.cache.get(
+                self.model, prefix_stage, prompt, temperature, record_stats=False
+            )
+        self.cache.record_lookup(self.stage, cached is not None)
+        if cached is not None:
+            yield cached
+            return
+        received: List[str] = []
+        try:
+            for chunk in stream_completion(self.llm, prompt, **kwargs):
+                received.append(chunk)
+                yield chunk
+        except GeneratorExit:
+            text = "".join(received)
+            if self._is_cacheable(text):
+                self.cache.put(self.model, self.stage, prompt, temperature, text)
+            else:
+                decided = self._decided_prefix(text)
+                if decided is not None:
+                    self.cache.put(
+                        self.model, prefix_stage, prompt, temperature, decided
+                    )
+            raise
+        response = "".join(received)
+        if self._is_cacheable(response):
+            self.cache.put(self.model, self.stage, prompt, temperature, response)
+
+    @staticmethod
+    def _decided_prefix(text: str) -> Optional[str]:
+        """Get the complete top-level fields of a partial response as JSON."""
+        parser = IncrementalJSONParser()
+        fields = parser.feed(text)
+        return json.dumps(fields) if fields else None
+
+    @staticmethod
+    def _is_cacheable(response: Any) -> bool:
+        """Check whether a response is well-formed JSON worth caching."""
+        if not isinstance(response, str):
+            return False
+        try:
+            json.loads(response.strip())
+            return True
+        except (json.JSONDecodeError, ValueError):
+            return False
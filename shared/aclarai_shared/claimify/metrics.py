@@ -0,0 +1,306 @@
+"""
+Instrumentation for the Claimify pipeline.
+Collects latency histograms (p50/p95/p99) per stage and per model, prompt and
+completion token counts, retries, JSON parse failures and the selection rate
+over time, and exports snapshots through pluggable metrics sinks.
+"""
+
+import json
+import logging
+import math
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Protocol, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+
+class MetricsSink(Protocol):
+    """Protocol for destinations of metrics snapshots."""
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        """Export a metrics snapshot."""
+        ...
+
+
+class LoggingMetricsSink:
+    """Writes metrics snapshots to the structured log."""
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        logger.info(
+            "[metrics.LoggingMetricsSink.emit] Claimify metrics snapshot",
+            extra={
+                "service": "aclarai-core",
+                "pipeline": "claimify",
+                "metrics": snapshot,
+            },
+        )
+
+
+class JsonlMetricsSink:
+    """Appends metrics snapshots to a JSONL file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(snapshot) + "\n")
+
+
+class InMemoryMetricsSink:
+    """Keeps emitted snapshots in memory (useful for tests and notebooks)."""
+
+    def __init__(self):
+        self.snapshots: List[Dict[str, Any]] = []
+
+    def emit(self, snapshot: Dict[str, Any]) -> None:
+        self.snapshots.append(snapshot)
+
+
+class LatencyHistogram:
+    """
+    Latency distribution over the most recent max_samples observations.
+    Percentiles are computed with the nearest-rank method.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one latency in seconds."""
+        self._samples.append(value)
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p: float) -> float:
+        """Get the p-th percentile (0-100) of the retained samples."""
+        return _nearest_rank(sorted(self._samples), p)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get count, mean, p50/p95/p99 and max."""
+        ordered = sorted(self._samples)
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": _nearest_rank(ordered, 50),
+            "p95": _nearest_rank(ordered, 95),
+            "p99": _nearest_rank(ordered, 99),
+            "max": self.max,
+        }
+
+
+def _nearest_rank(ordered: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = math.ceil(len(ordered) * p / 100) - 1
+    return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+
+class ClaimifyMetrics:
+    """
+    Thread-safe registry of Claimify pipeline metrics.
+    LLM-level figures are keyed by (stage, model); stage timings cover the
+    whole agent call, including parsing.
+    """
+
+    def __init__(
+        self,
+        sinks: Optional[List[MetricsSink]] = None,
+        selection_window_seconds: float = 60.0,
+        max_selection_windows: int = 1440,
+        export_interval_seconds: float = 0.0,
+    ):
+        """
+        Initialize the registry.
+        Args:
+            sinks: Destinations for exported snapshots
+            selection_window_seconds: Width of each selection-rate window
+            max_selection_windows: Number of selection-rate windows retained
+            export_interval_seconds: Minimum time between exports made through
+                export_if_due (0 exports every time)
+        """
+        self.sinks: List[MetricsSink] = list(sinks or [])
+        self.export_interval_seconds = export_interval_seconds
+        self._last_export: Optional[float] = None
+        self.selection_window_seconds = selection_window_seconds
+        self._lock = threading.Lock()
+        self._stage_latency: Dict[str, LatencyHistogram] = {}
+        self._llm_latency: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._counters: Dict[Tuple[str, str], Dict[str, int]] = {}
+        self._selection_windows: Deque[List[float]] = deque(
+            maxlen=max_selection_windows
+        )
+
+    def _counter(self, stage: str, model: str) -> Dict[str, int]:
+        return self._counters.setdefault(
+            (stage, model),
+            {
+                "calls": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "retries": 0,
+                "parse_failures": 0,
+                "json_repairs": 0,
+                "early_stops": 0,
+                "errors": 0,
+            },
+        )
+
+    def record_llm_call(
+        self,
+        stage: str,
+        model: str,
+        latency: float,
+        prompt_tokens: int,
+        completion_tokens: int,
+        error: bool = False,
+    ) -> None:
+        """Record one LLM completion."""
+        with self._lock:
+            histogram = self._llm_latency.setdefault((stage, model), LatencyHistogram())
+            histogram.observe(latency)
+            counter = self._counter(stage, model)
+            counter["calls"] += 1
+            counter["prompt_tokens"] += prompt_tokens
+            counter["completion_tokens"] += completion_tokens
+            if error:
+                counter["errors"] += 1
+
+    def record_stage_time(self, stage: str, processing_time: float) -> None:
+        """Record the end-to-end time of one agent call."""
+        with self._lock:
+            self._stage_latency.setdefault(stage, LatencyHistogram()).observe(
+                processing_time
+            )
+
+    def record_retry(self, stage: str, model: str) -> None:
+        """Record an LLM call that re-issued work for an earlier failed call."""
+        with self._lock:
+            self._counter(stage, model)["retries"] += 1
+
+    def record_parse_failure(self, stage: str, model: str) -> None:
+        """Record an LLM response that was not valid JSON."""
+        with self._lock:
+            self._counter(stage, model)["parse_failures"] += 1
+
+    def record_json_repair(self, stage: str, model: str) -> None:
+        """Record a malformed or truncated response recovered by repair."""
+        with self._lock:
+            self._counter(stage, model)["json_repairs"] += 1
+
+    def record_early_stop(self, stage: str, model: str) -> None:
+        """Record a streamed completion stopped once its verdict was decided."""
+        with self._lock:
+            self._counter(stage, model)["early_stops"] += 1
+
+    def record_selection(
+        self, selected: bool, timestamp: Optional[float] = None
+    ) -> None:
+        """Record a Selection decision in the current time window."""
+        timestamp = timestamp if timestamp is not None else time.time()
+        window_start = (
+            timestamp // self.selection_window_seconds * self.selection_window_seconds
+        )
+        with self._lock:
+            if (
+                not self._selection_windows
+                or self._selection_windows[-1][0] != window_start
+            ):
+                self._selection_windows.append([window_start, 0, 0])
+            window = self._selection_windows[-1]
+            window[2] += 1
+            if selected:
+                window[1] += 1
+
+    def selection_rate_series(self) -> List[Dict[str, float]]:
+        """Get the selection rate per time window, oldest first."""
+        with self._lock:
+            windows = list(self._selection_windows)
+        return [
+            {
+                "window_start": start,
+                "selected": selected,
+                "total": total,
+                "selection_rate": selected / total if total else 0.0,
+            }
+            for start, selected, total in windows
+        ]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all metrics as a JSON-serializable dictionary.
+        Returns:
+            Dictionary with stage latencies, per-(stage, model) LLM metrics
+            and the selection rate series
+        """
+        with self._lock:
+            stages = {
+                stage: histogram.snapshot()
+                for stage, histogram in self._stage_latency.items()
+            }
+            llm = []
+            for (stage, model), counter in self._counters.items():
+                histogram = self._llm_latency.get((stage, model))
+                llm.append(
+                    {
+                        "stage": stage,
+                        "model": model,
+                        **counter,
+                        "latency": histogram.snapshot() if histogram else None,
+                    }
+                )
+        return {
+            "timestamp": time.time(),
+            "stages": stages,
+            "llm": llm,
+            "selection_rate": self.selection_rate_series(),
+        }
+
+    def export_if_due(self) -> Optional[Dict[str, Any]]:
+        """
+        Export unless the last export is more recent than the export interval.
+        Returns:
+            The exported snapshot, or None if no export was due
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._last_export is not None
+                and now - self._last_export < self.export_interval_seconds
+            ):
+                return None
+            self._last_export = now
+        return self.export()
+
+    def export(self) -> Dict[str, Any]:
+        """Take a snapshot and send it to every sink."""
+        with self._lock:
+            self._last_export = time.monotonic()
+        snapshot = self.snapshot()
+        for sink in self.sinks:
+            try:
+                sink.emit(snapshot)
+            except Exception as e:
+                logger.warning(
+                    f"[metrics.ClaimifyMetrics.export] Metrics sink {sink.__class__.__name__} failed: {e}",
+                    extra={
+                        "service": "aclarai-core",
+                        "pipeline": "claimify",
+                        "error": str(e),
+                    },
+                )
+        return snapshot
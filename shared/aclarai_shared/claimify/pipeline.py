@@ -4,25 +4,44 @@ This module contains the ClaimifyPipeline class that coordinates the three-stage
 processing: Selection → Disambiguation → Decomposition.
 """
 
+import asyncio
 import logging
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, TypeVar
 
 from .agents import (
+    ConcurrencyLimitedLLM,
     DecompositionAgent,
     DisambiguationAgent,
+    FusedDisambiguationDecompositionAgent,
+    InstrumentedLLM,
     LLMInterface,
     SelectionAgent,
 )
 from .data_models import (
+    FUSED_STAGE,
     ClaimifyConfig,
     ClaimifyContext,
     ClaimifyResult,
+    SelectionResult,
     SentenceChunk,
 )
+from .llm_cache import CachedLLM, LLMResponseCache
+from .metrics import (
+    ClaimifyMetrics,
+    JsonlMetricsSink,
+    LoggingMetricsSink,
+    MetricsSink,
+)
+from .preselection import PRESELECTION_REASON_PREFIX, PreselectionGate
+from .sentence_memo import SentenceMemo
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ClaimifyPipeline:
     """
@@ -40,6 +59,9 @@ class ClaimifyPipeline:
         selection_llm: Optional[LLMInterface] = None,
         disambiguation_llm: Optional[LLMInterface] = None,
         decomposition_llm: Optional[LLMInterface] = None,
+        llm_cache: Optional[LLMResponseCache] = None,
+        metrics: Optional[ClaimifyMetrics] = None,
+        sentence_memo: Optional[SentenceMemo] = None,
     ):
         """
         Initialize the Claimify pipeline.
@@ -48,17 +70,91 @@ class ClaimifyPipeline:
             selection_llm: LLM instance for Selection stage
             disambiguation_llm: LLM instance for Disambiguation stage
             decomposition_llm: LLM instance for Decomposition stage
+            llm_cache: Response cache shared by all stages (created from config
+                when llm_cache_enabled is set and none is given)
+            metrics: Metrics registry for all stages (created from config when
+                metrics_enabled is set and none is given)
+            sentence_memo: Memo of finished sentence results, reused for
+                repeated sentences (created from config when
+                sentence_memo_enabled is set and none is given)
         """
         self.config = config or ClaimifyConfig()
         self.logger = logging.getLogger(f"{__name__}.ClaimifyPipeline")
+        if metrics is None and self.config.metrics_enabled:
+            sinks: List[MetricsSink] = [LoggingMetricsSink()]
+            if self.config.metrics_jsonl_path:
+                sinks.append(JsonlMetricsSink(self.config.metrics_jsonl_path))
+            metrics = ClaimifyMetrics(
+                sinks=sinks,
+                export_interval_seconds=self.config.metrics_export_interval_seconds,
+            )
+        self.metrics = metrics
+        if sentence_memo is None and self.config.sentence_memo_enabled:
+            sentence_memo = SentenceMemo(
+                strictness=self.config.sentence_memo_strictness,
+                max_entries=self.config.sentence_memo_max_entries,
+            )
+        self.sentence_memo = sentence_memo
+        # The fused stage reuses the decomposition LLM under its own stage name
+        fused_model = self.config.get_fused_stage_model()
+        fused_llm = decomposition_llm if fused_model else None
+        # Measure the model calls themselves, excluding slot waits and cache hits
+        selection_llm = self._apply_instrumentation(selection_llm, "selection")
+        disambiguation_llm = self._apply_instrumentation(
+            disambiguation_llm, "disambiguation"
+        )
+        decomposition_llm = self._apply_instrumentation(
+            decomposition_llm, "decomposition"
+        )
+        fused_llm = self._apply_instrumentation(fused_llm, FUSED_STAGE)
+        # Per-model semaphores shared by all stages that use the same model
+        self._model_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        selection_llm = self._apply_model_concurrency_limit(selection_llm, "selection")
+        disambiguation_llm = self._apply_model_concurrency_limit(
+            disambiguation_llm, "disambiguation"
+        )
+        decomposition_llm = self._apply_model_concurrency_limit(
+            decomposition_llm, "decomposition"
+        )
+        fused_llm = self._apply_model_concurrency_limit(fused_llm, FUSED_STAGE)
+        # Serve repeated prompts from the response cache before taking a slot
+        if llm_cache is None and self.config.llm_cache_enabled:
+            llm_cache = LLMResponseCache(
+                self.config.llm_cache_path,
+                ttl_seconds=self.config.llm_cache_ttl_seconds,
+                max_entries=self.config.llm_cache_max_entries,
+            )
+        self.llm_cache = llm_cache
+        selection_llm = self._apply_llm_cache(selection_llm, "selection")
+        disambiguation_llm = self._apply_llm_cache(disambiguation_llm, "disambiguation")
+        decomposition_llm = self._apply_llm_cache(decomposition_llm, "decomposition")
+        fused_llm = self._apply_llm_cache(fused_llm, FUSED_STAGE)
         # Initialize agents with their respective LLMs
-        self.selection_agent = SelectionAgent(llm=selection_llm, config=self.config)
+        preselection_gate = (
+            PreselectionGate.from_config(self.config)
+            if self.config.preselection_enabled
+            else None
+        )
+        self.selection_agent = SelectionAgent(
+            llm=selection_llm,
+            config=self.config,
+            preselection_gate=preselection_gate,
+            metrics=self.metrics,
+        )
         self.disambiguation_agent = DisambiguationAgent(
-            llm=disambiguation_llm, config=self.config
+            llm=disambiguation_llm, config=self.config, metrics=self.metrics
         )
         self.decomposition_agent = DecompositionAgent(
-            llm=decomposition_llm, config=self.config
+            llm=decomposition_llm, config=self.config, metrics=self.metrics
         )
+        self.fused_agent: Optional[FusedDisambiguationDecompositionAgent] = None
+        if fused_llm is not None:
+            self.fused_agent = FusedDisambiguationDecompositionAgent(
+                llm=fused_llm,
+                config=self.config,
+                metrics=self.metrics,
+                decomposition_agent=self.decomposition_agent,
+            )
         self.logger.info(
             "[pipeline.ClaimifyPipeline.__init__] Claimify pipeline initialized",
             extra={
@@ -67,6 +163,14 @@ class ClaimifyPipeline:
                 "config": {
                     "context_window_p": self.config.context_window_p,
                     "context_window_f": self.config.context_window_f,
+                    "max_concurrency": self.config.max_concurrency,
+                    "llm_cache_enabled": self.llm_cache is not None,
+                    "preselection_enabled": preselection_gate is not None,
+                    "metrics_enabled": self.metrics is not None,
+                    "fused_stage_model": fused_model if fused_llm else None,
+                    "sentence_memo_strictness": self.sentence_memo.strictness
+                    if self.sentence_memo is not None
+                    else None,
                     "selection_model": self.config.get_model_for_stage("selection"),
                     "disambiguation_model": self.config.get_model_for_stage(
                         "disambiguation"
@@ -99,33 +203,14 @@ class ClaimifyPipeline:
                 "sentence_count": len(sentences),
             },
         )
-        results = []
         total_start_time = time.time()
-        for i, sentence in enumerate(sentences):
-            try:
-                # Build context window for this sentence
-                context = self._build_context_window(sentence, sentences, i)
-                # Process the sentence through the pipeline
-                result = self.process_sentence(context)
-                results.append(result)
-            except Exception as e:
-                self.logger.error(
-                    f"[pipeline.ClaimifyPipeline.process] Error processing sentence {i}: {e}",
-                    extra={
-                        "service": "aclarai-core",
-                        "pipeline": "claimify",
-                        "sentence_index": i,
-                        "error": str(e),
-                    },
-                )
-                # Create error result
-                context = self._build_context_window(sentence, sentences, i)
-                error_result = ClaimifyResult(
-                    original_chunk=sentence,
-                    context=context,
-                    errors=[f"Pipeline error: {e}"],
-                )
-                results.append(error_result)
+        selection_results: List[Optional[SelectionResult]] = [None] * len(sentences)
+        if self.config.selection_batch_size > 1:
+            selection_results = self._run_batched_selection(sentences)
+        results = self._map_concurrently(
+            lambda i: self._process_sentence_at(sentences, i, selection_results[i]),
+            range(len(sentences)),
+        )
         total_processing_time = time.time() - total_start_time
         # Log summary statistics
         processed_count = sum(1 for r in results if r.was_processed)
@@ -144,16 +229,280 @@ class ClaimifyPipeline:
                 "total_processing_time": total_processing_time,
             },
         )
+        self._export_metrics()
         return results
 
-    def process_sentence(self, context: ClaimifyContext) -> ClaimifyResult:
+    def iter_process_sentences(
+        self, sentences: List[SentenceChunk]
+    ) -> Iterator[ClaimifyResult]:
+        """
+        Process sentence chunks and yield each ClaimifyResult as soon as it is ready.
+        Sentences are processed in waves of max_concurrency * selection_batch_size,
+        so only one wave of results is held in memory at a time and callers can
+        persist results while later sentences are still being processed.
+        Results are yielded in input order.
+        Args:
+            sentences: List of sentence chunks to process
+        Yields:
+            ClaimifyResult objects in input order
+        """
+        if not sentences:
+            return
+        wave_size = max(self.config.max_concurrency, 1) * max(
+            self.config.selection_batch_size, 1
+        )
+        for wave_start in range(0, len(sentences), wave_size):
+            wave = range(wave_start, min(wave_start + wave_size, len(sentences)))
+            selection_results: List[Optional[SelectionResult]] = [None] * len(wave)
+            if self.config.selection_batch_size > 1:
+                selection_results = self._run_batched_selection(sentences, wave)
+            wave_results = self._map_concurrently(
+                lambda i, selected=selection_results, offset=wave.start: (
+                    self._process_sentence_at(sentences, i, selected[i - offset])
+                ),
+                wave,
+            )
+            yield from wave_results
+        self._export_metrics()
+
+    async def aiter_process_sentences(
+        self, sentences: List[SentenceChunk]
+    ) -> AsyncIterator[ClaimifyResult]:
+        """
+        Async variant of iter_process_sentences.
+        Pipeline work runs in a worker thread so the event loop is not blocked.
+        Args:
+            sentences: List of sentence chunks to process
+        Yields:
+            ClaimifyResult objects in input order
+        """
+        results = self.iter_process_sentences(sentences)
+        done = object()
+        while True:
+            result = await asyncio.to_thread(next, results, done)
+            if result is done:
+                return
+            yield result
+
+    def _export_metrics(self) -> None:
+        """Send a metrics snapshot to the sinks if the export interval passed."""
+        if self.metrics is not None:
+            self.metrics.export_if_due()
+
+    def _map_concurrently(self, func: Callable[[int], T], indices: range) -> List[T]:
+        """
+        Apply func to each index, in parallel when concurrency is configured.
+        Sentences are independent once their context windows are built, so they
+        can be processed in parallel. Results are returned in index order.
+        """
+        if self.config.max_concurrency > 1 and len(indices) > 1:
+            max_workers = min(self.config.max_concurrency, len(indices))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="claimify"
+            ) as executor:
+                return list(executor.map(func, indices))
+        return [func(i) for i in indices]
+
+    def _run_batched_selection(
+        self, sentences: List[SentenceChunk], indices: Optional[range] = None
+    ) -> List[Optional[SelectionResult]]:
+        """
+        Run the Selection stage over windows of consecutive sentences.
+        Each window of selection_batch_size sentences is scored with one LLM call.
+        Args:
+            sentences: All sentences being processed
+            indices: Contiguous range of sentences to select (defaults to all)
+        Returns:
+            SelectionResult per sentence in indices, or None where batching
+            failed outright
+        """
+        if indices is None:
+            indices = range(len(sentences))
+        batch_size = self.config.selection_batch_size
+        batch_starts = range(indices.start, indices.stop, batch_size)
+
+        def _select_batch(start: int) -> List[Optional[SelectionResult]]:
+            end = min(start + batch_size, indices.stop)
+            try:
+                contexts = [
+                    self._build_context_window(sentences[i], sentences, i)
+                    for i in range(start, end)
+                ]
+                # Memoized sentences are resolved later without Selection
+                pending = [
+                    j
+                    for j, context in enumerate(contexts)
+                    if not self._is_memoized(context)
+                ]
+                results: List[Optional[SelectionResult]] = [None] * len(contexts)
+                if pending:
+                    batch_results = self.selection_agent.process_batch(
+                        [contexts[j] for j in pending]
+                    )
+                    for j, result in zip(pending, batch_results, strict=True):
+                        results[j] = result
+                return results
+            except Exception as e:
+                self.logger.error(
+                    f"[pipeline.ClaimifyPipeline._run_batched_selection] Error in batched selection for sentences {start}-{end - 1}: {e}",
+                    extra={
+                        "service": "aclarai-core",
+                        "pipeline": "claimify",
+                        "batch_start": start,
+                        "batch_end": end,
+                        "error": str(e),
+                    },
+                )
+                # Leave these sentences to per-sentence selection
+                return [None] * (end - start)
+
+        batches = self._map_concurrently(
+            lambda b: _select_batch(batch_starts[b]), range(len(batch_starts))
+        )
+        return [result for batch in batches for result in batch]
+
+    def _process_sentence_at(
+        self,
+        sentences: List[SentenceChunk],
+        index: int,
+        selection_result: Optional[SelectionResult] = None,
+    ) -> ClaimifyResult:
+        """
+        Build the context window for one sentence and process it.
+        Args:
+            sentences: All sentences being processed
+            index: Index of the sentence to process
+            selection_result: Precomputed Selection outcome (e.g. from a batch)
+        Returns:
+            ClaimifyResult for the sentence, with errors recorded on failure
+        """
+        sentence = sentences[index]
+        try:
+            # Build context window for this sentence
+            context = self._build_context_window(sentence, sentences, index)
+            # Process the sentence through the pipeline
+            return self.process_sentence(context, selection_result)
+        except Exception as e:
+            self.logger.error(
+                f"[pipeline.ClaimifyPipeline.process] Error processing sentence {index}: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "pipeline": "claimify",
+                    "sentence_index": index,
+                    "error": str(e),
+                },
+            )
+            # Create error result
+            context = self._build_context_window(sentence, sentences, index)
+            return ClaimifyResult(
+                original_chunk=sentence,
+                context=context,
+                errors=[f"Pipeline error: {e}"],
+            )
+
+    def _apply_instrumentation(
+        self, llm: Optional[LLMInterface], stage: str
+    ) -> Optional[LLMInterface]:
+        """
+        Wrap a stage LLM so its calls are recorded in the metrics registry.
+        Args:
+            llm: LLM instance for the stage
+            stage: Pipeline stage name
+        Returns:
+            The wrapped LLM, or the original LLM if metrics are disabled
+        """
+        if llm is None or self.metrics is None:
+            return llm
+        return InstrumentedLLM(
+            llm, self.metrics, self.config.get_model_for_stage(stage), stage
+        )
+
+    def _apply_model_concurrency_limit(
+        self, llm: Optional[LLMInterface], stage: str
+    ) -> Optional[LLMInterface]:
+        """
+        Wrap a stage LLM so it respects the configured per-model concurrency limit.
+        Args:
+            llm: LLM instance for the stage
+            stage: Pipeline stage name
+        Returns:
+            The wrapped LLM, or the original LLM if no limit applies
+        """
+        if llm is None:
+            return None
+        model = self.config.get_model_for_stage(stage)
+        limit = self.config.get_concurrency_limit_for_model(model)
+        if limit is None:
+            return llm
+        if model not in self._model_semaphores:
+            self._model_semaphores[model] = threading.BoundedSemaphore(limit)
+        return ConcurrencyLimitedLLM(llm, self._model_semaphores[model])
+
+    def _apply_llm_cache(
+        self, llm: Optional[LLMInterface], stage: str
+    ) -> Optional[LLMInterface]:
+        """
+        Wrap a stage LLM so its responses are served from the response cache.
+        Args:
+            llm: LLM instance for the stage
+            stage: Pipeline stage name
+        Returns:
+            The wrapped LLM, or the original LLM if caching is disabled
+        """
+        if llm is None or self.llm_cache is None:
+            return llm
+        return CachedLLM(
+            llm, self.llm_cache, self.config.get_model_for_stage(stage), stage
+        )
+
+    def _is_memoized(self, context: ClaimifyContext) -> bool:
+        """Check whether a sentence's result can be reused from the memo."""
+        if self.sentence_memo is None:
+            return False
+        return self.sentence_memo.contains(self.sentence_memo.make_key(context))
+
+    def process_sentence(
+        self,
+        context: ClaimifyContext,
+        selection_result: Optional[SelectionResult] = None,
+    ) -> ClaimifyResult:
         """
         Process a single sentence through the complete Claimify pipeline.
+        Results for sentences already seen in a matching context are reused
+        from the sentence memo, if configured.
         Args:
             context: ClaimifyContext with the sentence and surrounding context
+            selection_result: Precomputed Selection outcome; skips the Selection
+                LLM call when provided
         Returns:
             ClaimifyResult with the processing outcome
         """
+        if self.sentence_memo is None:
+            return self._run_stages(context, selection_result)
+        start_time = time.time()
+        key = self.sentence_memo.make_key(context)
+        memoized = self.sentence_memo.get(key, context)
+        if memoized is not None:
+            memoized.total_processing_time = time.time() - start_time
+            self.logger.debug(
+                f"[pipeline.ClaimifyPipeline.process_sentence] Reused memoized result for sentence: {context.current_sentence.text[:50]}...",
+                extra={
+                    "service": "aclarai-core",
+                    "pipeline": "claimify",
+                    "sentence_id": context.current_sentence.chunk_id,
+                },
+            )
+            return memoized
+        result = self._run_stages(context, selection_result)
+        self.sentence_memo.put(key, result)
+        return result
+
+    def _run_stages(
+        self,
+        context: ClaimifyContext,
+        selection_result: Optional[SelectionResult] = None,
+    ) -> ClaimifyResult:
+        """Run Selection, Disambiguation and Decomposition for one sentence."""
         sentence = context.current_sentence
         start_time = time.time()
         result = ClaimifyResult(
@@ -161,7 +510,7 @@ class ClaimifyPipeline:
             context=context,
         )
         try:
-            # Stage 1: Selection
+            # Stage 1: Selection (skipped if already decided by a batch)
             self.logger.debug(
                 f"[pipeline.ClaimifyPipeline.process_sentence] Processing sentence through Selection: {sentence.text[:50]}...",
                 extra={
@@ -171,12 +520,30 @@ class ClaimifyPipeline:
                     "sentence_id": sentence.chunk_id,
                 },
             )
-            selection_result = self.selection_agent.process(context)
+            if selection_result is None:
+                selection_result = self.selection_agent.process(context)
             result.selection_result = selection_result
             # If not selected, stop processing
             if not selection_result.is_selected:
                 result.total_processing_time = time.time() - start_time
                 return result
+            if self.fused_agent is not None:
+                # Stages 2 and 3 in a single LLM call
+                self.logger.debug(
+                    f"[pipeline.ClaimifyPipeline.process_sentence] Processing sentence through fused Disambiguation/Decomposition: {sentence.text[:50]}...",
+                    extra={
+                        "service": "aclarai-core",
+                        "pipeline": "claimify",
+                        "stage": FUSED_STAGE,
+                        "sentence_id": sentence.chunk_id,
+                    },
+                )
+                (
+                    result.disambiguation_result,
+                    result.decomposition_result,
+                ) = self.fused_agent.process(sentence, context)
+                result.total_processing_time = time.time() - start_time
+                return result
             # Stage 2: Disambiguation
             self.logger.debug(
                 f"[pipeline.ClaimifyPipeline.process_sentence] Processing sentence through Disambiguation: {sentence.text[:50]}...",
@@ -317,4 +684,25 @@ class ClaimifyPipeline:
                 "total_avg": sum(total_times) / len(total_times) if total_times else 0,
             },
         }
+        if self.selection_agent.preselection_gate is not None:
+            preselection_rejections = sum(
+                1
+                for r in results
+                if r.selection_result
+                and (r.selection_result.reasoning or "").startswith(
+                    PRESELECTION_REASON_PREFIX
+                )
+            )
+            stats["preselection"] = {
+                "rejections": preselection_rejections,
+                "rejection_rate": preselection_rejections / total_sentences
+                if total_sentences > 0
+                else 0,
+            }
+        if self.llm_cache is not None:
+            stats["llm_cache"] = self.llm_cache.get_stats()
+        if self.metrics is not None:
+            stats["metrics"] = self.metrics.snapshot()
+        if self.sentence_memo is not None:
+            stats["sentence_memo"] = self.sentence_memo.get_stats()
         return stats
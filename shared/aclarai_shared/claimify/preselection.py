@@ -0,0 +1,420 @@
+"""
+Local pre-selection gate for the Claimify Selection stage.
+Many sentence chunks in chat exports ("OK.", "Thanks!", pure questions) are
+always rejected by the Selection prompt's own rules. This module decides those
+cases locally, on CPU, before any LLM call is made:
+- Rules catch fillers, acknowledgements, greetings and pure questions
+- An optional logistic-regression classifier scores SentenceChunk.embedding.
+  It only runs for chunks whose embedding is set. The backfill runner sets
+  it, reusing the utterance embeddings stored at ingestion; other pipeline
+  callers get rules only unless they attach embeddings themselves
+The gate only ever rejects, and only when its confidence reaches the configured
+threshold. Everything else is left to the Selection LLM.
+"""
+
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .data_models import SentenceChunk
+
+logger = logging.getLogger(__name__)
+
+# Whole-sentence fillers the Selection prompt always rejects
+FILLER_PHRASES = {
+    "ok",
+    "okay",
+    "k",
+    "yes",
+    "yeah",
+    "yep",
+    "no",
+    "nope",
+    "sure",
+    "thanks",
+    "thank you",
+    "thanks a lot",
+    "thank you so much",
+    "got it",
+    "cool",
+    "great",
+    "nice",
+    "perfect",
+    "awesome",
+    "right",
+    "hmm",
+    "hm",
+    "uh",
+    "um",
+    "lol",
+    "haha",
+    "sounds good",
+    "makes sense",
+    "i see",
+    "agreed",
+    "done",
+}
+GREETING_PATTERN = re.compile(
+    r"^(hi|hello|hey|good (morning|afternoon|evening)|bye|goodbye|see you)\b",
+    re.IGNORECASE,
+)
+# Opening words of a pure question; "The server is down, right?" opens with
+# a statement and is left to the Selection LLM
+QUESTION_OPENERS = {
+    "what",
+    "why",
+    "how",
+    "who",
+    "whom",
+    "whose",
+    "when",
+    "where",
+    "which",
+    "should",
+    "shall",
+    "can",
+    "could",
+    "would",
+    "will",
+    "do",
+    "does",
+    "did",
+    "is",
+    "are",
+    "was",
+    "were",
+    "have",
+    "has",
+    "may",
+    "might",
+    "any",
+    "anyone",
+}
+WORD_PATTERN = re.compile(r"[\w']+")
+SENTENCE_END_PATTERN = re.compile(r"[.!?](\s|$)")
+# Prefix of SelectionResult.reasoning for gate rejections
+PRESELECTION_REASON_PREFIX = "Pre-selection:"
+
+
+@dataclass
+class PreselectionDecision:
+    """A confident local rejection of a sentence chunk."""
+
+    rejected: bool
+    confidence: float
+    reason: str
+    rule: str  # Name of the rule or "classifier"
+
+
+class EmbeddingClassifier:
+    """
+    Logistic-regression classifier over sentence embeddings.
+    Predicts the probability that a chunk contains no verifiable claim.
+    Trained with plain numpy so it stays CPU-only and dependency-free.
+    """
+
+    def __init__(self, weights: Optional[np.ndarray] = None, bias: float = 0.0) -> None:
+        self.weights = weights
+        self.bias = bias
+
+    @property
+    def is_trained(self) -> bool:
+        """Check whether the classifier has weights."""
+        return self.weights is not None
+
+    def fit(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        rejected_labels: Sequence[bool],
+        epochs: int = 200,
+        learning_rate: float = 0.5,
+        l2: float = 1e-3,
+    ) -> "EmbeddingClassifier":
+        """
+        Fit the classifier with batch gradient descent.
+        Args:
+            embeddings: Embeddings of labelled chunks
+            rejected_labels: True where the Selection LLM rejected the chunk
+            epochs: Number of gradient steps
+            learning_rate: Gradient step size
+            l2: L2 regularization strength
+        Returns:
+            The fitted classifier
+        """
+        x = np.asarray(embeddings, dtype=np.float32)
+        y = np.asarray(rejected_labels, dtype=np.float32)
+        if x.ndim != 2 or len(x) != len(y) or len(x) == 0:
+            raise ValueError("embeddings and labels must be non-empty and aligned")
+        weights = np.zeros(x.shape[1], dtype=np.float32)
+        bias = 0.0
+        for _ in range(epochs):
+            predictions = self._sigmoid(x @ weights + bias)
+            error = predictions - y
+            weights -= learning_rate * ((x.T @ error) / len(x) + l2 * weights)
+            bias -= learning_rate * float(error.mean())
+        self.weights = weights
+        self.bias = bias
+        return self
+
+    def predict_rejection_probability(self, embedding: Sequence[float]) -> float:
+        """Get the probability that a chunk is a non-claim."""
+        if self.weights is None:
+            raise ValueError("Classifier has not been trained or loaded")
+        x = np.asarray(embedding, dtype=np.float32)
+        return float(self._sigmoid(float(x @ self.weights) + self.bias))
+
+    def save(self, path: str) -> None:
+        """Save the classifier weights to an .npz file."""
+        if self.weights is None:
+            raise ValueError("Classifier has not been trained")
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, weights=self.weights, bias=np.array([self.bias]))
+
+    @classmethod
+    def load(cls, path: str) -> "EmbeddingClassifier":
+        """Load classifier weights from an .npz file."""
+        with np.load(path) as data:
+            return cls(weights=data["weights"], bias=float(data["bias"][0]))
+
+    @staticmethod
+    def _sigmoid(z: Any) -> Any:
+        return 1.0 / (1.0 + np.exp(-np.clip(z, -30, 30)))
+
+
+class PreselectionGate:
+    """
+    CPU-only gate in front of the Selection LLM.
+    Combines rules with an optional embedding classifier and rejects a chunk
+    only when its confidence is at or above confidence_threshold.
+    """
+
+    def __init__(
+        self,
+        confidence_threshold: float = 0.9,
+        classifier: Optional[EmbeddingClassifier] = None,
+    ):
+        """
+        Initialize the gate.
+        Args:
+            confidence_threshold: Minimum confidence for a local rejection
+            classifier: Optional embedding classifier for chunks with embeddings
+        """
+        self.confidence_threshold = confidence_threshold
+        self.classifier = classifier
+
+    @classmethod
+    def from_config(cls, config: Any) -> "PreselectionGate":
+        """
+        Create a gate from a ClaimifyConfig.
+        Loads the classifier if a path is configured; a missing or unreadable
+        classifier leaves the gate running on rules only.
+        """
+        classifier = None
+        classifier_path = config.preselection_classifier_path
+        if classifier_path:
+            try:
+                classifier = EmbeddingClassifier.load(classifier_path)
+            except Exception as e:
+                logger.warning(
+                    f"[preselection.PreselectionGate.from_config] Could not load pre-selection classifier from {classifier_path}, using rules only: {e}",
+                    extra={
+                        "service": "aclarai-core",
+                        "stage": "preselection",
+                        "classifier_path": classifier_path,
+                        "error": str(e),
+                    },
+                )
+        return cls(
+            confidence_threshold=config.preselection_confidence_threshold,
+            classifier=classifier,
+        )
+
+    def evaluate(self, sentence: SentenceChunk) -> Optional[PreselectionDecision]:
+        """
+        Decide whether a chunk can be rejected without the LLM.
+        Args:
+            sentence: The sentence chunk to check
+        Returns:
+            A rejection decision, or None if the chunk must go to the LLM
+        """
+        candidates = [self._evaluate_rules(sentence.text)]
+        if (
+            self.classifier is not None
+            and self.classifier.is_trained
+            and sentence.embedding is not None
+        ):
+            probability = self.classifier.predict_rejection_probability(
+                sentence.embedding
+            )
+            candidates.append(
+                PreselectionDecision(
+                    rejected=True,
+                    confidence=probability,
+                    reason=f"Embedding classifier non-claim probability {probability:.2f}",
+                    rule="classifier",
+                )
+            )
+        best = max(
+            (c for c in candidates if c is not None),
+            key=lambda c: c.confidence,
+            default=None,
+        )
+        if best is None or best.confidence < self.confidence_threshold:
+            return None
+        logger.info(
+            f"[preselection.PreselectionGate.evaluate] Claimify.preselection decision: rejected ({best.rule})",
+            extra={
+                "service": "aclarai-core",
+                "stage": "preselection",
+                "decision": "rejected",
+                "rule": best.rule,
+                "confidence": best.confidence,
+                "reasoning": best.reason,
+                "sentence_id": sentence.chunk_id,
+            },
+        )
+        return best
+
+    def _evaluate_rules(self, text: str) -> Optional[PreselectionDecision]:
+        """Apply the rule set and return the most confident rejection, if any."""
+        stripped = text.strip()
+        if not stripped:
+            return PreselectionDecision(True, 1.0, "Empty sentence", "empty")
+        normalized = " ".join(WORD_PATTERN.findall(stripped.lower()))
+        if not normalized:
+            return PreselectionDecision(True, 0.99, "Sentence has no words", "no_words")
+        if normalized in FILLER_PHRASES:
+            return PreselectionDecision(
+                True, 0.98, f"Conversational filler '{stripped}'", "filler"
+            )
+        words = normalized.split()
+        has_digit = any(ch.isdigit() for ch in stripped)
+        if (
+            stripped.endswith("?")
+            and words[0] in QUESTION_OPENERS
+            and len(SENTENCE_END_PATTERN.findall(stripped)) == 1
+            and not has_digit
+        ):
+            return PreselectionDecision(True, 0.95, "Pure question", "question")
+        if GREETING_PATTERN.match(stripped) and len(words) <= 5:
+            return PreselectionDecision(True, 0.95, "Greeting", "greeting")
+        # Two words can be a whole claim ("Build failed."), so this rule stays
+        # below the default threshold and only rejects when the gate is tuned
+        # more aggressively
+        if len(words) < 3 and not has_digit:
+            return PreselectionDecision(
+                True, 0.8, f"Very short fragment ({len(words)} words)", "short_fragment"
+            )
+        return None
+
+
+@dataclass
+class PreselectionEvaluation:
+    """Agreement between the pre-selection gate and LLM Selection decisions."""
+
+    total: int = 0
+    gate_rejections: int = 0
+    llm_rejections: int = 0
+    agreed_rejections: int = 0
+    false_rejections: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def precision(self) -> float:
+        """Fraction of gate rejections that the LLM also rejected."""
+        if self.gate_rejections == 0:
+            return 0.0
+        return self.agreed_rejections / self.gate_rejections
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of LLM rejections that the gate decided locally."""
+        if self.llm_rejections == 0:
+            return 0.0
+        return self.agreed_rejections / self.llm_rejections
+
+    @property
+    def llm_calls_saved_rate(self) -> float:
+        """Fraction of Selection LLM calls the gate would remove."""
+        if self.total == 0:
+            return 0.0
+        return self.gate_rejections / self.total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the evaluation to a report dictionary."""
+        return {
+            "total": self.total,
+            "gate_rejections": self.gate_rejections,
+            "llm_rejections": self.llm_rejections,
+            "agreed_rejections": self.agreed_rejections,
+            "false_rejection_count": len(self.false_rejections),
+            "precision": self.precision,
+            "coverage": self.coverage,
+            "llm_calls_saved_rate": self.llm_calls_saved_rate,
+            "false_rejections": self.false_rejections,
+        }
+
+
+def load_labelled_set(path: str) -> List[Tuple[SentenceChunk, bool]]:
+    """
+    Load a labelled set of LLM Selection decisions from a JSONL file.
+    Each line holds "text" and "selected", plus optional "embedding",
+    "source_id" and "chunk_id".
+    Args:
+        path: Path to the JSONL file
+    Returns:
+        List of (sentence chunk, LLM selected) pairs
+    """
+    examples = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            chunk = SentenceChunk(
+                text=record["text"],
+                source_id=record.get("source_id", "labelled"),
+                chunk_id=record.get("chunk_id", f"labelled_{line_number}"),
+                sentence_index=line_number,
+                embedding=record.get("embedding"),
+            )
+            examples.append((chunk, bool(record["selected"])))
+    return examples
+
+
+def evaluate_preselection_agreement(
+    gate: PreselectionGate, examples: Iterable[Tuple[SentenceChunk, bool]]
+) -> PreselectionEvaluation:
+    """
+    Measure how well the gate agrees with LLM Selection decisions.
+    Args:
+        gate: The pre-selection gate to evaluate
+        examples: (sentence chunk, LLM selected) pairs
+    Returns:
+        PreselectionEvaluation with precision, coverage and false rejections
+    """
+    evaluation = PreselectionEvaluation()
+    for sentence, llm_selected in examples:
+        evaluation.total += 1
+        if not llm_selected:
+            evaluation.llm_rejections += 1
+        decision = gate.evaluate(sentence)
+        if decision is None:
+            continue
+        evaluation.gate_rejections += 1
+        if llm_selected:
+            evaluation.false_rejections.append(
+                {
+                    "text": sentence.text,
+                    "rule": decision.rule,
+                    "confidence": decision.confidence,
+                    "reason": decision.reason,
+                }
+            )
+        else:
+            evaluation.agreed_rejections += 1
+    return evaluation
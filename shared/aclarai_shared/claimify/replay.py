@@ -0,0 +1,193 @@
+"""
+Record/replay LLM stand-ins for offline Claimify runs.
+RecordingLLM captures real prompt→response pairs, with their latencies, into a
+JSONL ReplayLog. ReplayLLM serves them back deterministically, optionally
+sleeping for the recorded latency, so pipeline strategies (concurrency,
+batching, caching) can be benchmarked on a machine without network access.
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .agents import LLMInterface
+from .llm_cache import LLMResponseCache
+from .metrics import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayMissError(KeyError):
+    """Raised when a replayed prompt was never recorded."""
+
+
+@dataclass
+class ReplayRecord:
+    """One recorded LLM completion."""
+
+    key: str
+    model: str
+    stage: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency: float
+    response: str
+
+
+class ReplayLog:
+    """
+    Append-only JSONL log of recorded completions.
+    Records are keyed like the LLM response cache, by (model, stage, prompt,
+    temperature). Repeated prompts are replayed in recording order.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the log.
+        Args:
+            path: JSONL file to load from and append to (None keeps it in memory)
+        """
+        self.path = path
+        self._records: Dict[str, List[ReplayRecord]] = {}
+        self._lock = threading.Lock()
+        if path and Path(path).exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = ReplayRecord(**json.loads(line))
+                        self._records.setdefault(record.key, []).append(record)
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._records.values())
+
+    def append(self, record: ReplayRecord) -> None:
+        """Add a record and write it to the log file."""
+        with self._lock:
+            self._records.setdefault(record.key, []).append(record)
+            if self.path:
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(asdict(record)) + "\n")
+
+    def lookup(self, key: str, occurrence: int) -> Optional[ReplayRecord]:
+        """Get the nth recording of a key, repeating the last one if exhausted."""
+        records = self._records.get(key)
+        if not records:
+            return None
+        return records[min(occurrence, len(records) - 1)]
+
+
+class RecordingLLM:
+    """LLM wrapper that records every completion into a ReplayLog."""
+
+    def __init__(self, llm: LLMInterface, log: ReplayLog, model: str, stage: str):
+        self.llm = llm
+        self.log = log
+        self.model = model
+        self.stage = stage
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        """Call the wrapped LLM and record the prompt, response and latency."""
+        start_time = time.time()
+        response = self.llm.complete(prompt, **kwargs)
+        latency = time.time() - start_time
+        self.log.append(
+            ReplayRecord(
+                key=LLMResponseCache.make_key(
+                    self.model, self.stage, prompt, kwargs.get("temperature")
+                ),
+                model=self.model,
+                stage=self.stage,
+                prompt_tokens=estimate_tokens(prompt),
+                completion_tokens=estimate_tokens(str(response)),
+                latency=latency,
+                response=str(response),
+            )
+        )
+        return response
+
+
+class ReplayLLM:
+    """
+    LLM stand-in that serves completions from a ReplayLog.
+    Counts calls, misses and prompt tokens so benchmarks can report them.
+    """
+
+    def __init__(
+        self,
+        log: ReplayLog,
+        model: str,
+        stage: str,
+        simulate_latency: bool = False,
+        latency_scale: float = 1.0,
+        strict: bool = True,
+        miss_response: str = "{}",
+    ):
+        """
+        Initialize the replay LLM.
+        Args:
+            log: Recorded completions
+            model: Model name the completions were recorded for
+            stage: Pipeline stage the completions were recorded for
+            simulate_latency: Sleep for the recorded latency before returning
+            latency_scale: Multiplier applied to recorded latencies
+            strict: Raise ReplayMissError for unrecorded prompts
+            miss_response: Response returned for unrecorded prompts when not strict
+        """
+        self.log = log
+        self.model = model
+        self.stage = stage
+        self.simulate_latency = simulate_latency
+        self.latency_scale = latency_scale
+        self.strict = strict
+        self.miss_response = miss_response
+        self.calls = 0
+        self.misses = 0
+        self.prompt_tokens = 0
+        self._occurrences: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        """Return the recorded completion for the prompt."""
+        key = LLMResponseCache.make_key(
+            self.model, self.stage, prompt, kwargs.get("temperature")
+        )
+        with self._lock:
+            occurrence = self._occurrences.get(key, 0)
+            self._occurrences[key] = occurrence + 1
+            self.calls += 1
+            self.prompt_tokens += estimate_tokens(prompt)
+            record = self.log.lookup(key, occurrence)
+            if record is None:
+                self.misses += 1
+        if record is None:
+            if self.strict:
+                raise ReplayMissError(
+                    f"No recorded {self.stage} completion for prompt {key[:12]}"
+                )
+            logger.warning(
+                f"[replay.ReplayLLM.complete] No recorded {self.stage} completion, returning miss response",
+                extra={
+                    "service": "aclarai-core",
+                    "pipeline": "claimify",
+                    "stage": self.stage,
+                    "model": self.model,
+                },
+            )
+            return self.miss_response
+        if self.simulate_latency and record.latency > 0:
+            time.sleep(record.latency * self.latency_scale)
+        return record.response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get call, miss and token counters."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "misses": self.misses,
+                "prompt_tokens": self.prompt_tokens,
+            }
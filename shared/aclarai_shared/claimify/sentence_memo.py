@@ -0,0 +1,246 @@
+"""
+Sentence-level memo of Claimify results.
+Chat exports repeat the same sentences across conversations (boilerplate,
+pasted error messages, stand-up lines). SentenceMemo keys finished results by
+normalized sentence text plus a hash of the context window, so a repeated
+sentence reuses the earlier Selection/Disambiguation/Decomposition outcome
+instead of running the pipeline again. Unlike the LLM response cache, the key
+ignores prompt details and context differences the strictness level treats
+as irrelevant.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Dict, Iterable, Optional
+
+from .data_models import ClaimifyContext, ClaimifyResult
+
+logger = logging.getLogger(__name__)
+
+STRICTNESS_LEVELS = ("exact", "normalized", "relaxed")
+# Prefix the agents use for reasoning/changes recorded on a failed LLM call
+ERROR_PREFIX = "Error during processing"
+
+# Tokens that change between copies of the same context without changing its meaning
+VOLATILE_TOKEN_PATTERN = re.compile(
+    r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b"  # UUIDs
+    r"|\b\d{4}-\d{2}-\d{2}(?:[t ]\d{1,2}:\d{2}(?::\d{2})?(?:\.\d+)?z?)?\b"  # dates
+    r"|\b\d{1,2}:\d{2}(?::\d{2})?\s*(?:am|pm)?\b"  # times
+    r"|\b(?=[0-9a-f]*\d)[0-9a-f]{8,}\b"  # hex ids and hashes
+)
+PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Words whose meaning depends on the surrounding sentences
+CONTEXT_DEPENDENT_PATTERN = re.compile(
+    r"\b(it|its|this|that|these|those|they|them|their|he|him|his|she|her|"
+    r"we|us|our|here|there|then|former|latter|above|below|same)\b"
+)
+
+
+def normalize_sentence(text: str) -> str:
+    """Normalize sentence text: Unicode form, case, quotes and whitespace."""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = text.replace("’", "'").replace("“", '"').replace("”", '"')
+    return WHITESPACE_PATTERN.sub(" ", text).strip().rstrip(".!?;:")
+
+
+def normalize_context(text: str) -> str:
+    """Normalize context text, masking timestamps, ids and punctuation."""
+    text = normalize_sentence(text)
+    text = VOLATILE_TOKEN_PATTERN.sub("#", text)
+    text = PUNCTUATION_PATTERN.sub(" ", text)
+    return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+
+class SentenceMemo:
+    """
+    Thread-safe LRU memo of ClaimifyResults keyed by sentence and context.
+    Strictness levels:
+        exact: raw sentence text and raw context must match
+        normalized: sentence and context match after normalization
+            (case, whitespace, punctuation, timestamps, dates and ids)
+        relaxed: as normalized, but context is ignored for sentences without
+            context-dependent words (pronouns, "here", "then", ...)
+    """
+
+    def __init__(self, strictness: str = "normalized", max_entries: int = 50000):
+        """
+        Initialize the memo.
+        Args:
+            strictness: One of STRICTNESS_LEVELS
+            max_entries: Maximum number of memoized sentences
+        """
+        if strictness not in STRICTNESS_LEVELS:
+            raise ValueError(
+                f"Unknown sentence memo strictness {strictness!r}, expected one of {STRICTNESS_LEVELS}"
+            )
+        self.strictness = strictness
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, ClaimifyResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "skipped": 0,
+            "evictions": 0,
+            "reused_selected": 0,
+        }
+
+    def make_key(self, context: ClaimifyContext) -> str:
+        """
+        Build the memo key for a sentence in its context window.
+        Args:
+            context: Context window of the sentence
+        Returns:
+            Hex digest identifying the sentence and its relevant context
+        """
+        text = context.current_sentence.text
+        surrounding: Iterable[str] = [
+            s.text for s in (*context.preceding_sentences, *context.following_sentences)
+        ]
+        if self.strictness == "exact":
+            sentence_key = text
+        else:
+            sentence_key = normalize_sentence(text)
+            surrounding = [normalize_context(s) for s in surrounding]
+            if self.strictness == "relaxed" and not CONTEXT_DEPENDENT_PATTERN.search(
+                sentence_key
+            ):
+                surrounding = []
+        context_hash = hashlib.sha256(
+            "\x1e".join(surrounding).encode("utf-8")
+        ).hexdigest()
+        return hashlib.sha256(
+            f"{sentence_key}\x1f{context_hash}".encode("utf-8")
+        ).hexdigest()
+
+    def contains(self, key: str) -> bool:
+        """Check for a memoized result without counting a lookup."""
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: str, context: ClaimifyContext) -> Optional[ClaimifyResult]:
+        """
+        Get a memoized result rebound to the given sentence.
+        Args:
+            key: Key from make_key
+            context: Context window of the sentence being processed
+        Returns:
+            A ClaimifyResult for context.current_sentence, or None on a miss
+        """
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            if cached.was_processed:
+                self._stats["reused_selected"] += 1
+        return _rebind(cached, context)
+
+    def put(self, key: str, result: ClaimifyResult) -> bool:
+        """
+        Memoize a finished result if it is safe to reuse.
+        Results with errors, and selected sentences without claim candidates
+        (indistinguishable from a failed Decomposition), are not stored.
+        Args:
+            key: Key from make_key
+            result: Result to memoize
+        Returns:
+            True if the result was stored
+        """
+        if not _is_reusable(result):
+            with self._lock:
+                self._stats["skipped"] += 1
+            return False
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            self._stats["stores"] += 1
+            while len(self._entries) > self.max_entries > 0:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get reuse counters, the hit rate and the entry count."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups > 0 else 0
+        stats["strictness"] = self.strictness
+        return stats
+
+
+def has_processing_error(result: ClaimifyResult) -> bool:
+    """
+    Check whether a stage failed while processing a sentence.
+    Agents catch LLM errors and return results marked with ERROR_PREFIX
+    rather than raising, so a failed run still looks like a result.
+    """
+    if result.errors:
+        return True
+    if result.selection_result is not None and (
+        result.selection_result.reasoning or ""
+    ).startswith(ERROR_PREFIX):
+        return True
+    if result.disambiguation_result is not None and any(
+        change.startswith(ERROR_PREFIX)
+        for change in result.disambiguation_result.changes_made
+    ):
+        return True
+    return (
+        result.decomposition_result is not None
+        and result.decomposition_result.error is not None
+    )
+
+
+def _is_reusable(result: ClaimifyResult) -> bool:
+    """Check that a result reflects a completed, error-free pipeline run."""
+    if result.selection_result is None or has_processing_error(result):
+        return False
+    if not result.was_processed:
+        return True
+    if result.disambiguation_result is None or result.decomposition_result is None:
+        return False
+    return bool(result.decomposition_result.claim_candidates)
+
+
+def _rebind(cached: ClaimifyResult, context: ClaimifyContext) -> ClaimifyResult:
+    """Copy a memoized result onto a new sentence, without stage timings."""
+    sentence = context.current_sentence
+    result = ClaimifyResult(original_chunk=sentence, context=context)
+    if cached.selection_result is not None:
+        result.selection_result = replace(
+            cached.selection_result,
+            sentence_chunk=sentence,
+            processing_time=None,
+            rewritten_text=sentence.text
+            if cached.selection_result.rewritten_text is not None
+            else None,
+        )
+    if cached.disambiguation_result is not None:
+        result.disambiguation_result = replace(
+            cached.disambiguation_result,
+            original_sentence=sentence,
+            changes_made=list(cached.disambiguation_result.changes_made),
+            processing_time=None,
+        )
+    if cached.decomposition_result is not None:
+        result.decomposition_result = replace(
+            cached.decomposition_result,
+            claim_candidates=[
+                replace(candidate)
+                for candidate in cached.decomposition_result.claim_candidates
+            ],
+            processing_time=None,
+        )
+    return result
@@ -0,0 +1,320 @@
+"""
+Persistent hnswlib index of canonical concepts.
+ConceptDetector checks a new candidate against this index before the
+candidate index, so a candidate that names an existing :Concept is merged
+into it instead of being promoted into a duplicate. Concepts carry no
+embedding of their own in the graph; each is indexed with the embedding of
+the candidate it was promoted from. Like the candidate index, the index is
+saved with its id map and verified against a generation stamp in Postgres.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import hnswlib
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class CanonicalConceptIndex:
+    """
+    hnswlib index of canonical concepts keyed by concept id.
+    Metadata kept for every concept: concept_id, text, source_candidate_id
+    and the normalized_text of that candidate.
+    """
+
+    def __init__(
+        self,
+        candidates_store: Any,
+        embedding_dim: int,
+        index_path: Optional[Path] = None,
+        save_interval: float = 60.0,
+        generation_name: str = "concepts",
+    ):
+        """
+        Initialize an empty canonical concept index.
+        Args:
+            candidates_store: ConceptCandidatesVectorStore keeping the generation stamps
+            embedding_dim: Dimension of the concept embeddings
+            index_path: Path of the saved index without suffix (None keeps it in memory)
+            save_interval: Minimum seconds between automatic saves
+            generation_name: Name of the index's generation stamp
+        """
+        self.candidates_store = candidates_store
+        self.embedding_dim = embedding_dim
+        self.index_path = index_path
+        self.save_interval = save_interval
+        self.generation_name = generation_name
+        self.index: Optional[hnswlib.Index] = None
+        self.id_to_metadata: Dict[int, Dict[str, Any]] = {}
+        self.label_by_concept_id: Dict[str, int] = {}
+        self.next_id = 0
+        self.max_elements = 0
+        self.generation: Optional[int] = None
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.id_to_metadata)
+
+    def _initialize_index(self, max_elements: int = 1000) -> None:
+        """Initialize an empty HNSW index."""
+        self.index = hnswlib.Index(space="cosine", dim=self.embedding_dim)
+        self.index.init_index(
+            max_elements=max_elements, M=16, ef_construction=200, random_seed=42
+        )
+        self.index.set_ef(50)
+        self.max_elements = max_elements
+        self.id_to_metadata = {}
+        self.label_by_concept_id = {}
+        self.next_id = 0
+
+    def build(
+        self,
+        concepts: Iterable[Dict[str, Any]],
+        candidates: Dict[str, Dict[str, Any]],
+        force_rebuild: bool = False,
+    ) -> int:
+        """
+        Build the index, loading the saved copy when it is still current.
+        Args:
+            concepts: Concept dictionaries with id, text and source_candidate_id
+            candidates: Promoted candidates (with embedding) by candidate id
+            force_rebuild: Rebuild even if a current saved index exists
+        Returns:
+            Number of concepts in the index
+        """
+        if not force_rebuild and self.load():
+            return len(self)
+        entries = []
+        missing = 0
+        for concept in concepts:
+            candidate_data = candidates.get(concept.get("source_candidate_id"), {})
+            if candidate_data.get("embedding") is None:
+                missing += 1
+                continue
+            entries.append(
+                {
+                    "concept_id": concept["id"],
+                    "text": concept.get("text", ""),
+                    "source_candidate_id": concept.get("source_candidate_id"),
+                    "normalized_text": candidate_data.get("normalized_text"),
+                    "embedding": candidate_data["embedding"],
+                }
+            )
+        self._initialize_index(max(len(entries) * 2, 1000))
+        self._add_entries(entries)
+        self._dirty = True
+        logger.info(
+            f"Built canonical concept index with {len(self)} concepts",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_detection.canonical_index.CanonicalConceptIndex.build",
+                "concepts_added": len(self),
+                "concepts_without_embedding": missing,
+            },
+        )
+        return len(self)
+
+    def add_concepts(self, concepts: List[Dict[str, Any]]) -> int:
+        """
+        Add concepts to the index, growing it when full.
+        The saved index no longer covers every concept once one is added,
+        so its generation stamp is bumped, the same way store_candidates
+        does for candidates.
+        Args:
+            concepts: Dictionaries with concept_id, text, source_candidate_id,
+                normalized_text and embedding
+        Returns:
+            Number of concepts newly added
+        """
+        added = self._add_entries(concepts)
+        if added and self.index_path is not None:
+            try:
+                self.candidates_store.bump_index_generation(self.generation_name)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to bump canonical concept index generation: {e}",
+                    extra={
+                        "service": "aclarai",
+                        "filename.function_name": "concept_detection.canonical_index.CanonicalConceptIndex.add_concepts",
+                        "error": str(e),
+                    },
+                )
+        return added
+
+    def _add_entries(self, concepts: List[Dict[str, Any]]) -> int:
+        """Add concepts to the hnswlib index and id map, returning the count added."""
+        if self.index is None:
+            self._initialize_index()
+        embeddings = []
+        labels = []
+        for concept in concepts:
+            embedding = concept.get("embedding")
+            concept_id = concept.get("concept_id")
+            if embedding is None or not concept_id:
+                continue
+            metadata = {k: v for k, v in concept.items() if k != "embedding"}
+            if concept_id in self.label_by_concept_id:
+                self.id_to_metadata[self.label_by_concept_id[concept_id]] = metadata
+                continue
+            self.id_to_metadata[self.next_id] = metadata
+            self.label_by_concept_id[concept_id] = self.next_id
+            embeddings.append(np.asarray(embedding, dtype=np.float32))
+            labels.append(self.next_id)
+            self.next_id += 1
+        if embeddings:
+            if self.next_id > self.max_elements:
+                self.max_elements = max(self.next_id, self.max_elements * 2)
+                self.index.resize_index(self.max_elements)
+            self.index.add_items(np.array(embeddings, dtype=np.float32), labels)
+            self._dirty = True
+        return len(embeddings)
+
+    def best_matches(
+        self, embeddings: np.ndarray
+    ) -> List[Optional[Tuple[Dict[str, Any], float]]]:
+        """
+        Find the most similar concept for each row of an (n, dim) matrix.
+        Args:
+            embeddings: Query embeddings
+        Returns:
+            For every row, the concept metadata and cosine similarity of its
+            nearest concept, or None when the index is empty
+        """
+        if self.index is None or not self.id_to_metadata or len(embeddings) == 0:
+            return [None] * len(embeddings)
+        labels, distances = self.index.knn_query(embeddings, k=1, num_threads=-1)
+        return [
+            (self.id_to_metadata[int(label)], float(1.0 - distance))
+            for label, distance in zip(labels[:, 0], distances[:, 0], strict=True)
+        ]
+
+    def save(self) -> bool:
+        """
+        Save the index and its id map, stamped with a new generation.
+        Returns:
+            True if the index was saved
+        """
+        if self.index is None or self.index_path is None:
+            return False
+        try:
+            generation = self.candidates_store.bump_index_generation(
+                self.generation_name
+            )
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_file = self.index_path.with_suffix(".bin")
+            tmp_index_file = index_file.with_suffix(".bin.tmp")
+            self.index.save_index(str(tmp_index_file))
+            os.replace(tmp_index_file, index_file)
+            meta_file = self.index_path.with_suffix(".json")
+            tmp_meta_file = meta_file.with_suffix(".json.tmp")
+            tmp_meta_file.write_text(
+                json.dumps(
+                    {
+                        "generation": generation,
+                        "embedding_dim": self.embedding_dim,
+                        "next_id": self.next_id,
+                        "id_to_metadata": {
+                            str(label): metadata
+                            for label, metadata in self.id_to_metadata.items()
+                        },
+                    },
+                    default=str,
+                )
+            )
+            os.replace(tmp_meta_file, meta_file)
+        except Exception as e:
+            logger.error(
+                f"Failed to save canonical concept index: {e}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "concept_detection.canonical_index.CanonicalConceptIndex.save",
+                    "index_path": str(self.index_path),
+                    "error": str(e),
+                },
+            )
+            return False
+        self.generation = generation
+        self._dirty = False
+        self._last_save = time.monotonic()
+        return True
+
+    def load(self) -> bool:
+        """
+        Load the saved index if its generation stamp is current.
+        Returns:
+            True if the saved index was loaded
+        """
+        if self.index_path is None:
+            return False
+        index_file = self.index_path.with_suffix(".bin")
+        meta_file = self.index_path.with_suffix(".json")
+        if not index_file.exists() or not meta_file.exists():
+            return False
+        try:
+            saved = json.loads(meta_file.read_text())
+            generation = self.candidates_store.get_index_generation(
+                self.generation_name
+            )
+            if (
+                saved.get("generation") != generation
+                or saved.get("embedding_dim") != self.embedding_dim
+            ):
+                return False
+            index = hnswlib.Index(space="cosine", dim=self.embedding_dim)
+            index.load_index(str(index_file))
+            index.set_ef(50)
+        except Exception as e:
+            logger.warning(
+                f"Failed to load saved canonical concept index, rebuilding: {e}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "concept_detection.canonical_index.CanonicalConceptIndex.load",
+                    "index_path": str(self.index_path),
+                    "error": str(e),
+                },
+            )
+            return False
+        self.index = index
+        self.id_to_metadata = {
+            int(label): metadata for label, metadata in saved["id_to_metadata"].items()
+        }
+        self.label_by_concept_id = {
+            metadata["concept_id"]: label
+            for label, metadata in self.id_to_metadata.items()
+        }
+        self.next_id = saved["next_id"]
+        self.max_elements = index.get_max_elements()
+        self.generation = generation
+        self._dirty = False
+        self._last_save = time.monotonic()
+        logger.info(
+            f"Loaded canonical concept index with {len(self)} concepts",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_detection.canonical_index.CanonicalConceptIndex.load",
+                "index_size": len(self),
+                "generation": generation,
+            },
+        )
+        return True
+
+    def save_if_due(self, force: bool = False) -> bool:
+        """
+        Save the index if it changed and the save interval has passed.
+        Args:
+            force: Save a changed index without waiting for the interval
+        Returns:
+            True if the index was saved
+        """
+        if not self._dirty:
+            return False
+        if not force and time.monotonic() - self._last_save < self.save_interval:
+            return False
+        return self.save()
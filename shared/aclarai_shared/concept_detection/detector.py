@@ -2,11 +2,21 @@
 Concept detector using hnswlib for embedding-based similarity detection.
 This module implements the core logic for detecting similar concept candidates
 using hnswlib and determining whether candidates should be merged or promoted.
+The index holds the candidates a new candidate can be merged into (pending and
+promoted ones). It is updated as candidates are promoted or merged, saved to
+disk with its id map, and reloaded on startup when its generation stamp still
+matches the one kept in Postgres. Candidates are checked against the canonical
+concept index (see canonical_index) before the candidate index, and
+candidates whose normalized text is already known are resolved without either
+(see exact_match).
 """
 
+import json
 import logging
+import os
 import time
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 
 import hnswlib
 import numpy as np
@@ -16,6 +26,8 @@ from ..noun_phrase_extraction.concept_candidates_store import (
     ConceptCandidatesVectorStore,
 )
 from ..noun_phrase_extraction.models import NounPhraseCandidate
+from .canonical_index import CanonicalConceptIndex
+from .exact_match import ExactMatchIndex
 from .models import (
     ConceptAction,
     ConceptDetectionBatch,
@@ -25,6 +37,14 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Candidate statuses kept in the index; merged candidates are represented by
+# the candidate they were merged into
+INDEXED_STATUSES = ("pending", "promoted")
+# Batches up to this size are clustered with a dense similarity matrix,
+# larger ones with a temporary HNSW index
+INTRA_BATCH_EXACT_LIMIT = 2048
+INTRA_BATCH_NEIGHBOURS = 10
+
 
 class ConceptDetector:
     """
@@ -45,6 +65,30 @@ class ConceptDetector:
         self.index: Optional[hnswlib.Index] = None
         self.id_to_metadata: Dict[int, Dict[str, Any]] = {}
         self.next_id = 0
+        self.max_elements = 0
+        # Candidate id -> index label, for incremental updates
+        self.label_by_candidate_id: Dict[str, int] = {}
+        # Persistence of the index and its id map
+        index_path = self.config.concepts.candidates_index_path
+        self.index_path = Path(index_path) if index_path else None
+        self.save_interval = self.config.concepts.candidates_index_save_interval
+        # hnswlib threads for batched queries (-1 uses every core)
+        self.query_threads = -1
+        self.generation: Optional[int] = None
+        self._dirty = False
+        self._last_save = time.monotonic()
+        # Canonical concepts, checked before the candidate index
+        self.merge_threshold = self.config.concepts.merge_threshold
+        canonical_index_path = self.config.concepts.canonical_index_path
+        # Normalized text -> concept or candidate, filled from both indexes
+        self.exact_matches = ExactMatchIndex()
+        self.canonical_index = CanonicalConceptIndex(
+            self.candidates_store,
+            self.embedding_dim,
+            index_path=Path(canonical_index_path) if canonical_index_path else None,
+            save_interval=self.save_interval,
+            generation_name=self.config.concepts.canonical_collection,
+        )
         logger.info(
             f"Initialized ConceptDetector with similarity_threshold={self.similarity_threshold}",
             extra={
@@ -66,6 +110,7 @@ class ConceptDetector:
                 random_seed=42,
             )
             self.index.set_ef(50)  # Search parameter
+            self.max_elements = max_elements
             logger.info(
                 f"Initialized HNSW index with max_elements={max_elements}",
                 extra={
@@ -89,6 +134,8 @@ class ConceptDetector:
     def build_index_from_candidates(self, force_rebuild: bool = False) -> int:
         """
         Build the HNSW index from existing concept candidates.
+        A saved index whose generation stamp matches Postgres is loaded
+        instead of rebuilding, unless force_rebuild is set.
         Args:
             force_rebuild: Whether to force rebuilding even if index exists
         Returns:
@@ -97,6 +144,8 @@ class ConceptDetector:
         if self.index is not None and not force_rebuild:
             logger.debug("HNSW index already exists, skipping rebuild")
             return len(self.id_to_metadata)
+        if not force_rebuild and self.load_index():
+            return len(self.id_to_metadata)
         logger.info(
             "Building HNSW index from concept candidates",
             extra={
@@ -105,51 +154,42 @@ class ConceptDetector:
             },
         )
         try:
-            # Get all pending candidates with embeddings
-            pending_candidates = self.candidates_store.get_candidates_by_status(
-                "pending"
-            )
-            if not pending_candidates:
-                logger.warning("No pending candidates found to build index")
-                self._initialize_index(max_elements=1000)  # Initialize empty index
+            # Stream mergeable candidates chunk by chunk so memory stays
+            # bounded by the chunk size rather than the collection size
+            self.id_to_metadata = {}
+            self.label_by_candidate_id = {}
+            self.next_id = 0
+            self._initialize_index(max_elements=1000)
+            added = 0
+            for status in INDEXED_STATUSES:
+                for (
+                    metadata_chunk,
+                    embeddings,
+                ) in self.candidates_store.iter_candidate_chunks(status):
+                    # A candidate stored under several statuses keeps the first
+                    chunk = {}
+                    for metadata, embedding in zip(
+                        metadata_chunk, embeddings, strict=True
+                    ):
+                        key = _candidate_key(metadata)
+                        if key not in self.label_by_candidate_id:
+                            chunk.setdefault(key, {**metadata, "embedding": embedding})
+                    added += self.add_candidates(list(chunk.values()))
+            # Save right away so the next start loads instead of rebuilding
+            self.save_index()
+            if not added:
+                logger.warning("No candidates with embeddings found to build index")
+                self._mark_changed()
                 return 0
-            # Filter candidates that have embeddings
-            candidates_with_embeddings = []
-            for candidate_data in pending_candidates:
-                if candidate_data.get("embedding") is not None:
-                    candidates_with_embeddings.append(candidate_data)
-            if not candidates_with_embeddings:
-                logger.warning("No candidates with embeddings found")
-                self._initialize_index(max_elements=1000)
-                return 0
-            # Initialize index with appropriate size
-            max_elements = max(len(candidates_with_embeddings) * 2, 1000)
-            self._initialize_index(max_elements)
-            # Add candidates to index
-            embeddings = []
-            ids = []
-            for candidate_data in candidates_with_embeddings:
-                embedding = candidate_data["embedding"]
-                if isinstance(embedding, list):
-                    embedding = np.array(embedding, dtype=np.float32)
-                # Store metadata for this ID
-                self.id_to_metadata[self.next_id] = candidate_data
-                embeddings.append(embedding)
-                ids.append(self.next_id)
-                self.next_id += 1
-            # Add all embeddings to index
-            if embeddings:
-                embeddings_array = np.array(embeddings, dtype=np.float32)
-                self.index.add_items(embeddings_array, ids)
             logger.info(
-                f"Built HNSW index with {len(embeddings)} concept candidates",
+                f"Built HNSW index with {added} concept candidates",
                 extra={
                     "service": "aclarai",
                     "filename.function_name": "concept_detection.detector.ConceptDetector.build_index_from_candidates",
-                    "candidates_added": len(embeddings),
+                    "candidates_added": added,
                 },
             )
-            return len(embeddings)
+            return added
         except Exception as e:
             logger.error(
                 f"Failed to build HNSW index: {e}",
@@ -161,6 +201,433 @@ class ConceptDetector:
             )
             raise
 
+    def add_candidates(self, candidates: List[Dict[str, Any]]) -> int:
+        """
+        Add candidates to the index, growing it when full.
+        Candidates already in the index only have their metadata updated.
+        Args:
+            candidates: Candidate metadata dictionaries with an embedding
+        Returns:
+            Number of candidates newly added
+        """
+        if self.index is None:
+            self._initialize_index()
+        embeddings = []
+        labels = []
+        for candidate_data in candidates:
+            embedding = candidate_data.get("embedding")
+            if embedding is None:
+                continue
+            key = _candidate_key(candidate_data)
+            metadata = {k: v for k, v in candidate_data.items() if k != "embedding"}
+            self.exact_matches.add(metadata.get("normalized_text"), candidate_id=key)
+            if key in self.label_by_candidate_id:
+                self.id_to_metadata[self.label_by_candidate_id[key]] = metadata
+                continue
+            # Store metadata for this ID; the vector itself lives in the index
+            self.id_to_metadata[self.next_id] = metadata
+            self.label_by_candidate_id[key] = self.next_id
+            embeddings.append(np.asarray(embedding, dtype=np.float32))
+            labels.append(self.next_id)
+            self.next_id += 1
+        if embeddings:
+            self._ensure_capacity()
+            self.index.add_items(np.array(embeddings, dtype=np.float32), labels)
+            self._mark_changed()
+        return len(embeddings)
+
+    def remove_candidates(self, candidate_ids: Iterable[str]) -> int:
+        """
+        Remove candidates from the index.
+        Args:
+            candidate_ids: Ids of the candidates to remove
+        Returns:
+            Number of candidates removed
+        """
+        removed = 0
+        for candidate_id in candidate_ids:
+            label = self.label_by_candidate_id.pop(candidate_id, None)
+            if label is None:
+                continue
+            self.id_to_metadata.pop(label, None)
+            if self.index is not None:
+                self.index.mark_deleted(label)
+            removed += 1
+        if removed:
+            self._mark_changed()
+        return removed
+
+    def _ensure_capacity(self) -> None:
+        """
+        Resize the index so that every label below next_id fits.
+        Labels are never reused (removed items stay as tombstones until the
+        next rebuild), so next_id is the number of elements in the index.
+        """
+        if self.next_id > self.max_elements:
+            new_size = max(self.next_id, self.max_elements * 2)
+            self.index.resize_index(new_size)
+            self.max_elements = new_size
+            logger.info(
+                f"Resized HNSW index to max_elements={new_size}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "concept_detection.detector.ConceptDetector._ensure_capacity",
+                    "max_elements": new_size,
+                },
+            )
+
+    def _mark_changed(self) -> None:
+        """Record that the in-memory index differs from the saved one."""
+        self._dirty = True
+
+    def save_index(self) -> bool:
+        """
+        Save the index and its id map, stamped with a new generation.
+        The generation is bumped in Postgres before the files are written,
+        so an interrupted save leaves a stale stamp and forces a rebuild.
+        Returns:
+            True if the index was saved
+        """
+        if self.index is None or self.index_path is None:
+            return False
+        try:
+            generation = self.candidates_store.bump_index_generation()
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_file = self.index_path.with_suffix(".bin")
+            tmp_index_file = index_file.with_suffix(".bin.tmp")
+            self.index.save_index(str(tmp_index_file))
+            os.replace(tmp_index_file, index_file)
+            meta_file = self.index_path.with_suffix(".json")
+            tmp_meta_file = meta_file.with_suffix(".json.tmp")
+            tmp_meta_file.write_text(
+                json.dumps(
+                    {
+                        "generation": generation,
+                        "embedding_dim": self.embedding_dim,
+                        "next_id": self.next_id,
+                        "id_to_metadata": {
+                            str(label): metadata
+                            for label, metadata in self.id_to_metadata.items()
+                        },
+                    },
+                    default=str,
+                )
+            )
+            os.replace(tmp_meta_file, meta_file)
+        except Exception as e:
+            logger.error(
+                f"Failed to save HNSW index: {e}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "concept_detection.detector.ConceptDetector.save_index",
+                    "index_path": str(self.index_path),
+                    "error": str(e),
+                },
+            )
+            return False
+        self.generation = generation
+        self._dirty = False
+        self._last_save = time.monotonic()
+        logger.info(
+            f"Saved HNSW index with {len(self.id_to_metadata)} candidates at generation {generation}",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_detection.detector.ConceptDetector.save_index",
+                "index_path": str(self.index_path),
+                "index_size": len(self.id_to_metadata),
+                "generation": generation,
+            },
+        )
+        return True
+
+    def load_index(self) -> bool:
+        """
+        Load the saved index if its generation stamp is current.
+        Returns:
+            True if the saved index was loaded
+        """
+        if self.index_path is None:
+            return False
+        index_file = self.index_path.with_suffix(".bin")
+        meta_file = self.index_path.with_suffix(".json")
+        if not index_file.exists() or not meta_file.exists():
+            return False
+        try:
+            saved = json.loads(meta_file.read_text())
+            generation = self.candidates_store.get_index_generation()
+            if (
+                saved.get("generation") != generation
+                or saved.get("embedding_dim") != self.embedding_dim
+            ):
+                logger.info(
+                    "Saved HNSW index is stale, rebuilding",
+                    extra={
+                        "service": "aclarai",
+                        "filename.function_name": "concept_detection.detector.ConceptDetector.load_index",
+                        "saved_generation": saved.get("generation"),
+                        "generation": generation,
+                    },
+                )
+                return False
+            index = hnswlib.Index(space="cosine", dim=self.embedding_dim)
+            index.load_index(str(index_file))
+            index.set_ef(50)
+        except Exception as e:
+            logger.warning(
+                f"Failed to load saved HNSW index, rebuilding: {e}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "concept_detection.detector.ConceptDetector.load_index",
+                    "index_path": str(self.index_path),
+                    "error": str(e),
+                },
+            )
+            return False
+        self.index = index
+        self.id_to_metadata = {
+            int(label): metadata for label, metadata in saved["id_to_metadata"].items()
+        }
+        self.label_by_candidate_id = {
+            _candidate_key(metadata): label
+            for label, metadata in self.id_to_metadata.items()
+        }
+        for candidate_id, label in self.label_by_candidate_id.items():
+            self.exact_matches.add(
+                self.id_to_metadata[label].get("normalized_text"),
+                candidate_id=candidate_id,
+            )
+        self.next_id = saved["next_id"]
+        self.max_elements = index.get_max_elements()
+        self.generation = generation
+        self._dirty = False
+        self._last_save = time.monotonic()
+        logger.info(
+            f"Loaded HNSW index with {len(self.id_to_metadata)} candidates",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_detection.detector.ConceptDetector.load_index",
+                "index_size": len(self.id_to_metadata),
+                "generation": generation,
+            },
+        )
+        return True
+
+    def save_index_if_due(self, force: bool = False) -> bool:
+        """
+        Save the index if it changed and the save interval has passed.
+        Args:
+            force: Save a changed index without waiting for the interval
+        Returns:
+            True if the index was saved
+        """
+        if not self._dirty:
+            return False
+        if not force and time.monotonic() - self._last_save < self.save_interval:
+            return False
+        return self.save_index()
+
+    def close(self) -> None:
+        """
+        Save both indexes if they changed since their last save.
+        Called on shutdown so the next start loads the saved indexes
+        instead of rebuilding them.
+        """
+        self.save_index_if_due(force=True)
+        self.canonical_index.save_if_due(force=True)
+
+    def apply_detection_results(
+        self,
+        candidates: List[NounPhraseCandidate],
+        results: List[ConceptDetectionResult],
+    ) -> None:
+        """
+        Update the index with the outcome of a detection batch.
+        Promoted candidates become merge targets for later candidates;
+        merged candidates are removed in favour of the candidate they match.
+        Args:
+            candidates: Candidates of the batch
+            results: Detection results, in the same order
+        """
+        promoted = []
+        merged = []
+        for candidate, result in zip(candidates, results, strict=False):
+            if result.action == ConceptAction.MERGED:
+                merged.append(result.candidate_id)
+                # Later occurrences of the phrase resolve to the same target
+                if result.best_match is not None:
+                    self.exact_matches.add(
+                        candidate.normalized_text,
+                        candidate_id=result.best_match.matched_candidate_id,
+                        concept_id=result.best_match.matched_concept_id,
+                        text=result.best_match.matched_text,
+                    )
+            elif candidate.embedding is not None:
+                promoted.append(
+                    {
+                        "candidate_id": result.candidate_id,
+                        "original_text": candidate.text,
+                        "normalized_text": candidate.normalized_text,
+                        "source_node_id": candidate.source_node_id,
+                        "source_node_type": candidate.source_node_type,
+                        "aclarai_id": candidate.aclarai_id,
+                        "status": ConceptAction.PROMOTED.value,
+                        "embedding": candidate.embedding,
+                    }
+                )
+        self.remove_candidates(merged)
+        self.add_candidates(promoted)
+
+    def build_canonical_index(
+        self, concepts: Iterable[Dict[str, Any]], force_rebuild: bool = False
+    ) -> int:
+        """
+        Build the canonical concept index, loading the saved copy if current.
+        Each concept is indexed with the embedding of the promoted candidate
+        it was created from.
+        Args:
+            concepts: Concept dictionaries with id, text and source_candidate_id
+            force_rebuild: Rebuild even if a current saved index exists
+        Returns:
+            Number of concepts in the index
+        """
+        if force_rebuild or not self.canonical_index.load():
+            # Only the promoted candidates backing a concept are kept
+            concepts = list(concepts)
+            wanted = {concept.get("source_candidate_id") for concept in concepts}
+            promoted: Dict[str, Dict[str, Any]] = {}
+            for (
+                metadata_chunk,
+                embeddings,
+            ) in self.candidates_store.iter_candidate_chunks(
+                ConceptAction.PROMOTED.value
+            ):
+                for metadata, embedding in zip(metadata_chunk, embeddings, strict=True):
+                    key = _candidate_key(metadata)
+                    if key in wanted:
+                        promoted[key] = {**metadata, "embedding": embedding}
+            self.canonical_index.build(concepts, promoted, force_rebuild=True)
+            self.canonical_index.save()
+        self._add_exact_concepts(self.canonical_index.id_to_metadata.values())
+        return len(self.canonical_index)
+
+    def add_concepts(self, concepts: List[Dict[str, Any]]) -> int:
+        """
+        Add newly created concepts to the canonical concept index.
+        Args:
+            concepts: Dictionaries with concept_id, text, source_candidate_id
+                and the embedding of the promoted candidate
+        Returns:
+            Number of concepts added
+        """
+        added = self.canonical_index.add_concepts(concepts)
+        self._add_exact_concepts(concepts)
+        self.canonical_index.save_if_due()
+        return added
+
+    def _add_exact_concepts(self, concepts: Iterable[Dict[str, Any]]) -> None:
+        """Record the normalized text of concepts for exact matching."""
+        for concept in concepts:
+            self.exact_matches.add(
+                concept.get("normalized_text"),
+                candidate_id=concept.get("source_candidate_id"),
+                concept_id=concept.get("concept_id"),
+                text=concept.get("text", ""),
+            )
+
+    def match_exact(
+        self, candidates: List[NounPhraseCandidate]
+    ) -> List[Optional[ConceptDetectionResult]]:
+        """
+        Resolve candidates whose normalized text is already known.
+        This needs neither an embedding nor an index query, so callers can
+        skip both for the candidates it resolves.
+        Args:
+            candidates: Candidates to check
+        Returns:
+            For every candidate, a merge result into the concept or candidate
+            with the same normalized text, or None if the phrase is new
+        """
+        if self.index is None:
+            self.build_index_from_candidates()
+        results: List[Optional[ConceptDetectionResult]] = []
+        for candidate in candidates:
+            candidate_id = f"{candidate.source_node_type}_{candidate.source_node_id}_{candidate.text[:50]}"
+            entry = self.exact_matches.lookup(candidate.normalized_text)
+            # A candidate seen again (e.g. a re-synced block) is not its own match
+            if entry is None or entry["candidate_id"] == candidate_id:
+                results.append(None)
+                continue
+            match = SimilarityMatch(
+                candidate_id=candidate_id,
+                matched_candidate_id=entry["candidate_id"],
+                matched_concept_id=entry["concept_id"],
+                similarity_score=1.0,
+                matched_text=entry["text"],
+                metadata={"source": "exact"},
+            )
+            results.append(
+                ConceptDetectionResult(
+                    candidate_id=candidate_id,
+                    candidate_text=candidate.text,
+                    action=ConceptAction.MERGED,
+                    similarity_matches=[match],
+                    confidence=1.0,
+                    reason=f"Normalized text '{candidate.normalized_text}' matches '{entry['text']}' exactly",
+                )
+            )
+        logger.debug(
+            f"Resolved {sum(r is not None for r in results)} of {len(candidates)} candidates by exact match",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_detection.detector.ConceptDetector.match_exact",
+                "batch_size": len(candidates),
+            },
+        )
+        return results
+
+    def _concept_matches(
+        self, candidate_ids: List[str], embeddings: np.ndarray
+    ) -> List[Optional[SimilarityMatch]]:
+        """
+        Find the nearest canonical concept of each candidate.
+        Args:
+            candidate_ids: Ids of the candidates
+            embeddings: (n, dim) embeddings of the candidates
+        Returns:
+            For every candidate, the match with its nearest concept (None if
+            the canonical index is empty)
+        """
+        try:
+            best = self.canonical_index.best_matches(embeddings)
+        except Exception as e:
+            logger.warning(
+                f"Canonical concept lookup failed: {e}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "concept_detection.detector.ConceptDetector._concept_matches",
+                    "error": str(e),
+                },
+            )
+            return [None] * len(candidate_ids)
+        matches: List[Optional[SimilarityMatch]] = []
+        for candidate_id, entry in zip(candidate_ids, best, strict=True):
+            # A concept's own source candidate (e.g. a re-synced block) is not a match
+            if entry is None or entry[0].get("source_candidate_id") == candidate_id:
+                matches.append(None)
+                continue
+            metadata, similarity = entry
+            matches.append(
+                SimilarityMatch(
+                    candidate_id=candidate_id,
+                    matched_candidate_id=metadata.get("source_candidate_id"),
+                    matched_concept_id=metadata["concept_id"],
+                    similarity_score=similarity,
+                    matched_text=metadata.get("text", ""),
+                    metadata=metadata,
+                )
+            )
+        return matches
+
     def find_similar_candidates(
         self, candidate: NounPhraseCandidate, top_k: int = 10
     ) -> List[SimilarityMatch]:
@@ -193,22 +660,11 @@ class ConceptDetector:
             # Convert distances to similarities (cosine distance -> cosine similarity)
             similarities = 1.0 - distances[0]
             # Create similarity matches
-            matches = []
-            for label, similarity in zip(labels[0], similarities, strict=False):
-                if int(label) in self.id_to_metadata:
-                    metadata = self.id_to_metadata[int(label)]
-                    # Skip self-match
-                    if metadata.get("normalized_text") == candidate.normalized_text:
-                        continue
-                    match = SimilarityMatch(
-                        candidate_id=f"{candidate.source_node_type}_{candidate.source_node_id}_{candidate.text[:50]}",
-                        matched_candidate_id=metadata.get("id"),
-                        matched_concept_id=None,  # We don't have canonical concepts in this index yet
-                        similarity_score=float(similarity),
-                        matched_text=metadata.get("normalized_text", ""),
-                        metadata=metadata,
-                    )
-                    matches.append(match)
+            matches = [
+                self._similarity_match(candidate, int(label), similarity)
+                for label, similarity in zip(labels[0], similarities, strict=False)
+                if self._is_match(candidate, int(label))
+            ]
             logger.debug(
                 f"Found {len(matches)} similar candidates for '{candidate.text}'",
                 extra={
@@ -230,6 +686,28 @@ class ConceptDetector:
             )
             return []
 
+    def _is_match(self, candidate: NounPhraseCandidate, label: int) -> bool:
+        """Check that a neighbour is a live candidate other than the query itself."""
+        metadata = self.id_to_metadata.get(label)
+        return (
+            metadata is not None
+            and metadata.get("normalized_text") != candidate.normalized_text
+        )
+
+    def _similarity_match(
+        self, candidate: NounPhraseCandidate, label: int, similarity: float
+    ) -> SimilarityMatch:
+        """Build the similarity match of a candidate with an indexed neighbour."""
+        metadata = self.id_to_metadata[label]
+        return SimilarityMatch(
+            candidate_id=f"{candidate.source_node_type}_{candidate.source_node_id}_{candidate.text[:50]}",
+            matched_candidate_id=metadata.get("id", metadata.get("candidate_id")),
+            matched_concept_id=None,  # We don't have canonical concepts in this index yet
+            similarity_score=float(similarity),
+            matched_text=metadata.get("normalized_text", ""),
+            metadata=metadata,
+        )
+
     def detect_concept_action(
         self, candidate: NounPhraseCandidate
     ) -> ConceptDetectionResult:
@@ -251,48 +729,24 @@ class ConceptDetector:
             },
         )
         try:
+            # Existing concepts take precedence over candidates
+            concept_match = None
+            if candidate.embedding is not None:
+                concept_match = self._concept_matches(
+                    [candidate_id],
+                    np.asarray(candidate.embedding, dtype=np.float32).reshape(1, -1),
+                )[0]
+            if concept_match and concept_match.similarity_score >= self.merge_threshold:
+                return self._decide_action(
+                    candidate, candidate_id, [], None, concept_match
+                )
             # Find similar candidates
             matches = self.find_similar_candidates(candidate)
             # Check if any match exceeds the similarity threshold
             best_match = None
             if matches:
                 best_match = max(matches, key=lambda m: m.similarity_score)
-            # Make decision based on similarity threshold
-            if best_match and best_match.similarity_score >= self.similarity_threshold:
-                # Merge with existing similar candidate
-                action = ConceptAction.MERGED
-                reason = f"Found similar candidate '{best_match.matched_text}' with similarity {best_match.similarity_score:.3f} >= {self.similarity_threshold}"
-                confidence = min(best_match.similarity_score, 1.0)
-            else:
-                # Promote to new canonical concept
-                action = ConceptAction.PROMOTED
-                if best_match:
-                    reason = f"Best similarity {best_match.similarity_score:.3f} < {self.similarity_threshold}, promoting as new concept"
-                    confidence = (
-                        1.0 - best_match.similarity_score
-                    )  # Higher confidence if very different
-                else:
-                    reason = "No similar candidates found, promoting as new concept"
-                    confidence = 1.0
-            result = ConceptDetectionResult(
-                candidate_id=candidate_id,
-                candidate_text=candidate.text,
-                action=action,
-                similarity_matches=matches,
-                confidence=confidence,
-                reason=reason,
-            )
-            logger.debug(
-                f"Action determined for '{candidate.text}': {action.value}",
-                extra={
-                    "service": "aclarai",
-                    "filename.function_name": "concept_detection.detector.ConceptDetector.detect_concept_action",
-                    "candidate_text": candidate.text,
-                    "action": action.value,
-                    "confidence": confidence,
-                },
-            )
-            return result
+            return self._decide_action(candidate, candidate_id, matches, best_match)
         except Exception as e:
             logger.error(
                 f"Failed to detect concept action: {e}",
@@ -311,6 +765,300 @@ class ConceptDetector:
                 reason=f"Error during detection: {str(e)}",
             )
 
+    def _decide_action(
+        self,
+        candidate: NounPhraseCandidate,
+        candidate_id: str,
+        matches: List[SimilarityMatch],
+        best_match: Optional[SimilarityMatch],
+        concept_match: Optional[SimilarityMatch] = None,
+    ) -> ConceptDetectionResult:
+        """
+        Decide between merging and promoting a candidate.
+        Args:
+            candidate: The candidate to decide for
+            candidate_id: Id of the candidate
+            matches: Similarity matches of the candidate
+            best_match: Match with the highest similarity, if any
+            concept_match: Match with the nearest canonical concept, if any
+        Returns:
+            ConceptDetectionResult with recommended action
+        """
+        # Make decision based on similarity threshold
+        if concept_match and concept_match.similarity_score >= self.merge_threshold:
+            # Merge into the existing canonical concept
+            action = ConceptAction.MERGED
+            matches = [concept_match]
+            reason = f"Found existing concept '{concept_match.matched_text}' with similarity {concept_match.similarity_score:.3f} >= {self.merge_threshold}"
+            confidence = min(concept_match.similarity_score, 1.0)
+        elif best_match and best_match.similarity_score >= self.similarity_threshold:
+            # Merge with existing similar candidate
+            action = ConceptAction.MERGED
+            reason = f"Found similar candidate '{best_match.matched_text}' with similarity {best_match.similarity_score:.3f} >= {self.similarity_threshold}"
+            confidence = min(best_match.similarity_score, 1.0)
+        else:
+            # Promote to new canonical concept
+            action = ConceptAction.PROMOTED
+            if best_match:
+                reason = f"Best similarity {best_match.similarity_score:.3f} < {self.similarity_threshold}, promoting as new concept"
+                confidence = (
+                    1.0 - best_match.similarity_score
+                )  # Higher confidence if very different
+            else:
+                reason = "No similar candidates found, promoting as new concept"
+                confidence = 1.0
+        result = ConceptDetectionResult(
+            candidate_id=candidate_id,
+            candidate_text=candidate.text,
+            action=action,
+            similarity_matches=matches,
+            confidence=confidence,
+            reason=reason,
+        )
+        logger.debug(
+            f"Action determined for '{candidate.text}': {action.value}",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_detection.detector.ConceptDetector.detect_concept_action",
+                "candidate_text": candidate.text,
+                "action": action.value,
+                "confidence": confidence,
+            },
+        )
+        return result
+
+    def _detect_actions_batch(
+        self, candidates: List[NounPhraseCandidate], top_k: int = 10
+    ) -> List[ConceptDetectionResult]:
+        """
+        Detect actions for many candidates with one multi-threaded kNN query.
+        Candidates are first clustered within the batch (see
+        _cluster_batch); only the first candidate of each cluster is looked
+        up and the others are merged into it. Representatives matching a
+        canonical concept are merged into it; the embeddings of the remaining
+        ones are stacked into an (n, dim) matrix; self-matches
+        and removed labels are masked out of the similarity matrix and the best
+        neighbour of every row is picked with numpy. Representatives get the
+        same results as from detect_concept_action, which remains the fallback
+        when the index is unavailable or the batched query fails.
+        Args:
+            candidates: Candidates to analyze
+            top_k: Number of neighbours per candidate
+        Returns:
+            Detection results in candidate order
+        """
+        if self.index is None:
+            return [self.detect_concept_action(candidate) for candidate in candidates]
+        candidate_ids = [
+            f"{candidate.source_node_type}_{candidate.source_node_id}_{candidate.text[:50]}"
+            for candidate in candidates
+        ]
+        rows = [
+            i
+            for i, candidate in enumerate(candidates)
+            if candidate.embedding is not None
+        ]
+        results: List[Optional[ConceptDetectionResult]] = [None] * len(candidates)
+        if rows:
+            matrix = np.array(
+                [np.asarray(candidates[i].embedding, dtype=np.float32) for i in rows],
+                dtype=np.float32,
+            )
+            roots = self._cluster_batch(matrix)
+            representatives = [row for row, root in enumerate(roots) if row == root]
+            # Representatives matching an existing concept skip the candidate lookup
+            lookups = []
+            concept_matches = self._concept_matches(
+                [candidate_ids[rows[row]] for row in representatives],
+                matrix[representatives],
+            )
+            for row, concept_match in zip(
+                representatives, concept_matches, strict=True
+            ):
+                if (
+                    concept_match is not None
+                    and concept_match.similarity_score >= self.merge_threshold
+                ):
+                    results[rows[row]] = self._decide_action(
+                        candidates[rows[row]],
+                        candidate_ids[rows[row]],
+                        [],
+                        None,
+                        concept_match,
+                    )
+                else:
+                    lookups.append(row)
+            if lookups and self.id_to_metadata:
+                try:
+                    labels, distances = self.index.knn_query(
+                        matrix[lookups],
+                        k=min(top_k, len(self.id_to_metadata)),
+                        num_threads=self.query_threads,
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"Batched kNN query failed, detecting candidates one by one: {e}",
+                        extra={
+                            "service": "aclarai",
+                            "filename.function_name": "concept_detection.detector.ConceptDetector._detect_actions_batch",
+                            "batch_size": len(lookups),
+                            "error": str(e),
+                        },
+                    )
+                    return [
+                        self.detect_concept_action(candidate)
+                        for candidate in candidates
+                    ]
+                # Convert distances to similarities (cosine distance -> cosine similarity)
+                similarities = 1.0 - distances
+                query_rows = [rows[row] for row in lookups]
+                valid = np.array(
+                    [
+                        [
+                            self._is_match(candidates[i], int(label))
+                            for label in labels[n]
+                        ]
+                        for n, i in enumerate(query_rows)
+                    ],
+                    dtype=bool,
+                ).reshape(labels.shape)
+                masked = np.where(valid, similarities, -np.inf)
+                best_columns = masked.argmax(axis=1)
+                has_match = valid.any(axis=1)
+                for n, i in enumerate(query_rows):
+                    candidate = candidates[i]
+                    columns = np.flatnonzero(valid[n])
+                    matches = [
+                        self._similarity_match(
+                            candidate, int(labels[n, col]), similarities[n, col]
+                        )
+                        for col in columns
+                    ]
+                    best_match = None
+                    if has_match[n]:
+                        best_match = matches[
+                            int(np.searchsorted(columns, best_columns[n]))
+                        ]
+                    results[i] = self._decide_action(
+                        candidate, candidate_ids[i], matches, best_match
+                    )
+            for row, root in enumerate(roots):
+                if row != root:
+                    representative_result = results[rows[root]]
+                    results[rows[row]] = self._batch_merge_result(
+                        candidates[rows[row]],
+                        candidate_ids[rows[row]],
+                        candidates[rows[root]],
+                        candidate_ids[rows[root]],
+                        _cosine_similarity(matrix[row], matrix[root]),
+                        representative_result.best_match
+                        if representative_result is not None
+                        and representative_result.action == ConceptAction.MERGED
+                        else None,
+                    )
+        # Candidates without an embedding (or an empty index) have no matches
+        return [
+            result
+            if result is not None
+            else self._decide_action(candidate, candidate_id, [], None)
+            for candidate, candidate_id, result in zip(
+                candidates, candidate_ids, results, strict=True
+            )
+        ]
+
+    def _cluster_batch(self, embeddings: np.ndarray) -> List[int]:
+        """
+        Cluster the candidates of a batch by embedding similarity.
+        Pairs with cosine similarity >= similarity_threshold are joined with
+        union-find, so ten spellings of the same phrase extracted in one run
+        end up in one cluster instead of being promoted separately. A row
+        joined only through a chain, below similarity_threshold against the
+        cluster's representative, is left as its own cluster. Pairs come
+        from a dense similarity matrix for batches up to
+        INTRA_BATCH_EXACT_LIMIT, and from a temporary HNSW index (the
+        INTRA_BATCH_NEIGHBOURS nearest neighbours of each row) above it.
+        Args:
+            embeddings: (n, dim) embeddings of the batch
+        Returns:
+            For every row, the row of its cluster's representative (the
+            cluster's first row, or the row itself)
+        """
+        n = len(embeddings)
+        if n < 2:
+            return list(range(n))
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        unit = embeddings / np.where(norms == 0, 1.0, norms)
+        if n <= INTRA_BATCH_EXACT_LIMIT:
+            pairs = np.argwhere(
+                np.triu(unit @ unit.T >= self.similarity_threshold, k=1)
+            )
+        else:
+            index = hnswlib.Index(space="cosine", dim=unit.shape[1])
+            index.init_index(max_elements=n, M=16, ef_construction=100, random_seed=42)
+            index.set_ef(max(INTRA_BATCH_NEIGHBOURS * 2, 50))
+            index.add_items(unit, np.arange(n), num_threads=self.query_threads)
+            labels, distances = index.knn_query(
+                unit,
+                k=min(INTRA_BATCH_NEIGHBOURS, n),
+                num_threads=self.query_threads,
+            )
+            first = np.repeat(np.arange(n), labels.shape[1])
+            second = labels.ravel().astype(np.int64)
+            keep = (1.0 - distances.ravel() >= self.similarity_threshold) & (
+                first != second
+            )
+            pairs = np.stack([first[keep], second[keep]], axis=1)
+        roots = _union_find_roots(n, pairs.tolist())
+        # Chained pairs can join rows that are not similar to the representative
+        # itself; those rows stay on their own
+        to_root = np.einsum("ij,ij->i", unit, unit[roots])
+        return [
+            root if to_root[row] >= self.similarity_threshold else row
+            for row, root in enumerate(roots)
+        ]
+
+    def _batch_merge_result(
+        self,
+        candidate: NounPhraseCandidate,
+        candidate_id: str,
+        representative: NounPhraseCandidate,
+        representative_id: str,
+        similarity: float,
+        representative_match: Optional[SimilarityMatch] = None,
+    ) -> ConceptDetectionResult:
+        """
+        Build the result of a candidate merged into its batch representative.
+        When the representative itself merges into another candidate or a
+        canonical concept, the member points at that final target, since the
+        merged representative is never indexed.
+        """
+        if representative_match is not None:
+            match = SimilarityMatch(
+                candidate_id=candidate_id,
+                matched_candidate_id=representative_match.matched_candidate_id,
+                matched_concept_id=representative_match.matched_concept_id,
+                similarity_score=similarity,
+                matched_text=representative_match.matched_text,
+                metadata={"source": "batch"},
+            )
+        else:
+            match = SimilarityMatch(
+                candidate_id=candidate_id,
+                matched_candidate_id=representative_id,
+                matched_concept_id=None,
+                similarity_score=similarity,
+                matched_text=representative.normalized_text,
+                metadata={"source": "batch"},
+            )
+        return ConceptDetectionResult(
+            candidate_id=candidate_id,
+            candidate_text=candidate.text,
+            action=ConceptAction.MERGED,
+            similarity_matches=[match],
+            confidence=min(max(similarity, 0.0), 1.0),
+            reason=f"Clustered with '{representative.normalized_text}' from the same batch (similarity {similarity:.3f})",
+        )
+
     def process_candidates_batch(
         self, candidates: List[NounPhraseCandidate]
     ) -> ConceptDetectionBatch:
@@ -334,16 +1082,18 @@ class ConceptDetector:
             # Ensure index is built
             if self.index is None:
                 self.build_index_from_candidates()
-            results = []
+            results = self._detect_actions_batch(candidates)
             merged_count = 0
             promoted_count = 0
-            for candidate in candidates:
-                result = self.detect_concept_action(candidate)
-                results.append(result)
+            for result in results:
                 if result.action == ConceptAction.MERGED:
                     merged_count += 1
                 elif result.action == ConceptAction.PROMOTED:
                     promoted_count += 1
+            # Later batches see this batch's promotions and merges
+            if candidates and results:
+                self.apply_detection_results(candidates, results)
+                self.save_index_if_due()
             processing_time = time.time() - start_time
             batch_result = ConceptDetectionBatch(
                 results=results,
@@ -380,3 +1130,42 @@ class ConceptDetector:
                 processing_time=processing_time,
                 error=str(e),
             )
+
+
+def _candidate_key(metadata: Dict[str, Any]) -> str:
+    """
+    Get the id of a candidate from its metadata.
+    Falls back to the id ConceptCandidatesVectorStore derives for its
+    documents when the metadata carries no explicit id.
+    """
+    key = metadata.get("candidate_id") or metadata.get("id")
+    if key:
+        return str(key)
+    return f"{metadata.get('source_node_type')}_{metadata.get('source_node_id')}_{str(metadata.get('original_text', ''))[:50]}"
+
+
+def _cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Cosine similarity of two vectors (0 if either is zero)."""
+    norm = float(np.linalg.norm(a) * np.linalg.norm(b))
+    return float(np.dot(a, b) / norm) if norm else 0.0
+
+
+def _union_find_roots(n: int, pairs: List[List[int]]) -> List[int]:
+    """
+    Join the pairs with union-find.
+    Returns:
+        For each element, the smallest element of its set
+    """
+    parent = list(range(n))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
+
+    for a, b in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+    return [find(i) for i in range(n)]
@@ -0,0 +1,67 @@
+"""
+Exact-match lookup of normalized concept phrases.
+After lemmatisation many candidates repeat a phrase that is already a
+candidate or a concept. ExactMatchIndex maps each known normalized_text to
+the concept or candidate it resolves to, so such candidates can be merged
+without being embedded or searched in an ANN index.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class ExactMatchIndex:
+    """
+    In-memory map from normalized_text to the concept or candidate it names.
+    An entry pointing at a canonical concept is never replaced by one that
+    only points at a candidate.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._entries: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, normalized_text: str) -> bool:
+        return normalized_text in self._entries
+
+    def add(
+        self,
+        normalized_text: Optional[str],
+        candidate_id: Optional[str] = None,
+        concept_id: Optional[str] = None,
+        text: str = "",
+    ) -> bool:
+        """
+        Record the concept or candidate a normalized phrase resolves to.
+        Args:
+            normalized_text: Normalized phrase
+            candidate_id: Id of the candidate the phrase resolves to
+            concept_id: Id of the canonical concept the phrase resolves to
+            text: Display text of the match
+        Returns:
+            True if the entry was recorded
+        """
+        if not normalized_text or not (candidate_id or concept_id):
+            return False
+        existing = self._entries.get(normalized_text)
+        if existing and existing["concept_id"] and not concept_id:
+            return False
+        self._entries[normalized_text] = {
+            "candidate_id": candidate_id,
+            "concept_id": concept_id,
+            "text": text or normalized_text,
+        }
+        return True
+
+    def lookup(self, normalized_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the entry of a normalized phrase.
+        Args:
+            normalized_text: Normalized phrase
+        Returns:
+            Dictionary with candidate_id, concept_id and text, or None if the
+            phrase has not been seen
+        """
+        return self._entries.get(normalized_text)
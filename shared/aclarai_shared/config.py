@@ -52,9 +52,14 @@ class ConceptsConfig:
     # Concept candidates settings
     candidates_collection: str = "concept_candidates"
     similarity_threshold: float = 0.9
+    # Persistent HNSW index of concept candidates (empty to keep it in memory)
+    candidates_index_path: str = ".aclarai/cache/concept_candidates_index"
+    candidates_index_save_interval: float = 60.0
     # Canonical concepts settings
     canonical_collection: str = "concepts"
     merge_threshold: float = 0.95
+    # Persistent HNSW index of canonical concepts (empty to keep it in memory)
+    canonical_index_path: str = ".aclarai/cache/canonical_concepts_index"
 
 
 @dataclass
@@ -104,6 +109,8 @@ class DatabaseConfig:
     user: str
     password: str
     database: str = ""
+    # Driver connection pool settings, passed through to the client library
+    pool: Dict[str, Any] = field(default_factory=dict)
 
     def get_connection_url(self, scheme: str = "postgresql") -> str:
         """Build database connection URL."""
@@ -173,6 +180,8 @@ class aclaraiConfig:
     paths: VaultPaths = field(default_factory=VaultPaths)
     # Feature flags
     features: Dict[str, Any] = field(default_factory=dict)
+    # Processing settings (retries, batch sizes, graph write buffer)
+    processing: Dict[str, Any] = field(default_factory=dict)
 
     @classmethod
     def from_env(
@@ -222,6 +231,8 @@ class aclaraiConfig:
             port=int(os.getenv("NEO4J_BOLT_PORT", neo4j_config.get("port", "7687"))),
             user=os.getenv("NEO4J_USER", "neo4j"),
             password=os.getenv("NEO4J_PASSWORD", ""),
+            database=neo4j_config.get("database", ""),
+            pool=neo4j_config.get("pool", {}),
         )
         # Load embedding configuration from YAML
         embedding_config = yaml_config.get("embedding", {})
@@ -263,12 +274,21 @@ class aclaraiConfig:
             similarity_threshold=concepts_config.get("candidates", {}).get(
                 "similarity_threshold", 0.9
             ),
+            candidates_index_path=concepts_config.get("candidates", {}).get(
+                "index_path", ".aclarai/cache/concept_candidates_index"
+            ),
+            candidates_index_save_interval=concepts_config.get("candidates", {}).get(
+                "index_save_interval_seconds", 60.0
+            ),
             canonical_collection=concepts_config.get("canonical", {}).get(
                 "collection_name", "concepts"
             ),
             merge_threshold=concepts_config.get("canonical", {}).get(
                 "similarity_threshold", 0.95
             ),
+            canonical_index_path=concepts_config.get("canonical", {}).get(
+                "index_path", ".aclarai/cache/canonical_concepts_index"
+            ),
         )
         # Load noun phrase extraction configuration from YAML
         noun_phrase_config = yaml_config.get("noun_phrase_extraction", {})
@@ -353,6 +373,7 @@ class aclaraiConfig:
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
             paths=paths,
             features=features_config,
+            processing=yaml_config.get("processing", {}),
         )
 
     @classmethod
@@ -254,6 +254,46 @@ class aclaraiVectorStore:
             logger.error(f"Failed to retrieve chunks for block {aclarai_block_id}: {e}")
             return []
 
+    def get_chunk_embeddings(
+        self, aclarai_block_id: str
+    ) -> Dict[int, Tuple[str, List[float]]]:
+        """
+        Retrieve the stored embeddings of a block's chunks.
+        Lets callers reuse the utterance embeddings computed at ingestion
+        instead of embedding the same chunks again.
+        Args:
+            aclarai_block_id: The aclarai:id of the source block
+        Returns:
+            Mapping of chunk_index to (chunk text, embedding); empty on failure
+        """
+        from pgvector.sqlalchemy import Vector
+
+        try:
+            table_name = self._validate_table_name(
+                f"data_{self.config.embedding.collection_name.lower()}"
+            )
+            with self.engine.connect() as conn:
+                # Table name is validated above to prevent SQL injection
+                rows = conn.execute(
+                    text(f"""
+                        SELECT metadata_->>'chunk_index', text, embedding
+                        FROM {table_name}
+                        WHERE metadata_->>'aclarai_block_id' = :block_id
+                          AND embedding IS NOT NULL
+                    """).columns(embedding=Vector(self.config.embedding.embed_dim)),  # nosec B608
+                    {"block_id": aclarai_block_id},
+                ).fetchall()
+        except Exception as e:
+            logger.error(
+                f"Failed to retrieve chunk embeddings for block {aclarai_block_id}: {e}"
+            )
+            return {}
+        return {
+            int(chunk_index): (chunk_text, [float(x) for x in embedding])
+            for chunk_index, chunk_text, embedding in rows
+            if chunk_index is not None
+        }
+
     def delete_chunks_by_block_id(self, aclarai_block_id: str) -> int:
         """
         Delete all chunks for a specific aclarai block ID.
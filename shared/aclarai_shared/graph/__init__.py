@@ -6,6 +6,8 @@ structure including Claims, Sentences, and their relationships.
 
 from .models import Claim, ClaimInput, Concept, ConceptInput, Sentence, SentenceInput
 from .neo4j_manager import Neo4jGraphManager
+from .pagination import iter_node_pages
+from .write_buffer import GraphWriteBuffer
 
 __all__ = [
     "Claim",
@@ -15,4 +17,6 @@ __all__ = [
     "Concept",
     "ConceptInput",
     "Neo4jGraphManager",
+    "GraphWriteBuffer",
+    "iter_node_pages",
 ]
@@ -0,0 +1,408 @@
+"""
+Query instrumentation for Neo4j.
+Every query run through Neo4jGraphManager is tracked under a name
+(e.g. "sync_blocks", "fetch_unlinked_claims"), recording a latency histogram,
+rows returned, transaction retries and errors per name. Queries slower than
+processing.query_instrumentation.slow_query_ms are logged and can have their
+EXPLAIN or PROFILE plan captured. The static schema audit flags MATCH/MERGE
+lookups and WHERE predicates on properties that no index or constraint
+covers, such as b.aclarai_id on :Block nodes, which are keyed by b.id.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+PLAN_MODES = ("off", "explain", "profile")
+# Plan operators that read every node of the graph or of a label
+SCAN_OPERATORS = ("AllNodesScan", "NodeByLabelScan")
+
+CLAUSE_KEYWORDS = (
+    r"OPTIONAL\s+MATCH|MATCH|MERGE|WHERE|WITH|RETURN|SET|CREATE|DELETE|"
+    r"DETACH|REMOVE|UNWIND|FOREACH|CALL|ORDER\s+BY|LIMIT|SKIP|ON\s+CREATE|ON\s+MATCH"
+)
+CLAUSE_PATTERN = re.compile(rf"\b({CLAUSE_KEYWORDS})\b", re.IGNORECASE)
+NODE_PATTERN = re.compile(r"\(\s*(\w+)\s*:\s*`?(\w+)`?[^)]*?(?:\{([^}]*)\})?\s*\)")
+MAP_KEY_PATTERN = re.compile(r"(\w+)\s*:")
+PREDICATE_PATTERN = re.compile(
+    r"\b(\w+)\.(\w+)\s*(?:=|<>|<=|>=|<|>|\bIN\b|\bSTARTS\s+WITH\b|\bIS\s+NOT\s+NULL\b)",
+    re.IGNORECASE,
+)
+SCHEMA_PATTERN = re.compile(
+    r"FOR\s*\(\s*(\w+)\s*:\s*(\w+)\s*\)\s*(?:ON|REQUIRE)\s*\(?([^)]*?)\)?\s*(?:IS\b|$)",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class QueryStats:
+    """Latency histogram and counters for one named query."""
+
+    name: str
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    rows: int = 0
+    slow_calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+
+    def observe(
+        self, duration_ms: float, rows: int, retries: int, failed: bool, slow: bool
+    ) -> None:
+        """Record one call."""
+        self.calls += 1
+        self.errors += int(failed)
+        self.retries += retries
+        self.rows += rows
+        self.slow_calls += int(slow)
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        bucket = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if duration_ms <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+        self.histogram[bucket] += 1
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Estimate a latency percentile as the upper bound of its bucket."""
+        if self.calls == 0:
+            return None
+        target = fraction * self.calls
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram, strict=False):
+            seen += count
+            if seen >= target:
+                return float(min(bound, self.max_ms))
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the stats, with the histogram keyed by bucket bound."""
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]}ms")
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "rows": self.rows,
+            "slow_calls": self.slow_calls,
+            "mean_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms,
+            "histogram": dict(zip(labels, self.histogram, strict=True)),
+        }
+
+
+@dataclass
+class QueryTracker:
+    """Per-call measurements filled in while a tracked query runs."""
+
+    name: str
+    attempts: int = 0
+    rows: int = 0
+    duration_ms: float = 0.0
+    slow: bool = False
+
+
+class QueryInstrumentation:
+    """
+    Thread-safe registry of per-query statistics, captured plans and
+    schema audit findings.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        slow_query_ms: float = 1000.0,
+        capture_plans: str = "off",
+        max_plans: int = 20,
+        audit_indexes: bool = True,
+        indexed_properties: Optional[Dict[str, Set[str]]] = None,
+    ):
+        """
+        Initialize the instrumentation.
+        Args:
+            enabled: Record statistics for tracked queries
+            slow_query_ms: Latency at which a query is logged as slow
+            capture_plans: One of PLAN_MODES; plans are captured for slow queries
+            max_plans: Number of captured plans kept (most recent per query name)
+            audit_indexes: Audit each distinct query against indexed_properties
+            indexed_properties: Indexed properties per label for the audit
+        """
+        if capture_plans not in PLAN_MODES:
+            raise ValueError(
+                f"Unknown plan capture mode {capture_plans!r}, expected one of {PLAN_MODES}"
+            )
+        self.enabled = enabled
+        self.slow_query_ms = slow_query_ms
+        self.capture_plans = capture_plans
+        self.max_plans = max_plans
+        self.audit_indexes = audit_indexes
+        self.indexed_properties = indexed_properties or {}
+        self._stats: Dict[str, QueryStats] = {}
+        self._plans: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._findings: Dict[str, List[Dict[str, str]]] = {}
+        self._audited: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(
+        cls,
+        settings: Dict[str, Any],
+        indexed_properties: Optional[Dict[str, Set[str]]] = None,
+    ) -> "QueryInstrumentation":
+        """Create the instrumentation from processing.query_instrumentation."""
+        return cls(
+            enabled=settings.get("enabled", True),
+            slow_query_ms=settings.get("slow_query_ms", 1000.0),
+            capture_plans=settings.get("capture_plans", "off"),
+            max_plans=settings.get("max_plans", 20),
+            audit_indexes=settings.get("audit_indexes", True),
+            indexed_properties=indexed_properties,
+        )
+
+    @contextmanager
+    def track(self, name: str, query: Optional[str] = None) -> Iterator[QueryTracker]:
+        """
+        Time a query and record it under name when the block exits.
+        The caller counts transaction attempts and rows on the yielded tracker.
+        Args:
+            name: Query name used to group statistics
+            query: Cypher text, audited for unindexed lookups on first use
+        """
+        if query is not None:
+            self.audit(name, query)
+        tracker = QueryTracker(name)
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield tracker
+        except Exception:
+            failed = True
+            raise
+        finally:
+            tracker.duration_ms = (time.perf_counter() - start) * 1000
+            tracker.slow = tracker.duration_ms >= self.slow_query_ms
+            if self.enabled:
+                with self._lock:
+                    stats = self._stats.setdefault(name, QueryStats(name))
+                    stats.observe(
+                        tracker.duration_ms,
+                        tracker.rows,
+                        max(tracker.attempts - 1, 0),
+                        failed,
+                        tracker.slow,
+                    )
+            if tracker.slow:
+                logger.warning(
+                    f"instrumentation.track: Slow query {name} took {tracker.duration_ms:.0f}ms",
+                    extra={
+                        "service": "aclarai-core",
+                        "filename.function_name": "instrumentation.track",
+                        "query_name": name,
+                        "duration_ms": tracker.duration_ms,
+                        "rows_count": tracker.rows,
+                        "retries": max(tracker.attempts - 1, 0),
+                    },
+                )
+
+    def should_capture_plan(self, tracker: QueryTracker) -> bool:
+        """Check whether a plan should be captured for a finished query."""
+        return self.enabled and self.capture_plans != "off" and tracker.slow
+
+    def record_plan(self, name: str, mode: str, plan: Dict[str, Any]) -> None:
+        """
+        Keep the summarized plan of a slow query and log its scan operators.
+        Args:
+            name: Query name
+            mode: "EXPLAIN" or "PROFILE"
+            plan: Plan or profile dictionary from the driver's result summary
+        """
+        operators = summarize_plan(plan)
+        scans = [op for op in operators if op["operator"] in SCAN_OPERATORS]
+        with self._lock:
+            self._plans.pop(name, None)
+            self._plans[name] = {"mode": mode, "operators": operators}
+            while len(self._plans) > self.max_plans > 0:
+                self._plans.popitem(last=False)
+        logger.info(
+            f"instrumentation.record_plan: Captured {mode} plan for {name}",
+            extra={
+                "service": "aclarai-core",
+                "filename.function_name": "instrumentation.record_plan",
+                "query_name": name,
+                "operators": [op["operator"] for op in operators],
+                "scan_operators": [op["details"] for op in scans],
+            },
+        )
+
+    def audit(self, name: str, query: str) -> List[Dict[str, str]]:
+        """
+        Audit a query for unindexed lookups, once per distinct query text.
+        Args:
+            name: Query name
+            query: Cypher text
+        Returns:
+            Findings for the query (empty if already audited or disabled)
+        """
+        if not self.audit_indexes or not self.indexed_properties:
+            return []
+        with self._lock:
+            if query in self._audited:
+                return []
+            self._audited.add(query)
+        findings = audit_query_indexes(query, self.indexed_properties)
+        if findings:
+            with self._lock:
+                self._findings[name] = findings
+            logger.warning(
+                f"instrumentation.audit: Query {name} looks up unindexed properties: "
+                + ", ".join(f":{f['label']}.{f['property']}" for f in findings),
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "instrumentation.audit",
+                    "query_name": name,
+                    "findings": findings,
+                },
+            )
+        return findings
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the statistics of every tracked query, by name."""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in self._stats.items()}
+
+    def get_plans(self) -> Dict[str, Dict[str, Any]]:
+        """Get the captured plans, by query name."""
+        with self._lock:
+            return dict(self._plans)
+
+    def get_findings(self) -> Dict[str, List[Dict[str, str]]]:
+        """Get the schema audit findings, by query name."""
+        with self._lock:
+            return dict(self._findings)
+
+    def reset(self) -> None:
+        """Clear statistics, plans and findings."""
+        with self._lock:
+            self._stats.clear()
+            self._plans.clear()
+            self._findings.clear()
+            self._audited.clear()
+
+
+def indexed_properties_from_schema(
+    schema_queries: Iterable[str],
+) -> Dict[str, Set[str]]:
+    """
+    Collect the properties covered by CREATE INDEX/CONSTRAINT statements.
+    Args:
+        schema_queries: Schema statements such as those run by setup_schema
+    Returns:
+        Indexed property names per label
+    """
+    indexed: Dict[str, Set[str]] = {}
+    for statement in schema_queries:
+        match = SCHEMA_PATTERN.search(statement)
+        if not match:
+            continue
+        variable, label, properties = match.groups()
+        for prop in properties.split(","):
+            prop = prop.strip()
+            if prop.startswith(f"{variable}."):
+                indexed.setdefault(label, set()).add(prop[len(variable) + 1 :])
+    return indexed
+
+
+def audit_query_indexes(
+    query: str, indexed: Dict[str, Set[str]]
+) -> List[Dict[str, str]]:
+    """
+    Find MATCH/MERGE lookups and WHERE predicates on unindexed properties.
+    This is a static check: a variable is bound to the first label it is
+    declared with, and a label missing from indexed has no indexed properties.
+    Args:
+        query: Cypher text
+        indexed: Indexed property names per label
+    Returns:
+        Findings with variable, label, property and clause
+    """
+    clauses = _split_clauses(query)
+    labels: Dict[str, str] = {}
+    for _keyword, body in clauses:
+        for variable, label, _props in NODE_PATTERN.findall(body):
+            labels.setdefault(variable, label)
+    findings: List[Dict[str, str]] = []
+    seen: Set[tuple] = set()
+
+    def _check(variable: str, prop: str, clause: str) -> None:
+        label = labels.get(variable)
+        if label is None or prop in indexed.get(label, set()):
+            return
+        if (label, prop) in seen:
+            return
+        seen.add((label, prop))
+        findings.append(
+            {"variable": variable, "label": label, "property": prop, "clause": clause}
+        )
+
+    for keyword, body in clauses:
+        if keyword in ("MATCH", "OPTIONAL MATCH", "MERGE"):
+            for variable, _label, props in NODE_PATTERN.findall(body):
+                for prop in MAP_KEY_PATTERN.findall(props or ""):
+                    _check(variable, prop, keyword)
+        elif keyword == "WHERE":
+            for variable, prop in PREDICATE_PATTERN.findall(body):
+                _check(variable, prop, keyword)
+    return findings
+
+
+def summarize_plan(plan: Dict[str, Any], depth: int = 0) -> List[Dict[str, Any]]:
+    """
+    Flatten a driver plan or profile tree into one entry per operator.
+    Args:
+        plan: Plan dictionary with operatorType, arguments and children
+        depth: Depth of plan in the tree
+    Returns:
+        Operators in pre-order with depth, details and, for profiles,
+        rows and dbHits
+    """
+    if not plan:
+        return []
+    arguments = plan.get("arguments", {}) or {}
+    entry: Dict[str, Any] = {
+        "operator": str(plan.get("operatorType", "")).split("@")[0],
+        "depth": depth,
+        "details": arguments.get("Details", ""),
+    }
+    for key in ("rows", "dbHits"):
+        if key in plan:
+            entry[key] = plan[key]
+    operators = [entry]
+    for child in plan.get("children", []) or []:
+        operators.extend(summarize_plan(child, depth + 1))
+    return operators
+
+
+def _split_clauses(query: str) -> List[tuple]:
+    """Split Cypher text into (normalized keyword, body) pairs."""
+    matches = list(CLAUSE_PATTERN.finditer(query))
+    clauses = []
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(query)
+        keyword = re.sub(r"\s+", " ", match.group(1).upper())
+        clauses.append((keyword, query[match.end() : end]))
+    return clauses
@@ -6,18 +6,93 @@ from docs/arch/idea-neo4J-ineteraction.md.
 """
 
 import logging
+import threading
 import time
 from contextlib import contextmanager
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
-from neo4j import Driver, GraphDatabase
+from neo4j import READ_ACCESS, WRITE_ACCESS, Driver, GraphDatabase, Session
 from neo4j.exceptions import AuthError, ServiceUnavailable, TransientError
 
 from ..config import aclaraiConfig
+from .instrumentation import (
+    QueryInstrumentation,
+    QueryTracker,
+    indexed_properties_from_schema,
+)
 from .models import Claim, ClaimInput, Concept, ConceptInput, Sentence, SentenceInput
+from .write_buffer import GraphWriteBuffer
 
 logger = logging.getLogger(__name__)
 
+# Constraints and indexes created by setup_schema
+SCHEMA_QUERIES = [
+    # Constraints for unique IDs
+    "CREATE CONSTRAINT claim_id_unique IF NOT EXISTS FOR (c:Claim) REQUIRE c.id IS UNIQUE",
+    "CREATE CONSTRAINT sentence_id_unique IF NOT EXISTS FOR (s:Sentence) REQUIRE s.id IS UNIQUE",
+    "CREATE CONSTRAINT block_id_unique IF NOT EXISTS FOR (b:Block) REQUIRE b.id IS UNIQUE",
+    "CREATE CONSTRAINT concept_id_unique IF NOT EXISTS FOR (c:Concept) REQUIRE c.id IS UNIQUE",
+    "CREATE CONSTRAINT sync_state_id_unique IF NOT EXISTS FOR (s:SyncState) REQUIRE s.id IS UNIQUE",
+    # Indexes for performance (technical requirements specify aclarai:id and text)
+    "CREATE INDEX claim_text_index IF NOT EXISTS FOR (c:Claim) ON (c.text)",
+    "CREATE INDEX sentence_text_index IF NOT EXISTS FOR (s:Sentence) ON (s.text)",
+    "CREATE INDEX block_text_index IF NOT EXISTS FOR (b:Block) ON (b.text)",
+    "CREATE INDEX block_hash_index IF NOT EXISTS FOR (b:Block) ON (b.hash)",
+    # Additional performance indexes from graph_schema.cypher
+    "CREATE INDEX claim_entailed_score_index IF NOT EXISTS FOR (c:Claim) ON (c.entailed_score)",
+    "CREATE INDEX claim_coverage_score_index IF NOT EXISTS FOR (c:Claim) ON (c.coverage_score)",
+    "CREATE INDEX claim_decontextualization_score_index IF NOT EXISTS FOR (c:Claim) ON (c.decontextualization_score)",
+]
+
+# Driver settings that may be set under databases.neo4j.pool
+DRIVER_POOL_SETTINGS = (
+    "max_connection_pool_size",
+    "connection_acquisition_timeout",
+    "connection_timeout",
+    "max_connection_lifetime",
+    "liveness_check_timeout",
+    "max_transaction_retry_time",
+)
+
+# Per-block hash comparison, version conflict detection and version increment
+BLOCK_SYNC_QUERY = """
+UNWIND $blocks_data AS data
+OPTIONAL MATCH (existing:Block {id: data.aclarai_id})
+WITH data, existing,
+     existing.version AS graph_version,
+     existing.hash AS old_hash,
+     CASE
+         WHEN existing IS NULL THEN 'create'
+         WHEN existing.hash = data.hash THEN 'unchanged'
+         WHEN data.version < coalesce(existing.version, 1) THEN 'conflict'
+         ELSE 'update'
+     END AS action
+FOREACH (_ IN CASE WHEN action = 'create' THEN [1] ELSE [] END |
+    MERGE (b:Block {id: data.aclarai_id})
+    ON CREATE SET
+        b.text = data.text,
+        b.hash = data.hash,
+        b.version = data.version,
+        b.last_updated = datetime(),
+        b.needs_reprocessing = true,
+        b.source_file = data.source_file
+)
+FOREACH (_ IN CASE WHEN action = 'update' THEN [1] ELSE [] END |
+    SET existing.text = data.text,
+        existing.hash = data.hash,
+        existing.version = coalesce(graph_version, 1) + 1,
+        existing.last_updated = datetime(),
+        existing.needs_reprocessing = true,
+        existing.source_file = data.source_file
+)
+RETURN data.aclarai_id AS aclarai_id, action, graph_version, old_hash,
+       CASE action
+           WHEN 'create' THEN data.version
+           WHEN 'update' THEN coalesce(graph_version, 1) + 1
+           ELSE graph_version
+       END AS version
+"""
+
 
 class Neo4jGraphManager:
     """
@@ -41,6 +116,24 @@ class Neo4jGraphManager:
         # Connection details
         self.uri = config.neo4j.get_neo4j_bolt_url()
         self.auth = (config.neo4j.user, config.neo4j.password)
+        database = getattr(config.neo4j, "database", None)
+        self.database: Optional[str] = (
+            database if isinstance(database, str) and database else None
+        )
+        # Session shared by nested calls inside session_scope(), per thread
+        self._local = threading.local()
+        self.instrumentation = QueryInstrumentation.from_config(
+            self._processing_config("query_instrumentation"),
+            indexed_properties_from_schema(SCHEMA_QUERIES),
+        )
+        # Optional write-behind buffer for deferred writes
+        self.write_buffer: Optional[GraphWriteBuffer] = None
+        buffer_config = self._processing_config("graph_write_buffer")
+        if buffer_config.get("enabled", False) is True:
+            self.enable_write_buffer(
+                max_rows=buffer_config.get("max_rows", 500),
+                max_delay_seconds=buffer_config.get("max_delay_seconds", 1.0),
+            )
         logger.info(
             f"neo4j_manager.__init__: Initialized Neo4jGraphManager for {self.uri}",
             extra={
@@ -54,7 +147,9 @@ class Neo4jGraphManager:
         """Get or create Neo4j driver."""
         if self._driver is None:
             try:
-                self._driver = GraphDatabase.driver(self.uri, auth=self.auth)
+                self._driver = GraphDatabase.driver(
+                    self.uri, auth=self.auth, **self._driver_settings()
+                )
                 self._driver.verify_connectivity()
                 logger.info(
                     "neo4j_manager.driver: Neo4j driver connected successfully",
@@ -74,8 +169,74 @@ class Neo4jGraphManager:
                 raise
         return self._driver
 
+    def _driver_settings(self) -> Dict[str, Any]:
+        """Get the connection pool settings from databases.neo4j.pool."""
+        pool = getattr(self.config.neo4j, "pool", {})
+        if not isinstance(pool, dict):
+            return {}
+        unknown = set(pool) - set(DRIVER_POOL_SETTINGS)
+        if unknown:
+            logger.warning(
+                f"neo4j_manager._driver_settings: Ignoring unknown pool settings: {sorted(unknown)}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "neo4j_manager._driver_settings",
+                },
+            )
+        return {
+            key: value
+            for key, value in pool.items()
+            if key in DRIVER_POOL_SETTINGS and value is not None
+        }
+
+    def enable_write_buffer(
+        self, max_rows: int = 500, max_delay_seconds: float = 1.0
+    ) -> GraphWriteBuffer:
+        """
+        Enable the write-behind buffer used by deferred writes.
+        Args:
+            max_rows: Pending row count that triggers a flush
+            max_delay_seconds: Age of the oldest pending write that makes a flush due
+        Returns:
+            The write buffer
+        """
+        if self.write_buffer is None:
+            self.write_buffer = GraphWriteBuffer(self, max_rows, max_delay_seconds)
+            logger.info(
+                "neo4j_manager.enable_write_buffer: Write-behind buffer enabled",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "neo4j_manager.enable_write_buffer",
+                    "max_rows": max_rows,
+                    "max_delay_seconds": max_delay_seconds,
+                },
+            )
+        return self.write_buffer
+
+    def flush(self) -> int:
+        """
+        Flush deferred writes, running their on_commit or on_failure hooks.
+        Returns:
+            Number of rows written (0 if the write buffer is disabled)
+        """
+        if self.write_buffer is None:
+            return 0
+        return self.write_buffer.flush()
+
     def close(self):
-        """Close Neo4j driver connection."""
+        """Flush deferred writes and close Neo4j driver connection."""
+        if self.write_buffer is not None and self.write_buffer.pending_rows:
+            try:
+                self.write_buffer.flush()
+            except Exception as e:
+                logger.error(
+                    f"neo4j_manager.close: Failed to flush buffered writes: {e}",
+                    extra={
+                        "service": "aclarai-core",
+                        "filename.function_name": "neo4j_manager.close",
+                        "error": str(e),
+                    },
+                )
         if self._driver is not None:
             self._driver.close()
             self._driver = None
@@ -88,14 +249,227 @@ class Neo4jGraphManager:
             )
 
     @contextmanager
-    def session(self):
-        """Context manager for Neo4j sessions."""
-        session = self.driver.session()
+    def session(self, access_mode: Optional[str] = None) -> Iterator[Session]:
+        """
+        Context manager for Neo4j sessions.
+        Inside session_scope() the scope's session is reused instead of
+        opening a new one.
+        Args:
+            access_mode: READ_ACCESS or WRITE_ACCESS for auto-commit queries
+                (driver default if None); transaction functions pick their own
+        """
+        shared = getattr(self._local, "session", None)
+        if shared is not None:
+            yield shared
+            return
+        session_kwargs: Dict[str, Any] = {}
+        if self.database:
+            session_kwargs["database"] = self.database
+        if access_mode is not None:
+            session_kwargs["default_access_mode"] = access_mode
+        session = self.driver.session(**session_kwargs)
         try:
             yield session
         finally:
             session.close()
 
+    @contextmanager
+    def session_scope(self, access_mode: str = WRITE_ACCESS) -> Iterator[Session]:
+        """
+        Share one session across several manager calls on this thread.
+        Multi-statement work (e.g. read, then write) avoids acquiring a pooled
+        connection and opening a session per call, and later reads see earlier
+        writes through the session's bookmarks. Scopes nest; the outermost
+        scope owns the session.
+        Args:
+            access_mode: Default access mode of the shared session
+        """
+        shared = getattr(self._local, "session", None)
+        if shared is not None:
+            yield shared
+            return
+        with self.session(access_mode) as session:
+            self._local.session = session
+            try:
+                yield session
+            finally:
+                self._local.session = None
+
+    def execute_read(self, work: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a read transaction function, routed to readers in a cluster.
+        The driver retries the function on transient errors for up to
+        max_transaction_retry_time, so work must consume its results inside
+        the transaction and have no side effects outside it. The call is
+        tracked under the function's name (without an "_execute_" prefix).
+        Args:
+            work: Function called as work(tx, *args, **kwargs)
+        Returns:
+            The value returned by work
+        """
+        with self.instrumentation.track(_work_name(work)) as tracker:
+            return self._run_managed(tracker, READ_ACCESS, work, *args, **kwargs)
+
+    def execute_write(self, work: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a write transaction function with the driver's built-in retries.
+        Args:
+            work: Function called as work(tx, *args, **kwargs)
+        Returns:
+            The value returned by work
+        """
+        with self.instrumentation.track(_work_name(work)) as tracker:
+            return self._run_managed(tracker, WRITE_ACCESS, work, *args, **kwargs)
+
+    def execute_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        read_only: bool = False,
+        query_name: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a single Cypher query in a managed transaction.
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+            read_only: Run as a read transaction so it can go to a reader
+            query_name: Name the query's statistics are recorded under
+        Returns:
+            Result records as dictionaries
+        """
+        return self._run_query(
+            query_name or "execute_query",
+            query,
+            parameters or {},
+            lambda result: [dict(record) for record in result],
+            read_only=read_only,
+        )
+
+    def _run_managed(
+        self,
+        tracker: QueryTracker,
+        access_mode: str,
+        work: Callable[..., Any],
+        *args,
+        **kwargs,
+    ) -> Any:
+        """Run a transaction function, counting attempts and rows on tracker."""
+
+        def _counted_work(tx, *work_args, **work_kwargs):
+            tracker.attempts += 1
+            return work(tx, *work_args, **work_kwargs)
+
+        with self.session(access_mode) as session:
+            if access_mode == READ_ACCESS:
+                result = session.execute_read(_counted_work, *args, **kwargs)
+            else:
+                result = session.execute_write(_counted_work, *args, **kwargs)
+        if isinstance(result, list):
+            tracker.rows = len(result)
+        else:
+            tracker.rows = 0 if result is None else 1
+        return result
+
+    def _run_query(
+        self,
+        name: str,
+        query: str,
+        parameters: Dict[str, Any],
+        consume: Callable[[Any], Any],
+        read_only: bool = False,
+    ) -> Any:
+        """
+        Run one named query as a tracked managed transaction.
+        Args:
+            name: Query name for statistics, plans and audit findings
+            query: Cypher query string
+            parameters: Query parameters
+            consume: Turns the query result into the return value inside
+                the transaction
+            read_only: Run as a read transaction
+        Returns:
+            The value returned by consume
+        """
+
+        def _work(tx):
+            return consume(tx.run(query, **parameters))
+
+        access_mode = READ_ACCESS if read_only else WRITE_ACCESS
+        with self.instrumentation.track(name, query) as tracker:
+            result = self._run_managed(tracker, access_mode, _work)
+        if self.instrumentation.should_capture_plan(tracker):
+            self._capture_plan(name, query, parameters, read_only)
+        return result
+
+    def _capture_plan(
+        self, name: str, query: str, parameters: Dict[str, Any], read_only: bool
+    ) -> None:
+        """
+        Capture the plan of a slow query.
+        PROFILE runs the query again, so it is only used for reads; writes
+        always fall back to EXPLAIN.
+        """
+        mode = (
+            "PROFILE"
+            if self.instrumentation.capture_plans == "profile" and read_only
+            else "EXPLAIN"
+        )
+        try:
+            with self.session(READ_ACCESS if read_only else WRITE_ACCESS) as session:
+                summary = session.run(f"{mode} {query}", **parameters).consume()
+            plan = summary.profile if mode == "PROFILE" else summary.plan
+            self.instrumentation.record_plan(name, mode, plan or {})
+        except Exception as e:
+            logger.warning(
+                f"neo4j_manager._capture_plan: Failed to capture {mode} plan for {name}: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "neo4j_manager._capture_plan",
+                    "query_name": name,
+                    "error": str(e),
+                },
+            )
+
+    def get_query_stats(self) -> Dict[str, Any]:
+        """
+        Get query instrumentation results.
+        Returns:
+            Statistics, captured plans and index audit findings by query name
+        """
+        return {
+            "queries": self.instrumentation.get_stats(),
+            "plans": self.instrumentation.get_plans(),
+            "index_findings": self.instrumentation.get_findings(),
+        }
+
+    def load_index_catalog(self) -> Dict[str, Set[str]]:
+        """
+        Load indexed properties from the database for the schema audit.
+        Replaces the catalog derived from SCHEMA_QUERIES, so indexes created
+        outside setup_schema are taken into account.
+        Returns:
+            Indexed property names per label
+        """
+
+        def _consume(result):
+            return [dict(record) for record in result]
+
+        records = self._run_query(
+            "load_index_catalog",
+            "SHOW INDEXES YIELD entityType, labelsOrTypes, properties "
+            "WHERE entityType = 'NODE' RETURN labelsOrTypes, properties",
+            {},
+            _consume,
+            read_only=True,
+        )
+        indexed: Dict[str, Set[str]] = {}
+        for record in records:
+            for label in record["labelsOrTypes"] or []:
+                indexed.setdefault(label, set()).update(record["properties"] or [])
+        self.instrumentation.indexed_properties = indexed
+        return indexed
+
     def _retry_with_backoff(self, func, *args, **kwargs):
         """
         Execute function with retry logic and exponential backoff.
@@ -158,31 +532,96 @@ class Neo4jGraphManager:
                 )
                 raise
 
+    def _processing_config(self, section: str) -> Dict[str, Any]:
+        """Get a section of the processing configuration, or {} if unset."""
+        processing = getattr(self.config, "processing", {})
+        if not isinstance(processing, dict):
+            return {}
+        value = processing.get(section, {})
+        return value if isinstance(value, dict) else {}
+
+    def _write_batch_size(self) -> int:
+        """Get the number of rows per UNWIND write query."""
+        return self._processing_config("batch_sizes").get("graph_writes", 500)
+
+    def _batched_upsert(
+        self,
+        label: str,
+        variable: str,
+        rows_param: str,
+        rows: List[Dict[str, Any]],
+        set_cypher: str,
+        link_cypher: str = "",
+        batch_size: Optional[int] = None,
+        defer: bool = False,
+    ) -> List[str]:
+        """
+        Upsert nodes of any label with UNWIND, one query per batch of rows.
+        Nodes are merged on data.id, so a retried or replayed batch does not
+        create duplicates. Each batch runs in its own write transaction,
+        retried by the driver on transient errors.
+        Args:
+            label: Node label to merge
+            variable: Cypher variable bound to the merged node
+            rows_param: Name of the query parameter holding the rows
+            rows: Row dictionaries, each with an "id" key
+            set_cypher: Assignments applied ON CREATE (may reference data)
+            link_cypher: Optional clauses run per row after the merge,
+                e.g. relationship MERGEs
+            batch_size: Rows per query (defaults to processing.batch_sizes.graph_writes)
+            defer: Queue the rows in the write buffer instead of writing now
+        Returns:
+            Ids of the upserted nodes
+        """
+        if batch_size is None:
+            batch_size = self._write_batch_size()
+        batch_size = max(batch_size, 1)
+        cypher_query = f"""
+        UNWIND ${rows_param} AS data
+        MERGE ({variable}:{label} {{id: data.id}})
+        ON CREATE SET
+            {set_cypher}
+        {link_cypher}
+        RETURN {variable}.id as node_id
+        """
+        if defer:
+            self._require_write_buffer().add(
+                f"upsert_{label.lower()}", cypher_query, rows_param, rows
+            )
+            return [row["id"] for row in rows]
+        node_ids: List[str] = []
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+
+            node_ids.extend(
+                self._run_query(
+                    f"upsert_{label.lower()}",
+                    cypher_query,
+                    {rows_param: batch},
+                    lambda result: [record["node_id"] for record in result],
+                )
+            )
+        return node_ids
+
+    def _require_write_buffer(self) -> GraphWriteBuffer:
+        """Get the write buffer, failing if deferred writes are not enabled."""
+        if self.write_buffer is None:
+            raise RuntimeError(
+                "Deferred graph writes require the write buffer; "
+                "call enable_write_buffer() or set processing.graph_write_buffer.enabled"
+            )
+        return self.write_buffer
+
     def setup_schema(self):
         """
         Set up Neo4j schema with constraints and indexes.
         Creates constraints and indexes as specified in graph_schema.cypher
         and technical requirements.
         """
-        schema_queries = [
-            # Constraints for unique IDs
-            "CREATE CONSTRAINT claim_id_unique IF NOT EXISTS FOR (c:Claim) REQUIRE c.id IS UNIQUE",
-            "CREATE CONSTRAINT sentence_id_unique IF NOT EXISTS FOR (s:Sentence) REQUIRE s.id IS UNIQUE",
-            "CREATE CONSTRAINT block_id_unique IF NOT EXISTS FOR (b:Block) REQUIRE b.id IS UNIQUE",
-            # Indexes for performance (technical requirements specify aclarai:id and text)
-            "CREATE INDEX claim_text_index IF NOT EXISTS FOR (c:Claim) ON (c.text)",
-            "CREATE INDEX sentence_text_index IF NOT EXISTS FOR (s:Sentence) ON (s.text)",
-            "CREATE INDEX block_text_index IF NOT EXISTS FOR (b:Block) ON (b.text)",
-            "CREATE INDEX block_hash_index IF NOT EXISTS FOR (b:Block) ON (b.hash)",
-            # Additional performance indexes from graph_schema.cypher
-            "CREATE INDEX claim_entailed_score_index IF NOT EXISTS FOR (c:Claim) ON (c.entailed_score)",
-            "CREATE INDEX claim_coverage_score_index IF NOT EXISTS FOR (c:Claim) ON (c.coverage_score)",
-            "CREATE INDEX claim_decontextualization_score_index IF NOT EXISTS FOR (c:Claim) ON (c.decontextualization_score)",
-        ]
 
         def _execute_schema():
             with self.session() as session:
-                for query in schema_queries:
+                for query in SCHEMA_QUERIES:
                     try:
                         session.run(query)
                         logger.debug(
@@ -210,11 +649,14 @@ class Neo4jGraphManager:
             },
         )
 
-    def create_claims(self, claim_inputs: List[ClaimInput]) -> List[Claim]:
+    def create_claims(
+        self, claim_inputs: List[ClaimInput], defer: bool = False
+    ) -> List[Claim]:
         """
         Create Claim nodes in batch with ORIGINATES_FROM relationships.
         Args:
             claim_inputs: List of ClaimInput objects
+            defer: Queue the writes in the write buffer until the next flush
         Returns:
             List of created Claim objects
         """
@@ -244,29 +686,25 @@ class Neo4jGraphManager:
             },
         )
         # Batch create using UNWIND (following architecture guidelines)
-        cypher_query = """
-        UNWIND $claims_data AS data
-        MERGE (c:Claim {id: data.id})
-        ON CREATE SET
-            c.text = data.text,
+        set_cypher = """c.text = data.text,
             c.entailed_score = data.entailed_score,
             c.coverage_score = data.coverage_score,
             c.decontextualization_score = data.decontextualization_score,
             c.version = data.version,
-            c.timestamp = datetime(data.timestamp)
-        MERGE (b:Block {id: data.block_id})
-        MERGE (c)-[:ORIGINATES_FROM]->(b)
-        RETURN c.id as claim_id
-        """
-
-        def _execute_claim_creation():
-            with self.session() as session:
-                result = session.run(cypher_query, claims_data=claims_data)
-                created_ids = [record["claim_id"] for record in result]
-                return created_ids
+            c.timestamp = datetime(data.timestamp)"""
+        link_cypher = """MERGE (b:Block {id: data.block_id})
+        MERGE (c)-[:ORIGINATES_FROM]->(b)"""
 
         try:
-            created_ids = self._retry_with_backoff(_execute_claim_creation)
+            created_ids = self._batched_upsert(
+                "Claim",
+                "c",
+                "claims_data",
+                claims_data,
+                set_cypher,
+                link_cypher,
+                defer=defer,
+            )
             logger.info(
                 f"neo4j_manager.create_claims: Successfully created {len(created_ids)} Claim nodes",
                 extra={
@@ -288,11 +726,14 @@ class Neo4jGraphManager:
             )
             raise
 
-    def create_sentences(self, sentence_inputs: List[SentenceInput]) -> List[Sentence]:
+    def create_sentences(
+        self, sentence_inputs: List[SentenceInput], defer: bool = False
+    ) -> List[Sentence]:
         """
         Create Sentence nodes in batch with ORIGINATES_FROM relationships.
         Args:
             sentence_inputs: List of SentenceInput objects
+            defer: Queue the writes in the write buffer until the next flush
         Returns:
             List of created Sentence objects
         """
@@ -324,30 +765,26 @@ class Neo4jGraphManager:
             },
         )
         # Batch create using UNWIND
-        cypher_query = """
-        UNWIND $sentences_data AS data
-        MERGE (s:Sentence {id: data.id})
-        ON CREATE SET
-            s.text = data.text,
+        set_cypher = """s.text = data.text,
             s.ambiguous = data.ambiguous,
             s.verifiable = data.verifiable,
             s.failed_decomposition = data.failed_decomposition,
             s.rejection_reason = data.rejection_reason,
             s.version = data.version,
-            s.timestamp = datetime(data.timestamp)
-        MERGE (b:Block {id: data.block_id})
-        MERGE (s)-[:ORIGINATES_FROM]->(b)
-        RETURN s.id as sentence_id
-        """
-
-        def _execute_sentence_creation():
-            with self.session() as session:
-                result = session.run(cypher_query, sentences_data=sentences_data)
-                created_ids = [record["sentence_id"] for record in result]
-                return created_ids
+            s.timestamp = datetime(data.timestamp)"""
+        link_cypher = """MERGE (b:Block {id: data.block_id})
+        MERGE (s)-[:ORIGINATES_FROM]->(b)"""
 
         try:
-            created_ids = self._retry_with_backoff(_execute_sentence_creation)
+            created_ids = self._batched_upsert(
+                "Sentence",
+                "s",
+                "sentences_data",
+                sentences_data,
+                set_cypher,
+                link_cypher,
+                defer=defer,
+            )
             logger.info(
                 f"neo4j_manager.create_sentences: Successfully created {len(created_ids)} Sentence nodes",
                 extra={
@@ -369,6 +806,162 @@ class Neo4jGraphManager:
             )
             raise
 
+    def sync_blocks(
+        self,
+        blocks: List[Dict[str, Any]],
+        source_file: Optional[str] = None,
+        batch_size: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Synchronize parsed vault blocks with Block nodes in batches.
+        Each batch is a single UNWIND query that applies the optimistic locking
+        rules from docs/arch/on-graph_vault_synchronization.md per block:
+        - Block not in graph: create it with the vault version
+        - Hash unchanged: leave it untouched
+        - vault_ver < graph_ver: conflict, leave it untouched
+        - Otherwise: update text and hash, increment the graph version
+        Created and updated blocks are marked with needs_reprocessing = true.
+        A batch that still fails after retries marks its blocks as "error"
+        instead of raising, so the remaining batches are still applied.
+        Args:
+            blocks: Block dictionaries with aclarai_id, version, semantic_text
+                and content_hash, optionally with their own source_file
+            source_file: Source file for blocks that do not carry one
+            batch_size: Blocks per query (defaults to processing.batch_sizes.graph_writes)
+        Returns:
+            One outcome per input block, in input order, with aclarai_id,
+            action ("create", "update", "unchanged", "conflict" or "error"),
+            graph_version (before the sync), version (after the sync)
+            and old_hash
+        """
+        if not blocks:
+            return []
+        if batch_size is None:
+            batch_size = self._write_batch_size()
+        outcomes: List[Dict[str, Any]] = []
+        for batch in self._block_batches(blocks, batch_size):
+            blocks_data = [_block_sync_row(block, source_file) for block in batch]
+
+            try:
+                records = {
+                    record["aclarai_id"]: record
+                    for record in self._run_query(
+                        "sync_blocks",
+                        BLOCK_SYNC_QUERY,
+                        {"blocks_data": blocks_data},
+                        lambda result: [dict(record) for record in result],
+                    )
+                }
+            except Exception as e:
+                logger.error(
+                    f"neo4j_manager.sync_blocks: Failed to sync batch of {len(batch)} blocks: {e}",
+                    extra={
+                        "service": "aclarai-core",
+                        "filename.function_name": "neo4j_manager.sync_blocks",
+                        "blocks_count": len(batch),
+                        "error": str(e),
+                    },
+                )
+                outcomes.extend(
+                    _block_error_outcome(block["aclarai_id"], str(e)) for block in batch
+                )
+                continue
+            outcomes.extend(
+                records.get(block["aclarai_id"])
+                or _block_error_outcome(
+                    block["aclarai_id"], "No result returned for block"
+                )
+                for block in batch
+            )
+        counts: Dict[str, int] = {}
+        for outcome in outcomes:
+            counts[outcome["action"]] = counts.get(outcome["action"], 0) + 1
+        logger.info(
+            f"neo4j_manager.sync_blocks: Synced {len(blocks)} blocks: {counts}",
+            extra={
+                "service": "aclarai-core",
+                "filename.function_name": "neo4j_manager.sync_blocks",
+                "blocks_count": len(blocks),
+                **{f"blocks_{action}": count for action, count in counts.items()},
+            },
+        )
+        return outcomes
+
+    def buffer_block_sync(
+        self,
+        blocks: List[Dict[str, Any]],
+        source_file: Optional[str] = None,
+        on_commit: Optional[Callable[[], None]] = None,
+        on_failure: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """
+        Queue blocks for the same sync as sync_blocks in the write buffer.
+        The flush batches them like sync_blocks, so a block id queued twice is
+        written by separate queries in queue order. Outcomes are logged when
+        the buffer flushes. on_commit runs once the
+        flush transaction commits, on_failure if it fails, so a caller can
+        acknowledge its input only after the write is durable.
+        Args:
+            blocks: Block dictionaries as for sync_blocks
+            source_file: Source file for blocks that do not carry one
+            on_commit: Called after the flush commits
+            on_failure: Called with the error if the flush fails
+        """
+        self._require_write_buffer().add(
+            "sync_blocks",
+            BLOCK_SYNC_QUERY,
+            "blocks_data",
+            [_block_sync_row(block, source_file) for block in blocks],
+            on_commit=on_commit,
+            on_failure=on_failure,
+            result_handler=self._log_block_sync_outcomes,
+            batcher=self._block_batches,
+        )
+
+    def _log_block_sync_outcomes(self, outcomes: List[Dict[str, Any]]) -> None:
+        """Log action counts and version conflicts for synced blocks."""
+        counts: Dict[str, int] = {}
+        for outcome in outcomes:
+            counts[outcome["action"]] = counts.get(outcome["action"], 0) + 1
+            if outcome["action"] == "conflict":
+                logger.warning(
+                    "neo4j_manager.sync_blocks: Version conflict detected - vault is stale",
+                    extra={
+                        "service": "aclarai-core",
+                        "filename.function_name": "neo4j_manager.sync_blocks",
+                        "aclarai_id": outcome["aclarai_id"],
+                        "graph_version": outcome["graph_version"],
+                        "action": "skip_conflict",
+                    },
+                )
+        logger.info(
+            f"neo4j_manager.sync_blocks: Synced {len(outcomes)} blocks: {counts}",
+            extra={
+                "service": "aclarai-core",
+                "filename.function_name": "neo4j_manager.sync_blocks",
+                "blocks_count": len(outcomes),
+                **{f"blocks_{action}": count for action, count in counts.items()},
+            },
+        )
+
+    @staticmethod
+    def _block_batches(blocks: List[Dict[str, Any]], batch_size: int):
+        """
+        Split blocks into batches of at most batch_size.
+        A block id repeated in the input starts a new batch, so each query sees
+        the graph state left by the earlier occurrence.
+        """
+        batch: List[Dict[str, Any]] = []
+        batch_ids = set()
+        for block in blocks:
+            if len(batch) >= max(batch_size, 1) or block["aclarai_id"] in batch_ids:
+                yield batch
+                batch, batch_ids = [], set()
+            batch.append(block)
+            batch_ids.add(block["aclarai_id"])
+        if batch:
+            yield batch
+
     def get_claim_by_id(self, claim_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a Claim node by ID.
@@ -384,14 +977,14 @@ class Neo4jGraphManager:
                c.version as version, c.timestamp as timestamp
         """
 
-        def _execute_get_claim():
-            with self.session() as session:
-                result = session.run(cypher_query, claim_id=claim_id)
-                record = result.single()
-                return dict(record) if record else None
-
         try:
-            result = self._retry_with_backoff(_execute_get_claim)
+            result = self._run_query(
+                "get_claim_by_id",
+                cypher_query,
+                {"claim_id": claim_id},
+                _single_record,
+                read_only=True,
+            )
             if result:
                 logger.debug(
                     f"neo4j_manager.get_claim_by_id: Found claim {claim_id}",
@@ -438,14 +1031,14 @@ class Neo4jGraphManager:
                s.rejection_reason as rejection_reason, s.version as version, s.timestamp as timestamp
         """
 
-        def _execute_get_sentence():
-            with self.session() as session:
-                result = session.run(cypher_query, sentence_id=sentence_id)
-                record = result.single()
-                return dict(record) if record else None
-
         try:
-            result = self._retry_with_backoff(_execute_get_sentence)
+            result = self._run_query(
+                "get_sentence_by_id",
+                cypher_query,
+                {"sentence_id": sentence_id},
+                _single_record,
+                read_only=True,
+            )
             if result:
                 logger.debug(
                     f"neo4j_manager.get_sentence_by_id: Found sentence {sentence_id}",
@@ -490,20 +1083,20 @@ class Neo4jGraphManager:
         RETURN claim_count, sentence_count, block_count
         """
 
-        def _execute_count_nodes():
-            with self.session() as session:
-                result = session.run(cypher_query)
-                record = result.single()
-                if record:
-                    return {
-                        "claims": record["claim_count"],
-                        "sentences": record["sentence_count"],
-                        "blocks": record["block_count"],
-                    }
-                return {"claims": 0, "sentences": 0, "blocks": 0}
+        def _consume_counts(result):
+            record = result.single()
+            if record:
+                return {
+                    "claims": record["claim_count"],
+                    "sentences": record["sentence_count"],
+                    "blocks": record["block_count"],
+                }
+            return {"claims": 0, "sentences": 0, "blocks": 0}
 
         try:
-            result = self._retry_with_backoff(_execute_count_nodes)
+            result = self._run_query(
+                "count_nodes", cypher_query, {}, _consume_counts, read_only=True
+            )
             logger.debug(
                 f"neo4j_manager.count_nodes: Node counts - Claims: {result['claims']}, "
                 f"Sentences: {result['sentences']}, Blocks: {result['blocks']}",
@@ -527,11 +1120,60 @@ class Neo4jGraphManager:
             )
             raise
 
-    def create_concepts(self, concept_inputs: List[ConceptInput]) -> List[Concept]:
+    def get_sync_watermark(self, name: str) -> Optional[float]:
         """
-        Create Concept nodes in the knowledge graph with proper indexing.
+        Get the recorded watermark of a sync process.
+        Args:
+            name: Sync process name, e.g. "vault_sync"
+        Returns:
+            Unix timestamp up to which the source has been loaded, or None
+        """
+        record = self._run_query(
+            "get_sync_watermark",
+            "MATCH (s:SyncState {id: $name}) RETURN s.watermark as watermark",
+            {"name": name},
+            _single_record,
+            read_only=True,
+        )
+        return record["watermark"] if record else None
+
+    def set_sync_watermark(self, name: str, watermark: float) -> None:
+        """
+        Record the watermark of a sync process.
+        Args:
+            name: Sync process name, e.g. "vault_sync"
+            watermark: Unix timestamp up to which the source has been loaded
+        """
+        self._run_query(
+            "set_sync_watermark",
+            """
+            MERGE (s:SyncState {id: $name})
+            SET s.watermark = $watermark, s.updated_at = datetime()
+            """,
+            {"name": name, "watermark": watermark},
+            lambda result: result.consume(),
+        )
+        logger.info(
+            f"neo4j_manager.set_sync_watermark: Recorded {name} watermark {watermark}",
+            extra={
+                "service": "aclarai-core",
+                "filename.function_name": "neo4j_manager.set_sync_watermark",
+                "sync_name": name,
+                "watermark": watermark,
+            },
+        )
+
+    def create_concepts(
+        self, concept_inputs: List[ConceptInput], defer: bool = False
+    ) -> List[Concept]:
+        """
+        Create Concept nodes in batch, linked to the nodes they were promoted from.
+        A source Claim gets a MENTIONS_CONCEPT edge to the Concept and a source
+        Block gets an ORIGINATES_FROM edge from it. The promoted candidate lives
+        in the vector store and is referenced by source_candidate_id.
         Args:
             concept_inputs: List of ConceptInput objects to create
+            defer: Queue the writes in the write buffer until the next flush
         Returns:
             List of created Concept objects
         Raises:
@@ -554,51 +1196,63 @@ class Neo4jGraphManager:
                 "concept_count": len(concept_inputs),
             },
         )
-
-        def _execute_concept_creation():
-            with self.session() as session:
-                concepts = []
-                for concept_input in concept_inputs:
-                    concept = Concept.from_input(concept_input)
-                    concept_data = concept.to_dict()
-                    # Create Concept node with proper indexing
-                    cypher = """
-                    CREATE (c:Concept $concept_data)
-                    RETURN c
-                    """
-                    result = session.run(cypher, concept_data=concept_data)
-                    record = result.single()
-                    if record:
-                        concepts.append(concept)
-                        logger.debug(
-                            f"create_concepts: Created Concept node: {concept.concept_id}",
-                            extra={
-                                "service": "aclarai-core",
-                                "filename.function_name": "neo4j_manager.create_concepts",
-                                "concept_id": concept.concept_id,
-                                "concept_text": concept.text,
-                            },
-                        )
-                    else:
-                        logger.error(
-                            f"create_concepts: Failed to create Concept node: {concept.concept_id}",
-                            extra={
-                                "service": "aclarai-core",
-                                "filename.function_name": "neo4j_manager.create_concepts",
-                                "concept_id": concept.concept_id,
-                            },
-                        )
-                logger.info(
-                    f"create_concepts: Successfully created {len(concepts)} Concept nodes",
+        concepts = [
+            Concept.from_input(concept_input) for concept_input in concept_inputs
+        ]
+        concepts_data = [concept.to_dict() for concept in concepts]
+        link_cypher = """WITH c, data
+        OPTIONAL MATCH (claim:Claim {id: data.source_node_id})
+        FOREACH (_ IN CASE WHEN claim IS NULL THEN [] ELSE [1] END |
+            MERGE (claim)-[:MENTIONS_CONCEPT]->(c)
+        )
+        WITH c, data
+        OPTIONAL MATCH (block:Block {id: data.source_node_id})
+        FOREACH (_ IN CASE WHEN block IS NULL THEN [] ELSE [1] END |
+            MERGE (c)-[:ORIGINATES_FROM]->(block)
+        )"""
+        try:
+            created_ids = set(
+                self._batched_upsert(
+                    "Concept",
+                    "c",
+                    "concepts_data",
+                    concepts_data,
+                    "c += data",
+                    link_cypher,
+                    defer=defer,
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"create_concepts: Failed to create Concept nodes: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "neo4j_manager.create_concepts",
+                    "concept_count": len(concepts),
+                    "error": str(e),
+                },
+            )
+            raise
+        created_concepts = [c for c in concepts if c.concept_id in created_ids]
+        for concept in concepts:
+            if concept.concept_id not in created_ids:
+                logger.error(
+                    f"create_concepts: Failed to create Concept node: {concept.concept_id}",
                     extra={
                         "service": "aclarai-core",
                         "filename.function_name": "neo4j_manager.create_concepts",
-                        "created_count": len(concepts),
+                        "concept_id": concept.concept_id,
                     },
                 )
-                return concepts
-
-        return self._retry_with_backoff(_execute_concept_creation)
+        logger.info(
+            f"create_concepts: Successfully created {len(created_concepts)} Concept nodes",
+            extra={
+                "service": "aclarai-core",
+                "filename.function_name": "neo4j_manager.create_concepts",
+                "created_count": len(created_concepts),
+            },
+        )
+        return created_concepts
 
     def __enter__(self):
         """Context manager entry."""
@@ -607,3 +1261,40 @@ class Neo4jGraphManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+def _block_sync_row(
+    block: Dict[str, Any], source_file: Optional[str]
+) -> Dict[str, Any]:
+    """Build the BLOCK_SYNC_QUERY row for a parsed block."""
+    return {
+        "aclarai_id": block["aclarai_id"],
+        "text": block["semantic_text"],
+        "hash": block["content_hash"],
+        "version": block["version"],
+        "source_file": block.get("source_file", source_file),
+    }
+
+
+def _block_error_outcome(aclarai_id: str, error: str) -> Dict[str, Any]:
+    """Build the sync_blocks outcome for a block whose batch failed."""
+    return {
+        "aclarai_id": aclarai_id,
+        "action": "error",
+        "graph_version": None,
+        "version": None,
+        "old_hash": None,
+        "error": error,
+    }
+
+
+def _single_record(result: Any) -> Optional[Dict[str, Any]]:
+    """Consume a result expected to hold at most one record."""
+    record = result.single()
+    return dict(record) if record else None
+
+
+def _work_name(work: Callable[..., Any]) -> str:
+    """Name a transaction function's statistics after the function."""
+    name = getattr(work, "__name__", "transaction")
+    return name.removeprefix("_execute_") if name != "<lambda>" else "transaction"
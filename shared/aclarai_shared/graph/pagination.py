@@ -0,0 +1,130 @@
+"""
+Keyset-paginated readers for large graph scans.
+Instead of loading every node of a label into memory with one query,
+iter_node_pages reads fixed-size pages ordered by a stable key and resumes
+each page after the last key seen (WHERE n.id > $after_id ... LIMIT $page_size).
+Every page is its own short read transaction, so the first page arrives
+quickly, memory stays bounded by the page size, and the scan uses the id
+index rather than SKIP/OFFSET, which rescans all earlier rows.
+"""
+
+import logging
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000
+# Internal result columns carrying the keyset cursor
+PAGE_ID_COLUMN = "_page_id"
+PAGE_KEY_COLUMN = "_page_key"
+
+
+def graph_read_page_size(config: Any) -> int:
+    """
+    Get the page size for paginated graph reads.
+    Args:
+        config: aclarai configuration
+    Returns:
+        processing.batch_sizes.graph_reads, or DEFAULT_PAGE_SIZE if unset
+    """
+    processing = getattr(config, "processing", {})
+    if not isinstance(processing, dict):
+        return DEFAULT_PAGE_SIZE
+    batch_sizes = processing.get("batch_sizes", {})
+    if not isinstance(batch_sizes, dict):
+        return DEFAULT_PAGE_SIZE
+    return max(int(batch_sizes.get("graph_reads", DEFAULT_PAGE_SIZE)), 1)
+
+
+def iter_node_pages(
+    graph_manager: Any,
+    label: str,
+    return_cypher: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    order_by: str = "id",
+    descending: bool = False,
+    where: str = "",
+    parameters: Optional[Dict[str, Any]] = None,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield pages of nodes of one label, ordered by a stable key.
+    The node is bound to the variable n. Ordering by a property other than id
+    (e.g. timestamp) uses n.id as a tie-breaker and skips nodes where the
+    property is null, since they cannot be placed in the keyset order.
+    Args:
+        graph_manager: Object providing execute_query(query, parameters,
+            read_only, query_name)
+        label: Node label to scan
+        return_cypher: RETURN items for each node, e.g. "n.id as id, n.text as text"
+        page_size: Maximum rows per page
+        order_by: Node property defining the page order
+        descending: Scan from the highest key down
+        where: Optional extra predicate on n
+        parameters: Parameters referenced by where
+    Returns:
+        Iterator of pages, each a non-empty list of result dictionaries
+    """
+    page_size = max(page_size, 1)
+    comparison = "<" if descending else ">"
+    direction = " DESC" if descending else ""
+    filters = [f"({where})"] if where else []
+    if order_by == "id":
+        cursor_filter = f"n.id {comparison} $after_id"
+        order_cypher = f"n.id{direction}"
+        cursor_columns = f"n.id AS {PAGE_ID_COLUMN}"
+    else:
+        filters.append(f"n.{order_by} IS NOT NULL")
+        cursor_filter = (
+            f"(n.{order_by} {comparison} $after_key OR "
+            f"(n.{order_by} = $after_key AND n.id {comparison} $after_id))"
+        )
+        order_cypher = f"n.{order_by}{direction}, n.id{direction}"
+        cursor_columns = f"n.id AS {PAGE_ID_COLUMN}, n.{order_by} AS {PAGE_KEY_COLUMN}"
+
+    def _build_query(first_page: bool) -> str:
+        clauses = filters if first_page else [*filters, cursor_filter]
+        where_cypher = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return f"""
+        MATCH (n:{label})
+        {where_cypher}
+        RETURN {return_cypher}, {cursor_columns}
+        ORDER BY {order_cypher}
+        LIMIT $page_size
+        """
+
+    query_parameters = dict(parameters or {}, page_size=page_size)
+    query = _build_query(first_page=True)
+    pages = 0
+    rows = 0
+    while True:
+        records = graph_manager.execute_query(
+            query,
+            dict(query_parameters),
+            read_only=True,
+            query_name=f"iter_{label.lower()}_pages",
+        )
+        if not records:
+            break
+        page = []
+        for record in records:
+            row = dict(record)
+            query_parameters["after_id"] = row.pop(PAGE_ID_COLUMN, None)
+            if PAGE_KEY_COLUMN in row:
+                query_parameters["after_key"] = row.pop(PAGE_KEY_COLUMN)
+            page.append(row)
+        pages += 1
+        rows += len(page)
+        yield page
+        if len(page) < page_size or query_parameters.get("after_id") is None:
+            break
+        query = _build_query(first_page=False)
+    logger.debug(
+        f"pagination.iter_node_pages: Read {rows} {label} nodes in {pages} pages",
+        extra={
+            "service": "aclarai-core",
+            "filename.function_name": "pagination.iter_node_pages",
+            "label": label,
+            "pages": pages,
+            "rows_count": rows,
+        },
+    )
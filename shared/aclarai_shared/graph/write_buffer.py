@@ -0,0 +1,248 @@
+"""
+Write-behind buffer for Neo4j graph writes.
+Small writes (block syncs, claim and sentence persists, concept links) are
+queued per operation and flushed as UNWIND batches in a single transaction
+once a row count or age threshold is reached. Callers that must not report
+success before the data is durable (e.g. a RabbitMQ consumer acking a message)
+pass on_commit/on_failure hooks, which run after the flush transaction commits
+or fails.
+"""
+
+import contextlib
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from .neo4j_manager import Neo4jGraphManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingOperation:
+    """Rows queued for one operation, with the hooks of the writes they came from."""
+
+    operation: str
+    cypher_query: str
+    rows_param: str
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    on_commit: List[Callable[[], None]] = field(default_factory=list)
+    on_failure: List[Callable[[Exception], None]] = field(default_factory=list)
+    result_handler: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+    batcher: Optional[
+        Callable[[List[Dict[str, Any]], int], Iterable[List[Dict[str, Any]]]]
+    ] = None
+
+    def batches(self, batch_size: int) -> Iterable[List[Dict[str, Any]]]:
+        """Split the queued rows into the batches written by one query each."""
+        if self.batcher is not None:
+            return self.batcher(self.rows, batch_size)
+        return (
+            self.rows[start : start + batch_size]
+            for start in range(0, len(self.rows), batch_size)
+        )
+
+
+class GraphWriteBuffer:
+    """
+    Groups compatible graph writes and flushes them as UNWIND batches.
+    Writes are compatible when they share an operation name and Cypher query.
+    A flush runs every pending operation in one transaction, so all queued
+    writes commit or fail together.
+    """
+
+    def __init__(
+        self,
+        graph_manager: "Neo4jGraphManager",
+        max_rows: int = 500,
+        max_delay_seconds: float = 1.0,
+    ):
+        """
+        Initialize the buffer.
+        Args:
+            graph_manager: Manager providing write transactions and batch size
+            max_rows: Pending row count that triggers a flush
+            max_delay_seconds: Age of the oldest pending write that makes a flush due
+        """
+        self.graph_manager = graph_manager
+        self.max_rows = max(max_rows, 1)
+        self.max_delay_seconds = max_delay_seconds
+        self._pending: Dict[Tuple[str, str], _PendingOperation] = {}
+        self._pending_rows = 0
+        self._oldest_write: Optional[float] = None
+        self._lock = threading.RLock()
+        self._stats = {"writes": 0, "rows": 0, "flushes": 0, "failed_flushes": 0}
+
+    @property
+    def pending_rows(self) -> int:
+        """Number of rows waiting to be flushed."""
+        with self._lock:
+            return self._pending_rows
+
+    def add(
+        self,
+        operation: str,
+        cypher_query: str,
+        rows_param: str,
+        rows: List[Dict[str, Any]],
+        on_commit: Optional[Callable[[], None]] = None,
+        on_failure: Optional[Callable[[Exception], None]] = None,
+        result_handler: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        batcher: Optional[
+            Callable[[List[Dict[str, Any]], int], Iterable[List[Dict[str, Any]]]]
+        ] = None,
+    ) -> None:
+        """
+        Queue rows for an UNWIND write, flushing if a threshold is reached.
+        A flush triggered here reports failures through the on_failure hooks
+        and does not raise.
+        Args:
+            operation: Operation name used to group compatible writes
+            cypher_query: UNWIND query reading its rows from rows_param
+            rows_param: Name of the query parameter holding the rows
+            rows: Rows to write
+            on_commit: Called once the rows are committed
+            on_failure: Called with the error if the flush fails
+            result_handler: Called with the result records of the operation
+                after commit (the first handler registered for a group is used)
+            batcher: Splits the group's rows into per-query batches given the
+                batch size, for writes whose rows must not share a query
+                (defaults to fixed-size slices; the first one registered is used)
+        """
+        with self._lock:
+            key = (operation, cypher_query)
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = _PendingOperation(
+                    operation, cypher_query, rows_param, batcher=batcher
+                )
+                self._pending[key] = pending
+            pending.rows.extend(rows)
+            if on_commit is not None:
+                pending.on_commit.append(on_commit)
+            if on_failure is not None:
+                pending.on_failure.append(on_failure)
+            if pending.result_handler is None:
+                pending.result_handler = result_handler
+            self._pending_rows += len(rows)
+            self._stats["writes"] += 1
+            if self._oldest_write is None:
+                self._oldest_write = time.monotonic()
+        self.flush_if_due()
+
+    def is_due(self) -> bool:
+        """Check whether the row count or age threshold has been reached."""
+        with self._lock:
+            if self._pending_rows >= self.max_rows:
+                return True
+            return (
+                self._oldest_write is not None
+                and time.monotonic() - self._oldest_write >= self.max_delay_seconds
+            )
+
+    def flush_if_due(self) -> None:
+        """Flush if a threshold has been reached; failures go to the hooks."""
+        if self.is_due():
+            # Errors are already logged and reported through the on_failure hooks
+            with contextlib.suppress(Exception):
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        Write all pending operations in one transaction.
+        On success the on_commit hooks run; on failure the on_failure hooks run,
+        the pending rows are dropped and the error is raised.
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+            row_count = self._pending_rows
+            self._pending = {}
+            self._pending_rows = 0
+            self._oldest_write = None
+        if not pending:
+            return 0
+        batch_size = max(self.graph_manager._write_batch_size(), 1)
+
+        def _execute_flush(tx):
+            results: List[List[Dict[str, Any]]] = []
+            for op in pending:
+                records: List[Dict[str, Any]] = []
+                results.append(records)
+                for batch in op.batches(batch_size):
+                    result = tx.run(op.cypher_query, **{op.rows_param: batch})
+                    records.extend(dict(record) for record in result)
+            return results
+
+        try:
+            results = self.graph_manager.execute_write(_execute_flush)
+        except Exception as e:
+            with self._lock:
+                self._stats["failed_flushes"] += 1
+            logger.error(
+                f"write_buffer.flush: Failed to flush {row_count} buffered rows: {e}",
+                extra={
+                    "service": "aclarai-core",
+                    "filename.function_name": "write_buffer.flush",
+                    "rows_count": row_count,
+                    "operations": [op.operation for op in pending],
+                    "error": str(e),
+                },
+            )
+            for op in pending:
+                for callback in op.on_failure:
+                    _run_hook(callback, e)
+            raise
+        with self._lock:
+            self._stats["flushes"] += 1
+            self._stats["rows"] += row_count
+        logger.debug(
+            f"write_buffer.flush: Flushed {row_count} rows in {len(pending)} operations",
+            extra={
+                "service": "aclarai-core",
+                "filename.function_name": "write_buffer.flush",
+                "rows_count": row_count,
+                "operations": [op.operation for op in pending],
+            },
+        )
+        for op, records in zip(pending, results, strict=True):
+            if op.result_handler is not None:
+                _run_hook(op.result_handler, records)
+            for callback in op.on_commit:
+                _run_hook(callback)
+        return row_count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write, row and flush counters and the pending row count."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["pending_rows"] = self._pending_rows
+        return stats
+
+
+def _run_hook(callback: Callable[..., None], *args: Any) -> None:
+    """Run a durability hook, logging instead of raising on error."""
+    try:
+        callback(*args)
+    except Exception as e:
+        logger.error(
+            f"write_buffer._run_hook: Hook {getattr(callback, '__name__', callback)} failed: {e}",
+            extra={
+                "service": "aclarai-core",
+                "filename.function_name": "write_buffer._run_hook",
+                "error": str(e),
+            },
+        )
@@ -5,10 +5,12 @@ from Claims and Summary nodes, implementing the concept_candidates vector table
 as specified in docs/arch/on-vector_stores.md.
 """
 
+import json
 import logging
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
+import numpy as np
 from llama_index.core import Document, Settings, VectorStoreIndex
 from llama_index.vector_stores.postgres import PGVectorStore
 from sqlalchemy import create_engine
@@ -19,6 +21,11 @@ from .models import NounPhraseCandidate
 
 logger = logging.getLogger(__name__)
 
+# Generation stamps of persisted candidate indexes, one row per collection
+INDEX_GENERATIONS_TABLE = "concept_index_generations"
+# Rows fetched per round trip when streaming candidates by status
+DEFAULT_CHUNK_SIZE = 1000
+
 
 @dataclass
 class ConceptCandidateDocument:
@@ -76,6 +83,8 @@ class ConceptCandidatesVectorStore:
         self.vector_index = VectorStoreIndex.from_vector_store(
             self.vector_store, embed_model=self.embedding_generator.embedding_model
         )
+        self._generations_table_ready = False
+        self._metadata_indexes_ready = False
         logger.info(
             f"Initialized ConceptCandidatesVectorStore with collection: {self.collection_name}, "
             f"dimension: {self.embed_dim}",
@@ -135,6 +144,19 @@ class ConceptCandidatesVectorStore:
                 for idx, embedding in zip(indices_to_embed, embeddings, strict=False):
                     candidates[idx].embedding = embedding
                     documents[idx].embedding = embedding
+            # Invalidate saved candidate indexes before the rows become visible,
+            # so a failure here can only cause an unneeded rebuild
+            try:
+                self.bump_index_generation()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to bump concept candidate index generation: {e}",
+                    extra={
+                        "service": "aclarai",
+                        "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.store_candidates",
+                        "error": str(e),
+                    },
+                )
             # Use batch insertion via LlamaIndex
             logger.debug("Performing batch insertion of documents")
             # Insert all documents at once using LlamaIndex's batch capability
@@ -162,6 +184,86 @@ class ConceptCandidatesVectorStore:
             )
             return 0
 
+    def store_merged_candidates(
+        self, merges: List[Tuple[NounPhraseCandidate, Dict[str, Any]]]
+    ) -> int:
+        """
+        Record candidates that were merged without being embedded.
+        Candidates resolved by exact match never get an embedding, so they
+        are written as metadata-only rows (embedding NULL) with status
+        "merged", in one statement. A candidate that is already stored,
+        e.g. from a re-synced block, has its metadata updated instead.
+        Rows without an embedding are never indexed, so the index
+        generation is left alone.
+        Args:
+            merges: (candidate, metadata_updates) pairs, where the updates
+                carry merged_with_id and, for concepts, merged_with_concept_id
+        Returns:
+            Number of candidates recorded
+        """
+        if not merges:
+            return 0
+        rows: Dict[str, Dict[str, Any]] = {}
+        for candidate, metadata_updates in merges:
+            metadata = {
+                **self._candidate_metadata(candidate),
+                **metadata_updates,
+                "status": "merged",
+            }
+            rows[metadata["candidate_id"]] = {
+                "candidate_id": metadata["candidate_id"],
+                "text": candidate.normalized_text,
+                "metadata": metadata,
+            }
+        try:
+            from sqlalchemy import text
+
+            table = self._table_name()
+            with self.engine.connect() as conn:
+                self._ensure_metadata_indexes(conn)
+                result = conn.execute(
+                    text(f"""
+                        WITH incoming AS (
+                            SELECT * FROM jsonb_to_recordset(CAST(:rows AS jsonb))
+                                AS r(candidate_id text, text text, metadata jsonb)
+                        ),
+                        updated AS (
+                            UPDATE {table} AS t
+                            SET metadata_ = (t.metadata_::jsonb || incoming.metadata)::json
+                            FROM incoming
+                            WHERE t.metadata_->>'candidate_id' = incoming.candidate_id
+                            RETURNING incoming.candidate_id
+                        )
+                        INSERT INTO {table} (text, metadata_, node_id)
+                        SELECT incoming.text, incoming.metadata::json, incoming.candidate_id
+                        FROM incoming
+                        WHERE incoming.candidate_id NOT IN (SELECT candidate_id FROM updated)
+                    """),  # nosec B608 - table name is derived from configuration, not user input
+                    {"rows": json.dumps(list(rows.values()), default=str)},
+                )
+                conn.commit()
+        except Exception as e:
+            logger.error(
+                f"Failed to store merged candidates: {e}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.store_merged_candidates",
+                    "candidates_count": len(rows),
+                    "error": str(e),
+                },
+            )
+            return 0
+        logger.info(
+            f"Recorded {len(rows)} merged concept candidates ({result.rowcount} new)",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.store_merged_candidates",
+                "candidates_count": len(rows),
+                "inserted_count": result.rowcount,
+            },
+        )
+        return len(rows)
+
     def find_similar_candidates(
         self,
         query_text: str,
@@ -236,135 +338,344 @@ class ConceptCandidatesVectorStore:
         Returns:
             True if update was successful, False otherwise
         """
-        logger.debug(
-            f"Updating candidate status: {candidate_id} -> {new_status}",
-            extra={
-                "service": "aclarai",
-                "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.update_candidate_status",
-                "candidate_id": candidate_id,
-                "new_status": new_status,
-            },
+        updated = self.update_candidate_statuses(
+            [(candidate_id, new_status, metadata_updates)]
         )
+        if candidate_id not in updated:
+            logger.warning(
+                f"Candidate not found for status update: {candidate_id}",
+                extra={
+                    "service": "aclarai",
+                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.update_candidate_status",
+                    "candidate_id": candidate_id,
+                },
+            )
+            return False
+        return True
+
+    def update_candidate_statuses(
+        self, updates: List[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> Set[str]:
+        """
+        Update the status and metadata of many candidates in one statement.
+        The changes are sent as a single JSON array, expanded with
+        jsonb_to_recordset and merged into each row's metadata with jsonb ||,
+        so a batch costs one round trip. Rows are matched through the
+        expression index on metadata->>'candidate_id'.
+        Args:
+            updates: (candidate_id, new_status, metadata_updates) tuples; later
+                entries for the same candidate win
+        Returns:
+            Ids of the candidates that were updated
+        """
+        if not updates:
+            return set()
+        changes: Dict[str, Dict[str, Any]] = {}
+        for candidate_id, new_status, metadata_updates in updates:
+            change = changes.setdefault(candidate_id, {})
+            change.update(metadata_updates or {})
+            change["status"] = new_status
         try:
-            # For PostgreSQL vector store, we need to update via SQL
-            from llama_index.vector_stores.postgres.base import ITEMS_TABLE
             from sqlalchemy import text
 
-            # Build the update query
-            metadata_updates = metadata_updates or {}
-            metadata_updates["status"] = new_status
-            # Update metadata column by merging with existing metadata
+            table = self._table_name()
             with self.engine.connect() as conn:
-                # First get the current record
-                select_stmt = text(f"""
-                    SELECT metadata FROM {ITEMS_TABLE}
-                    WHERE metadata->>'candidate_id' = :candidate_id
-                """)  # nosec B608 - ITEMS_TABLE is a constant from LlamaIndex, not user input
-                result = conn.execute(select_stmt, {"candidate_id": candidate_id})
-                row = result.fetchone()
-                if not row:
-                    logger.warning(
-                        f"Candidate not found for status update: {candidate_id}",
-                        extra={
-                            "service": "aclarai",
-                            "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.update_candidate_status",
-                            "candidate_id": candidate_id,
-                        },
-                    )
-                    return False
-                # Merge metadata
-                import json
-
-                current_metadata = row[0] if row[0] else {}
-                if isinstance(current_metadata, str):
-                    current_metadata = json.loads(current_metadata)
-                current_metadata.update(metadata_updates)
-                # Update the record
-                update_stmt = text(f"""
-                    UPDATE {ITEMS_TABLE}
-                    SET metadata = :metadata
-                    WHERE metadata->>'candidate_id' = :candidate_id
-                """)  # nosec B608 - ITEMS_TABLE is a constant from LlamaIndex, not user input
-                conn.execute(
-                    update_stmt,
+                self._ensure_metadata_indexes(conn)
+                rows = conn.execute(
+                    text(f"""
+                        UPDATE {table} AS t
+                        SET metadata_ = (t.metadata_::jsonb || u.changes)::json
+                        FROM jsonb_to_recordset(CAST(:updates AS jsonb))
+                            AS u(candidate_id text, changes jsonb)
+                        WHERE t.metadata_->>'candidate_id' = u.candidate_id
+                        RETURNING u.candidate_id
+                    """),  # nosec B608 - table name is derived from configuration, not user input
                     {
-                        "candidate_id": candidate_id,
-                        "metadata": json.dumps(current_metadata),
+                        "updates": json.dumps(
+                            [
+                                {"candidate_id": candidate_id, "changes": change}
+                                for candidate_id, change in changes.items()
+                            ],
+                            default=str,
+                        )
                     },
-                )
+                ).fetchall()
                 conn.commit()
-            logger.info(
-                f"Successfully updated candidate status: {candidate_id} -> {new_status}",
+        except Exception as e:
+            logger.error(
+                f"Failed to update candidate statuses: {e}",
                 extra={
                     "service": "aclarai",
-                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.update_candidate_status",
-                    "candidate_id": candidate_id,
-                    "new_status": new_status,
+                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.update_candidate_statuses",
+                    "updates_count": len(changes),
+                    "error": str(e),
                 },
             )
-            return True
+            return set()
+        updated = {row[0] for row in rows}
+        logger.info(
+            f"Updated {len(updated)}/{len(changes)} candidate statuses",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.update_candidate_statuses",
+                "updates_count": len(changes),
+                "updated_count": len(updated),
+            },
+        )
+        return updated
+
+    def get_candidates_by_status(self, status: str) -> List[Dict[str, Any]]:
+        """
+        Retrieve all candidates with a specific status (e.g., "pending").
+        Unlike iter_candidate_chunks, this includes rows stored without an
+        embedding, such as candidates merged by exact match; their
+        "embedding" is None. Prefer iter_candidate_chunks or
+        count_candidates_by_status for large collections; this materializes
+        every matching candidate.
+        Args:
+            status: Status to filter by
+        Returns:
+            List of candidate metadata dictionaries, each with its embedding
+        """
+        candidates: List[Dict[str, Any]] = []
+        try:
+            for rows in self._iter_status_rows(
+                status, DEFAULT_CHUNK_SIZE, embedded_only=False
+            ):
+                for metadata, embedding in rows:
+                    candidates.append(
+                        {
+                            **_row_metadata(metadata),
+                            "embedding": None
+                            if embedding is None
+                            else np.asarray(embedding, dtype=np.float32),
+                        }
+                    )
+        except Exception:
+            return []
+        return candidates
+
+    def iter_candidate_chunks(
+        self, status: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Tuple[List[Dict[str, Any]], np.ndarray]]:
+        """
+        Stream the candidates with a status that have an embedding, in chunks.
+        This is what index builds read. Rows stored without an embedding
+        (candidates merged by exact match) are skipped, since they can
+        never be indexed. Memory stays bounded by the chunk size however
+        many candidates match.
+        Args:
+            status: Status to filter by
+            chunk_size: Rows fetched per chunk
+        Yields:
+            (metadata dictionaries, (n, embed_dim) float32 embedding matrix)
+        Raises:
+            Exception: If the query fails, so callers never see a partial set
+        """
+        for rows in self._iter_status_rows(status, chunk_size, embedded_only=True):
+            metadata_chunk = [_row_metadata(row[0]) for row in rows]
+            embeddings = np.asarray(
+                np.stack([row[1] for row in rows]), dtype=np.float32
+            )
+            yield metadata_chunk, embeddings
+
+    def count_candidates_by_status(self) -> Dict[str, int]:
+        """
+        Count the candidates of every status with one GROUP BY query.
+        Returns:
+            Mapping of status to number of candidates
+        Raises:
+            Exception: If the query fails
+        """
+        from sqlalchemy import text
+
+        table = self._table_name()
+        try:
+            with self.engine.connect() as conn:
+                self._ensure_metadata_indexes(conn)
+                conn.commit()
+                rows = conn.execute(
+                    text(f"""
+                        SELECT metadata_->>'status', count(*) FROM {table}
+                        GROUP BY 1
+                    """)  # nosec B608 - table name is derived from configuration, not user input
+                ).fetchall()
         except Exception as e:
             logger.error(
-                f"Failed to update candidate status for {candidate_id}: {e}",
+                f"Failed to count candidates by status: {e}",
                 extra={
                     "service": "aclarai",
-                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.update_candidate_status",
-                    "candidate_id": candidate_id,
-                    "new_status": new_status,
+                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.count_candidates_by_status",
                     "error": str(e),
                 },
             )
-            return False
+            raise
+        return {status: int(count) for status, count in rows if status is not None}
 
-    def get_candidates_by_status(self, status: str) -> List[Dict[str, Any]]:
+    def _iter_status_rows(
+        self, status: str, chunk_size: int, embedded_only: bool
+    ) -> Iterator[List[Any]]:
         """
-        Retrieve all candidates with a specific status (e.g., "pending").
+        Stream (metadata, embedding) rows with a status in partitions.
+        Rows are read through a server-side cursor filtered on the expression
+        index over metadata->>'status'.
         Args:
             status: Status to filter by
-        Returns:
-            List of candidate metadata dictionaries
+            chunk_size: Rows fetched per partition
+            embedded_only: Skip rows stored without an embedding
+        Yields:
+            Lists of (metadata, embedding) rows
+        Raises:
+            Exception: If the query fails
         """
         logger.debug(
-            f"Retrieving candidates with status: {status}",
+            f"Streaming candidates with status: {status}",
             extra={
                 "service": "aclarai",
-                "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.get_candidates_by_status",
+                "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore._iter_status_rows",
                 "status": status,
+                "chunk_size": chunk_size,
             },
         )
+        from pgvector.sqlalchemy import Vector
+        from sqlalchemy import text
+
+        table = self._table_name()
+        embedding_filter = "AND embedding IS NOT NULL" if embedded_only else ""
+        total = 0
         try:
-            # Use similarity search with empty query but metadata filter
-            results = self.find_similar_candidates(
-                query_text="",  # Empty query to get all
-                top_k=1000,  # Large number to get all matches
-            )
-            # Filter by status
-            filtered_results = [
-                metadata
-                for metadata, score in results
-                if metadata.get("status") == status
-            ]
-            logger.debug(
-                f"Found {len(filtered_results)} candidates with status '{status}'",
-                extra={
-                    "service": "aclarai",
-                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.get_candidates_by_status",
-                    "status": status,
-                    "count": len(filtered_results),
-                },
-            )
-            return filtered_results
+            with self.engine.connect() as conn:
+                self._ensure_metadata_indexes(conn)
+                conn.commit()
+                result = conn.execution_options(yield_per=chunk_size).execute(
+                    text(f"""
+                        SELECT metadata_, embedding FROM {table}
+                        WHERE metadata_->>'status' = :status
+                          {embedding_filter}
+                    """).columns(embedding=Vector(self.embed_dim)),  # nosec B608 - table name is derived from configuration, not user input
+                    {"status": status},
+                )
+                for rows in result.partitions():
+                    total += len(rows)
+                    yield rows
         except Exception as e:
             logger.error(
                 f"Failed to retrieve candidates by status '{status}': {e}",
                 extra={
                     "service": "aclarai",
-                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore.get_candidates_by_status",
+                    "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore._iter_status_rows",
                     "status": status,
                     "error": str(e),
                 },
             )
-            return []
+            raise
+        logger.debug(
+            f"Found {total} candidates with status '{status}'",
+            extra={
+                "service": "aclarai",
+                "filename.function_name": "concept_candidates_vector_store.ConceptCandidatesVectorStore._iter_status_rows",
+                "status": status,
+                "count": total,
+            },
+        )
+
+    def get_index_generation(self, name: Optional[str] = None) -> int:
+        """
+        Get the generation stamp of this collection's candidate index.
+        The stamp changes whenever candidates are added outside the index or
+        an index snapshot is saved, so a snapshot whose stamp differs is stale.
+        Args:
+            name: Stamp of another index (defaults to the collection name)
+        Returns:
+            Current generation (0 if never bumped)
+        """
+        from sqlalchemy import text
+
+        with self.engine.connect() as conn:
+            self._ensure_generations_table(conn)
+            row = conn.execute(
+                text(
+                    f"SELECT generation FROM {INDEX_GENERATIONS_TABLE} WHERE name = :name"
+                ),  # nosec B608 - INDEX_GENERATIONS_TABLE is a module constant
+                {"name": name or self.collection_name},
+            ).fetchone()
+            conn.commit()
+        return int(row[0]) if row else 0
+
+    def bump_index_generation(self, name: Optional[str] = None) -> int:
+        """
+        Advance the generation stamp of this collection's candidate index.
+        Args:
+            name: Stamp of another index (defaults to the collection name)
+        Returns:
+            The new generation
+        """
+        from sqlalchemy import text
+
+        with self.engine.connect() as conn:
+            self._ensure_generations_table(conn)
+            row = conn.execute(
+                text(f"""
+                    INSERT INTO {INDEX_GENERATIONS_TABLE} (name, generation)
+                    VALUES (:name, 1)
+                    ON CONFLICT (name) DO UPDATE
+                    SET generation = {INDEX_GENERATIONS_TABLE}.generation + 1
+                    RETURNING generation
+                """),  # nosec B608 - INDEX_GENERATIONS_TABLE is a module constant
+                {"name": name or self.collection_name},
+            ).fetchone()
+            conn.commit()
+        return int(row[0])
+
+    def _ensure_generations_table(self, conn) -> None:
+        """Create the index generations table on first use."""
+        if self._generations_table_ready:
+            return
+        from sqlalchemy import text
+
+        conn.execute(
+            text(f"""
+                CREATE TABLE IF NOT EXISTS {INDEX_GENERATIONS_TABLE} (
+                    name TEXT PRIMARY KEY,
+                    generation BIGINT NOT NULL DEFAULT 0
+                )
+            """)
+        )
+        self._generations_table_ready = True
+
+    def _table_name(self) -> str:
+        """Name of the table PGVectorStore keeps this collection in."""
+        return f"data_{self.collection_name.lower()}"
+
+    def _ensure_metadata_indexes(self, conn) -> None:
+        """
+        Create the expression indexes on metadata->>'candidate_id' and
+        metadata->>'status' on first use.
+        Rows stored before candidate_id was part of the metadata get it from
+        node_id, which holds the same id.
+        """
+        if self._metadata_indexes_ready:
+            return
+        from sqlalchemy import text
+
+        table = self._table_name()
+        for key in ("candidate_id", "status"):
+            conn.execute(
+                text(f"""
+                    CREATE INDEX IF NOT EXISTS {table}_{key}_idx
+                    ON {table} ((metadata_->>'{key}'))
+                """)
+            )
+        conn.execute(
+            text(f"""
+                UPDATE {table}
+                SET metadata_ = (
+                    metadata_::jsonb || jsonb_build_object('candidate_id', node_id)
+                )::json
+                WHERE metadata_->>'candidate_id' IS NULL AND node_id IS NOT NULL
+            """)  # nosec B608 - table name is derived from configuration, not user input
+        )
+        self._metadata_indexes_ready = True
 
     def _initialize_pgvector_store(self) -> PGVectorStore:
         """Initialize PGVectorStore for concept_candidates collection."""
@@ -444,24 +755,34 @@ class ConceptCandidatesVectorStore:
         """
         documents = []
         for candidate in candidates:
-            # Create comprehensive metadata
-            metadata = {
-                "original_text": candidate.text,
-                "normalized_text": candidate.normalized_text,
-                "source_node_id": candidate.source_node_id,
-                "source_node_type": candidate.source_node_type,
-                "aclarai_id": candidate.aclarai_id,
-                "status": candidate.status,
-                "timestamp": candidate.timestamp.isoformat()
-                if candidate.timestamp
-                else None,
-            }
+            metadata = self._candidate_metadata(candidate)
             # Create Document with normalized text as the content
             doc = Document(
                 text=candidate.normalized_text,  # This is what gets embedded and searched
                 metadata=metadata,
-                doc_id=f"{candidate.source_node_type}_{candidate.source_node_id}_{candidate.text[:50]}",
+                doc_id=metadata["candidate_id"],
                 embedding=candidate.embedding,
             )
             documents.append(doc)
         return documents
+
+    def _candidate_metadata(self, candidate: NounPhraseCandidate) -> Dict[str, Any]:
+        """Build the metadata stored with a candidate's row."""
+        candidate_id = f"{candidate.source_node_type}_{candidate.source_node_id}_{candidate.text[:50]}"
+        return {
+            "candidate_id": candidate_id,
+            "original_text": candidate.text,
+            "normalized_text": candidate.normalized_text,
+            "source_node_id": candidate.source_node_id,
+            "source_node_type": candidate.source_node_type,
+            "aclarai_id": candidate.aclarai_id,
+            "status": candidate.status,
+            "timestamp": candidate.timestamp.isoformat()
+            if candidate.timestamp
+            else None,
+        }
+
+
+def _row_metadata(metadata: Any) -> Dict[str, Any]:
+    """Decode a metadata_ column value, which the driver may return as text."""
+    return metadata if isinstance(metadata, dict) else json.loads(metadata)
@@ -10,13 +10,14 @@ This module implements the main NounPhraseExtractor class that:
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import spacy
 
 from ..config import aclaraiConfig, load_config
 from ..embedding import EmbeddingGenerator
-from ..graph import Neo4jGraphManager
+from ..graph import Neo4jGraphManager, iter_node_pages
+from ..graph.pagination import graph_read_page_size
 from .concept_candidates_store import ConceptCandidatesVectorStore
 from .models import ExtractionResult, NounPhraseCandidate
 
@@ -64,11 +65,19 @@ class NounPhraseExtractor:
             },
         )
 
-    def extract_from_all_nodes(self) -> ExtractionResult:
+    def extract_from_all_nodes(
+        self,
+        on_candidates: Optional[Callable[[List[NounPhraseCandidate]], None]] = None,
+    ) -> ExtractionResult:
         """
         Extract noun phrases from all (:Claim) and (:Summary) nodes.
+        Candidates are stored page by page and are not kept on the result,
+        so memory stays bounded by the page size however large the graph is.
+        Args:
+            on_candidates: Optional callback receiving each batch of candidates
+                after it has been stored
         Returns:
-            ExtractionResult with all extracted candidates and processing metrics
+            ExtractionResult with processing counts (candidates is left empty)
         """
         logger.info(
             "Starting noun phrase extraction from all Claims and Summaries",
@@ -80,41 +89,32 @@ class NounPhraseExtractor:
         start_time = time.time()
         result = ExtractionResult()
         try:
-            # Fetch all Claims and Summaries
-            claims = self._fetch_claim_nodes()
-            summaries = self._fetch_summary_nodes()
-            all_nodes = claims + summaries
-            result.total_nodes_processed = len(all_nodes)
+            # Stream Claims, then Summaries, page by page; candidates are
+            # stored as they accumulate instead of after the full scan
+            page_size = graph_read_page_size(self.config)
+            node_counts = {"claim": 0, "summary": 0}
+            pending: List[NounPhraseCandidate] = []
+            for label, node_type in (("Claim", "claim"), ("Summary", "summary")):
+                for page in self._iter_node_pages(label, node_type, page_size):
+                    node_counts[node_type] += len(page)
+                    result.total_nodes_processed += len(page)
+                    for node in page:
+                        pending.extend(self._extract_node_candidates(node, result))
+                    if len(pending) >= page_size:
+                        self._flush_candidates(pending, on_candidates)
+                        pending = []
             logger.info(
-                f"Processing {len(claims)} Claims and {len(summaries)} Summaries",
+                f"Processed {node_counts['claim']} Claims and {node_counts['summary']} Summaries",
                 extra={
                     "service": "aclarai",
                     "filename.function_name": "noun_phrase_extraction.NounPhraseExtractor.extract_from_all_nodes",
-                    "claims_count": len(claims),
-                    "summaries_count": len(summaries),
+                    "claims_count": node_counts["claim"],
+                    "summaries_count": node_counts["summary"],
                 },
             )
-            # Extract noun phrases from each node
-            for node in all_nodes:
-                try:
-                    candidates = self._extract_from_node(node)
-                    result.candidates.extend(candidates)
-                    result.successful_extractions += 1
-                    result.total_phrases_extracted += len(candidates)
-                except Exception as e:
-                    logger.error(
-                        f"Failed to extract noun phrases from node {node.get('id')}",
-                        extra={
-                            "service": "aclarai",
-                            "filename.function_name": "noun_phrase_extraction.NounPhraseExtractor.extract_from_all_nodes",
-                            "node_id": node.get("id"),
-                            "error": str(e),
-                        },
-                    )
-                    result.failed_extractions += 1
-            # Store all candidates in vector database
-            if result.candidates:
-                self._store_candidates(result.candidates)
+            # Store the remaining candidates in the vector database
+            if pending:
+                self._flush_candidates(pending, on_candidates)
             result.processing_time = time.time() - start_time
             result.model_used = self.spacy_model_name
             logger.info(
@@ -142,79 +142,70 @@ class NounPhraseExtractor:
             )
             return result
 
-    def _fetch_claim_nodes(self) -> List[Dict[str, Any]]:
-        """Fetch all (:Claim) nodes from Neo4j."""
+    def _flush_candidates(
+        self,
+        candidates: List[NounPhraseCandidate],
+        on_candidates: Optional[Callable[[List[NounPhraseCandidate]], None]],
+    ) -> None:
+        """Store one batch of candidates and hand it to the caller's callback."""
+        self._store_candidates(candidates)
+        if on_candidates is not None:
+            on_candidates(candidates)
+
+    def _extract_node_candidates(
+        self, node: Dict[str, Any], result: ExtractionResult
+    ) -> List[NounPhraseCandidate]:
+        """Extract candidates from one node, recording success or failure in result."""
         try:
-            query = """
-            MATCH (c:Claim)
-            RETURN c.id as id, c.text as text, 'claim' as node_type
-            """
-            result = self.neo4j_manager.execute_query(query)
-            claims = []
-            for record in result:
-                claims.append(
-                    {
-                        "id": record["id"],
-                        "text": record["text"],
-                        "node_type": record["node_type"],
-                    }
-                )
-            logger.debug(
-                f"Fetched {len(claims)} Claim nodes",
-                extra={
-                    "service": "aclarai",
-                    "filename.function_name": "noun_phrase_extraction.NounPhraseExtractor._fetch_claim_nodes",
-                    "claims_count": len(claims),
-                },
-            )
-            return claims
+            candidates = self._extract_from_node(node)
         except Exception as e:
             logger.error(
-                f"Failed to fetch Claim nodes: {e}",
+                f"Failed to extract noun phrases from node {node.get('id')}",
                 extra={
                     "service": "aclarai",
-                    "filename.function_name": "noun_phrase_extraction.NounPhraseExtractor._fetch_claim_nodes",
+                    "filename.function_name": "noun_phrase_extraction.NounPhraseExtractor.extract_from_all_nodes",
+                    "node_id": node.get("id"),
                     "error": str(e),
                 },
             )
+            result.failed_extractions += 1
             return []
+        result.successful_extractions += 1
+        result.total_phrases_extracted += len(candidates)
+        return candidates
 
-    def _fetch_summary_nodes(self) -> List[Dict[str, Any]]:
-        """Fetch all (:Summary) nodes from Neo4j."""
+    def _iter_node_pages(
+        self, label: str, node_type: str, page_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream (:Claim) or (:Summary) nodes from Neo4j in pages ordered by id.
+        A failed read is logged and ends the stream for that label, keeping
+        the pages already yielded.
+        Args:
+            label: Node label to read
+            node_type: node_type value recorded on each node
+            page_size: Nodes per page
+        Returns:
+            Iterator of pages of nodes with id, text and node_type
+        """
         try:
-            query = """
-            MATCH (s:Summary)
-            RETURN s.id as id, s.text as text, 'summary' as node_type
-            """
-            result = self.neo4j_manager.execute_query(query)
-            summaries = []
-            for record in result:
-                summaries.append(
-                    {
-                        "id": record["id"],
-                        "text": record["text"],
-                        "node_type": record["node_type"],
-                    }
-                )
-            logger.debug(
-                f"Fetched {len(summaries)} Summary nodes",
-                extra={
-                    "service": "aclarai",
-                    "filename.function_name": "noun_phrase_extraction.NounPhraseExtractor._fetch_summary_nodes",
-                    "summaries_count": len(summaries),
-                },
+            yield from iter_node_pages(
+                self.neo4j_manager,
+                label,
+                "n.id as id, n.text as text, $node_type as node_type",
+                page_size=page_size,
+                parameters={"node_type": node_type},
             )
-            return summaries
         except Exception as e:
             logger.error(
-                f"Failed to fetch Summary nodes: {e}",
+                f"Failed to fetch {label} nodes: {e}",
                 extra={
                     "service": "aclarai",
-                    "filename.function_name": "noun_phrase_extraction.NounPhraseExtractor._fetch_summary_nodes",
+                    "filename.function_name": "noun_phrase_extraction.NounPhraseExtractor._iter_node_pages",
+                    "label": label,
                     "error": str(e),
                 },
             )
-            return []
 
     def _extract_from_node(self, node: Dict[str, Any]) -> List[NounPhraseCandidate]:
         """
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Command-line interface for the resumable Claimify backfill.
+Runs Claimify over every aclarai:id block in the vault's Tier 1 files,
+checkpointing each block so an interrupted run can be resumed.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from aclarai_shared.claimify import (
+    ClaimifyGraphIntegration,
+    ClaimifyPipeline,
+    load_claimify_config_from_file,
+)
+from aclarai_shared.claimify.backfill import (
+    BackfillCheckpointStore,
+    BackfillProgress,
+    ClaimifyBackfillRunner,
+)
+from aclarai_shared.config import load_config
+
+
+def setup_logging(verbose: bool = False):
+    """Setup logging configuration."""
+    level = logging.DEBUG if verbose else logging.INFO
+    format_str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    logging.basicConfig(level=level, format=format_str)
+
+
+class TextCompletionLLM:
+    """Adapts a LlamaIndex LLM to the string-returning Claimify LLMInterface."""
+
+    def __init__(self, llm):
+        self.llm = llm
+
+    def complete(self, prompt: str, **kwargs) -> str:
+        return self.llm.complete(prompt, **kwargs).text
+
+
+def print_progress(progress: BackfillProgress) -> None:
+    """Print a one-line progress report."""
+    eta = progress.eta_seconds()
+    eta_text = f"{eta / 60:.1f} min" if eta is not None else "?"
+    done = progress.completed_blocks + progress.skipped_blocks
+    print(
+        f"  {done}/{progress.total_blocks} blocks | "
+        f"{progress.sentences_per_minute():.1f} sentences/min | "
+        f"{progress.tokens_used} tokens | ETA {eta_text}"
+    )
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run Claimify over existing Tier 1 files with checkpointing",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Backfill the configured vault, newest conversations first
+  python claimify_backfill_cli.py
+  # Resume with a token budget and rate limit
+  python claimify_backfill_cli.py --token-budget 2000000 --max-sentences-per-minute 120
+  # Show checkpoint status without processing
+  python claimify_backfill_cli.py --status
+        """,
+    )
+    parser.add_argument("--vault-path", type=Path, help="Override vault path")
+    parser.add_argument("--checkpoint", type=Path, help="Checkpoint database path")
+    parser.add_argument(
+        "--priority",
+        choices=["newest", "oldest", "path"],
+        help="Block processing order",
+    )
+    parser.add_argument("--token-budget", type=int, help="Stop after this many tokens")
+    parser.add_argument("--cost-budget", type=float, help="Stop at this cost")
+    parser.add_argument(
+        "--max-sentences-per-minute", type=int, help="Sentence rate limit"
+    )
+    parser.add_argument(
+        "--no-persist",
+        action="store_true",
+        help="Run Claimify without writing results to Neo4j",
+    )
+    parser.add_argument(
+        "--status", action="store_true", help="Print checkpoint status and exit"
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="Enable verbose logging"
+    )
+    args = parser.parse_args()
+    setup_logging(args.verbose)
+    try:
+        config = load_config(validate=False)
+        claimify_config = load_claimify_config_from_file()
+    except Exception as e:
+        print(f"✗ Failed to load configuration: {e}")
+        sys.exit(1)
+    if args.priority:
+        claimify_config.backfill_priority = args.priority
+    if args.token_budget is not None:
+        claimify_config.backfill_token_budget = args.token_budget
+    if args.cost_budget is not None:
+        claimify_config.backfill_cost_budget = args.cost_budget
+    if args.max_sentences_per_minute is not None:
+        claimify_config.backfill_max_sentences_per_minute = (
+            args.max_sentences_per_minute
+        )
+    checkpoint_path = str(args.checkpoint or claimify_config.backfill_checkpoint_path)
+    store = BackfillCheckpointStore(checkpoint_path)
+    if args.status:
+        print(f"📊 Checkpoint {checkpoint_path}: {store.get_summary()}")
+        sys.exit(0)
+    vault_path = Path(args.vault_path or config.vault_path)
+    tier1_path = vault_path / config.paths.tier1
+    if not tier1_path.is_dir():
+        print(f"✗ Tier 1 directory not found: {tier1_path}")
+        sys.exit(1)
+    try:
+        from llama_index.llms.openai import OpenAI
+
+        llm = TextCompletionLLM(
+            OpenAI(
+                model=claimify_config.default_model,
+                api_key=config.openai_api_key,
+                temperature=claimify_config.temperature,
+            )
+        )
+        pipeline = ClaimifyPipeline(
+            config=claimify_config,
+            selection_llm=llm,
+            disambiguation_llm=llm,
+            decomposition_llm=llm,
+        )
+        integration = None
+        if not args.no_persist:
+            from aclarai_shared.graph.neo4j_manager import Neo4jGraphManager
+
+            integration = ClaimifyGraphIntegration(
+                Neo4jGraphManager(config), config=claimify_config
+            )
+        # A trained pre-selection classifier reuses the stored utterance embeddings
+        stored_embeddings = None
+        gate = pipeline.selection_agent.preselection_gate
+        if (
+            gate is not None
+            and gate.classifier is not None
+            and gate.classifier.is_trained
+        ):
+            from aclarai_shared.embedding.storage import aclaraiVectorStore
+
+            stored_embeddings = aclaraiVectorStore(config).get_chunk_embeddings
+        runner = ClaimifyBackfillRunner(
+            pipeline,
+            store,
+            integration=integration,
+            stored_embeddings=stored_embeddings,
+        )
+    except Exception as e:
+        print(f"✗ Failed to initialize backfill: {e}")
+        sys.exit(1)
+    blocks = runner.discover_blocks(str(tier1_path))
+    print(f"🚀 Backfilling {len(blocks)} blocks from {tier1_path}")
+    progress = runner.run(blocks, progress_callback=print_progress)
+    print("\n📊 Backfill summary:")
+    for key, value in progress.to_dict().items():
+        print(f"  {key}: {value}")
+    sys.exit(0 if progress.failed_blocks == 0 else 1)
+
+
+if __name__ == "__main__":
+    main()
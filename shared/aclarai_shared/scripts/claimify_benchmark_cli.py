@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Command-line interface for the offline Claimify throughput benchmark.
+Replays recorded LLM completions over a fixed corpus and compares pipeline
+strategies (concurrency and selection batching) without network access.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from dataclasses import replace
+
+from aclarai_shared.claimify import load_claimify_config_from_file
+from aclarai_shared.claimify.benchmark import compare_strategies, load_corpus
+from aclarai_shared.claimify.replay import ReplayLog
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark Claimify strategies against recorded LLM responses",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Compare 1, 4 and 8 workers at a tenth of the recorded latency
+  python claimify_benchmark_cli.py --corpus corpus.jsonl --replay-log replay.jsonl \\
+      --max-workers 1 4 8 --latency-scale 0.1
+  # Compare selection batch sizes (each must have been recorded)
+  python claimify_benchmark_cli.py --corpus corpus.jsonl --replay-log replay.jsonl \\
+      --selection-batch-size 1 5
+        """,
+    )
+    parser.add_argument("--corpus", required=True, help="JSONL corpus of sentences")
+    parser.add_argument("--replay-log", required=True, help="JSONL replay log")
+    parser.add_argument("--max-workers", type=int, nargs="+", default=[1])
+    parser.add_argument("--selection-batch-size", type=int, nargs="+", default=[1])
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    parser.add_argument(
+        "--no-latency", action="store_true", help="Do not simulate recorded latency"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    sentences = load_corpus(args.corpus)
+    log = ReplayLog(args.replay_log)
+    if not sentences or not len(log):
+        print("✗ Corpus or replay log is empty")
+        sys.exit(1)
+    base_config = load_claimify_config_from_file()
+    configs = {}
+    for workers in args.max_workers:
+        for batch_size in args.selection_batch_size:
+            configs[f"workers={workers},batch={batch_size}"] = replace(
+                base_config, max_concurrency=workers, selection_batch_size=batch_size
+            )
+    results = compare_strategies(
+        sentences,
+        log,
+        configs,
+        simulate_latency=not args.no_latency,
+        latency_scale=args.latency_scale,
+    )
+    for result in results:
+        print(json.dumps(result.to_dict()))
+    sys.exit(0 if all(r.replay_misses == 0 for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -301,11 +301,13 @@ class Tier2SummaryAgent:
             RETURN c.id as id, c.text as text, c.entailed_score as entailed_score,
                    c.coverage_score as coverage_score, c.decontextualization_score as decontextualization_score,
                    c.version as version, c.timestamp as timestamp,
-                   b.aclarai_id as source_block_id, b.text as source_block_text
+                   b.id as source_block_id, b.text as source_block_text
             ORDER BY (c.entailed_score + c.coverage_score + c.decontextualization_score) DESC
             LIMIT 50
             """
-            result = self.neo4j_manager.execute_query(query)
+            result = self.neo4j_manager.execute_query(
+                query, read_only=True, query_name="tier2_high_quality_claims"
+            )
             claims = []
             for record in result:
                 claims.append(
@@ -436,14 +438,17 @@ class Tier2SummaryAgent:
             # Get Claims that reference these blocks
             claims_query = """
             MATCH (c:Claim)-[:REFERENCES]->(b:Block)
-            WHERE b.aclarai_id IN $block_ids
+            WHERE b.id IN $block_ids
             RETURN c.id as id, c.text as text, c.entailed_score as entailed_score,
                    c.coverage_score as coverage_score, c.decontextualization_score as decontextualization_score,
                    c.version as version, c.timestamp as timestamp,
-                   b.aclarai_id as source_block_id
+                   b.id as source_block_id
             """
             claims_result = self.neo4j_manager.execute_query(
-                claims_query, block_ids=block_ids
+                claims_query,
+                {"block_ids": block_ids},
+                read_only=True,
+                query_name="tier2_claims_for_blocks",
             )
             claims = []
             for record in claims_result:
@@ -465,13 +470,16 @@ class Tier2SummaryAgent:
             # Get Sentences that reference these blocks
             sentences_query = """
             MATCH (s:Sentence)-[:REFERENCES]->(b:Block)
-            WHERE b.aclarai_id IN $block_ids
+            WHERE b.id IN $block_ids
             RETURN s.id as id, s.text as text, s.ambiguous as ambiguous,
                    s.verifiable as verifiable, s.version as version, s.timestamp as timestamp,
-                   b.aclarai_id as source_block_id
+                   b.id as source_block_id
             """
             sentences_result = self.neo4j_manager.execute_query(
-                sentences_query, block_ids=block_ids
+                sentences_query,
+                {"block_ids": block_ids},
+                read_only=True,
+                query_name="tier2_sentences_for_blocks",
             )
             sentences = []
             for record in sentences_result:
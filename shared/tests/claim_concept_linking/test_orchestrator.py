@@ -52,6 +52,10 @@ class MockClaimConceptNeo4jManager:
             {"id": "concept_cuda_error", "text": "CUDA Error"},
         ]
 
+    def count_concepts(self):
+        """Return the number of mock concepts."""
+        return len(self.fetch_all_concepts())
+
     def get_claim_context(self, claim_id):
         """Return mock context."""
         return {
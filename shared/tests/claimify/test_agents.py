@@ -16,6 +16,7 @@ from aclarai_shared.claimify.agents import (
     DecompositionAgent,
     DisambiguationAgent,
     SelectionAgent,
+    _build_context_text,
 )
 from aclarai_shared.claimify.data_models import (
     ClaimifyConfig,
@@ -98,10 +99,8 @@ class TestSelectionAgent:
         assert not result.is_selected
         assert "LLM is required for Selection agent processing" in result.reasoning
 
-    def test_context_window_building(self, config, test_sentence):
+    def test_context_window_building(self, test_sentence):
         """Test that context window is properly built."""
-        mock_llm = MockLLM("Test response")
-        agent = SelectionAgent(llm=mock_llm, config=config)
         preceding = SentenceChunk(
             text="The user submitted a form.",
             source_id="blk_001",
@@ -119,7 +118,7 @@ class TestSelectionAgent:
             preceding_sentences=[preceding],
             following_sentences=[following],
         )
-        context_text = agent._build_context_text(context)
+        context_text = _build_context_text(context)
         assert "[-1] The user submitted a form." in context_text
         assert (
             "[0] The system reported an error when processing the request. ← TARGET"
@@ -128,6 +127,76 @@ class TestSelectionAgent:
         assert "[1] The error was logged to the database." in context_text
 
 
+class TestSelectionAgentBatching:
+    """Test batched SelectionAgent functionality."""
+
+    @staticmethod
+    def _contexts(count):
+        sentences = [
+            SentenceChunk(f"Sentence {i}.", "blk_001", f"chunk_{i:03d}", i)
+            for i in range(count)
+        ]
+        return [
+            ClaimifyContext(
+                current_sentence=sentences[i],
+                preceding_sentences=sentences[max(0, i - 1) : i],
+                following_sentences=sentences[i + 1 : i + 2],
+            )
+            for i in range(count)
+        ]
+
+    def test_batch_selection_single_call(self, config):
+        """Test that a window of sentences is scored with one LLM call."""
+        response = (
+            '{"verdicts": ['
+            '{"index": 1, "selected": true, "confidence": 0.9, "reasoning": "Fact"},'
+            '{"index": 2, "selected": false, "confidence": 0.9, "reasoning": "Filler"},'
+            '{"index": 3, "selected": true, "confidence": 0.8, "reasoning": "Fact"}'
+            "]}"
+        )
+        mock_llm = MockLLM(response)
+        agent = SelectionAgent(llm=mock_llm, config=config)
+        contexts = self._contexts(3)
+        results = agent.process_batch(contexts)
+        assert len(mock_llm.calls) == 1
+        assert [r.is_selected for r in results] == [True, False, True]
+        assert [r.sentence_chunk for r in results] == [
+            c.current_sentence for c in contexts
+        ]
+        prompt = mock_llm.calls[0][0]
+        assert "[T1] Sentence 0." in prompt
+        assert "[T3] Sentence 2." in prompt
+
+    def test_batch_selection_missing_index_falls_back(self, config):
+        """Test that sentences without a verdict are scored individually."""
+        batch_response = '{"verdicts": [{"index": 1, "selected": true, "confidence": 0.9, "reasoning": "Fact"}]}'
+        single_response = (
+            '{"selected": false, "confidence": 0.9, "reasoning": "Per-sentence"}'
+        )
+        mock_llm = Mock()
+        mock_llm.complete = Mock(
+            side_effect=[batch_response, single_response, single_response]
+        )
+        agent = SelectionAgent(llm=mock_llm, config=config)
+        results = agent.process_batch(self._contexts(3))
+        assert mock_llm.complete.call_count == 3
+        assert results[0].is_selected is True
+        assert results[1].reasoning == "Per-sentence"
+        assert results[2].reasoning == "Per-sentence"
+
+    def test_batch_selection_invalid_json_falls_back(self, config):
+        """Test that a malformed batch response falls back for every sentence."""
+        single_response = '{"selected": true, "confidence": 0.9, "reasoning": "Fact"}'
+        mock_llm = Mock()
+        mock_llm.complete = Mock(
+            side_effect=["not json", single_response, single_response]
+        )
+        agent = SelectionAgent(llm=mock_llm, config=config)
+        results = agent.process_batch(self._contexts(2))
+        assert mock_llm.complete.call_count == 3
+        assert all(r.is_selected for r in results)
+
+
 class TestDisambiguationAgent:
     """Test DisambiguationAgent functionality."""
 
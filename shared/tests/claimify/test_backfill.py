@@ -0,0 +1,233 @@
+"""
+Tests for the resumable Claimify backfill runner.
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from aclarai_shared.claimify.agents import stream_completion
+from aclarai_shared.claimify.backfill import (
+    BackfillBlock,
+    BackfillCheckpointStore,
+    ClaimifyBackfillRunner,
+    TokenCountingLLM,
+)
+from aclarai_shared.claimify.data_models import ClaimifyConfig
+from aclarai_shared.claimify.llm_cache import CachedLLM, LLMResponseCache
+from aclarai_shared.claimify.pipeline import ClaimifyPipeline
+from aclarai_shared.claimify.preselection import EmbeddingClassifier
+
+REJECT_RESPONSE = '{"selected": false, "confidence": 0.9, "reasoning": "Filler"}'
+
+
+class CountingLLM:
+    """Mock LLM that counts calls and rejects every sentence."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, _prompt: str, **_kwargs) -> str:
+        self.calls += 1
+        return REJECT_RESPONSE
+
+
+def split_lines(text: str, _block_id: str):
+    return [line for line in text.split(". ") if line]
+
+
+def make_runner(tmp_path, llm, config=None, sleep=None):
+    pipeline = ClaimifyPipeline(config=config or ClaimifyConfig(), selection_llm=llm)
+    store = BackfillCheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+    return ClaimifyBackfillRunner(
+        pipeline,
+        store,
+        sentence_splitter=split_lines,
+        sleep=sleep or Mock(),
+    )
+
+
+def make_block(index: int, modified_time: float = 0.0) -> BackfillBlock:
+    return BackfillBlock(
+        block_id=f"blk_{index:03d}",
+        file_path=f"conv_{index}.md",
+        text=f"Block {index} first sentence. Block {index} second sentence",
+        content_hash=f"hash_{index}",
+        modified_time=modified_time,
+    )
+
+
+class TestClaimifyBackfillRunner:
+    """Test ClaimifyBackfillRunner checkpointing and limits."""
+
+    def test_resume_skips_completed_blocks(self, tmp_path):
+        """Test that a second run does not repeat LLM calls for done blocks."""
+        llm = CountingLLM()
+        blocks = [make_block(i) for i in range(3)]
+        progress = make_runner(tmp_path, llm).run(blocks)
+        assert progress.completed_blocks == 3
+        assert progress.processed_sentences == 6
+        calls_after_first_run = llm.calls
+        resumed = make_runner(tmp_path, llm).run(blocks)
+        assert resumed.skipped_blocks == 3
+        assert llm.calls == calls_after_first_run
+
+    def test_changed_block_is_reprocessed(self, tmp_path):
+        """Test that a block whose content hash changed runs again."""
+        llm = CountingLLM()
+        make_runner(tmp_path, llm).run([make_block(0)])
+        changed = make_block(0)
+        changed.content_hash = "hash_changed"
+        progress = make_runner(tmp_path, llm).run([changed])
+        assert progress.completed_blocks == 1
+
+    def test_failed_block_is_retried(self, tmp_path):
+        """Test that persistence failures leave the block to the next run."""
+        llm = CountingLLM()
+        runner = make_runner(tmp_path, llm)
+        runner.integration = Mock()
+        runner.integration.persist_claimify_results = Mock(
+            return_value=(0, 0, ["Neo4j unavailable"])
+        )
+        progress = runner.run([make_block(0)])
+        assert progress.failed_blocks == 1
+        summary = runner.checkpoint_store.get_summary()
+        assert summary["blocks"] == {"failed": 1}
+        assert make_runner(tmp_path, llm).run([make_block(0)]).completed_blocks == 1
+
+    def test_llm_errors_leave_block_unfinished(self, tmp_path):
+        """Test that results carrying agent errors are not checkpointed as done."""
+        failing = Mock()
+        failing.complete.side_effect = RuntimeError("LLM unavailable")
+        progress = make_runner(tmp_path, failing).run([make_block(0)])
+        assert progress.completed_blocks == 0
+        assert progress.failed_blocks == 1
+        assert (
+            make_runner(tmp_path, CountingLLM()).run([make_block(0)]).completed_blocks
+            == 1
+        )
+
+    def test_decomposition_errors_leave_block_unfinished(self, tmp_path):
+        """Test that a failed Decomposition stage is retried on the next run."""
+        selection = Mock()
+        selection.complete.return_value = (
+            '{"selected": true, "confidence": 0.9, "reasoning": "Fact"}'
+        )
+        disambiguation = Mock()
+        disambiguation.complete.return_value = (
+            '{"disambiguated_text": "The fact holds.", "changes_made": []}'
+        )
+        decomposition = Mock()
+        decomposition.complete.side_effect = RuntimeError("LLM unavailable")
+        pipeline = ClaimifyPipeline(
+            selection_llm=selection,
+            disambiguation_llm=disambiguation,
+            decomposition_llm=decomposition,
+        )
+        store = BackfillCheckpointStore(str(tmp_path / "checkpoint.sqlite"))
+        runner = ClaimifyBackfillRunner(
+            pipeline, store, sentence_splitter=split_lines, sleep=Mock()
+        )
+        progress = runner.run([make_block(0)])
+        assert progress.completed_blocks == 0
+        assert progress.failed_blocks == 1
+        assert decomposition.complete.called
+
+    def test_token_budget_stops_run_across_resumes(self, tmp_path):
+        """Test that the budget counts tokens spent by earlier runs."""
+        llm = CountingLLM()
+        config = ClaimifyConfig(backfill_token_budget=1)
+        progress = make_runner(tmp_path, llm, config).run([make_block(0)])
+        assert progress.completed_blocks == 1
+        assert progress.tokens_used > 0
+        resumed = make_runner(tmp_path, llm, config).run([make_block(0), make_block(1)])
+        assert resumed.completed_blocks == 0
+        assert "token budget" in resumed.stopped_reason
+
+    def test_rate_limit_sleeps(self, tmp_path):
+        """Test that the runner paces blocks under the sentence rate limit."""
+        sleep = Mock()
+        config = ClaimifyConfig(backfill_max_sentences_per_minute=60)
+        make_runner(tmp_path, CountingLLM(), config, sleep).run([make_block(0)])
+        # Two sentences at 60/minute need at least two seconds
+        assert sleep.call_args[0][0] > 1.5
+
+    def test_priority_and_discovery(self, tmp_path):
+        """Test that blocks are discovered from the vault newest first."""
+        vault = tmp_path / "vault"
+        vault.mkdir()
+        old = vault / "old.md"
+        old.write_text("alice: The old fact holds. <!-- aclarai:id=blk_old ver=1 -->\n")
+        new = vault / "new.md"
+        new.write_text("bob: The new fact holds. <!-- aclarai:id=blk_new ver=1 -->\n")
+        os.utime(old, (1_000, 1_000))
+        os.utime(new, (2_000, 2_000))
+        runner = make_runner(tmp_path, CountingLLM())
+        blocks = runner.discover_blocks(str(vault))
+        assert [b.block_id for b in blocks] == ["blk_new", "blk_old"]
+        runner.config.backfill_priority = "oldest"
+        assert [b.block_id for b in runner.order_blocks(blocks)] == [
+            "blk_old",
+            "blk_new",
+        ]
+
+    def test_sentences_are_embedded_for_classifier(self, tmp_path):
+        """Test that a trained pre-selection classifier sees embeddings."""
+        classifier = EmbeddingClassifier().fit(
+            [[1.0, 0.0]] * 10 + [[0.0, 1.0]] * 10, [True] * 10 + [False] * 10
+        )
+        llm = CountingLLM()
+        runner = make_runner(tmp_path, llm, ClaimifyConfig(preselection_enabled=True))
+        runner.pipeline.selection_agent.preselection_gate.classifier = classifier
+        runner.embed_texts = Mock(side_effect=lambda texts: [[1.0, 0.0]] * len(texts))
+        # The first sentence's utterance embedding is already stored
+        runner.stored_embeddings = Mock(
+            return_value={0: ("Block 0 first sentence", [1.0, 0.0])}
+        )
+        progress = runner.run([make_block(0)])
+        runner.stored_embeddings.assert_called_once_with("blk_000")
+        runner.embed_texts.assert_called_once_with(["Block 0 second sentence"])
+        assert progress.completed_blocks == 1
+        # Both sentences were rejected by the classifier without the LLM
+        assert llm.calls == 0
+
+    def test_fused_agent_and_cache_metering(self, tmp_path):
+        """Test that the fused stage is metered and cache hits are free."""
+        config = ClaimifyConfig()
+        config.fused_stage_models = [config.get_model_for_stage("decomposition")]
+        pipeline = ClaimifyPipeline(
+            config=config,
+            selection_llm=CountingLLM(),
+            decomposition_llm=CountingLLM(),
+            llm_cache=LLMResponseCache(":memory:"),
+        )
+        runner = ClaimifyBackfillRunner(
+            pipeline,
+            BackfillCheckpointStore(str(tmp_path / "checkpoint.sqlite")),
+            sentence_splitter=split_lines,
+        )
+        fused_llm = pipeline.fused_agent.llm
+        assert isinstance(fused_llm, CachedLLM)
+        assert isinstance(fused_llm.llm, TokenCountingLLM)
+        assert fused_llm.llm in runner.token_meters
+        fused_llm.complete("prompt", temperature=0.1)
+        tokens = runner._metered_tokens()
+        assert tokens > 0
+        fused_llm.complete("prompt", temperature=0.1)
+        assert runner._metered_tokens() == tokens
+
+    def test_token_meter_streams(self):
+        """Test that metering keeps streaming and counts consumed deltas."""
+
+        class StreamingLLM:
+            def complete(self, _prompt, **_kwargs):
+                return REJECT_RESPONSE
+
+            def stream_complete(self, _prompt, **_kwargs):
+                yield from (REJECT_RESPONSE[:10], REJECT_RESPONSE[10:])
+
+        meter = TokenCountingLLM(StreamingLLM())
+        chunks = list(stream_completion(meter, "prompt"))
+        assert len(chunks) == 2
+        assert meter.tokens > 0
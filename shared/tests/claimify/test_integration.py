@@ -10,6 +10,7 @@ from unittest.mock import Mock
 import pytest
 from aclarai_shared.claimify.data_models import (
     ClaimCandidate,
+    ClaimifyConfig,
     ClaimifyContext,
     ClaimifyResult,
     DecompositionResult,
@@ -19,6 +20,7 @@ from aclarai_shared.claimify.data_models import (
 )
 from aclarai_shared.claimify.integration import (
     ClaimifyGraphIntegration,
+    ClaimifyGraphSink,
 )
 from aclarai_shared.graph.models import ClaimInput, SentenceInput
 
@@ -580,3 +582,59 @@ class TestCreateGraphManagerFromConfigStructure:
         assert not sentence_input.verifiable
         assert not sentence_input.failed_decomposition
         assert sentence_input.rejection_reason == "Failed selection"
+
+
+class TestClaimifyGraphSink:
+    """Test micro-batched persistence of streamed results."""
+
+    @staticmethod
+    def _unprocessed_result(index: int) -> ClaimifyResult:
+        chunk = SentenceChunk(
+            text=f"Sentence {index}.",
+            source_id="blk_001",
+            chunk_id=f"chunk_{index:03d}",
+            sentence_index=index,
+        )
+        return ClaimifyResult(
+            original_chunk=chunk,
+            context=ClaimifyContext(current_sentence=chunk),
+            selection_result=SelectionResult(sentence_chunk=chunk, is_selected=False),
+        )
+
+    def test_flushes_in_micro_batches(self):
+        """Test that the sink writes every batch_size results and on exit."""
+        manager = MockNeo4jGraphManager()
+        manager.create_sentences = Mock(wraps=manager.create_sentences)
+        integration = ClaimifyGraphIntegration(manager)
+        with ClaimifyGraphSink(integration, batch_size=2) as sink:
+            for i in range(3):
+                sink.add(self._unprocessed_result(i))
+            # The first full batch is already durable
+            assert len(manager.sentences_created) == 2
+        assert len(manager.sentences_created) == 3
+        assert manager.create_sentences.call_count == 2
+        assert sink.flushes == 2
+        assert sink.sentences_created == 3
+
+    def test_persist_claimify_stream(self):
+        """Test that streamed persistence uses the configured batch size."""
+        manager = MockNeo4jGraphManager()
+        manager.create_sentences = Mock(wraps=manager.create_sentences)
+        integration = ClaimifyGraphIntegration(
+            manager, config=ClaimifyConfig(persistence_batch_size=4)
+        )
+        results = (self._unprocessed_result(i) for i in range(10))
+        claims, sentences, errors = integration.persist_claimify_stream(results)
+        assert (claims, sentences, errors) == (0, 10, [])
+        assert manager.create_sentences.call_count == 3
+
+    def test_persistence_error_is_reported(self):
+        """Test that a failed flush is recorded and later batches still run."""
+        manager = Mock()
+        manager.create_sentences = Mock(side_effect=[RuntimeError("down"), ["s"]])
+        integration = ClaimifyGraphIntegration(manager)
+        claims, sentences, errors = integration.persist_claimify_stream(
+            (self._unprocessed_result(i) for i in range(2)), batch_size=1
+        )
+        assert sentences == 1
+        assert len(errors) == 1 and "down" in errors[0]
@@ -0,0 +1,195 @@
+"""
+Tests for incremental JSON parsing and streamed Claimify completions.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from aclarai_shared.claimify.agents import (
+    DecompositionAgent,
+    SelectionAgent,
+    stream_completion,
+)
+from aclarai_shared.claimify.data_models import (
+    ClaimifyConfig,
+    ClaimifyContext,
+    SentenceChunk,
+)
+from aclarai_shared.claimify.json_stream import (
+    IncrementalJSONParser,
+    repair_truncated_json,
+)
+from aclarai_shared.claimify.llm_cache import CachedLLM, LLMResponseCache
+from aclarai_shared.claimify.metrics import ClaimifyMetrics
+
+
+class StreamingLLM:
+    """Mock streaming LLM that yields a response in fixed-size chunks."""
+
+    def __init__(self, response: str, chunk_size: int = 8):
+        self.response = response
+        self.chunk_size = chunk_size
+        self.chunks_sent = 0
+        self.closed = False
+
+    def complete(self, _prompt: str, **_kwargs) -> str:
+        return self.response
+
+    def stream_complete(self, _prompt: str, **_kwargs):
+        try:
+            for start in range(0, len(self.response), self.chunk_size):
+                self.chunks_sent += 1
+                yield self.response[start : start + self.chunk_size]
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def context():
+    sentence = SentenceChunk("What should we do?", "blk_001", "chunk_001", 0)
+    return ClaimifyContext(current_sentence=sentence)
+
+
+class TestIncrementalJSONParser:
+    """Test IncrementalJSONParser."""
+
+    def test_fields_decided_as_they_complete(self):
+        """Test that each top-level field appears once its value ends."""
+        parser = IncrementalJSONParser()
+        assert parser.feed('```json\n{"selected": fa') == {}
+        assert parser.feed('lse, "reasoning": "Ques') == {"selected": False}
+        parser.feed('tion, not a fact"}')
+        assert parser.is_complete
+        assert parser.fields["reasoning"] == "Question, not a fact"
+
+    def test_nested_values_wait_for_closing_bracket(self):
+        """Test that commas inside nested values do not end a member."""
+        parser = IncrementalJSONParser()
+        parser.feed('{"changes_made": ["a", "b"')
+        assert parser.fields == {}
+        parser.feed('], "confidence": 0.9}')
+        assert parser.fields == {"changes_made": ["a", "b"], "confidence": 0.9}
+
+
+class TestRepairTruncatedJSON:
+    """Test repair_truncated_json."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ('{"selected": false, "confidence": 0.', {"selected": False}),
+            ('{"selected": true, "reas', {"selected": True}),
+            ('{"a": 1,}', {"a": 1}),
+            ('```json\n{"a": {"b": [1, 2]}}\n```', {"a": {"b": [1, 2]}}),
+            (
+                '{"claim_candidates": [{"text": "A."}, {"text": "B", "is_',
+                {"claim_candidates": [{"text": "A."}, {"text": "B"}]},
+            ),
+        ],
+    )
+    def test_recovers_complete_prefix(self, text, expected):
+        """Test that truncated members are dropped and brackets closed."""
+        assert repair_truncated_json(text) == expected
+
+    def test_does_not_guess_cut_off_strings(self):
+        """Test that a value cut off mid-string is not completed."""
+        assert repair_truncated_json('{"disambiguated_text": "The serv') is None
+        assert repair_truncated_json("not json") is None
+
+
+class TestStreamingAgents:
+    """Test agents with streaming enabled."""
+
+    def test_selection_stops_after_rejection(self, context):
+        """Test that a rejection stops the stream before the reasoning."""
+        llm = StreamingLLM(
+            '{"selected": false, "confidence": 0.95, "reasoning": "'
+            + "A question does not state a verifiable fact. " * 10
+            + '"}'
+        )
+        metrics = ClaimifyMetrics()
+        agent = SelectionAgent(
+            llm=llm, config=ClaimifyConfig(streaming_enabled=True), metrics=metrics
+        )
+        result = agent.process(context)
+        assert not result.is_selected
+        assert llm.closed
+        assert llm.chunks_sent < len(llm.response) // llm.chunk_size
+        assert metrics.snapshot()["llm"][0]["early_stops"] == 1
+
+    def test_selected_sentence_keeps_reasoning(self, context):
+        """Test that selected sentences stream to the end."""
+        llm = StreamingLLM(
+            '{"selected": true, "confidence": 0.9, "reasoning": "Factual"}'
+        )
+        agent = SelectionAgent(llm=llm, config=ClaimifyConfig(streaming_enabled=True))
+        result = agent.process(context)
+        assert result.is_selected
+        assert result.reasoning == "Factual"
+
+    def test_truncated_decomposition_is_repaired(self):
+        """Test that a response cut off by max_tokens keeps its complete claims."""
+        llm = StreamingLLM(
+            '{"claim_candidates": [{"text": "The server failed.", "is_atomic": true, '
+            '"is_self_contained": true, "is_verifiable": true, '
+            '"passes_criteria": true, "confidence": 0.9}, {"text": "It rest'
+        )
+        agent = DecompositionAgent(
+            llm=llm, config=ClaimifyConfig(streaming_enabled=True)
+        )
+        sentence = SentenceChunk(
+            "The server failed and it restarted.", "blk_001", "chunk_001", 0
+        )
+        result = agent.process(sentence.text, sentence)
+        assert [c.text for c in result.claim_candidates] == ["The server failed."]
+
+    def test_partial_stream_is_not_cached(self):
+        """Test that a stream closed early is not written to the cache."""
+        cache = LLMResponseCache(":memory:")
+        llm = CachedLLM(
+            StreamingLLM('{"selected": false, "reasoning": "x"}'),
+            cache,
+            "gpt-4",
+            "selection",
+        )
+        stream = stream_completion(llm, "prompt", temperature=0.1)
+        next(stream)
+        stream.close()
+        assert cache.get("gpt-4", "selection", "prompt", 0.1) is None
+        assert "".join(stream_completion(llm, "prompt", temperature=0.1))
+        assert cache.get("gpt-4", "selection", "prompt", 0.1) is not None
+
+    def test_early_stopped_rejection_is_cached(self, context):
+        """Test that a rejection decided mid-stream is served from the cache."""
+        cache = LLMResponseCache(":memory:")
+        llm = StreamingLLM(
+            '{"selected": false, "confidence": 0.95, "reasoning": "'
+            + "A question does not state a verifiable fact. " * 10
+            + '"}'
+        )
+        config = ClaimifyConfig(streaming_enabled=True)
+        agent = SelectionAgent(
+            llm=CachedLLM(llm, cache, "gpt-4", "selection"), config=config
+        )
+        assert not agent.process(context).is_selected
+        chunks_sent = llm.chunks_sent
+        assert chunks_sent < len(llm.response) // llm.chunk_size
+        result = agent.process(context)
+        assert not result.is_selected
+        assert llm.chunks_sent == chunks_sent
+        assert cache.get_stats()["stages"]["selection"] == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+        }
+        # Non-streaming callers never get the truncated response back
+        cached_llm = CachedLLM(llm, cache, "gpt-4", "selection")
+        stream = cached_llm.stream_complete("prompt")
+        next(stream)
+        next(stream)
+        next(stream)
+        stream.close()
+        assert cached_llm.complete("prompt") == llm.response
@@ -0,0 +1,113 @@
+"""
+Tests for the persistent Claimify LLM response cache.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from aclarai_shared.claimify.data_models import ClaimifyConfig, SentenceChunk
+from aclarai_shared.claimify.llm_cache import CachedLLM, LLMResponseCache
+from aclarai_shared.claimify.pipeline import ClaimifyPipeline
+
+
+class CountingLLM:
+    """Mock LLM that counts calls."""
+
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    def complete(self, _prompt: str, **_kwargs) -> str:
+        self.calls += 1
+        return self.response
+
+
+class TestLLMResponseCache:
+    """Test LLMResponseCache functionality."""
+
+    def test_key_depends_on_model_stage_and_temperature(self):
+        """Test that cache keys separate models, stages and temperatures."""
+        base = LLMResponseCache.make_key("gpt-4", "selection", "prompt", 0.1)
+        assert base == LLMResponseCache.make_key("gpt-4", "selection", "prompt", 0.1)
+        assert base != LLMResponseCache.make_key("gpt-3.5", "selection", "prompt", 0.1)
+        assert base != LLMResponseCache.make_key(
+            "gpt-4", "decomposition", "prompt", 0.1
+        )
+        assert base != LLMResponseCache.make_key("gpt-4", "selection", "prompt", 0.5)
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that entries survive reopening the SQLite file."""
+        path = str(tmp_path / "cache" / "llm.sqlite")
+        cache = LLMResponseCache(path)
+        cache.put("gpt-4", "selection", "prompt", 0.1, '{"selected": true}')
+        cache.close()
+        reopened = LLMResponseCache(path)
+        assert reopened.get("gpt-4", "selection", "prompt", 0.1) == '{"selected": true}'
+
+    def test_ttl_expiry(self):
+        """Test that expired entries are treated as misses."""
+        cache = LLMResponseCache(":memory:", ttl_seconds=1)
+        cache.put("gpt-4", "selection", "prompt", 0.1, "{}")
+        cache._conn.execute("UPDATE llm_cache SET created_at = ?", (time.time() - 5,))
+        assert cache.get("gpt-4", "selection", "prompt", 0.1) is None
+
+    def test_size_eviction_removes_least_recently_used(self):
+        """Test that the oldest accessed entries are evicted over max_entries."""
+        cache = LLMResponseCache(":memory:", max_entries=2)
+        cache.put("m", "selection", "a", 0.1, "{}")
+        cache.put("m", "selection", "b", 0.1, "{}")
+        cache._conn.execute(
+            "UPDATE llm_cache SET last_accessed = 0 WHERE cache_key = ?",
+            (LLMResponseCache.make_key("m", "selection", "a", 0.1),),
+        )
+        cache.put("m", "selection", "c", 0.1, "{}")
+        assert cache.get_stats()["entries"] == 2
+        assert cache.get("m", "selection", "a", 0.1) is None
+        assert cache.get("m", "selection", "c", 0.1) == "{}"
+
+    def test_cached_llm_skips_invalid_json(self):
+        """Test that malformed responses are not cached."""
+        cache = LLMResponseCache(":memory:")
+        llm = CountingLLM("not json")
+        cached_llm = CachedLLM(llm, cache, "gpt-4", "selection")
+        cached_llm.complete("prompt", temperature=0.1)
+        cached_llm.complete("prompt", temperature=0.1)
+        assert llm.calls == 2
+        assert cache.get_stats()["entries"] == 0
+
+
+class TestPipelineCaching:
+    """Test response caching through the Claimify pipeline."""
+
+    def test_reprocessing_hits_cache(self):
+        """Test that reprocessing unchanged sentences makes no new LLM calls."""
+        cache = LLMResponseCache(":memory:")
+        selection_llm = CountingLLM(
+            '{"selected": false, "confidence": 0.9, "reasoning": "Filler"}'
+        )
+        pipeline = ClaimifyPipeline(
+            config=ClaimifyConfig(),
+            selection_llm=selection_llm,
+            disambiguation_llm=CountingLLM("{}"),
+            decomposition_llm=CountingLLM("{}"),
+            llm_cache=cache,
+        )
+        sentences = [
+            SentenceChunk(f"Sentence {i}.", "blk_001", f"chunk_{i:03d}", i)
+            for i in range(3)
+        ]
+        pipeline.process_sentences(sentences)
+        results = pipeline.process_sentences(sentences)
+        assert selection_llm.calls == 3
+        stats = pipeline.get_pipeline_stats(results)
+        assert stats["llm_cache"]["stages"]["selection"]["hits"] == 3
+        assert stats["llm_cache"]["stages"]["selection"]["misses"] == 3
+        assert stats["llm_cache"]["hit_rate"] == 0.5
+
+    def test_cache_disabled_by_default(self):
+        """Test that no cache is created unless configured."""
+        pipeline = ClaimifyPipeline(config=ClaimifyConfig())
+        assert pipeline.llm_cache is None
+        assert "llm_cache" not in pipeline.get_pipeline_stats([])
@@ -0,0 +1,181 @@
+"""
+Tests for Claimify pipeline metrics.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from aclarai_shared.claimify.agents import InstrumentedLLM
+from aclarai_shared.claimify.data_models import ClaimifyConfig, SentenceChunk
+from aclarai_shared.claimify.metrics import (
+    ClaimifyMetrics,
+    InMemoryMetricsSink,
+    JsonlMetricsSink,
+    LatencyHistogram,
+)
+from aclarai_shared.claimify.pipeline import ClaimifyPipeline
+
+
+class FixedLLM:
+    """Mock LLM returning a fixed response."""
+
+    def __init__(self, response: str):
+        self.response = response
+
+    def complete(self, _prompt: str, **_kwargs) -> str:
+        return self.response
+
+
+class FailingLLM:
+    """Mock LLM that always raises."""
+
+    def complete(self, _prompt: str, **_kwargs) -> str:
+        raise RuntimeError("model unavailable")
+
+
+def _llm_entry(snapshot, stage):
+    return next(entry for entry in snapshot["llm"] if entry["stage"] == stage)
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram percentiles."""
+
+    def test_percentiles(self):
+        """Test nearest-rank p50/p95/p99 over 100 samples."""
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.observe(value / 100)
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 100
+        assert snapshot["p50"] == 0.5
+        assert snapshot["p95"] == 0.95
+        assert snapshot["p99"] == 0.99
+        assert snapshot["max"] == 1.0
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram reports zeros."""
+        assert LatencyHistogram().snapshot()["p95"] == 0.0
+
+
+class TestClaimifyMetrics:
+    """Test the metrics registry and sinks."""
+
+    def test_instrumented_llm_records_tokens_and_errors(self):
+        """Test that InstrumentedLLM records calls, tokens and failures."""
+        metrics = ClaimifyMetrics()
+        InstrumentedLLM(FixedLLM("12345678"), metrics, "gpt-4", "selection").complete(
+            "abcd"
+        )
+        failing = InstrumentedLLM(FailingLLM(), metrics, "gpt-4", "selection")
+        with pytest.raises(RuntimeError):
+            failing.complete("abcd")
+        entry = _llm_entry(metrics.snapshot(), "selection")
+        assert entry["model"] == "gpt-4"
+        assert entry["calls"] == 2
+        assert entry["errors"] == 1
+        assert entry["prompt_tokens"] == 2
+        assert entry["completion_tokens"] == 2
+        assert entry["latency"]["count"] == 2
+
+    def test_selection_rate_windows(self):
+        """Test that selection decisions are bucketed by time window."""
+        metrics = ClaimifyMetrics(selection_window_seconds=60)
+        metrics.record_selection(True, timestamp=0)
+        metrics.record_selection(False, timestamp=30)
+        metrics.record_selection(True, timestamp=61)
+        series = metrics.selection_rate_series()
+        assert [w["selection_rate"] for w in series] == [0.5, 1.0]
+        assert series[1]["window_start"] == 60
+
+    def test_export_to_sinks(self, tmp_path):
+        """Test that export reaches every sink and survives a failing one."""
+
+        class BrokenSink:
+            def emit(self, _snapshot):
+                raise OSError("disk full")
+
+        memory = InMemoryMetricsSink()
+        path = tmp_path / "metrics" / "claimify.jsonl"
+        metrics = ClaimifyMetrics(
+            sinks=[BrokenSink(), memory, JsonlMetricsSink(str(path))]
+        )
+        metrics.record_stage_time("selection", 0.2)
+        metrics.export()
+        assert memory.snapshots[0]["stages"]["selection"]["count"] == 1
+        assert json.loads(path.read_text())["stages"]["selection"]["max"] == 0.2
+
+    def test_export_if_due_respects_interval(self):
+        """Test that periodic exports are spaced by the export interval."""
+        memory = InMemoryMetricsSink()
+        metrics = ClaimifyMetrics(sinks=[memory], export_interval_seconds=3600)
+        assert metrics.export_if_due() is not None
+        assert metrics.export_if_due() is None
+        metrics.export()
+        assert len(memory.snapshots) == 2
+
+
+class TestPipelineMetrics:
+    """Test metrics collected by ClaimifyPipeline."""
+
+    def test_pipeline_records_stage_metrics(self):
+        """Test that each stage reports LLM calls, stage timings and selections."""
+        metrics = ClaimifyMetrics()
+        pipeline = ClaimifyPipeline(
+            selection_llm=FixedLLM(
+                '{"selected": true, "confidence": 0.9, "reasoning": "Factual"}'
+            ),
+            disambiguation_llm=FixedLLM(
+                '{"disambiguated_text": "The server failed.", "changes_made": []}'
+            ),
+            decomposition_llm=FixedLLM("not json"),
+            metrics=metrics,
+        )
+        sentences = [
+            SentenceChunk("The server failed.", "blk_001", "chunk_001", 0),
+            SentenceChunk("It restarted at noon.", "blk_001", "chunk_002", 1),
+        ]
+        memory = InMemoryMetricsSink()
+        metrics.sinks.append(memory)
+        results = pipeline.process_sentences(sentences)
+        snapshot = pipeline.get_pipeline_stats(results)["metrics"]
+        assert _llm_entry(snapshot, "selection")["calls"] == 2
+        # A snapshot reaches the sinks when processing finishes
+        assert _llm_entry(memory.snapshots[-1], "selection")["calls"] == 2
+        assert _llm_entry(snapshot, "decomposition")["parse_failures"] == 2
+        # Stage timings cover successful agent calls only
+        assert set(snapshot["stages"]) == {"selection", "disambiguation"}
+        assert snapshot["selection_rate"][0]["selection_rate"] == 1.0
+
+    def test_batch_fallback_counts_retries(self):
+        """Test that per-sentence fallbacks after a batch failure count as retries."""
+        config = ClaimifyConfig(selection_batch_size=2)
+        metrics = ClaimifyMetrics()
+        pipeline = ClaimifyPipeline(
+            config=config,
+            selection_llm=FixedLLM(
+                '{"selected": false, "confidence": 0.9, "reasoning": "No"}'
+            ),
+            metrics=metrics,
+        )
+        sentences = [
+            SentenceChunk("The server failed.", "blk_001", "chunk_001", 0),
+            SentenceChunk("It restarted at noon.", "blk_001", "chunk_002", 1),
+        ]
+        pipeline.process_sentences(sentences)
+        entry = _llm_entry(metrics.snapshot(), "selection")
+        # The batch response has no verdicts, so both sentences are re-issued
+        assert entry["calls"] == 3
+        assert entry["retries"] == 2
+
+    def test_metrics_enabled_from_config(self, tmp_path):
+        """Test that config creates a registry with a JSONL sink."""
+        path = str(tmp_path / "metrics.jsonl")
+        config = ClaimifyConfig(metrics_enabled=True, metrics_jsonl_path=path)
+        pipeline = ClaimifyPipeline(config=config, selection_llm=FixedLLM("{}"))
+        assert pipeline.metrics is not None
+        assert isinstance(pipeline.metrics.sinks[-1], JsonlMetricsSink)
+        assert ClaimifyPipeline().metrics is None
@@ -3,10 +3,13 @@ Tests for the main Claimify pipeline.
 Tests the ClaimifyPipeline orchestrator and end-to-end processing.
 """
 
+import asyncio
 import os
 
 # Import the pipeline classes
 import sys
+import threading
+import time
 from unittest.mock import Mock
 
 import pytest
@@ -324,6 +327,207 @@ class TestClaimifyPipeline:
         results = pipeline.process_sentences([sentence])
         assert len(results) == 1
 
+    def test_concurrent_processing_preserves_order(self):
+        """Test that concurrent mode returns results in input order."""
+        selection_llm = Mock()
+
+        def slow_selection(prompt, **_kwargs):
+            # Earlier sentences finish later to shuffle completion order
+            index = int(prompt.split('Target sentence: "Sentence ')[1].split(" ")[0])
+            time.sleep(0.002 * (10 - index))
+            return '{"selected": false, "confidence": 0.9, "reasoning": "Filler"}'
+
+        selection_llm.complete = Mock(side_effect=slow_selection)
+        pipeline = ClaimifyPipeline(
+            config=ClaimifyConfig(max_concurrency=4),
+            selection_llm=selection_llm,
+            disambiguation_llm=MockLLM(),
+            decomposition_llm=MockLLM(),
+        )
+        sentences = [
+            SentenceChunk(f"Sentence {i} with content.", "blk_001", f"chunk_{i:03d}", i)
+            for i in range(10)
+        ]
+        results = pipeline.process_sentences(sentences)
+        assert [r.original_chunk for r in results] == sentences
+        assert selection_llm.complete.call_count == 10
+
+    def test_iter_process_sentences_streams_in_order(self):
+        """Test that streamed results match batch results and arrive in order."""
+        selection_llm = MockLLM(
+            '{"selected": false, "confidence": 0.9, "reasoning": "Filler"}'
+        )
+        pipeline = ClaimifyPipeline(
+            config=ClaimifyConfig(max_concurrency=2, selection_batch_size=2),
+            selection_llm=selection_llm,
+            disambiguation_llm=MockLLM(),
+            decomposition_llm=MockLLM(),
+        )
+        sentences = [
+            SentenceChunk(f"Sentence {i} with content.", "blk_001", f"chunk_{i:03d}", i)
+            for i in range(9)
+        ]
+        stream = pipeline.iter_process_sentences(sentences)
+        first = next(stream)
+        assert first.original_chunk == sentences[0]
+        # Only the first wave (max_concurrency * selection_batch_size) has run:
+        # two batch prompts plus per-sentence fallbacks for 4 sentences
+        assert len(selection_llm.calls) == 6
+        rest = list(stream)
+        assert [r.original_chunk for r in [first, *rest]] == sentences
+
+    def test_aiter_process_sentences(self):
+        """Test the async iterator variant."""
+        pipeline = ClaimifyPipeline(
+            selection_llm=MockLLM(
+                '{"selected": false, "confidence": 0.9, "reasoning": "Filler"}'
+            ),
+            disambiguation_llm=MockLLM(),
+            decomposition_llm=MockLLM(),
+        )
+        sentences = [
+            SentenceChunk(f"Sentence {i} with content.", "blk_001", f"chunk_{i:03d}", i)
+            for i in range(3)
+        ]
+
+        async def collect():
+            return [r async for r in pipeline.aiter_process_sentences(sentences)]
+
+        results = asyncio.run(collect())
+        assert [r.original_chunk for r in results] == sentences
+
+    def test_per_model_concurrency_limit(self):
+        """Test that in-flight calls per model never exceed the configured limit."""
+        lock = threading.Lock()
+        in_flight = {"current": 0, "peak": 0}
+
+        class TrackingLLM:
+            def complete(self, _prompt, **_kwargs):
+                with lock:
+                    in_flight["current"] += 1
+                    in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+                time.sleep(0.005)
+                with lock:
+                    in_flight["current"] -= 1
+                return '{"selected": false, "confidence": 0.9, "reasoning": "Filler"}'
+
+        config = ClaimifyConfig(
+            max_concurrency=8,
+            default_model="gpt-4",
+            model_concurrency_limits={"gpt-4": 2},
+        )
+        pipeline = ClaimifyPipeline(
+            config=config,
+            selection_llm=TrackingLLM(),
+            disambiguation_llm=TrackingLLM(),
+            decomposition_llm=TrackingLLM(),
+        )
+        sentences = [
+            SentenceChunk(f"Sentence {i}.", "blk_001", f"chunk_{i:03d}", i)
+            for i in range(12)
+        ]
+        results = pipeline.process_sentences(sentences)
+        assert len(results) == 12
+        assert in_flight["peak"] <= 2
+
+    def test_batched_selection_reduces_llm_calls(self):
+        """Test that selection_batch_size groups Selection prompts."""
+
+        def batch_selection(prompt, **_kwargs):
+            count = prompt.count("[T")
+            verdicts = ",".join(
+                f'{{"index": {i}, "selected": false, "confidence": 0.9, "reasoning": "Filler"}}'
+                for i in range(1, count + 1)
+            )
+            return f'{{"verdicts": [{verdicts}]}}'
+
+        selection_llm = Mock()
+        selection_llm.complete = Mock(side_effect=batch_selection)
+        pipeline = ClaimifyPipeline(
+            config=ClaimifyConfig(selection_batch_size=3),
+            selection_llm=selection_llm,
+            disambiguation_llm=MockLLM(),
+            decomposition_llm=MockLLM(),
+        )
+        sentences = [
+            SentenceChunk(f"Sentence {i}.", "blk_001", f"chunk_{i:03d}", i)
+            for i in range(7)
+        ]
+        results = pipeline.process_sentences(sentences)
+        assert [r.original_chunk for r in results] == sentences
+        assert all(r.selection_result is not None for r in results)
+        assert not any(r.was_processed for r in results)
+        # 7 sentences in windows of 3 -> 3 calls (the last window has one sentence)
+        assert selection_llm.complete.call_count == 3
+
+    def test_fused_stage_uses_one_call_per_selected_sentence(self):
+        """Test that fused mode disambiguates and decomposes in a single call."""
+        config = ClaimifyConfig(default_model="gpt-4", fused_stage_models=["gpt-4"])
+        selection_llm = MockLLM(
+            '{"selected": true, "confidence": 0.9, "reasoning": "Factual"}'
+        )
+        disambiguation_llm = MockLLM()
+        fused_llm = MockLLM(
+            '{"disambiguated_text": "The server failed at noon.", '
+            '"changes_made": ["Replaced it with the server"], "confidence": 0.9, '
+            '"claim_candidates": [{"text": "The server failed at noon.", '
+            '"is_atomic": true, "is_self_contained": true, "is_verifiable": true, '
+            '"passes_criteria": true, "confidence": 0.9}]}'
+        )
+        pipeline = ClaimifyPipeline(
+            config=config,
+            selection_llm=selection_llm,
+            disambiguation_llm=disambiguation_llm,
+            decomposition_llm=fused_llm,
+        )
+        sentence = SentenceChunk("It failed at noon.", "blk_001", "chunk_001", 0)
+        result = pipeline.process_sentences([sentence])[0]
+        assert len(selection_llm.calls) + len(fused_llm.calls) == 2
+        assert disambiguation_llm.calls == []
+        assert result.disambiguation_result.disambiguated_text == (
+            "The server failed at noon."
+        )
+        assert [c.text for c in result.final_claims] == ["The server failed at noon."]
+
+    def test_fused_stage_requires_shared_model(self):
+        """Test that fusing is skipped when the two stages use different models."""
+        config = ClaimifyConfig(
+            disambiguation_model="gpt-3.5-turbo",
+            decomposition_model="gpt-4",
+            fused_stage_models=["gpt-4"],
+        )
+        assert config.get_fused_stage_model() is None
+        pipeline = ClaimifyPipeline(config=config, decomposition_llm=MockLLM())
+        assert pipeline.fused_agent is None
+
+    def test_fused_stage_redecomposes_rejected_rewrite(self):
+        """Test that a low-confidence rewrite falls back to decomposing the original."""
+        config = ClaimifyConfig(default_model="gpt-4", fused_stage_models=["gpt-4"])
+        responses = iter(
+            [
+                '{"disambiguated_text": "The cache failed.", "changes_made": [], '
+                '"confidence": 0.2, "claim_candidates": [{"text": "The cache failed.", '
+                '"passes_criteria": true, "confidence": 0.9}]}',
+                '{"claim_candidates": [{"text": "It failed.", "confidence": 0.9}]}',
+            ]
+        )
+        decomposition_llm = Mock()
+        decomposition_llm.complete = Mock(side_effect=lambda *_a, **_k: next(responses))
+        pipeline = ClaimifyPipeline(
+            config=config,
+            selection_llm=MockLLM(
+                '{"selected": true, "confidence": 0.9, "reasoning": "Factual"}'
+            ),
+            decomposition_llm=decomposition_llm,
+        )
+        sentence = SentenceChunk("It failed.", "blk_001", "chunk_001", 0)
+        result = pipeline.process_sentences([sentence])[0]
+        assert result.disambiguation_result.disambiguated_text == "It failed."
+        assert [c.text for c in result.decomposition_result.claim_candidates] == [
+            "It failed."
+        ]
+        assert decomposition_llm.complete.call_count == 2
+
 
 class TestClaimifyPipelineIntegration:
     """Integration tests for the Claimify pipeline with realistic scenarios."""
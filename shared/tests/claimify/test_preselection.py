@@ -0,0 +1,169 @@
+"""
+Tests for the local Claimify pre-selection gate.
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from aclarai_shared.claimify.agents import SelectionAgent
+from aclarai_shared.claimify.data_models import (
+    ClaimifyConfig,
+    ClaimifyContext,
+    SentenceChunk,
+)
+from aclarai_shared.claimify.pipeline import ClaimifyPipeline
+from aclarai_shared.claimify.preselection import (
+    EmbeddingClassifier,
+    PreselectionGate,
+    evaluate_preselection_agreement,
+    load_labelled_set,
+)
+
+
+class CountingLLM:
+    """Mock LLM that counts calls and always selects."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, _prompt: str, **_kwargs) -> str:
+        self.calls += 1
+        return '{"selected": true, "confidence": 0.9, "reasoning": "Factual"}'
+
+
+def make_chunk(text: str, index: int = 0, embedding=None) -> SentenceChunk:
+    return SentenceChunk(
+        text=text,
+        source_id="blk_001",
+        chunk_id=f"chunk_{index:03d}",
+        sentence_index=index,
+        embedding=embedding,
+    )
+
+
+class TestPreselectionGate:
+    """Test the rule-based and classifier-based gate decisions."""
+
+    def test_rejects_obvious_non_claims(self):
+        """Test that fillers, pure questions and greetings are rejected."""
+        gate = PreselectionGate(confidence_threshold=0.9)
+        for text in ["OK.", "Thanks!", "What do you think?", "Hello there!", ""]:
+            decision = gate.evaluate(make_chunk(text))
+            assert decision is not None, text
+            assert decision.rejected
+
+    def test_passes_factual_sentences(self):
+        """Test that factual sentences and questions with data go to the LLM."""
+        gate = PreselectionGate(confidence_threshold=0.9)
+        for text in [
+            "The API returned a 500 error on March 3.",
+            "Python 3.12 was released in October 2023.",
+            "Did the 2023 release fix it?",
+        ]:
+            assert gate.evaluate(make_chunk(text)) is None, text
+
+    def test_short_claims_and_tag_questions_reach_llm(self):
+        """Test that two-word claims and tag questions are not rejected."""
+        gate = PreselectionGate(confidence_threshold=0.9)
+        for text in [
+            "Build failed.",
+            "Postgres crashed.",
+            "Deployment succeeded.",
+            "The server is down, right?",
+        ]:
+            assert gate.evaluate(make_chunk(text)) is None, text
+        # A more aggressive gate still rejects short fragments
+        assert PreselectionGate(confidence_threshold=0.8).evaluate(
+            make_chunk("Build failed.")
+        )
+
+    def test_threshold_limits_rejections(self):
+        """Test that low-confidence rules do not reject above the threshold."""
+        gate = PreselectionGate(confidence_threshold=0.97)
+        assert gate.evaluate(make_chunk("Thanks!")) is not None
+        assert gate.evaluate(make_chunk("What do you think?")) is None
+
+    def test_embedding_classifier(self, tmp_path):
+        """Test that a trained classifier rejects chunks with embeddings."""
+        embeddings = [[1.0, 0.0]] * 10 + [[0.0, 1.0]] * 10
+        labels = [True] * 10 + [False] * 10
+        classifier = EmbeddingClassifier().fit(embeddings, labels, epochs=500)
+        path = str(tmp_path / "gate.npz")
+        classifier.save(path)
+        gate = PreselectionGate(
+            confidence_threshold=0.8, classifier=EmbeddingClassifier.load(path)
+        )
+        text = "The deployment finished without errors today."
+        assert gate.evaluate(make_chunk(text, embedding=[1.0, 0.0])) is not None
+        assert gate.evaluate(make_chunk(text, embedding=[0.0, 1.0])) is None
+        # Chunks without embeddings fall back to rules only
+        assert gate.evaluate(make_chunk(text)) is None
+
+
+class TestPreselectionIntegration:
+    """Test the gate in front of the Selection agent and pipeline."""
+
+    def test_selection_agent_skips_llm_for_rejected(self):
+        """Test that gate rejections do not call the LLM."""
+        llm = CountingLLM()
+        agent = SelectionAgent(llm=llm, preselection_gate=PreselectionGate())
+        context = ClaimifyContext(current_sentence=make_chunk("Thanks!"))
+        result = agent.process(context)
+        assert not result.is_selected
+        assert result.reasoning.startswith("Pre-selection:")
+        assert llm.calls == 0
+
+    def test_batch_only_sends_remaining_sentences(self):
+        """Test that batched selection excludes gate-rejected sentences."""
+        llm = CountingLLM()
+        agent = SelectionAgent(llm=llm, preselection_gate=PreselectionGate())
+        chunks = [
+            make_chunk("OK.", 0),
+            make_chunk("The server restarted at 10:42 UTC.", 1),
+            make_chunk("Thanks!", 2),
+        ]
+        results = agent.process_batch(
+            [ClaimifyContext(current_sentence=chunk) for chunk in chunks]
+        )
+        assert [r.is_selected for r in results] == [False, True, False]
+        assert llm.calls == 1
+
+    def test_pipeline_enables_gate_from_config(self):
+        """Test that the pipeline creates the gate and reports its rejections."""
+        llm = CountingLLM()
+        config = ClaimifyConfig(preselection_enabled=True)
+        pipeline = ClaimifyPipeline(config=config, selection_llm=llm)
+        assert pipeline.selection_agent.preselection_gate is not None
+        results = pipeline.process_sentences(
+            [make_chunk("Okay.", 0), make_chunk("Sounds good!", 1)]
+        )
+        assert llm.calls == 0
+        stats = pipeline.get_pipeline_stats(results)
+        assert stats["preselection"]["rejections"] == 2
+
+
+class TestPreselectionEvaluation:
+    """Test the agreement harness against LLM labels."""
+
+    def test_agreement_report(self, tmp_path):
+        """Test precision, coverage and false rejections from a JSONL set."""
+        path = tmp_path / "labelled.jsonl"
+        records = [
+            {"text": "Thanks!", "selected": False},
+            {"text": "What time is it?", "selected": False},
+            {"text": "The build takes 12 minutes.", "selected": False},
+            {"text": "Yes.", "selected": True},
+            {"text": "The database uses PostgreSQL 15.", "selected": True},
+        ]
+        path.write_text("\n".join(json.dumps(r) for r in records))
+        evaluation = evaluate_preselection_agreement(
+            PreselectionGate(), load_labelled_set(str(path))
+        )
+        assert evaluation.total == 5
+        assert evaluation.gate_rejections == 3
+        assert evaluation.agreed_rejections == 2
+        assert evaluation.precision == 2 / 3
+        assert evaluation.coverage == 2 / 3
+        assert [f["text"] for f in evaluation.false_rejections] == ["Yes."]
@@ -0,0 +1,135 @@
+"""
+Tests for record/replay LLMs and the offline Claimify benchmark.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from aclarai_shared.claimify.benchmark import (
+    compare_strategies,
+    load_corpus,
+    record_claimify_corpus,
+    run_claimify_benchmark,
+)
+from aclarai_shared.claimify.data_models import ClaimifyConfig, SentenceChunk
+from aclarai_shared.claimify.replay import (
+    RecordingLLM,
+    ReplayLLM,
+    ReplayLog,
+    ReplayMissError,
+)
+
+
+class ScriptedLLM:
+    """Mock live LLM returning stage-appropriate JSON."""
+
+    def complete(self, prompt: str, **_kwargs) -> str:
+        if "verdicts" in prompt:
+            count = prompt.count("[T")
+            verdicts = [
+                {"index": i, "selected": True, "confidence": 0.9, "reasoning": "x"}
+                for i in range(1, count + 1)
+            ]
+            return json.dumps({"verdicts": verdicts})
+        if "disambiguated_text" in prompt:
+            return json.dumps(
+                {"disambiguated_text": "The server failed.", "changes_made": []}
+            )
+        if "claim_candidates" in prompt:
+            return json.dumps(
+                {
+                    "claim_candidates": [
+                        {
+                            "text": "The server failed.",
+                            "is_atomic": True,
+                            "is_self_contained": True,
+                            "is_verifiable": True,
+                            "passes_criteria": True,
+                            "confidence": 0.9,
+                        }
+                    ]
+                }
+            )
+        return '{"selected": true, "confidence": 0.9, "reasoning": "Factual"}'
+
+
+@pytest.fixture
+def corpus():
+    return [
+        SentenceChunk(f"Server {i} failed at noon.", "blk_001", f"chunk_{i:03d}", i)
+        for i in range(4)
+    ]
+
+
+class TestReplay:
+    """Test recording and replaying completions."""
+
+    def test_round_trip_through_file(self, tmp_path):
+        """Test that recorded completions replay from the JSONL log."""
+        path = str(tmp_path / "replay.jsonl")
+        recorder = RecordingLLM(ScriptedLLM(), ReplayLog(path), "gpt-4", "selection")
+        response = recorder.complete("Is this factual?", temperature=0.1)
+        replay = ReplayLLM(ReplayLog(path), "gpt-4", "selection")
+        assert replay.complete("Is this factual?", temperature=0.1) == response
+        assert replay.get_stats() == {
+            "calls": 1,
+            "misses": 0,
+            "prompt_tokens": 4,
+        }
+
+    def test_miss_handling(self):
+        """Test strict and lenient handling of unrecorded prompts."""
+        log = ReplayLog()
+        with pytest.raises(ReplayMissError):
+            ReplayLLM(log, "gpt-4", "selection").complete("unknown")
+        lenient = ReplayLLM(log, "gpt-4", "selection", strict=False)
+        assert lenient.complete("unknown") == "{}"
+        assert lenient.misses == 1
+
+
+class TestBenchmark:
+    """Test the offline Claimify benchmark."""
+
+    def test_benchmark_replays_recorded_run(self, corpus):
+        """Test that a replayed run makes the recorded calls with no misses."""
+        log = ReplayLog()
+        record_claimify_corpus(corpus, ScriptedLLM(), log)
+        result = run_claimify_benchmark(corpus, log, simulate_latency=False)
+        assert result.replay_misses == 0
+        assert result.errors == 0
+        assert result.llm_calls == {
+            "selection": 4,
+            "disambiguation": 4,
+            "decomposition": 4,
+        }
+        assert result.llm_calls_per_sentence == 3
+        assert result.prompt_tokens["selection"] > 0
+
+    def test_compare_batching_strategy(self, corpus):
+        """Test that batched selection shows fewer selection calls."""
+        log = ReplayLog()
+        batched = ClaimifyConfig(selection_batch_size=4)
+        record_claimify_corpus(corpus, ScriptedLLM(), log)
+        record_claimify_corpus(corpus, ScriptedLLM(), log, batched)
+        sequential_result, batched_result = compare_strategies(
+            corpus,
+            log,
+            {"sequential": ClaimifyConfig(), "batched": batched},
+            simulate_latency=False,
+        )
+        assert batched_result.replay_misses == 0
+        assert batched_result.llm_calls["selection"] == 1
+        assert sequential_result.llm_calls["selection"] == 4
+
+    def test_load_corpus(self, tmp_path):
+        """Test loading a JSONL benchmark corpus."""
+        path = tmp_path / "corpus.jsonl"
+        path.write_text('{"text": "A."}\n\n{"text": "B.", "source_id": "blk"}\n')
+        sentences = load_corpus(str(path))
+        assert [s.text for s in sentences] == ["A.", "B."]
+        assert sentences[1].sentence_index == 1
+        assert sentences[1].source_id == "blk"
@@ -0,0 +1,157 @@
+"""
+Tests for the Claimify sentence memo.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+from aclarai_shared.claimify.data_models import (
+    ClaimifyConfig,
+    ClaimifyContext,
+    SentenceChunk,
+)
+from aclarai_shared.claimify.pipeline import ClaimifyPipeline
+from aclarai_shared.claimify.sentence_memo import SentenceMemo
+
+
+class CountingLLM:
+    """Mock LLM that counts calls."""
+
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    def complete(self, _prompt: str, **_kwargs) -> str:
+        self.calls += 1
+        return self.response
+
+
+def _context(text, preceding=(), source_id="blk_001"):
+    before = [
+        SentenceChunk(t, source_id, f"{source_id}_p{i}", i)
+        for i, t in enumerate(preceding)
+    ]
+    sentence = SentenceChunk(text, source_id, f"{source_id}_c", len(before))
+    return ClaimifyContext(current_sentence=sentence, preceding_sentences=before)
+
+
+class TestSentenceMemoKeys:
+    """Test memo keys at each strictness level."""
+
+    def test_normalized_ignores_irrelevant_context_differences(self):
+        """Test that case, whitespace, timestamps and ids do not change the key."""
+        memo = SentenceMemo("normalized")
+        first = _context(
+            "The deploy failed with error 503.", ["[10:31] Build a1b2c3d4e5 started."]
+        )
+        second = _context(
+            "the deploy failed with  error 503", ["[14:02] build ffee0099aa started"]
+        )
+        assert memo.make_key(first) == memo.make_key(second)
+        # Numbers in the sentence itself are meaningful
+        third = _context(
+            "The deploy failed with error 504.", ["[10:31] Build a1b2c3d4e5 started."]
+        )
+        assert memo.make_key(first) != memo.make_key(third)
+
+    def test_exact_requires_identical_text(self):
+        """Test that exact strictness distinguishes any textual difference."""
+        memo = SentenceMemo("exact")
+        assert memo.make_key(_context("Deploy failed.")) != memo.make_key(
+            _context("deploy failed.")
+        )
+
+    def test_relaxed_ignores_context_only_without_references(self):
+        """Test that relaxed strictness keeps context for pronoun sentences."""
+        memo = SentenceMemo("relaxed")
+        assert memo.make_key(_context("The API returned 500.", ["A"])) == (
+            memo.make_key(_context("The API returned 500.", ["B"]))
+        )
+        assert memo.make_key(_context("It returned 500.", ["A"])) != (
+            memo.make_key(_context("It returned 500.", ["B"]))
+        )
+
+    def test_unknown_strictness(self):
+        """Test that an unknown strictness level is rejected."""
+        with pytest.raises(ValueError):
+            SentenceMemo("fuzzy")
+
+
+class TestPipelineSentenceMemo:
+    """Test result reuse in ClaimifyPipeline."""
+
+    @pytest.fixture
+    def llms(self):
+        return {
+            "selection_llm": CountingLLM(
+                '{"selected": true, "confidence": 0.9, "reasoning": "Factual"}'
+            ),
+            "disambiguation_llm": CountingLLM(
+                '{"disambiguated_text": "The deploy failed with error 503.", '
+                '"changes_made": [], "confidence": 0.9}'
+            ),
+            "decomposition_llm": CountingLLM(
+                '{"claim_candidates": [{"text": "The deploy failed with error 503.", '
+                '"is_atomic": true, "is_self_contained": true, '
+                '"is_verifiable": true, "confidence": 0.9}]}'
+            ),
+        }
+
+    def test_repeated_sentence_reuses_result(self, llms):
+        """Test that a repeat in another conversation skips all LLM calls."""
+        pipeline = ClaimifyPipeline(
+            config=ClaimifyConfig(sentence_memo_enabled=True), **llms
+        )
+        first = SentenceChunk("The deploy failed with error 503.", "blk_a", "a_0", 0)
+        repeat = SentenceChunk("The deploy failed with error 503.", "blk_b", "b_0", 0)
+        pipeline.process_sentences([first])
+        results = pipeline.process_sentences([repeat])
+        assert all(llm.calls == 1 for llm in llms.values())
+        reused = results[0]
+        assert reused.original_chunk is repeat
+        assert reused.selection_result.sentence_chunk is repeat
+        assert reused.disambiguation_result.original_sentence is repeat
+        assert [c.text for c in reused.final_claims] == [
+            "The deploy failed with error 503."
+        ]
+        stats = pipeline.get_pipeline_stats(results)["sentence_memo"]
+        assert stats["hits"] == 1
+        assert stats["reused_selected"] == 1
+
+    def test_failed_results_are_not_memoized(self, llms):
+        """Test that a selected sentence with a failed decomposition is retried."""
+        llms["decomposition_llm"] = CountingLLM("not json")
+        pipeline = ClaimifyPipeline(
+            config=ClaimifyConfig(sentence_memo_enabled=True), **llms
+        )
+        sentence = SentenceChunk("The deploy failed.", "blk_a", "a_0", 0)
+        pipeline.process_sentences([sentence])
+        pipeline.process_sentences([sentence])
+        assert llms["decomposition_llm"].calls == 2
+        assert pipeline.sentence_memo.get_stats()["skipped"] == 2
+
+    def test_batched_selection_skips_memoized_sentences(self, llms):
+        """Test that memo hits are left out of batched Selection prompts."""
+        llms["selection_llm"] = CountingLLM(
+            '{"verdicts": [{"index": 1, "selected": false, "confidence": 0.9}]}'
+        )
+        pipeline = ClaimifyPipeline(
+            config=ClaimifyConfig(
+                sentence_memo_enabled=True,
+                selection_batch_size=2,
+                context_window_p=0,
+                context_window_f=0,
+            ),
+            **llms,
+        )
+        sentences = [
+            SentenceChunk("Standup at ten.", "blk_a", "a_0", 0),
+            SentenceChunk("Standup at ten.", "blk_a", "a_1", 1),
+        ]
+        pipeline.process_sentences(sentences[:1])
+        results = pipeline.process_sentences(sentences)
+        assert llms["selection_llm"].calls == 1
+        assert not any(r.was_processed for r in results)
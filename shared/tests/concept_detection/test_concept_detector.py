@@ -6,12 +6,14 @@ similarity matching and merge/promote decision logic.
 
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 from aclarai_shared.concept_detection import (
     ConceptDetectionResult,
     ConceptDetector,
     SimilarityMatch,
 )
+from aclarai_shared.concept_detection.canonical_index import CanonicalConceptIndex
 from aclarai_shared.concept_detection.models import ConceptAction
 from aclarai_shared.config import (
     ConceptsConfig,
@@ -22,6 +24,21 @@ from aclarai_shared.config import (
 from aclarai_shared.noun_phrase_extraction.models import NounPhraseCandidate
 
 
+def _stream(candidates, chunk_size=2):
+    """Serve candidate dicts the way iter_candidate_chunks streams them."""
+
+    def iter_candidate_chunks(status):
+        rows = [c for c in candidates if c["status"] == status]
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start : start + chunk_size]
+            yield (
+                [{k: v for k, v in c.items() if k != "embedding"} for c in chunk],
+                np.array([c["embedding"] for c in chunk], dtype=np.float32),
+            )
+
+    return iter_candidate_chunks
+
+
 class TestConceptDetector:
     """Test suite for ConceptDetector class."""
 
@@ -29,8 +46,12 @@ class TestConceptDetector:
     def mock_config(self):
         """Mock configuration for testing."""
         config = Mock(spec=aclaraiConfig)
-        config.concepts = Mock(spec=ConceptsConfig)
-        config.concepts.similarity_threshold = 0.9
+        # Empty index paths keep the HNSW indexes in memory
+        config.concepts = ConceptsConfig(
+            similarity_threshold=0.9,
+            candidates_index_path="",
+            canonical_index_path="",
+        )
         config.noun_phrase_extraction = Mock(spec=NounPhraseExtractionConfig)
         config.noun_phrase_extraction.concept_candidates_collection = "mock_collection"
         config.embedding = Mock(spec=EmbeddingConfig)
@@ -50,7 +71,7 @@ class TestConceptDetector:
             # Create a mock instance of the vector store
             mock_store_instance = Mock()
             mock_store_instance.embed_dim = 384  # Set expected dimension
-            mock_store_instance.get_candidates_by_status.return_value = []
+            mock_store_instance.iter_candidate_chunks.side_effect = _stream([])
 
             # Configure the patch to return our mock instance
             mock_store_class.return_value = mock_store_instance
@@ -130,7 +151,7 @@ class TestConceptDetector:
 
     def test_build_index_empty_candidates(self, detector):
         """Test building index with no candidates."""
-        detector.mock_candidates_store.get_candidates_by_status.return_value = []
+        detector.mock_candidates_store.iter_candidate_chunks.side_effect = _stream([])
         with patch.object(detector, "_initialize_index") as mock_init:
             result = detector.build_index_from_candidates()
             assert result == 0
@@ -154,7 +175,7 @@ class TestConceptDetector:
             },
         ]
         # Configure the mock store to return our test candidates
-        detector.candidates_store.get_candidates_by_status.return_value = (
+        detector.candidates_store.iter_candidate_chunks.side_effect = _stream(
             mock_candidates
         )
         with patch(
@@ -288,6 +309,416 @@ class TestConceptDetector:
             assert len(batch_result.results) == 2
             assert batch_result.processing_time is not None
 
+    @staticmethod
+    def _candidate_data(candidate_id, direction, status="pending"):
+        embedding = [0.0] * 384
+        embedding[direction] = 1.0
+        return {
+            "candidate_id": candidate_id,
+            "normalized_text": candidate_id,
+            "status": status,
+            "embedding": embedding,
+        }
+
+    def test_incremental_updates_and_resize(self, detector):
+        """Test adding past capacity and removing candidates from the index."""
+        detector._initialize_index(max_elements=2)
+        added = detector.add_candidates(
+            [self._candidate_data(f"cand_{i}", i) for i in range(3)]
+        )
+        assert added == 3
+        assert detector.max_elements == 4
+        assert detector.index.get_max_elements() == 4
+        # Re-adding a known candidate only refreshes its metadata
+        assert detector.add_candidates([self._candidate_data("cand_0", 0)]) == 0
+        assert detector.remove_candidates(["cand_1", "unknown"]) == 1
+        query = NounPhraseCandidate(
+            text="query",
+            normalized_text="query",
+            source_node_id="claim_1",
+            source_node_type="claim",
+            aclarai_id="blk_1",
+            embedding=self._candidate_data("q", 1)["embedding"],
+        )
+        matches = detector.find_similar_candidates(query)
+        assert sorted(m.matched_candidate_id for m in matches) == ["cand_0", "cand_2"]
+
+    def test_build_index_streams_chunks(self, detector):
+        """Test building across chunks and statuses past the initial capacity."""
+        candidates = [
+            self._candidate_data(f"cand_{i}", i % 384) for i in range(1200)
+        ] + [
+            # Also stored as pending, so the pending copy is kept
+            self._candidate_data("cand_0", 1, status="promoted"),
+            self._candidate_data("cand_p", 2, status="promoted"),
+        ]
+        detector.mock_candidates_store.iter_candidate_chunks.side_effect = _stream(
+            candidates, chunk_size=500
+        )
+        assert detector.build_index_from_candidates(force_rebuild=True) == 1201
+        assert detector.index.get_current_count() == 1201
+        assert detector.max_elements == 2000
+        assert detector.id_to_metadata[0]["status"] == "pending"
+        assert detector.label_by_candidate_id["cand_p"] == 1200
+
+    def test_apply_detection_results(self, detector, sample_candidate):
+        """Test that promotions are indexed and merged candidates removed."""
+        detector.add_candidates([self._candidate_data("claim_9_old", 5)])
+        merged = NounPhraseCandidate(
+            text="old",
+            normalized_text="old",
+            source_node_id="9",
+            source_node_type="claim",
+            aclarai_id="blk_9",
+        )
+        results = [
+            ConceptDetectionResult(
+                candidate_id="claim_claim_123_machine learning",
+                candidate_text="machine learning",
+                action=ConceptAction.PROMOTED,
+            ),
+            ConceptDetectionResult(
+                candidate_id="claim_9_old",
+                candidate_text="old",
+                action=ConceptAction.MERGED,
+            ),
+        ]
+        detector.apply_detection_results([sample_candidate, merged], results)
+        assert set(detector.label_by_candidate_id) == {
+            "claim_claim_123_machine learning"
+        }
+        metadata = next(iter(detector.id_to_metadata.values()))
+        assert metadata["status"] == "promoted"
+        assert "embedding" not in metadata
+
+    def test_save_and_load_index(self, detector, mock_config, tmp_path):
+        """Test cold start from disk and rebuild on a stale generation."""
+        store = detector.mock_candidates_store
+        detector.index_path = tmp_path / "concept_index"
+        detector.add_candidates([self._candidate_data("cand_0", 0)])
+        store.bump_index_generation.return_value = 7
+        assert detector.save_index()
+        assert detector.generation == 7
+        with patch(
+            "aclarai_shared.concept_detection.detector.ConceptCandidatesVectorStore",
+            return_value=store,
+        ):
+            restarted = ConceptDetector(config=mock_config)
+        restarted.index_path = detector.index_path
+        store.get_index_generation.return_value = 7
+        store.iter_candidate_chunks.reset_mock()
+        assert restarted.build_index_from_candidates() == 1
+        store.iter_candidate_chunks.assert_not_called()
+        assert restarted.label_by_candidate_id == {"cand_0": 0}
+        assert restarted.next_id == 1
+        # Candidates added since the save make the snapshot stale
+        store.get_index_generation.return_value = 8
+        assert not restarted.load_index()
+
+    def test_rebuild_and_close_save_index(self, detector, tmp_path):
+        """Test that a rebuild is saved at once and close saves later changes."""
+        store = detector.mock_candidates_store
+        detector.index_path = tmp_path / "concept_index"
+        store.iter_candidate_chunks.side_effect = _stream(
+            [self._candidate_data("cand_0", 0)]
+        )
+        store.bump_index_generation.side_effect = [1, 2]
+        assert detector.build_index_from_candidates(force_rebuild=True) == 1
+        assert detector.generation == 1
+        assert detector.index_path.with_suffix(".bin").exists()
+        detector.add_candidates([self._candidate_data("cand_1", 1)])
+        # Within the save interval only close writes the change
+        assert not detector.save_index_if_due()
+        detector.close()
+        assert detector.generation == 2
+        assert not detector._dirty
+
+    def test_existing_concept_takes_precedence(self, detector):
+        """Test that candidates naming an existing concept are merged into it."""
+        store = detector.mock_candidates_store
+        store.iter_candidate_chunks.side_effect = _stream(
+            [
+                self._candidate_data("cand_ml", 5, status="promoted"),
+                self._candidate_data("cand_unused", 7, status="promoted"),
+            ]
+        )
+        count = detector.build_canonical_index(
+            [
+                {
+                    "id": "concept_ml",
+                    "text": "machine learning",
+                    "source_candidate_id": "cand_ml",
+                },
+                # Concepts whose candidate has no embedding are skipped
+                {"id": "concept_x", "text": "x", "source_candidate_id": "missing"},
+            ]
+        )
+        assert count == 1
+        store.iter_candidate_chunks.assert_called_with("promoted")
+        detector.add_candidates([self._candidate_data("cand_other", 6)])
+        candidates = [
+            NounPhraseCandidate(
+                text=text,
+                normalized_text=text,
+                source_node_id=f"claim_{direction}",
+                source_node_type="claim",
+                aclarai_id="blk_1",
+                embedding=self._candidate_data(text, direction)["embedding"],
+            )
+            for text, direction in (("ml", 5), ("other", 6))
+        ]
+        for results in (
+            detector._detect_actions_batch(candidates),
+            [detector.detect_concept_action(c) for c in candidates],
+        ):
+            assert [r.action for r in results] == [
+                ConceptAction.MERGED,
+                ConceptAction.MERGED,
+            ]
+            assert results[0].best_match.matched_concept_id == "concept_ml"
+            assert results[0].best_match.matched_candidate_id == "cand_ml"
+            assert "existing concept 'machine learning'" in results[0].reason
+            # Without a matching concept the candidate index decides
+            assert results[1].best_match.matched_concept_id is None
+            assert results[1].best_match.matched_candidate_id == "cand_other"
+        assert detector.add_concepts(
+            [{"concept_id": "concept_new", "text": "new", "embedding": [1.0] * 384}]
+        )
+        assert len(detector.canonical_index) == 2
+
+    def test_added_concepts_invalidate_saved_canonical_index(self, detector, tmp_path):
+        """Test that a concept added after the last save makes the snapshot stale."""
+        store = detector.mock_candidates_store
+        generations = {"concepts": 0}
+
+        def bump(name):
+            generations[name] += 1
+            return generations[name]
+
+        store.bump_index_generation.side_effect = bump
+        store.get_index_generation.side_effect = generations.get
+        canonical = detector.canonical_index
+        canonical.index_path = tmp_path / "canonical_index"
+        canonical.build([], {}, force_rebuild=True)
+        assert canonical.save()
+        canonical.add_concepts(
+            [{"concept_id": "concept_1", "text": "c1", "embedding": [1.0] * 384}]
+        )
+        # Not due yet, so the saved file still lacks concept_1
+        assert not canonical.save_if_due()
+        restarted = CanonicalConceptIndex(store, 384, index_path=canonical.index_path)
+        assert not restarted.load()
+
+    def test_match_exact(self, detector):
+        """Test resolving known normalized phrases without an index query."""
+        detector.add_candidates([self._candidate_data("neural net", 1)])
+        detector.add_concepts(
+            [
+                {
+                    "concept_id": "concept_ml",
+                    "text": "Machine Learning",
+                    "source_candidate_id": "cand_ml",
+                    "normalized_text": "machine learning",
+                    "embedding": self._candidate_data("ml", 2)["embedding"],
+                }
+            ]
+        )
+        # A candidate with the same text does not replace the concept entry
+        detector.add_candidates([self._candidate_data("machine learning", 3)])
+
+        def candidate(normalized_text, node_id="claim_1"):
+            return NounPhraseCandidate(
+                text=normalized_text,
+                normalized_text=normalized_text,
+                source_node_id=node_id,
+                source_node_type="claim",
+                aclarai_id="blk_1",
+            )
+
+        detector.index = Mock(wraps=detector.index)
+        results = detector.match_exact(
+            [
+                candidate("machine learning"),
+                candidate("neural net"),
+                candidate("unseen phrase"),
+            ]
+        )
+        detector.index.knn_query.assert_not_called()
+        assert results[0].action == ConceptAction.MERGED
+        assert results[0].best_match.matched_concept_id == "concept_ml"
+        assert results[0].best_match.matched_text == "Machine Learning"
+        assert results[1].best_match.matched_candidate_id == "neural net"
+        assert results[1].best_match.matched_concept_id is None
+        assert results[2] is None
+        # Merged candidates resolve to their merge target afterwards
+        merged = candidate("neural network", node_id="claim_2")
+        merge_result = ConceptDetectionResult(
+            candidate_id="claim_claim_2_neural network",
+            candidate_text="neural network",
+            action=ConceptAction.MERGED,
+            similarity_matches=results[1].similarity_matches,
+        )
+        detector.apply_detection_results([merged], [merge_result])
+        match = detector.match_exact([merged])[0].best_match
+        assert match.matched_candidate_id == "neural net"
+
+    def test_batch_matches_per_candidate_detection(self, detector):
+        """Test that one batched kNN query gives the per-candidate results."""
+        rng = np.random.default_rng(0)
+        base = rng.normal(size=(5, 384)).astype(np.float32)
+        detector.add_candidates(
+            [
+                {
+                    "candidate_id": f"cand_{i}",
+                    "normalized_text": f"text {i}",
+                    "embedding": base[i].tolist(),
+                }
+                for i in range(5)
+            ]
+        )
+        candidates = [
+            NounPhraseCandidate(
+                text=f"query {i}",
+                normalized_text="text 0" if i == 0 else f"query {i}",
+                source_node_id=f"claim_{i}",
+                source_node_type="claim",
+                aclarai_id=f"blk_{i}",
+                embedding=(base[i] + rng.normal(scale=0.05 * i, size=384)).tolist(),
+            )
+            for i in range(5)
+        ]
+        candidates.append(
+            NounPhraseCandidate(
+                text="no embedding",
+                normalized_text="no embedding",
+                source_node_id="claim_x",
+                source_node_type="claim",
+                aclarai_id="blk_x",
+            )
+        )
+        expected = [detector.detect_concept_action(c) for c in candidates]
+        real_index = detector.index
+        detector.index = Mock(wraps=real_index)
+        batch = detector._detect_actions_batch(candidates)
+        detector.index.knn_query.assert_called_once()
+        assert detector.index.knn_query.call_args[0][0].shape == (5, 384)
+        assert {r.action for r in batch} == {
+            ConceptAction.MERGED,
+            ConceptAction.PROMOTED,
+        }
+        for got, want in zip(batch, expected, strict=True):
+            assert got.candidate_id == want.candidate_id
+            assert got.action == want.action
+            assert got.confidence == want.confidence
+            assert got.reason == want.reason
+            assert [
+                (m.matched_candidate_id, m.similarity_score)
+                for m in got.similarity_matches
+            ] == [
+                (m.matched_candidate_id, m.similarity_score)
+                for m in want.similarity_matches
+            ]
+
+    @staticmethod
+    def _near_duplicates(rng, base, count):
+        return [
+            NounPhraseCandidate(
+                text=f"variant {i}",
+                normalized_text=f"variant {i}",
+                source_node_id=f"claim_{i}",
+                source_node_type="claim",
+                aclarai_id=f"blk_{i}",
+                embedding=(base + rng.normal(scale=0.1, size=384)).tolist(),
+            )
+            for i in range(count)
+        ]
+
+    def test_batch_clusters_near_duplicates(self, detector):
+        """Test that near-duplicates in one batch promote a single concept."""
+        rng = np.random.default_rng(1)
+        base = rng.normal(size=384)
+        other = rng.normal(size=384)
+        detector._initialize_index()
+        candidates = self._near_duplicates(rng, base, 4)
+        candidates.insert(
+            2,
+            NounPhraseCandidate(
+                text="unrelated",
+                normalized_text="unrelated",
+                source_node_id="claim_u",
+                source_node_type="claim",
+                aclarai_id="blk_u",
+                embedding=other.tolist(),
+            ),
+        )
+        results = detector._detect_actions_batch(candidates)
+        assert [r.action for r in results] == [
+            ConceptAction.PROMOTED,
+            ConceptAction.MERGED,
+            ConceptAction.PROMOTED,
+            ConceptAction.MERGED,
+            ConceptAction.MERGED,
+        ]
+        for result in (results[1], results[3], results[4]):
+            match = result.similarity_matches[0]
+            assert match.matched_candidate_id == results[0].candidate_id
+            assert match.matched_text == "variant 0"
+            assert match.similarity_score >= detector.similarity_threshold
+
+    def test_batch_members_follow_merged_representative(self, detector):
+        """Test that members of a merged representative point at its target."""
+        rng = np.random.default_rng(3)
+        base = rng.normal(size=384)
+        detector.add_candidates(
+            [
+                {
+                    "candidate_id": "cand_x",
+                    "normalized_text": "existing",
+                    "embedding": base.tolist(),
+                }
+            ]
+        )
+        candidates = [
+            NounPhraseCandidate(
+                text=f"variant {i}",
+                normalized_text=f"variant {i}",
+                source_node_id=f"claim_{i}",
+                source_node_type="claim",
+                aclarai_id=f"blk_{i}",
+                embedding=(base + rng.normal(scale=0.01, size=384)).tolist(),
+            )
+            for i in range(2)
+        ]
+        results = detector._detect_actions_batch(candidates)
+        assert [r.action for r in results] == [ConceptAction.MERGED] * 2
+        assert results[0].best_match.matched_candidate_id == "cand_x"
+        assert results[1].best_match.matched_candidate_id == "cand_x"
+        assert results[1].best_match.matched_text == "existing"
+
+    def test_chained_rows_below_threshold_stay_apart(self, detector):
+        """Test that a chain does not join rows dissimilar to the representative."""
+        angle = np.arccos(0.93)
+        embeddings = np.zeros((3, 384), dtype=np.float32)
+        for row in range(3):
+            embeddings[row, 0] = np.cos(row * angle)
+            embeddings[row, 1] = np.sin(row * angle)
+        # Rows 0-1 and 1-2 pass the 0.9 threshold, rows 0-2 do not
+        assert detector._cluster_batch(embeddings) == [0, 0, 2]
+
+    def test_large_batch_clusters_with_temporary_index(self, detector):
+        """Test that the HNSW path finds the same clusters as the dense one."""
+        rng = np.random.default_rng(2)
+        candidates = []
+        for _ in range(3):
+            candidates.extend(self._near_duplicates(rng, rng.normal(size=384), 4))
+        embeddings = np.array([c.embedding for c in candidates], dtype=np.float32)
+        dense = detector._cluster_batch(embeddings)
+        with patch(
+            "aclarai_shared.concept_detection.detector.INTRA_BATCH_EXACT_LIMIT", 2
+        ):
+            approximate = detector._cluster_batch(embeddings)
+        assert dense == approximate == [0] * 4 + [4] * 4 + [8] * 4
+
     def test_similarity_threshold_from_config(self, mock_config):
         """Test that similarity threshold is correctly read from config."""
         mock_config.concepts.similarity_threshold = 0.85
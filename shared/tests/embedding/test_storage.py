@@ -2,7 +2,7 @@
 Tests for embedding storage components.
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from aclarai_shared.config import DatabaseConfig, aclaraiConfig
@@ -307,6 +307,27 @@ class TestaclaraiVectorStore:
         deleted_count = vector_store.delete_chunks_by_block_id("test_block_id")
         assert isinstance(deleted_count, int)
 
+    def test_get_chunk_embeddings(self):
+        """Test reading a block's stored chunk embeddings by chunk index."""
+        store = aclaraiVectorStore.__new__(aclaraiVectorStore)
+        store.config = aclaraiConfig()
+        store.engine = MagicMock()
+        conn = store.engine.connect.return_value.__enter__.return_value
+        conn.execute.return_value.fetchall.return_value = [
+            ("1", "Second chunk.", [0.0, 1.0]),
+            ("0", "First chunk.", [1.0, 0.0]),
+        ]
+        embeddings = store.get_chunk_embeddings("blk_1")
+        assert embeddings == {
+            0: ("First chunk.", [1.0, 0.0]),
+            1: ("Second chunk.", [0.0, 1.0]),
+        }
+        query, params = conn.execute.call_args[0]
+        assert "metadata_->>'aclarai_block_id' = :block_id" in str(query)
+        assert params == {"block_id": "blk_1"}
+        conn.execute.side_effect = RuntimeError("connection lost")
+        assert store.get_chunk_embeddings("blk_1") == {}
+
     def test_get_store_metrics(self):
         """Test getting vector store metrics (unit test)."""
         config = aclaraiConfig()
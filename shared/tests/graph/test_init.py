@@ -42,7 +42,7 @@ class TestGraphInit:
 
         assert hasattr(graph_module, "__all__")
         assert isinstance(graph_module.__all__, list)
-        assert len(graph_module.__all__) == 7
+        assert len(graph_module.__all__) == 9
         expected_exports = [
             "Claim",
             "Sentence",
@@ -51,6 +51,8 @@ class TestGraphInit:
             "Concept",
             "ConceptInput",
             "Neo4jGraphManager",
+            "GraphWriteBuffer",
+            "iter_node_pages",
         ]
         for item in expected_exports:
             assert item in graph_module.__all__
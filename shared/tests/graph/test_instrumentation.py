@@ -0,0 +1,145 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from aclarai_shared.graph.instrumentation import (
+    QueryInstrumentation,
+    audit_query_indexes,
+    indexed_properties_from_schema,
+    summarize_plan,
+)
+from aclarai_shared.graph.neo4j_manager import (
+    BLOCK_SYNC_QUERY,
+    SCHEMA_QUERIES,
+    Neo4jGraphManager,
+)
+
+
+class TestQueryInstrumentation:
+    """Unit tests for query statistics and the schema audit."""
+
+    def test_track_records_stats(self):
+        """Test latency, rows, retries and errors per query name."""
+        instrumentation = QueryInstrumentation()
+        with instrumentation.track("fetch") as tracker:
+            tracker.attempts = 3
+            tracker.rows = 10
+        with pytest.raises(RuntimeError), instrumentation.track("fetch"):
+            raise RuntimeError("boom")
+        stats = instrumentation.get_stats()["fetch"]
+        assert stats["calls"] == 2
+        assert stats["errors"] == 1
+        assert stats["retries"] == 2
+        assert stats["rows"] == 10
+        assert sum(stats["histogram"].values()) == 2
+        assert stats["p95_ms"] is not None
+
+    def test_schema_catalog(self):
+        """Test collecting indexed properties from schema statements."""
+        indexed = indexed_properties_from_schema(SCHEMA_QUERIES)
+        assert indexed["Block"] == {"id", "text", "hash"}
+        assert "entailed_score" in indexed["Claim"]
+
+    def test_audit_flags_unindexed_lookups(self):
+        """Test that lookups on unindexed properties are flagged."""
+        indexed = indexed_properties_from_schema(SCHEMA_QUERIES)
+        query = """
+        MATCH (c:Claim)-[:REFERENCES]->(b:Block)
+        WHERE b.aclarai_id IN $block_ids AND c.entailed_score > 0.7
+        SET c.reviewed = true
+        RETURN c.id as id, b.source_file as source_file
+        """
+        findings = audit_query_indexes(query, indexed)
+        assert findings == [
+            {
+                "variable": "b",
+                "label": "Block",
+                "property": "aclarai_id",
+                "clause": "WHERE",
+            }
+        ]
+        assert audit_query_indexes(BLOCK_SYNC_QUERY, indexed) == []
+        # A label without any index is flagged as well
+        assert audit_query_indexes("MATCH (s:Summary {id: $id}) RETURN s", indexed)
+
+    def test_summarize_plan(self):
+        """Test flattening a profile tree into operators."""
+        plan = {
+            "operatorType": "ProduceResults@neo4j",
+            "arguments": {},
+            "children": [
+                {
+                    "operatorType": "NodeByLabelScan@neo4j",
+                    "arguments": {"Details": "b:Block"},
+                    "dbHits": 1001,
+                    "rows": 1000,
+                    "children": [],
+                }
+            ],
+        }
+        operators = summarize_plan(plan)
+        assert [op["operator"] for op in operators] == [
+            "ProduceResults",
+            "NodeByLabelScan",
+        ]
+        assert operators[1]["depth"] == 1
+        assert operators[1]["dbHits"] == 1001
+
+
+class TestManagerInstrumentation:
+    """Unit tests for instrumentation wired into Neo4jGraphManager."""
+
+    @pytest.fixture
+    def manager(self):
+        """Fixture to create a manager that treats every query as slow."""
+        with patch("aclarai_shared.graph.neo4j_manager.GraphDatabase.driver"):
+            config = Mock()
+            config.neo4j.get_neo4j_bolt_url.return_value = "bolt://mock:7687"
+            config.neo4j.user = "mock"
+            config.neo4j.password = "mock"
+            config.processing = {
+                "query_instrumentation": {
+                    "slow_query_ms": 0,
+                    "capture_plans": "profile",
+                }
+            }
+            manager = Neo4jGraphManager(config)
+            mock_session = MagicMock()
+            patcher = patch.object(Neo4jGraphManager, "session", new_callable=MagicMock)
+            mock_session_method = patcher.start()
+            mock_session_method.return_value.__enter__.return_value = mock_session
+            for method in (mock_session.execute_read, mock_session.execute_write):
+                method.side_effect = lambda work, *args, **kwargs: work(
+                    mock_session, *args, **kwargs
+                )
+            manager.mock_session = mock_session
+            yield manager
+            patcher.stop()
+            manager.close()
+
+    def test_named_query_stats_and_plan(self, manager):
+        """Test that a slow read is recorded by name with a PROFILE plan."""
+        result = MagicMock()
+        result.__iter__.return_value = iter([{"id": "c1"}, {"id": "c2"}])
+        result.consume.return_value.profile = {
+            "operatorType": "NodeByLabelScan",
+            "arguments": {"Details": "k:Concept"},
+        }
+        manager.mock_session.run.return_value = result
+        manager.execute_query(
+            "MATCH (k:Concept) RETURN k.id as id",
+            read_only=True,
+            query_name="all_concepts",
+        )
+        stats = manager.get_query_stats()
+        assert stats["queries"]["all_concepts"]["rows"] == 2
+        assert stats["queries"]["all_concepts"]["retries"] == 0
+        assert stats["plans"]["all_concepts"]["mode"] == "PROFILE"
+        profile_query = manager.mock_session.run.call_args[0][0]
+        assert profile_query.startswith("PROFILE MATCH (k:Concept)")
+
+    def test_writes_are_explained_not_profiled(self, manager):
+        """Test that plan capture never re-runs a write query."""
+        manager.mock_session.run.return_value = []
+        manager.execute_query("MATCH (c:Claim {id: $id}) SET c.x = 1", {"id": "c1"})
+        explain_query = manager.mock_session.run.call_args[0][0]
+        assert explain_query.startswith("EXPLAIN ")
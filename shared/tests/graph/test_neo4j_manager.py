@@ -3,8 +3,9 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from aclarai_shared.config import load_config
-from aclarai_shared.graph.models import ClaimInput, SentenceInput
+from aclarai_shared.graph.models import ClaimInput, ConceptInput, SentenceInput
 from aclarai_shared.graph.neo4j_manager import Neo4jGraphManager
+from neo4j import READ_ACCESS, WRITE_ACCESS
 
 
 class TestNeo4jGraphManagerUnit:
@@ -27,6 +28,11 @@ class TestNeo4jGraphManagerUnit:
             patcher = patch.object(Neo4jGraphManager, "session", new_callable=MagicMock)
             mock_session_method = patcher.start()
             mock_session_method.return_value.__enter__.return_value = mock_session
+            # Transaction functions run against the session mock as their tx
+            for method in (mock_session.execute_read, mock_session.execute_write):
+                method.side_effect = lambda work, *args, **kwargs: work(
+                    mock_session, *args, **kwargs
+                )
 
             # Store the session mock on the manager instance for easy access in tests
             manager.mock_session = mock_session
@@ -71,6 +77,189 @@ class TestNeo4jGraphManagerUnit:
         assert len(params) == 1
         assert params[0]["text"] == "test sentence"
 
+    def test_create_concepts_unit(self, mock_manager):
+        """Test that create_concepts creates all concepts and edges in one query."""
+        concept_inputs = [
+            ConceptInput(
+                text=f"concept {i}",
+                source_candidate_id=f"cand_{i}",
+                source_node_id=f"claim_{i}",
+                source_node_type="claim",
+                aclarai_id="blk_1",
+            )
+            for i in range(3)
+        ]
+        mock_manager.mock_session.run.return_value = [
+            {"node_id": c.concept_id} for c in concept_inputs
+        ]
+        concepts = mock_manager.create_concepts(concept_inputs)
+
+        mock_manager.mock_session.run.assert_called_once()
+        args, kwargs = mock_manager.mock_session.run.call_args
+        query = args[0]
+        assert "UNWIND $concepts_data AS data" in query
+        assert "MERGE (c:Concept {id: data.id})" in query
+        assert "MERGE (claim)-[:MENTIONS_CONCEPT]->(c)" in query
+        assert "MERGE (c)-[:ORIGINATES_FROM]->(block)" in query
+        assert [d["source_candidate_id"] for d in kwargs["concepts_data"]] == [
+            "cand_0",
+            "cand_1",
+            "cand_2",
+        ]
+        assert [c.concept_id for c in concepts] == [
+            c.concept_id for c in concept_inputs
+        ]
+
+    def test_batched_upsert_splits_rows(self, mock_manager):
+        """Test that the generic upsert helper runs one query per batch."""
+        mock_manager.mock_session.run.side_effect = lambda _query, **kwargs: [
+            {"node_id": row["id"]} for row in kwargs["rows"]
+        ]
+        rows = [{"id": f"n{i}", "name": f"node {i}"} for i in range(5)]
+        node_ids = mock_manager._batched_upsert(
+            "Topic", "t", "rows", rows, "t.name = data.name", batch_size=2
+        )
+        assert mock_manager.mock_session.run.call_count == 3
+        assert node_ids == [f"n{i}" for i in range(5)]
+        query = mock_manager.mock_session.run.call_args[0][0]
+        assert "MERGE (t:Topic {id: data.id})" in query
+
+    def test_sync_blocks_unit(self, mock_manager):
+        """Test that sync_blocks checks and writes blocks in one UNWIND query."""
+        mock_manager.mock_session.run.return_value = [
+            {
+                "aclarai_id": "blk_2",
+                "action": "update",
+                "graph_version": 2,
+                "version": 3,
+                "old_hash": "old",
+            },
+            {
+                "aclarai_id": "blk_1",
+                "action": "create",
+                "graph_version": None,
+                "version": 1,
+                "old_hash": None,
+            },
+        ]
+        blocks = [
+            {
+                "aclarai_id": "blk_1",
+                "version": 1,
+                "semantic_text": "New block.",
+                "content_hash": "h1",
+            },
+            {
+                "aclarai_id": "blk_2",
+                "version": 2,
+                "semantic_text": "Edited block.",
+                "content_hash": "h2",
+                "source_file": "tier1/other.md",
+            },
+        ]
+        outcomes = mock_manager.sync_blocks(blocks, source_file="tier1/test.md")
+
+        mock_manager.mock_session.run.assert_called_once()
+        args, kwargs = mock_manager.mock_session.run.call_args
+        query = args[0]
+        assert "UNWIND $blocks_data AS data" in query
+        assert (
+            "WHEN data.version < coalesce(existing.version, 1) THEN 'conflict'" in query
+        )
+        assert "existing.version = coalesce(graph_version, 1) + 1" in query
+        assert "needs_reprocessing = true" in query
+        assert [b["source_file"] for b in kwargs["blocks_data"]] == [
+            "tier1/test.md",
+            "tier1/other.md",
+        ]
+        # Outcomes follow input order
+        assert [o["action"] for o in outcomes] == ["create", "update"]
+        assert outcomes[1]["version"] == 3
+
+    def test_sync_blocks_batches(self, mock_manager):
+        """Test batch splitting and error outcomes for failed batches."""
+        mock_manager.mock_session.run.side_effect = [
+            [
+                {
+                    "aclarai_id": "blk_1",
+                    "action": "unchanged",
+                    "graph_version": 1,
+                    "version": 1,
+                    "old_hash": "h",
+                }
+            ],
+            RuntimeError("boom"),
+        ]
+        block = {"version": 1, "semantic_text": "Text.", "content_hash": "h"}
+        outcomes = mock_manager.sync_blocks(
+            [{**block, "aclarai_id": "blk_1"}, {**block, "aclarai_id": "blk_1"}],
+            batch_size=10,
+        )
+        # A repeated id starts a new batch
+        assert mock_manager.mock_session.run.call_count == 2
+        assert [o["action"] for o in outcomes] == ["unchanged", "error"]
+        assert outcomes[1]["error"] == "boom"
+
+    def test_reads_use_read_transactions(self, mock_manager):
+        """Test that query-only methods run as read transaction functions."""
+        mock_manager.mock_session.run.return_value.single.return_value = None
+        assert mock_manager.get_claim_by_id("claim_1") is None
+        mock_manager.count_nodes()
+        assert mock_manager.mock_session.execute_read.call_count == 2
+        mock_manager.mock_session.execute_write.assert_not_called()
+        mock_manager.mock_session.run.return_value = [{"id": "concept_1"}]
+        records = mock_manager.execute_query(
+            "MATCH (c:Concept) RETURN c.id as id", read_only=True
+        )
+        assert records == [{"id": "concept_1"}]
+        assert mock_manager.mock_session.execute_read.call_count == 3
+
+
+class TestNeo4jGraphManagerSessions:
+    """Unit tests for session handling and driver settings."""
+
+    @pytest.fixture
+    def manager(self):
+        """Fixture to create a Neo4jGraphManager with a mocked driver."""
+        with patch(
+            "aclarai_shared.graph.neo4j_manager.GraphDatabase.driver"
+        ) as mock_driver:
+            config = Mock()
+            config.neo4j.get_neo4j_bolt_url.return_value = "bolt://mock:7687"
+            config.neo4j.user = "mock"
+            config.neo4j.password = "mock"
+            config.neo4j.database = "aclarai"
+            config.neo4j.pool = {"max_connection_pool_size": 20, "unknown": 1}
+            config.processing = {}
+            manager = Neo4jGraphManager(config)
+            manager.mock_driver = mock_driver
+            yield manager
+            manager.close()
+
+    def test_driver_pool_settings(self, manager):
+        """Test that known pool settings are passed to the driver."""
+        assert manager.driver is manager.mock_driver.return_value
+        manager.mock_driver.assert_called_once_with(
+            "bolt://mock:7687", auth=("mock", "mock"), max_connection_pool_size=20
+        )
+
+    def test_session_scope_reuses_session(self, manager):
+        """Test that calls inside session_scope share one session."""
+        driver = manager.mock_driver.return_value
+        with manager.session_scope() as scoped:
+            with manager.session() as first, manager.session_scope() as nested:
+                assert first is scoped
+                assert nested is scoped
+            manager.execute_read(lambda _tx: None)
+        driver.session.assert_called_once_with(
+            database="aclarai", default_access_mode=WRITE_ACCESS
+        )
+        scoped.close.assert_called_once()
+        scoped.execute_read.assert_called_once()
+        with manager.session(READ_ACCESS):
+            pass
+        assert driver.session.call_args.kwargs["default_access_mode"] == READ_ACCESS
+
 
 @pytest.mark.integration
 class TestNeo4jManagerIntegration:
@@ -128,6 +317,48 @@ class TestNeo4jManagerIntegration:
         assert retrieved_sentence is not None
         assert retrieved_sentence["text"] == "integration test sentence"
 
+    def test_sync_blocks_version_rules(self, integration_manager):
+        """Test block sync create, update, conflict and unchanged outcomes."""
+        with integration_manager.session() as session:
+            session.run("MATCH (b:Block {id: 'blk-sync'}) DETACH DELETE b")
+
+        def block(version, text):
+            return {
+                "aclarai_id": "blk-sync",
+                "version": version,
+                "semantic_text": text,
+                "content_hash": f"hash of {text}",
+            }
+
+        def graph_block():
+            with integration_manager.session() as session:
+                record = session.run(
+                    "MATCH (b:Block {id: 'blk-sync'}) "
+                    "RETURN b.text AS text, b.version AS version"
+                ).single()
+            return record["text"], record["version"]
+
+        created = integration_manager.sync_blocks([block(1, "first")], "sync.md")
+        assert created[0]["action"] == "create"
+        assert created[0]["version"] == 1
+        assert graph_block() == ("first", 1)
+
+        updated = integration_manager.sync_blocks([block(1, "second")], "sync.md")
+        assert updated[0]["action"] == "update"
+        assert updated[0]["graph_version"] == 1
+        assert updated[0]["version"] == 2
+        assert graph_block() == ("second", 2)
+
+        # The vault still has version 1 while the graph is at version 2
+        conflict = integration_manager.sync_blocks([block(1, "stale")], "sync.md")
+        assert conflict[0]["action"] == "conflict"
+        assert graph_block() == ("second", 2)
+
+        unchanged = integration_manager.sync_blocks([block(2, "second")], "sync.md")
+        assert unchanged[0]["action"] == "unchanged"
+        assert unchanged[0]["version"] == 2
+        assert graph_block() == ("second", 2)
+
     def test_node_count(self, integration_manager):
         """Test node counting functionality."""
         with integration_manager.session() as session:
@@ -0,0 +1,70 @@
+from unittest.mock import Mock
+
+from aclarai_shared.graph.pagination import graph_read_page_size, iter_node_pages
+
+
+class TestIterNodePages:
+    """Unit tests for keyset-paginated graph reads."""
+
+    @staticmethod
+    def _manager(pages):
+        manager = Mock()
+        manager.execute_query.side_effect = pages
+        return manager
+
+    def test_pages_resume_after_last_id(self):
+        """Test that each page resumes after the last id of the previous one."""
+        manager = self._manager(
+            [
+                [{"id": "a", "_page_id": "a"}, {"id": "b", "_page_id": "b"}],
+                [{"id": "c", "_page_id": "c"}],
+            ]
+        )
+        pages = list(iter_node_pages(manager, "Claim", "n.id as id", page_size=2))
+        assert pages == [[{"id": "a"}, {"id": "b"}], [{"id": "c"}]]
+        # A short page ends the scan without another query
+        assert manager.execute_query.call_count == 2
+        first_query, first_params = manager.execute_query.call_args_list[0][0]
+        second_query, second_params = manager.execute_query.call_args_list[1][0]
+        assert "$after_id" not in first_query
+        assert "n.id > $after_id" in second_query
+        assert "ORDER BY n.id" in second_query
+        assert second_params == {"page_size": 2, "after_id": "b"}
+        assert manager.execute_query.call_args.kwargs == {
+            "read_only": True,
+            "query_name": "iter_claim_pages",
+        }
+
+    def test_empty_page_ends_scan(self):
+        """Test that a full page followed by an empty one ends the scan."""
+        manager = self._manager([[{"id": "a", "_page_id": "a"}], []])
+        pages = list(iter_node_pages(manager, "Claim", "n.id as id", page_size=1))
+        assert pages == [[{"id": "a"}]]
+        assert manager.execute_query.call_count == 2
+
+    def test_descending_timestamp_order(self):
+        """Test keyset paging on a non-id property with an id tie-breaker."""
+        manager = self._manager([[{"id": "a", "_page_id": "a", "_page_key": 20}], []])
+        list(
+            iter_node_pages(
+                manager,
+                "Concept",
+                "n.id as id",
+                page_size=1,
+                order_by="timestamp",
+                descending=True,
+            )
+        )
+        query, params = manager.execute_query.call_args[0]
+        assert "n.timestamp IS NOT NULL" in query
+        assert "n.timestamp < $after_key" in query
+        assert "ORDER BY n.timestamp DESC, n.id DESC" in query
+        assert params["after_key"] == 20
+        assert params["after_id"] == "a"
+
+    def test_page_size_from_config(self):
+        """Test reading the page size from processing.batch_sizes."""
+        config = Mock()
+        config.processing = {"batch_sizes": {"graph_reads": 250}}
+        assert graph_read_page_size(config) == 250
+        assert graph_read_page_size(Mock()) == 1000
@@ -0,0 +1,116 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from aclarai_shared.graph.models import ClaimInput
+from aclarai_shared.graph.neo4j_manager import Neo4jGraphManager
+
+
+class TestGraphWriteBuffer:
+    """Unit tests for the write-behind buffer using a mocked driver."""
+
+    @pytest.fixture
+    def manager(self):
+        """Fixture to create a Neo4jGraphManager with a buffer and mocked transaction."""
+        with patch("aclarai_shared.graph.neo4j_manager.GraphDatabase.driver"):
+            config = Mock()
+            config.neo4j.get_neo4j_bolt_url.return_value = "bolt://mock:7687"
+            config.neo4j.user = "mock"
+            config.neo4j.password = "mock"
+            config.processing = {
+                "retries": {"max_attempts": 1},
+                "graph_write_buffer": {
+                    "enabled": True,
+                    "max_rows": 3,
+                    "max_delay_seconds": 60,
+                },
+            }
+            manager = Neo4jGraphManager(config)
+
+            mock_tx = MagicMock()
+            mock_tx.run.return_value = []
+            patcher = patch.object(Neo4jGraphManager, "session", new_callable=MagicMock)
+            mock_session_method = patcher.start()
+            mock_session = mock_session_method.return_value.__enter__.return_value
+            mock_session.execute_write.side_effect = lambda work, *args, **kwargs: work(
+                mock_tx, *args, **kwargs
+            )
+            manager.mock_session = mock_session
+            manager.mock_tx = mock_tx
+
+            yield manager
+
+            patcher.stop()
+            manager.write_buffer = None
+            manager.close()
+
+    @staticmethod
+    def _block(aclarai_id):
+        return {
+            "aclarai_id": aclarai_id,
+            "version": 1,
+            "semantic_text": f"Text of {aclarai_id}.",
+            "content_hash": f"hash_{aclarai_id}",
+        }
+
+    def test_writes_are_deferred_until_flush(self, manager):
+        """Test that deferred writes are grouped by operation in one transaction."""
+        committed = []
+        manager.buffer_block_sync(
+            [self._block("blk_1")], on_commit=lambda: committed.append("blk_1")
+        )
+        manager.create_claims([ClaimInput(text="claim", block_id="blk_1")], defer=True)
+        manager.mock_session.run.assert_not_called()
+        manager.mock_tx.run.assert_not_called()
+        assert committed == []
+
+        manager.buffer_block_sync(
+            [self._block("blk_2")], on_commit=lambda: committed.append("blk_2")
+        )
+        # Third row reaches max_rows and triggers the flush
+        assert manager.write_buffer.get_stats()["flushes"] == 1
+        manager.mock_session.execute_write.assert_called_once()
+        queries = [call.kwargs for call in manager.mock_tx.run.call_args_list]
+        assert [len(q.get("blocks_data", [])) for q in queries] == [2, 0]
+        assert len(queries[1]["claims_data"]) == 1
+        assert committed == ["blk_1", "blk_2"]
+
+    def test_repeated_block_id_is_synced_by_separate_queries(self, manager):
+        """Test that a block queued twice is not written by one UNWIND batch."""
+        manager.buffer_block_sync([self._block("blk_1"), self._block("blk_2")])
+        manager.buffer_block_sync([{**self._block("blk_1"), "version": 2}])
+        queries = [call.kwargs for call in manager.mock_tx.run.call_args_list]
+        assert [
+            [(row["aclarai_id"], row["version"]) for row in q["blocks_data"]]
+            for q in queries
+        ] == [[("blk_1", 1), ("blk_2", 1)], [("blk_1", 2)]]
+
+    def test_failed_flush_runs_failure_hooks(self, manager):
+        """Test that a failed flush reports the error and drops the rows."""
+        manager.mock_tx.run.side_effect = RuntimeError("write failed")
+        failures = []
+        commits = []
+        manager.buffer_block_sync(
+            [self._block("blk_1")],
+            on_commit=lambda: commits.append(True),
+            on_failure=failures.append,
+        )
+        with pytest.raises(RuntimeError):
+            manager.flush()
+        assert commits == []
+        assert [str(e) for e in failures] == ["write failed"]
+        assert manager.write_buffer.pending_rows == 0
+
+    def test_flush_if_due_after_delay(self, manager):
+        """Test that the age threshold makes a flush due."""
+        manager.buffer_block_sync([self._block("blk_1")])
+        manager.write_buffer.flush_if_due()
+        manager.mock_tx.run.assert_not_called()
+        manager.write_buffer.max_delay_seconds = 0
+        manager.write_buffer.flush_if_due()
+        manager.mock_tx.run.assert_called_once()
+
+    def test_deferred_write_requires_buffer(self, manager):
+        """Test that deferring without a write buffer fails loudly."""
+        manager.write_buffer = None
+        with pytest.raises(RuntimeError):
+            manager.buffer_block_sync([self._block("blk_1")])
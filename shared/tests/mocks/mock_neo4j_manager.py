@@ -60,13 +60,19 @@ class MockNeo4jGraphManager:
             pass
 
     def execute_query(
-        self, query: str, parameters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        read_only: bool = False,
+        query_name: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Mock query execution that simulates Cypher queries.
         Args:
             query: Cypher query string
             parameters: Query parameters
+            read_only: Whether the query runs as a read transaction
+            query_name: Name the query is recorded under
         Returns:
             List of result records
         """
@@ -76,6 +82,8 @@ class MockNeo4jGraphManager:
         query_record = {
             "query": query,
             "parameters": parameters,
+            "read_only": read_only,
+            "query_name": query_name,
         }
         self.executed_queries.append(query_record)
         logger.debug(
@@ -6,7 +6,7 @@ that simulates vector similarity search using simple in-memory operations.
 
 import logging
 import math
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from aclarai_shared.config import aclaraiConfig
 from aclarai_shared.noun_phrase_extraction.models import NounPhraseCandidate
@@ -169,6 +169,22 @@ class MockVectorStore:
         )
         return False
 
+    def update_candidate_statuses(
+        self, updates: List[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> Set[str]:
+        """
+        Update the status of many candidates.
+        Args:
+            updates: (candidate_id, new_status, metadata_updates) tuples
+        Returns:
+            Ids of the candidates that were updated
+        """
+        return {
+            candidate_id
+            for candidate_id, new_status, metadata_updates in updates
+            if self.update_candidate_status(candidate_id, new_status, metadata_updates)
+        }
+
     def get_candidates_by_status(self, status: str) -> List[Dict[str, Any]]:
         """
         Get candidates by status.
@@ -192,6 +208,19 @@ class MockVectorStore:
         )
         return results
 
+    def count_candidates_by_status(self) -> Dict[str, int]:
+        """
+        Count candidates by status.
+        Returns:
+            Mapping of status to number of candidates
+        """
+        counts: Dict[str, int] = {}
+        for doc in self.documents:
+            status = doc["metadata"].get("status")
+            if status is not None:
+                counts[status] = counts.get(status, 0) + 1
+        return counts
+
     def clear_all_data(self):
         """
         Clear all data from the mock vector store.
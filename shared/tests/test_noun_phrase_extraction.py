@@ -6,14 +6,19 @@ Tests the core noun phrase extraction logic including:
 - Data model creation and validation
 """
 
+import json
 import os
 import sys
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+from aclarai_shared.noun_phrase_extraction.concept_candidates_store import (
+    ConceptCandidatesVectorStore,
+)
 from aclarai_shared.noun_phrase_extraction.extractor import NounPhraseExtractor
 from aclarai_shared.noun_phrase_extraction.models import (
     ExtractionResult,
@@ -231,6 +236,159 @@ class TestNounPhraseExtractor:
         assert candidate.status == "pending"
 
 
+class TestConceptCandidatesVectorStore:
+    """Test the SQL side of the concept candidates store."""
+
+    @staticmethod
+    def _store():
+        store = ConceptCandidatesVectorStore.__new__(ConceptCandidatesVectorStore)
+        store.collection_name = "Concept_Candidates"
+        store.embed_dim = 3
+        store.engine = MagicMock()
+        store._metadata_indexes_ready = False
+        return store
+
+    def test_bulk_status_update_is_one_statement(self):
+        """Test that many status updates are applied with one UPDATE."""
+        store = self._store()
+        conn = store.engine.connect.return_value.__enter__.return_value
+        conn.execute.return_value.fetchall.return_value = [("c1",), ("c2",)]
+        updated = store.update_candidate_statuses(
+            [
+                ("c1", "merged", {"merged_with_id": "c0"}),
+                ("c2", "promoted", None),
+                ("c1", "merged", {"similarity_score": 0.95}),
+            ]
+        )
+        assert updated == {"c1", "c2"}
+        # Expression indexes and candidate_id backfill, then the update itself
+        assert conn.execute.call_count == 4
+        index_sql = str(conn.execute.call_args_list[0][0][0])
+        assert "data_concept_candidates_candidate_id_idx" in index_sql
+        assert "(metadata_->>'candidate_id')" in index_sql
+        update_sql = str(conn.execute.call_args[0][0])
+        assert "jsonb_to_recordset" in update_sql
+        assert "t.metadata_::jsonb || u.changes" in update_sql
+        assert json.loads(conn.execute.call_args[0][1]["updates"]) == [
+            {
+                "candidate_id": "c1",
+                "changes": {
+                    "merged_with_id": "c0",
+                    "similarity_score": 0.95,
+                    "status": "merged",
+                },
+            },
+            {"candidate_id": "c2", "changes": {"status": "promoted"}},
+        ]
+        conn.commit.assert_called_once()
+        # The index is only ensured once per store
+        store.update_candidate_status("c3", "merged")
+        assert conn.execute.call_count == 5
+        assert store.update_candidate_statuses([]) == set()
+        assert conn.execute.call_count == 5
+
+    def test_merged_candidates_are_stored_without_embedding(self):
+        """Test that exact-match merges become metadata-only rows in one statement."""
+        store = self._store()
+        store._metadata_indexes_ready = True
+        conn = store.engine.connect.return_value.__enter__.return_value
+        candidate = NounPhraseCandidate(
+            text="Machine Learning",
+            normalized_text="machine learning",
+            source_node_id="blk_1",
+            source_node_type="claim",
+            aclarai_id="blk_1",
+        )
+        recorded = store.store_merged_candidates(
+            [
+                (
+                    candidate,
+                    {"merged_with_id": "cand_ml", "merged_with_concept_id": "c_ml"},
+                )
+            ]
+        )
+        assert recorded == 1
+        assert conn.execute.call_count == 1
+        sql = str(conn.execute.call_args[0][0])
+        assert "INSERT INTO data_concept_candidates (text, metadata_, node_id)" in sql
+        assert "embedding" not in sql
+        (row,) = json.loads(conn.execute.call_args[0][1]["rows"])
+        assert row["candidate_id"] == "claim_blk_1_Machine Learning"
+        assert row["metadata"]["status"] == "merged"
+        assert row["metadata"]["merged_with_id"] == "cand_ml"
+        assert row["metadata"]["merged_with_concept_id"] == "c_ml"
+        assert row["metadata"]["source_node_id"] == "blk_1"
+        conn.commit.assert_called_once()
+        assert store.store_merged_candidates([]) == 0
+
+    def test_candidates_are_streamed_in_chunks(self):
+        """Test that candidates by status come from one server-side cursor."""
+        store = self._store()
+        store._metadata_indexes_ready = True
+        conn = store.engine.connect.return_value.__enter__.return_value
+        streaming = conn.execution_options.return_value
+        streaming.execute.return_value.partitions.return_value = iter(
+            [
+                [
+                    ({"candidate_id": "c1"}, np.ones(3)),
+                    ('{"candidate_id": "c2"}', np.zeros(3)),
+                ],
+                [({"candidate_id": "c3"}, np.ones(3))],
+            ]
+        )
+        chunks = list(store.iter_candidate_chunks("pending", chunk_size=2))
+        conn.execution_options.assert_called_once_with(yield_per=2)
+        query, params = streaming.execute.call_args[0]
+        assert "WHERE metadata_->>'status' = :status" in str(query)
+        assert params == {"status": "pending"}
+        assert [[m["candidate_id"] for m in metadata] for metadata, _ in chunks] == [
+            ["c1", "c2"],
+            ["c3"],
+        ]
+        assert chunks[0][1].shape == (2, 3)
+        assert chunks[0][1].dtype == np.float32
+        # A failed query is an error rather than a silently partial result
+        streaming.execute.side_effect = RuntimeError("connection lost")
+        with pytest.raises(RuntimeError):
+            list(store.iter_candidate_chunks("pending"))
+        assert store.get_candidates_by_status("pending") == []
+
+    def test_get_candidates_by_status_keeps_rows_without_embedding(self):
+        """Test that only index builds skip candidates stored without embedding."""
+        store = self._store()
+        store._metadata_indexes_ready = True
+        conn = store.engine.connect.return_value.__enter__.return_value
+        streaming = conn.execution_options.return_value
+        streaming.execute.return_value.partitions.return_value = iter(
+            [[({"candidate_id": "c1"}, np.ones(3)), ({"candidate_id": "c2"}, None)]]
+        )
+        candidates = store.get_candidates_by_status("merged")
+        assert "embedding IS NOT NULL" not in str(streaming.execute.call_args[0][0])
+        assert [c["candidate_id"] for c in candidates] == ["c1", "c2"]
+        assert candidates[1]["embedding"] is None
+        streaming.execute.return_value.partitions.return_value = iter([])
+        list(store.iter_candidate_chunks("merged"))
+        assert "embedding IS NOT NULL" in str(streaming.execute.call_args[0][0])
+
+    def test_count_candidates_by_status(self):
+        """Test that status counts come from one GROUP BY query."""
+        store = self._store()
+        store._metadata_indexes_ready = True
+        conn = store.engine.connect.return_value.__enter__.return_value
+        conn.execute.return_value.fetchall.return_value = [
+            ("pending", 4),
+            ("merged", 7),
+            (None, 1),
+        ]
+        assert store.count_candidates_by_status() == {"pending": 4, "merged": 7}
+        sql = str(conn.execute.call_args[0][0])
+        assert "count(*)" in sql
+        assert "GROUP BY 1" in sql
+        conn.execute.side_effect = RuntimeError("connection lost")
+        with pytest.raises(RuntimeError):
+            store.count_candidates_by_status()
+
+
 @pytest.mark.integration
 class TestNounPhraseExtractionRealIntegration:
     """Integration tests requiring actual services to be running."""
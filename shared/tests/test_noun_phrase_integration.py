@@ -243,6 +243,74 @@ class TestNounPhraseExtractionIntegration:
         # The error is logged but not propagated to the result object
         # This is a design choice for resilient error handling
 
+    @patch(
+        "aclarai_shared.noun_phrase_extraction.extractor.graph_read_page_size",
+        return_value=1,
+    )
+    @patch("aclarai_shared.noun_phrase_extraction.extractor.spacy")
+    @patch("aclarai_shared.noun_phrase_extraction.extractor.Neo4jGraphManager")
+    @patch("aclarai_shared.noun_phrase_extraction.extractor.EmbeddingGenerator")
+    @patch(
+        "aclarai_shared.noun_phrase_extraction.extractor.ConceptCandidatesVectorStore"
+    )
+    @patch("aclarai_shared.noun_phrase_extraction.extractor.load_config")
+    def test_candidates_are_handed_off_per_page(
+        self,
+        mock_load_config,
+        mock_vector_store_class,
+        _mock_embedding_gen_class,
+        mock_neo4j_class,
+        mock_spacy,
+        _mock_page_size,
+    ):
+        """Test that candidates are stored per page and not kept on the result."""
+        mock_load_config.return_value = Mock()
+        mock_spacy.load.return_value = Mock()
+        mock_neo4j = Mock()
+        mock_neo4j_class.return_value = mock_neo4j
+        mock_neo4j.execute_query.side_effect = [
+            [
+                {
+                    "id": "claim_1",
+                    "text": "a",
+                    "node_type": "claim",
+                    "_page_id": "claim_1",
+                }
+            ],
+            [],
+            [
+                {
+                    "id": "summary_1",
+                    "text": "b",
+                    "node_type": "summary",
+                    "_page_id": "summary_1",
+                }
+            ],
+            [],
+        ]
+        mock_vector_store = Mock()
+        mock_vector_store_class.return_value = mock_vector_store
+        extractor = NounPhraseExtractor()
+        extractor._extract_from_node = lambda node: [
+            NounPhraseCandidate(
+                text=node["text"],
+                normalized_text=node["text"],
+                source_node_id=node["id"],
+                source_node_type=node["node_type"],
+                aclarai_id=node["id"],
+                embedding=[0.1, 0.2],
+            )
+        ]
+        batches = []
+        result = extractor.extract_from_all_nodes(on_candidates=batches.append)
+        assert result.total_phrases_extracted == 2
+        assert result.candidates == []
+        assert [[c.source_node_id for c in batch] for batch in batches] == [
+            ["claim_1"],
+            ["summary_1"],
+        ]
+        assert mock_vector_store.store_candidates.call_count == 2
+
 
 @pytest.mark.integration
 class TestRealNounPhraseExtractionIntegration:
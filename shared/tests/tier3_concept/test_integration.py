@@ -59,7 +59,9 @@ class TestConceptProcessorTier3Integration:
             )
             # Setup mocks
             mock_store_instance = Mock()
-            mock_store_instance.update_candidate_status.return_value = True
+            mock_store_instance.update_candidate_statuses.side_effect = lambda u: {
+                candidate_id for candidate_id, _, _ in u
+            }
             mock_extractor_instance = Mock()
             mock_detector_instance = Mock()
             # Setup ConceptFileWriter mock
@@ -150,7 +152,9 @@ class TestConceptProcessorTier3Integration:
             )
             # Setup mocks
             mock_store_instance = Mock()
-            mock_store_instance.update_candidate_status.return_value = True
+            mock_store_instance.update_candidate_statuses.side_effect = lambda u: {
+                candidate_id for candidate_id, _, _ in u
+            }
             mock_extractor_instance = Mock()
             mock_detector_instance = Mock()
             # Setup ConceptFileWriter mock
@@ -0,0 +1,115 @@
+"""
+Tests for the bulk initial vault load.
+Covers the parallel vault scan, CSV output for LOAD CSV and neo4j-admin
+import, and recording the watermark used by the periodic vault sync.
+"""
+
+import csv
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from aclarai_scheduler.bulk_load import (
+    ADMIN_IMPORT_COLUMNS,
+    MANIFEST_FILE,
+    VaultBulkLoadJob,
+)
+from aclarai_scheduler.vault_sync import WATERMARK_NAME
+
+
+def _create_vault(root: Path) -> None:
+    """Create a small vault with a block duplicated across files."""
+    tier1 = root / "tier1"
+    tier1.mkdir(parents=True)
+    (tier1 / "a.md").write_text(
+        'Alice: First "quoted" line, with a comma. <!-- aclarai:id=blk_a ver=1 -->\n^blk_a\n'
+        "Bob: Second line. <!-- aclarai:id=blk_b ver=2 -->\n^blk_b\n"
+    )
+    (tier1 / "b.md").write_text(
+        "Carol: Third line. <!-- aclarai:id=blk_c ver=1 -->\n^blk_c\n"
+        "Bob: Second line. <!-- aclarai:id=blk_b ver=2 -->\n^blk_b\n"
+    )
+
+
+def _create_job(root: Path, **bulk_load) -> VaultBulkLoadJob:
+    config = MagicMock()
+    config.vault_path = str(root)
+    config.paths.tier1 = "tier1"
+    config.paths.tier2 = "tier2"
+    config.paths.tier3 = "tier3"
+    config.neo4j.database = ""
+    config.processing = {"bulk_load": {"scan_workers": 1, **bulk_load}}
+    return VaultBulkLoadJob(config, graph_manager=MagicMock())
+
+
+def test_scan_vault_in_parallel(tmp_path):
+    """Test that a parallel scan finds each block once."""
+    _create_vault(tmp_path)
+    job = _create_job(tmp_path, scan_workers=2)
+    blocks, stats = job.scan_vault()
+    assert [block["aclarai_id"] for block in blocks] == ["blk_a", "blk_b", "blk_c"]
+    assert blocks[0]["source_file"] == str(tmp_path / "tier1" / "a.md")
+    assert stats == {"files_processed": 2, "blocks": 3, "duplicates": 1, "errors": 0}
+
+
+def test_load_csv_through_import_dir(tmp_path):
+    """Test LOAD CSV with periodic commits over the written CSV file."""
+    _create_vault(tmp_path / "vault")
+    import_dir = tmp_path / "import"
+    job = _create_job(
+        tmp_path / "vault", import_dir=str(import_dir), rows_per_transaction=500
+    )
+    session = job.graph_manager.session.return_value.__enter__.return_value
+    session.run.return_value.consume.return_value.counters.nodes_created = 3
+    stats = job.load_csv()
+    query = session.run.call_args[0][0]
+    assert "IN TRANSACTIONS OF 500 ROWS" in query
+    assert session.run.call_args.kwargs == {"url": "file:///blocks.csv"}
+    assert stats["nodes_created"] == 3
+    # Constraints exist before rows are merged on Block.id
+    job.graph_manager.setup_schema.assert_called_once()
+    with (import_dir / "blocks.csv").open(newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["id"] == "blk_a"
+    assert rows[0]["text"] == 'Alice: First "quoted" line, with a comma.'
+    name, watermark = job.graph_manager.set_sync_watermark.call_args[0]
+    assert name == WATERMARK_NAME
+    assert isinstance(watermark, float)
+
+
+def test_load_without_import_dir_uses_sync_blocks(tmp_path):
+    """Test the UNWIND fallback and that errors keep the watermark unset."""
+    _create_vault(tmp_path)
+    job = _create_job(tmp_path)
+    job.graph_manager.sync_blocks.return_value = [
+        {"aclarai_id": "blk_a", "action": "create"},
+        {"aclarai_id": "blk_b", "action": "error"},
+        {"aclarai_id": "blk_c", "action": "create"},
+    ]
+    stats = job.load_csv()
+    assert len(job.graph_manager.sync_blocks.call_args[0][0]) == 3
+    assert stats["errors"] == 1
+    job.graph_manager.set_sync_watermark.assert_not_called()
+
+
+def test_admin_import_then_finalize(tmp_path):
+    """Test the neo4j-admin CSV, command and post-import schema setup."""
+    _create_vault(tmp_path / "vault")
+    output_dir = tmp_path / "import"
+    job = _create_job(tmp_path / "vault")
+    stats = job.prepare_admin_import(output_dir)
+    assert stats["command"][:4] == ["neo4j-admin", "database", "import", "full"]
+    assert f"--nodes={output_dir / 'blocks.csv'}" in stats["command"]
+    assert stats["command"][-1] == "neo4j"
+    with (output_dir / "blocks.csv").open(newline="") as f:
+        reader = csv.reader(f)
+        assert tuple(next(reader)) == ADMIN_IMPORT_COLUMNS
+        assert next(reader)[-1] == "Block"
+    # Nothing touches the (stopped) database until finalize
+    job.graph_manager.setup_schema.assert_not_called()
+    manifest = json.loads((output_dir / MANIFEST_FILE).read_text())
+    job.finalize(output_dir)
+    job.graph_manager.setup_schema.assert_called_once()
+    job.graph_manager.set_sync_watermark.assert_called_once_with(
+        WATERMARK_NAME, manifest["watermark"]
+    )
@@ -151,7 +151,16 @@ Alice: I'm doing well, thanks! <!-- aclarai:id=blk_followup ver=1 -->
             mock_graph_instance = Mock()
             mock_graph.return_value = mock_graph_instance
             # Mock graph responses (no existing blocks)
-            mock_graph_instance._retry_with_backoff.return_value = None
+            mock_graph_instance.sync_blocks.side_effect = lambda blocks: [
+                {
+                    "aclarai_id": block["aclarai_id"],
+                    "action": "create",
+                    "graph_version": None,
+                    "version": block["version"],
+                    "old_hash": None,
+                }
+                for block in blocks
+            ]
             vault_sync = VaultSyncJob()
             # Process the file
             stats = vault_sync._process_markdown_file(test_file, "tier1")
@@ -160,6 +169,8 @@ Alice: I'm doing well, thanks! <!-- aclarai:id=blk_followup ver=1 -->
             assert stats["blocks_new"] == 3
             assert stats["blocks_updated"] == 0
             assert stats["errors"] == 0
+            # All blocks of the file are synced in a single call
+            mock_graph_instance.sync_blocks.assert_called_once()
 
 
 @patch("aclarai_scheduler.vault_sync.load_config")
@@ -193,6 +204,40 @@ def test_vault_sync_job_stats_merging(mock_neo4j, mock_load_config):
     assert target["errors"] == 1
 
 
+@patch("aclarai_scheduler.vault_sync.Neo4jGraphManager")
+def test_run_sync_skips_files_before_watermark(mock_neo4j):
+    """Test that files unchanged since the watermark are not re-read."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tier1 = Path(temp_dir) / "tier1"
+        tier1.mkdir()
+        old_file = tier1 / "old.md"
+        old_file.write_text("Alice: Old. <!-- aclarai:id=blk_old ver=1 -->\n^blk_old\n")
+        new_file = tier1 / "new.md"
+        new_file.write_text("Bob: New. <!-- aclarai:id=blk_new ver=1 -->\n^blk_new\n")
+        config = _create_mock_config()
+        config.vault_path = temp_dir
+        mock_graph_instance = Mock()
+        mock_neo4j.return_value = mock_graph_instance
+        mock_graph_instance.get_sync_watermark.return_value = (
+            new_file.stat().st_mtime + 60
+        )
+        vault_sync = VaultSyncJob(config)
+        with patch("aclarai_scheduler.vault_sync._modified_since") as modified:
+            modified.side_effect = lambda path, _watermark: path == new_file
+            mock_graph_instance.sync_blocks.return_value = [
+                {"aclarai_id": "blk_new", "action": "unchanged"}
+            ]
+            stats = vault_sync.run_sync()
+        assert stats["files_skipped"] == 1
+        assert stats["files_processed"] == 1
+        synced = mock_graph_instance.sync_blocks.call_args[0][0]
+        assert [block["aclarai_id"] for block in synced] == ["blk_new"]
+        # The watermark advances to the start of the error-free run
+        name, watermark = mock_graph_instance.set_sync_watermark.call_args[0]
+        assert name == "vault_sync"
+        assert watermark == stats["start_time"]
+
+
 if __name__ == "__main__":
     # Run basic tests
     print("Running vault sync tests...")